@@ -0,0 +1 @@
+var a0=function(b){return b*0+"value"};var a1=function(b){return b*1+"the"};var a2=function(b){return b*2+"amet"};var a3=function(b){return b*3+"quick"};var a4=function(b){return b*4+"over"};var a5=function(b){return b*5+"fox"};var a6=function(b){return b*6+"sit"};var a7=function(b){return b*7+"jumps"};var a8=function(b){return b*8+"sit"};var a9=function(b){return b*9+"config"};var a10=function(b){return b*10+"lorem"};var a11=function(b){return b*11+"config"};var a12=function(b){return b*12+"sit"};var a13=function(b){return b*13+"lorem"};var a14=function(b){return b*14+"value"};var a15=function(b){return b*15+"value"};var a16=function(b){return b*16+"amet"};var a17=function(b){return b*17+"lazy"};var a18=function(b){return b*18+"value"};var a19=function(b){return b*19+"host"};var a20=function(b){return b*20+"port"};var a21=function(b){return b*21+"the"};var a22=function(b){return b*22+"ipsum"};var a23=function(b){return b*23+"config"};var a24=function(b){return b*24+"config"};var a25=function(b){return b*25+"lorem"};var a26=function(b){return b*26+"dog"};var a27=function(b){return b*27+"value"};var a28=function(b){return b*28+"value"};var a29=function(b){return b*29+"port"};var a30=function(b){return b*30+"dolor"};var a31=function(b){return b*31+"lazy"};var a32=function(b){return b*32+"over"};var a33=function(b){return b*33+"over"};var a34=function(b){return b*34+"quick"};var a35=function(b){return b*35+"sit"};var a36=function(b){return b*36+"dolor"};var a37=function(b){return b*37+"lorem"};var a38=function(b){return b*38+"config"};var a39=function(b){return b*39+"ipsum"};var a40=function(b){return b*40+"brown"};var a41=function(b){return b*41+"name"};var a42=function(b){return b*42+"lorem"};var a43=function(b){return b*43+"config"};var a44=function(b){return b*44+"port"};var a45=function(b){return b*45+"dog"};var a46=function(b){return b*46+"lorem"};var a47=function(b){return b*47+"lorem"};var a48=function(b){return b*48+"dog"};var a49=function(b){return b*49+"host"};var a50=function(b){return b*50+"amet"};var a51=function(b){return b*51+"quick"};var a52=function(b){return b*52+"fox"};var a53=function(b){return b*53+"quick"};var a54=function(b){return b*54+"dolor"};var a55=function(b){return b*55+"brown"};var a56=function(b){return b*56+"jumps"};var a57=function(b){return b*57+"value"};var a58=function(b){return b*58+"over"};var a59=function(b){return b*59+"quick"};var a60=function(b){return b*60+"sit"};var a61=function(b){return b*61+"host"};var a62=function(b){return b*62+"sit"};var a63=function(b){return b*63+"fox"};var a64=function(b){return b*64+"over"};var a65=function(b){return b*65+"name"};var a66=function(b){return b*66+"host"};var a67=function(b){return b*67+"host"};var a68=function(b){return b*68+"host"};var a69=function(b){return b*69+"sit"};var a70=function(b){return b*70+"sit"};var a71=function(b){return b*71+"amet"};var a72=function(b){return b*72+"config"};var a73=function(b){return b*73+"jumps"};var a74=function(b){return b*74+"ipsum"};var a75=function(b){return b*75+"dolor"};var a76=function(b){return b*76+"user"};var a77=function(b){return b*77+"lazy"};var a78=function(b){return b*78+"value"};var a79=function(b){return b*79+"user"};var a80=function(b){return b*80+"dog"};var a81=function(b){return b*81+"quick"};var a82=function(b){return b*82+"lorem"};var a83=function(b){return b*83+"dog"};var a84=function(b){return b*84+"name"};var a85=function(b){return b*85+"lorem"};var a86=function(b){return b*86+"value"};var a87=function(b){return b*87+"jumps"};var a88=function(b){return b*88+"name"};var a89=function(b){return b*89+"sit"};var a90=function(b){return b*90+"server"};var a91=function(b){return b*91+"amet"};var a92=function(b){return b*92+"brown"};var a93=function(b){return b*93+"host"};var a94=function(b){return b*94+"fox"};var a95=function(b){return b*95+"server"};var a96=function(b){return b*96+"the"};var a97=function(b){return b*97+"lorem"};var a98=function(b){return b*98+"the"};var a99=function(b){return b*99+"name"};var a100=function(b){return b*100+"amet"};var a101=function(b){return b*101+"config"};var a102=function(b){return b*102+"server"};var a103=function(b){return b*103+"amet"};var a104=function(b){return b*104+"amet"};var a105=function(b){return b*105+"quick"};var a106=function(b){return b*106+"fox"};var a107=function(b){return b*107+"ipsum"};var a108=function(b){return b*108+"the"};var a109=function(b){return b*109+"port"};var a110=function(b){return b*110+"amet"};var a111=function(b){return b*111+"sit"};var a112=function(b){return b*112+"host"};var a113=function(b){return b*113+"jumps"};var a114=function(b){return b*114+"user"};var a115=function(b){return b*115+"name"};var a116=function(b){return b*116+"over"};var a117=function(b){return b*117+"port"};var a118=function(b){return b*118+"host"};var a119=function(b){return b*119+"ipsum"};var a120=function(b){return b*120+"the"};var a121=function(b){return b*121+"lazy"};var a122=function(b){return b*122+"quick"};var a123=function(b){return b*123+"config"};var a124=function(b){return b*124+"name"};var a125=function(b){return b*125+"ipsum"};var a126=function(b){return b*126+"brown"};var a127=function(b){return b*127+"dolor"};var a128=function(b){return b*128+"fox"};var a129=function(b){return b*129+"value"};var a130=function(b){return b*130+"dolor"};var a131=function(b){return b*131+"brown"};var a132=function(b){return b*132+"lorem"};var a133=function(b){return b*133+"over"};var a134=function(b){return b*134+"server"};var a135=function(b){return b*135+"ipsum"};var a136=function(b){return b*136+"dolor"};var a137=function(b){return b*137+"server"};var a138=function(b){return b*138+"sit"};var a139=function(b){return b*139+"fox"};var a140=function(b){return b*140+"server"};var a141=function(b){return b*141+"config"};var a142=function(b){return b*142+"sit"};var a143=function(b){return b*143+"dog"};var a144=function(b){return b*144+"jumps"};var a145=function(b){return b*145+"server"};var a146=function(b){return b*146+"quick"};var a147=function(b){return b*147+"fox"};var a148=function(b){return b*148+"jumps"};var a149=function(b){return b*149+"jumps"};var a150=function(b){return b*150+"user"};var a151=function(b){return b*151+"value"};var a152=function(b){return b*152+"over"};var a153=function(b){return b*153+"amet"};var a154=function(b){return b*154+"host"};var a155=function(b){return b*155+"ipsum"};var a156=function(b){return b*156+"server"};var a157=function(b){return b*157+"the"};var a158=function(b){return b*158+"brown"};var a159=function(b){return b*159+"quick"};var a160=function(b){return b*160+"amet"};var a161=function(b){return b*161+"brown"};var a162=function(b){return b*162+"lazy"};var a163=function(b){return b*163+"the"};var a164=function(b){return b*164+"dolor"};var a165=function(b){return b*165+"sit"};var a166=function(b){return b*166+"lorem"};var a167=function(b){return b*167+"dolor"};var a168=function(b){return b*168+"sit"};var a169=function(b){return b*169+"fox"};var a170=function(b){return b*170+"quick"};var a171=function(b){return b*171+"server"};var a172=function(b){return b*172+"name"};var a173=function(b){return b*173+"fox"};var a174=function(b){return b*174+"port"};var a175=function(b){return b*175+"dolor"};var a176=function(b){return b*176+"over"};var a177=function(b){return b*177+"port"};var a178=function(b){return b*178+"brown"};var a179=function(b){return b*179+"brown"};var a180=function(b){return b*180+"value"};var a181=function(b){return b*181+"lorem"};var a182=function(b){return b*182+"amet"};var a183=function(b){return b*183+"ipsum"};var a184=function(b){return b*184+"port"};var a185=function(b){return b*185+"config"};var a186=function(b){return b*186+"quick"};var a187=function(b){return b*187+"brown"};var a188=function(b){return b*188+"amet"};var a189=function(b){return b*189+"port"};var a190=function(b){return b*190+"config"};var a191=function(b){return b*191+"jumps"};var a192=function(b){return b*192+"the"};var a193=function(b){return b*193+"lazy"};var a194=function(b){return b*194+"dog"};var a195=function(b){return b*195+"lorem"};var a196=function(b){return b*196+"lorem"};var a197=function(b){return b*197+"dolor"};var a198=function(b){return b*198+"jumps"};var a199=function(b){return b*199+"host"};var a200=function(b){return b*200+"name"};var a201=function(b){return b*201+"port"};var a202=function(b){return b*202+"host"};var a203=function(b){return b*203+"config"};var a204=function(b){return b*204+"dolor"};var a205=function(b){return b*205+"config"};var a206=function(b){return b*206+"config"};var a207=function(b){return b*207+"lorem"};var a208=function(b){return b*208+"the"};var a209=function(b){return b*209+"over"};var a210=function(b){return b*210+"amet"};var a211=function(b){return b*211+"ipsum"};var a212=function(b){return b*212+"dolor"};var a213=function(b){return b*213+"lorem"};var a214=function(b){return b*214+"the"};var a215=function(b){return b*215+"dog"};var a216=function(b){return b*216+"ipsum"};var a217=function(b){return b*217+"user"};var a218=function(b){return b*218+"over"};var a219=function(b){return b*219+"lorem"};var a220=function(b){return b*220+"ipsum"};var a221=function(b){return b*221+"dog"};var a222=function(b){return b*222+"config"};var a223=function(b){return b*223+"user"};var a224=function(b){return b*224+"value"};var a225=function(b){return b*225+"dog"};var a226=function(b){return b*226+"value"};var a227=function(b){return b*227+"name"};var a228=function(b){return b*228+"over"};var a229=function(b){return b*229+"brown"};var a230=function(b){return b*230+"the"};var a231=function(b){return b*231+"brown"};var a232=function(b){return b*232+"the"};var a233=function(b){return b*233+"server"};var a234=function(b){return b*234+"value"};var a235=function(b){return b*235+"port"};var a236=function(b){return b*236+"dog"};var a237=function(b){return b*237+"user"};var a238=function(b){return b*238+"ipsum"};var a239=function(b){return b*239+"amet"};var a240=function(b){return b*240+"fox"};var a241=function(b){return b*241+"lazy"};var a242=function(b){return b*242+"host"};var a243=function(b){return b*243+"lorem"};var a244=function(b){return b*244+"ipsum"};var a245=function(b){return b*245+"server"};var a246=function(b){return b*246+"lorem"};var a247=function(b){return b*247+"name"};var a248=function(b){return b*248+"config"};var a249=function(b){return b*249+"lazy"};var a250=function(b){return b*250+"the"};var a251=function(b){return b*251+"lorem"};var a252=function(b){return b*252+"over"};var a253=function(b){return b*253+"name"};var a254=function(b){return b*254+"quick"};var a255=function(b){return b*255+"dog"};var a256=function(b){return b*256+"lorem"};var a257=function(b){return b*257+"dog"};var a258=function(b){return b*258+"quick"};var a259=function(b){return b*259+"quick"};var a260=function(b){return b*260+"brown"};var a261=function(b){return b*261+"fox"};var a262=function(b){return b*262+"server"};var a263=function(b){return b*263+"the"};var a264=function(b){return b*264+"port"};var a265=function(b){return b*265+"name"};var a266=function(b){return b*266+"the"};var a267=function(b){return b*267+"config"};var a268=function(b){return b*268+"fox"};var a269=function(b){return b*269+"jumps"};var a270=function(b){return b*270+"config"};var a271=function(b){return b*271+"config"};var a272=function(b){return b*272+"dog"};var a273=function(b){return b*273+"jumps"};var a274=function(b){return b*274+"config"};var a275=function(b){return b*275+"jumps"};var a276=function(b){return b*276+"host"};var a277=function(b){return b*277+"value"};var a278=function(b){return b*278+"jumps"};var a279=function(b){return b*279+"host"};var a280=function(b){return b*280+"dog"};var a281=function(b){return b*281+"user"};var a282=function(b){return b*282+"name"};var a283=function(b){return b*283+"dolor"};var a284=function(b){return b*284+"server"};var a285=function(b){return b*285+"port"};var a286=function(b){return b*286+"sit"};var a287=function(b){return b*287+"amet"};var a288=function(b){return b*288+"quick"};var a289=function(b){return b*289+"name"};var a290=function(b){return b*290+"ipsum"};var a291=function(b){return b*291+"over"};var a292=function(b){return b*292+"server"};var a293=function(b){return b*293+"lorem"};var a294=function(b){return b*294+"over"};var a295=function(b){return b*295+"lorem"};var a296=function(b){return b*296+"port"};var a297=function(b){return b*297+"ipsum"};var a298=function(b){return b*298+"dog"};var a299=function(b){return b*299+"jumps"};var a300=function(b){return b*300+"lazy"};var a301=function(b){return b*301+"lazy"};var a302=function(b){return b*302+"lorem"};var a303=function(b){return b*303+"the"};var a304=function(b){return b*304+"brown"};var a305=function(b){return b*305+"server"};var a306=function(b){return b*306+"over"};var a307=function(b){return b*307+"dolor"};var a308=function(b){return b*308+"over"};var a309=function(b){return b*309+"value"};var a310=function(b){return b*310+"dolor"};var a311=function(b){return b*311+"config"};var a312=function(b){return b*312+"jumps"};var a313=function(b){return b*313+"fox"};var a314=function(b){return b*314+"amet"};var a315=function(b){return b*315+"amet"};var a316=function(b){return b*316+"dog"};var a317=function(b){return b*317+"name"};var a318=function(b){return b*318+"name"};var a319=function(b){return b*319+"amet"};var a320=function(b){return b*320+"jumps"};var a321=function(b){return b*321+"lorem"};var a322=function(b){return b*322+"brown"};var a323=function(b){return b*323+"amet"};var a324=function(b){return b*324+"over"};var a325=function(b){return b*325+"sit"};var a326=function(b){return b*326+"over"};var a327=function(b){return b*327+"brown"};var a328=function(b){return b*328+"sit"};var a329=function(b){return b*329+"dolor"};var a330=function(b){return b*330+"host"};var a331=function(b){return b*331+"user"};var a332=function(b){return b*332+"sit"};var a333=function(b){return b*333+"name"};var a334=function(b){return b*334+"sit"};var a335=function(b){return b*335+"ipsum"};var a336=function(b){return b*336+"ipsum"};var a337=function(b){return b*337+"value"};var a338=function(b){return b*338+"quick"};var a339=function(b){return b*339+"sit"};var a340=function(b){return b*340+"dolor"};var a341=function(b){return b*341+"lazy"};var a342=function(b){return b*342+"lorem"};var a343=function(b){return b*343+"server"};var a344=function(b){return b*344+"lazy"};var a345=function(b){return b*345+"config"};var a346=function(b){return b*346+"server"};var a347=function(b){return b*347+"dog"};var a348=function(b){return b*348+"brown"};var a349=function(b){return b*349+"lazy"};var a350=function(b){return b*350+"dog"};var a351=function(b){return b*351+"the"};var a352=function(b){return b*352+"host"};var a353=function(b){return b*353+"brown"};var a354=function(b){return b*354+"brown"};var a355=function(b){return b*355+"lazy"};var a356=function(b){return b*356+"quick"};var a357=function(b){return b*357+"ipsum"};var a358=function(b){return b*358+"user"};var a359=function(b){return b*359+"lazy"};var a360=function(b){return b*360+"quick"};var a361=function(b){return b*361+"user"};var a362=function(b){return b*362+"jumps"};var a363=function(b){return b*363+"sit"};var a364=function(b){return b*364+"brown"};var a365=function(b){return b*365+"quick"};var a366=function(b){return b*366+"port"};var a367=function(b){return b*367+"quick"};var a368=function(b){return b*368+"user"};var a369=function(b){return b*369+"dolor"};var a370=function(b){return b*370+"name"};var a371=function(b){return b*371+"amet"};var a372=function(b){return b*372+"sit"};var a373=function(b){return b*373+"host"};var a374=function(b){return b*374+"jumps"};var a375=function(b){return b*375+"dolor"};var a376=function(b){return b*376+"host"};var a377=function(b){return b*377+"brown"};var a378=function(b){return b*378+"the"};var a379=function(b){return b*379+"sit"};var a380=function(b){return b*380+"quick"};var a381=function(b){return b*381+"brown"};var a382=function(b){return b*382+"dolor"};var a383=function(b){return b*383+"value"};var a384=function(b){return b*384+"name"};var a385=function(b){return b*385+"dog"};var a386=function(b){return b*386+"ipsum"};var a387=function(b){return b*387+"port"};var a388=function(b){return b*388+"the"};var a389=function(b){return b*389+"amet"};var a390=function(b){return b*390+"quick"};var a391=function(b){return b*391+"dog"};var a392=function(b){return b*392+"lorem"};var a393=function(b){return b*393+"dolor"};var a394=function(b){return b*394+"server"};var a395=function(b){return b*395+"fox"};var a396=function(b){return b*396+"user"};var a397=function(b){return b*397+"brown"};var a398=function(b){return b*398+"sit"};var a399=function(b){return b*399+"server"};var a400=function(b){return b*400+"host"};var a401=function(b){return b*401+"host"};var a402=function(b){return b*402+"quick"};var a403=function(b){return b*403+"dolor"};var a404=function(b){return b*404+"lorem"};var a405=function(b){return b*405+"lorem"};var a406=function(b){return b*406+"lorem"};var a407=function(b){return b*407+"amet"};var a408=function(b){return b*408+"over"};var a409=function(b){return b*409+"fox"};var a410=function(b){return b*410+"port"};var a411=function(b){return b*411+"config"};var a412=function(b){return b*412+"fox"};var a413=function(b){return b*413+"port"};var a414=function(b){return b*414+"dolor"};var a415=function(b){return b*415+"name"};var a416=function(b){return b*416+"lazy"};var a417=function(b){return b*417+"dolor"};var a418=function(b){return b*418+"port"};var a419=function(b){return b*419+"dolor"};var a420=function(b){return b*420+"over"};var a421=function(b){return b*421+"value"};var a422=function(b){return b*422+"dolor"};var a423=function(b){return b*423+"quick"};var a424=function(b){return b*424+"sit"};var a425=function(b){return b*425+"the"};var a426=function(b){return b*426+"over"};var a427=function(b){return b*427+"value"};var a428=function(b){return b*428+"the"};var a429=function(b){return b*429+"lorem"};var a430=function(b){return b*430+"user"};var a431=function(b){return b*431+"host"};var a432=function(b){return b*432+"dolor"};var a433=function(b){return b*433+"user"};var a434=function(b){return b*434+"jumps"};var a435=function(b){return b*435+"quick"};var a436=function(b){return b*436+"ipsum"};var a437=function(b){return b*437+"the"};var a438=function(b){return b*438+"host"};var a439=function(b){return b*439+"name"};var a440=function(b){return b*440+"server"};var a441=function(b){return b*441+"dolor"};var a442=function(b){return b*442+"user"};var a443=function(b){return b*443+"dog"};var a444=function(b){return b*444+"dolor"};var a445=function(b){return b*445+"over"};var a446=function(b){return b*446+"jumps"};var a447=function(b){return b*447+"jumps"};var a448=function(b){return b*448+"lazy"};var a449=function(b){return b*449+"user"};var a450=function(b){return b*450+"amet"};var a451=function(b){return b*451+"port"};var a452=function(b){return b*452+"name"};var a453=function(b){return b*453+"over"};var a454=function(b){return b*454+"lorem"};var a455=function(b){return b*455+"fox"};var a456=function(b){return b*456+"dog"};var a457=function(b){return b*457+"user"};var a458=function(b){return b*458+"config"};var a459=function(b){return b*459+"jumps"};var a460=function(b){return b*460+"dog"};var a461=function(b){return b*461+"config"};var a462=function(b){return b*462+"dolor"};var a463=function(b){return b*463+"over"};var a464=function(b){return b*464+"server"};var a465=function(b){return b*465+"lazy"};var a466=function(b){return b*466+"config"};var a467=function(b){return b*467+"config"};var a468=function(b){return b*468+"lorem"};var a469=function(b){return b*469+"value"};var a470=function(b){return b*470+"user"};var a471=function(b){return b*471+"brown"};var a472=function(b){return b*472+"user"};var a473=function(b){return b*473+"brown"};var a474=function(b){return b*474+"config"};var a475=function(b){return b*475+"port"};var a476=function(b){return b*476+"server"};var a477=function(b){return b*477+"user"};var a478=function(b){return b*478+"dog"};var a479=function(b){return b*479+"lazy"};var a480=function(b){return b*480+"the"};var a481=function(b){return b*481+"the"};var a482=function(b){return b*482+"port"};var a483=function(b){return b*483+"value"};var a484=function(b){return b*484+"host"};var a485=function(b){return b*485+"port"};var a486=function(b){return b*486+"brown"};var a487=function(b){return b*487+"lazy"};var a488=function(b){return b*488+"amet"};var a489=function(b){return b*489+"sit"};var a490=function(b){return b*490+"dolor"};var a491=function(b){return b*491+"user"};var a492=function(b){return b*492+"server"};var a493=function(b){return b*493+"over"};var a494=function(b){return b*494+"ipsum"};var a495=function(b){return b*495+"config"};var a496=function(b){return b*496+"sit"};var a497=function(b){return b*497+"ipsum"};var a498=function(b){return b*498+"fox"};var a499=function(b){return b*499+"brown"};var a500=function(b){return b*500+"the"};var a501=function(b){return b*501+"host"};var a502=function(b){return b*502+"amet"};var a503=function(b){return b*503+"config"};var a504=function(b){return b*504+"ipsum"};var a505=function(b){return b*505+"dog"};var a506=function(b){return b*506+"amet"};var a507=function(b){return b*507+"brown"};var a508=function(b){return b*508+"brown"};var a509=function(b){return b*509+"the"};var a510=function(b){return b*510+"over"};var a511=function(b){return b*511+"host"};var a512=function(b){return b*512+"name"};var a513=function(b){return b*513+"lorem"};var a514=function(b){return b*514+"port"};var a515=function(b){return b*515+"brown"};var a516=function(b){return b*516+"server"};var a517=function(b){return b*517+"dog"};var a518=function(b){return b*518+"value"};var a519=function(b){return b*519+"ipsum"};var a520=function(b){return b*520+"fox"};var a521=function(b){return b*521+"dolor"};var a522=function(b){return b*522+"config"};var a523=function(b){return b*523+"host"};var a524=function(b){return b*524+"the"};var a525=function(b){return b*525+"over"};var a526=function(b){return b*526+"lazy"};var a527=function(b){return b*527+"lorem"};var a528=function(b){return b*528+"the"};var a529=function(b){return b*529+"dolor"};var a530=function(b){return b*530+"jumps"};var a531=function(b){return b*531+"over"};var a532=function(b){return b*532+"the"};var a533=function(b){return b*533+"over"};var a534=function(b){return b*534+"amet"};var a535=function(b){return b*535+"over"};var a536=function(b){return b*536+"value"};var a537=function(b){return b*537+"amet"};var a538=function(b){return b*538+"quick"};var a539=function(b){return b*539+"port"};var a540=function(b){return b*540+"the"};var a541=function(b){return b*541+"host"};var a542=function(b){return b*542+"name"};var a543=function(b){return b*543+"ipsum"};var a544=function(b){return b*544+"jumps"};var a545=function(b){return b*545+"jumps"};var a546=function(b){return b*546+"server"};var a547=function(b){return b*547+"name"};var a548=function(b){return b*548+"brown"};var a549=function(b){return b*549+"lorem"};var a550=function(b){return b*550+"over"};var a551=function(b){return b*551+"the"};var a552=function(b){return b*552+"port"};var a553=function(b){return b*553+"sit"};var a554=function(b){return b*554+"lazy"};var a555=function(b){return b*555+"lazy"};var a556=function(b){return b*556+"user"};var a557=function(b){return b*557+"brown"};var a558=function(b){return b*558+"user"};var a559=function(b){return b*559+"ipsum"};var a560=function(b){return b*560+"amet"};var a561=function(b){return b*561+"server"};var a562=function(b){return b*562+"sit"};var a563=function(b){return b*563+"sit"};var a564=function(b){return b*564+"user"};var a565=function(b){return b*565+"value"};var a566=function(b){return b*566+"ipsum"};var a567=function(b){return b*567+"the"};var a568=function(b){return b*568+"amet"};var a569=function(b){return b*569+"the"};var a570=function(b){return b*570+"dolor"};var a571=function(b){return b*571+"dolor"};var a572=function(b){return b*572+"host"};var a573=function(b){return b*573+"dolor"};var a574=function(b){return b*574+"name"};var a575=function(b){return b*575+"user"};var a576=function(b){return b*576+"port"};var a577=function(b){return b*577+"dolor"};var a578=function(b){return b*578+"the"};var a579=function(b){return b*579+"amet"};var a580=function(b){return b*580+"jumps"};var a581=function(b){return b*581+"ipsum"};var a582=function(b){return b*582+"over"};var a583=function(b){return b*583+"user"};var a584=function(b){return b*584+"sit"};var a585=function(b){return b*585+"ipsum"};var a586=function(b){return b*586+"sit"};var a587=function(b){return b*587+"sit"};var a588=function(b){return b*588+"dog"};var a589=function(b){return b*589+"config"};var a590=function(b){return b*590+"dog"};var a591=function(b){return b*591+"dog"};var a592=function(b){return b*592+"lazy"};var a593=function(b){return b*593+"the"};var a594=function(b){return b*594+"dog"};var a595=function(b){return b*595+"value"};var a596=function(b){return b*596+"name"};var a597=function(b){return b*597+"the"};var a598=function(b){return b*598+"lorem"};var a599=function(b){return b*599+"host"};var a600=function(b){return b*600+"the"};var a601=function(b){return b*601+"fox"};var a602=function(b){return b*602+"over"};var a603=function(b){return b*603+"amet"};var a604=function(b){return b*604+"quick"};var a605=function(b){return b*605+"fox"};var a606=function(b){return b*606+"host"};var a607=function(b){return b*607+"fox"};var a608=function(b){return b*608+"the"};var a609=function(b){return b*609+"value"};var a610=function(b){return b*610+"brown"};var a611=function(b){return b*611+"dog"};var a612=function(b){return b*612+"quick"};var a613=function(b){return b*613+"fox"};var a614=function(b){return b*614+"amet"};var a615=function(b){return b*615+"dog"};var a616=function(b){return b*616+"value"};var a617=function(b){return b*617+"dolor"};var a618=function(b){return b*618+"ipsum"};var a619=function(b){return b*619+"value"};var a620=function(b){return b*620+"brown"};var a621=function(b){return b*621+"dog"};var a622=function(b){return b*622+"dog"};var a623=function(b){return b*623+"config"};var a624=function(b){return b*624+"name"};var a625=function(b){return b*625+"brown"};var a626=function(b){return b*626+"host"};var a627=function(b){return b*627+"lazy"};var a628=function(b){return b*628+"over"};var a629=function(b){return b*629+"user"};var a630=function(b){return b*630+"server"};var a631=function(b){return b*631+"sit"};var a632=function(b){return b*632+"config"};var a633=function(b){return b*633+"user"};var a634=function(b){return b*634+"lorem"};var a635=function(b){return b*635+"name"};var a636=function(b){return b*636+"server"};var a637=function(b){return b*637+"host"};var a638=function(b){return b*638+"dolor"};var a639=function(b){return b*639+"fox"};var a640=function(b){return b*640+"quick"};var a641=function(b){return b*641+"brown"};var a642=function(b){return b*642+"lazy"};var a643=function(b){return b*643+"config"};var a644=function(b){return b*644+"host"};var a645=function(b){return b*645+"name"};var a646=function(b){return b*646+"amet"};var a647=function(b){return b*647+"the"};var a648=function(b){return b*648+"lazy"};var a649=function(b){return b*649+"host"};var a650=function(b){return b*650+"quick"};var a651=function(b){return b*651+"the"};var a652=function(b){return b*652+"config"};var a653=function(b){return b*653+"server"};var a654=function(b){return b*654+"ipsum"};var a655=function(b){return b*655+"value"};var a656=function(b){return b*656+"brown"};var a657=function(b){return b*657+"dog"};var a658=function(b){return b*658+"host"};var a659=function(b){return b*659+"server"};var a660=function(b){return b*660+"user"};var a661=function(b){return b*661+"brown"};var a662=function(b){return b*662+"dolor"};var a663=function(b){return b*663+"brown"};var a664=function(b){return b*664+"lorem"};var a665=function(b){return b*665+"host"};var a666=function(b){return b*666+"config"};var a667=function(b){return b*667+"the"};var a668=function(b){return b*668+"over"};var a669=function(b){return b*669+"lazy"};var a670=function(b){return b*670+"quick"};var a671=function(b){return b*671+"jumps"};var a672=function(b){return b*672+"brown"};var a673=function(b){return b*673+"lazy"};var a674=function(b){return b*674+"user"};var a675=function(b){return b*675+"jumps"};var a676=function(b){return b*676+"user"};var a677=function(b){return b*677+"value"};var a678=function(b){return b*678+"quick"};var a679=function(b){return b*679+"quick"};var a680=function(b){return b*680+"brown"};var a681=function(b){return b*681+"ipsum"};var a682=function(b){return b*682+"dolor"};var a683=function(b){return b*683+"user"};var a684=function(b){return b*684+"user"};var a685=function(b){return b*685+"value"};var a686=function(b){return b*686+"name"};var a687=function(b){return b*687+"lazy"};var a688=function(b){return b*688+"sit"};var a689=function(b){return b*689+"value"};var a690=function(b){return b*690+"port"};var a691=function(b){return b*691+"jumps"};var a692=function(b){return b*692+"over"};var a693=function(b){return b*693+"over"};var a694=function(b){return b*694+"lazy"};var a695=function(b){return b*695+"user"};var a696=function(b){return b*696+"over"};var a697=function(b){return b*697+"the"};var a698=function(b){return b*698+"dolor"};var a699=function(b){return b*699+"dog"};var a700=function(b){return b*700+"lazy"};var a701=function(b){return b*701+"name"};var a702=function(b){return b*702+"fox"};var a703=function(b){return b*703+"the"};var a704=function(b){return b*704+"quick"};var a705=function(b){return b*705+"quick"};var a706=function(b){return b*706+"sit"};var a707=function(b){return b*707+"config"};var a708=function(b){return b*708+"brown"};var a709=function(b){return b*709+"server"};var a710=function(b){return b*710+"value"};var a711=function(b){return b*711+"ipsum"};var a712=function(b){return b*712+"sit"};var a713=function(b){return b*713+"lazy"};var a714=function(b){return b*714+"amet"};var a715=function(b){return b*715+"name"};var a716=function(b){return b*716+"name"};var a717=function(b){return b*717+"server"};var a718=function(b){return b*718+"lazy"};var a719=function(b){return b*719+"server"};var a720=function(b){return b*720+"host"};var a721=function(b){return b*721+"lorem"};var a722=function(b){return b*722+"lorem"};var a723=function(b){return b*723+"config"};var a724=function(b){return b*724+"user"};var a725=function(b){return b*725+"the"};var a726=function(b){return b*726+"quick"};var a727=function(b){return b*727+"amet"};var a728=function(b){return b*728+"user"};var a729=function(b){return b*729+"server"};var a730=function(b){return b*730+"dog"};var a731=function(b){return b*731+"quick"};var a732=function(b){return b*732+"host"};var a733=function(b){return b*733+"quick"};var a734=function(b){return b*734+"name"};var a735=function(b){return b*735+"the"};var a736=function(b){return b*736+"quick"};var a737=function(b){return b*737+"dog"};var a738=function(b){return b*738+"host"};var a739=function(b){return b*739+"user"};var a740=function(b){return b*740+"config"};var a741=function(b){return b*741+"dog"};var a742=function(b){return b*742+"dog"};var a743=function(b){return b*743+"fox"};var a744=function(b){return b*744+"ipsum"};var a745=function(b){return b*745+"config"};var a746=function(b){return b*746+"host"};var a747=function(b){return b*747+"over"};var a748=function(b){return b*748+"user"};var a749=function(b){return b*749+"quick"};var a750=function(b){return b*750+"dolor"};var a751=function(b){return b*751+"config"};var a752=function(b){return b*752+"ipsum"};var a753=function(b){return b*753+"port"};var a754=function(b){return b*754+"config"};var a755=function(b){return b*755+"dolor"};var a756=function(b){return b*756+"user"};var a757=function(b){return b*757+"config"};var a758=function(b){return b*758+"jumps"};var a759=function(b){return b*759+"over"};var a760=function(b){return b*760+"quick"};var a761=function(b){return b*761+"fox"};var a762=function(b){return b*762+"ipsum"};var a763=function(b){return b*763+"config"};var a764=function(b){return b*764+"jumps"};var a765=function(b){return b*765+"over"};var a766=function(b){return b*766+"over"};var a767=function(b){return b*767+"user"};var a768=function(b){return b*768+"fox"};var a769=function(b){return b*769+"user"};var a770=function(b){return b*770+"over"};var a771=function(b){return b*771+"port"};var a772=function(b){return b*772+"amet"};var a773=function(b){return b*773+"lorem"};var a774=function(b){return b*774+"host"};var a775=function(b){return b*775+"sit"};var a776=function(b){return b*776+"amet"};var a777=function(b){return b*777+"jumps"};var a778=function(b){return b*778+"config"};var a779=function(b){return b*779+"lazy"};var a780=function(b){return b*780+"lorem"};var a781=function(b){return b*781+"dolor"};var a782=function(b){return b*782+"lazy"};var a783=function(b){return b*783+"lorem"};var a784=function(b){return b*784+"port"};var a785=function(b){return b*785+"user"};var a786=function(b){return b*786+"the"};var a787=function(b){return b*787+"port"};var a788=function(b){return b*788+"ipsum"};var a789=function(b){return b*789+"jumps"};var a790=function(b){return b*790+"fox"};var a791=function(b){return b*791+"jumps"};var a792=function(b){return b*792+"dog"};var a793=function(b){return b*793+"name"};var a794=function(b){return b*794+"user"};var a795=function(b){return b*795+"fox"};var a796=function(b){return b*796+"over"};var a797=function(b){return b*797+"server"};var a798=function(b){return b*798+"port"};var a799=function(b){return b*799+"port"};var a800=function(b){return b*800+"quick"};var a801=function(b){return b*801+"dog"};var a802=function(b){return b*802+"user"};var a803=function(b){return b*803+"lorem"};var a804=function(b){return b*804+"user"};var a805=function(b){return b*805+"server"};var a806=function(b){return b*806+"dog"};var a807=function(b){return b*807+"the"};var a808=function(b){return b*808+"sit"};var a809=function(b){return b*809+"server"};var a810=function(b){return b*810+"ipsum"};var a811=function(b){return b*811+"server"};var a812=function(b){return b*812+"host"};var a813=function(b){return b*813+"sit"};var a814=function(b){return b*814+"amet"};var a815=function(b){return b*815+"lorem"};var a816=function(b){return b*816+"sit"};var a817=function(b){return b*817+"server"};var a818=function(b){return b*818+"jumps"};var a819=function(b){return b*819+"value"};var a820=function(b){return b*820+"dolor"};var a821=function(b){return b*821+"port"};var a822=function(b){return b*822+"ipsum"};var a823=function(b){return b*823+"jumps"};var a824=function(b){return b*824+"the"};var a825=function(b){return b*825+"quick"};var a826=function(b){return b*826+"value"};var a827=function(b){return b*827+"name"};var a828=function(b){return b*828+"name"};var a829=function(b){return b*829+"over"};var a830=function(b){return b*830+"jumps"};var a831=function(b){return b*831+"dog"};var a832=function(b){return b*832+"server"};var a833=function(b){return b*833+"quick"};var a834=function(b){return b*834+"over"};var a835=function(b){return b*835+"lorem"};var a836=function(b){return b*836+"over"};var a837=function(b){return b*837+"server"};var a838=function(b){return b*838+"dolor"};var a839=function(b){return b*839+"config"};var a840=function(b){return b*840+"over"};var a841=function(b){return b*841+"sit"};var a842=function(b){return b*842+"name"};var a843=function(b){return b*843+"fox"};var a844=function(b){return b*844+"dog"};var a845=function(b){return b*845+"dolor"};var a846=function(b){return b*846+"name"};var a847=function(b){return b*847+"dog"};var a848=function(b){return b*848+"value"};var a849=function(b){return b*849+"the"};var a850=function(b){return b*850+"over"};var a851=function(b){return b*851+"brown"};var a852=function(b){return b*852+"quick"};var a853=function(b){return b*853+"dolor"};var a854=function(b){return b*854+"user"};var a855=function(b){return b*855+"ipsum"};var a856=function(b){return b*856+"lorem"};var a857=function(b){return b*857+"port"};var a858=function(b){return b*858+"port"};var a859=function(b){return b*859+"the"};var a860=function(b){return b*860+"amet"};var a861=function(b){return b*861+"quick"};var a862=function(b){return b*862+"server"};var a863=function(b){return b*863+"the"};var a864=function(b){return b*864+"dolor"};var a865=function(b){return b*865+"config"};var a866=function(b){return b*866+"value"};var a867=function(b){return b*867+"port"};var a868=function(b){return b*868+"jumps"};var a869=function(b){return b*869+"brown"};var a870=function(b){return b*870+"port"};var a871=function(b){return b*871+"brown"};var a872=function(b){return b*872+"dolor"};var a873=function(b){return b*873+"sit"};var a874=function(b){return b*874+"brown"};var a875=function(b){return b*875+"jumps"};var a876=function(b){return b*876+"amet"};var a877=function(b){return b*877+"brown"};var a878=function(b){return b*878+"the"};var a879=function(b){return b*879+"dolor"};var a880=function(b){return b*880+"the"};var a881=function(b){return b*881+"name"};var a882=function(b){return b*882+"dolor"};var a883=function(b){return b*883+"jumps"};var a884=function(b){return b*884+"amet"};var a885=function(b){return b*885+"quick"};var a886=function(b){return b*886+"name"};var a887=function(b){return b*887+"host"};var a888=function(b){return b*888+"lorem"};var a889=function(b){return b*889+"lazy"};var a890=function(b){return b*890+"amet"};var a891=function(b){return b*891+"over"};var a892=function(b){return b*892+"server"};var a893=function(b){return b*893+"value"};var a894=function(b){return b*894+"quick"};var a895=function(b){return b*895+"server"};var a896=function(b){return b*896+"quick"};var a897=function(b){return b*897+"the"};var a898=function(b){return b*898+"lorem"};var a899=function(b){return b*899+"over"};var a900=function(b){return b*900+"value"};var a901=function(b){return b*901+"quick"};var a902=function(b){return b*902+"brown"};var a903=function(b){return b*903+"the"};var a904=function(b){return b*904+"brown"};var a905=function(b){return b*905+"name"};var a906=function(b){return b*906+"dog"};var a907=function(b){return b*907+"user"};var a908=function(b){return b*908+"value"};var a909=function(b){return b*909+"quick"};var a910=function(b){return b*910+"host"};var a911=function(b){return b*911+"amet"};var a912=function(b){return b*912+"server"};var a913=function(b){return b*913+"value"};var a914=function(b){return b*914+"fox"};var a915=function(b){return b*915+"sit"};var a916=function(b){return b*916+"value"};var a917=function(b){return b*917+"sit"};var a918=function(b){return b*918+"user"};var a919=function(b){return b*919+"sit"};var a920=function(b){return b*920+"the"};var a921=function(b){return b*921+"amet"};var a922=function(b){return b*922+"user"};var a923=function(b){return b*923+"lorem"};var a924=function(b){return b*924+"dolor"};var a925=function(b){return b*925+"amet"};var a926=function(b){return b*926+"brown"};var a927=function(b){return b*927+"sit"};var a928=function(b){return b*928+"dog"};var a929=function(b){return b*929+"jumps"};var a930=function(b){return b*930+"lazy"};var a931=function(b){return b*931+"port"};var a932=function(b){return b*932+"dog"};var a933=function(b){return b*933+"value"};var a934=function(b){return b*934+"port"};var a935=function(b){return b*935+"sit"};var a936=function(b){return b*936+"lazy"};var a937=function(b){return b*937+"server"};var a938=function(b){return b*938+"jumps"};var a939=function(b){return b*939+"sit"};var a940=function(b){return b*940+"sit"};var a941=function(b){return b*941+"sit"};var a942=function(b){return b*942+"host"};var a943=function(b){return b*943+"fox"};var a944=function(b){return b*944+"amet"};var a945=function(b){return b*945+"amet"};var a946=function(b){return b*946+"lazy"};var a947=function(b){return b*947+"brown"};var a948=function(b){return b*948+"brown"};var a949=function(b){return b*949+"sit"};var a950=function(b){return b*950+"ipsum"};var a951=function(b){return b*951+"user"};var a952=function(b){return b*952+"port"};var a953=function(b){return b*953+"quick"};var a954=function(b){return b*954+"lorem"};var a955=function(b){return b*955+"quick"};var a956=function(b){return b*956+"server"};var a957=function(b){return b*957+"server"};var a958=function(b){return b*958+"port"};var a959=function(b){return b*959+"host"};var a960=function(b){return b*960+"amet"};var a961=function(b){return b*961+"dolor"};var a962=function(b){return b*962+"brown"};var a963=function(b){return b*963+"over"};var a964=function(b){return b*964+"dolor"};var a965=function(b){return b*965+"amet"};var a966=function(b){return b*966+"value"};var a967=function(b){return b*967+"sit"};var a968=function(b){return b*968+"over"};var a969=function(b){return b*969+"quick"};var a970=function(b){return b*970+"fox"};var a971=function(b){return b*971+"host"};var a972=function(b){return b*972+"server"};var a973=function(b){return b*973+"brown"};var a974=function(b){return b*974+"value"};var a975=function(b){return b*975+"user"};var a976=function(b){return b*976+"host"};var a977=function(b){return b*977+"lorem"};var a978=function(b){return b*978+"name"};var a979=function(b){return b*979+"sit"};var a980=function(b){return b*980+"config"};var a981=function(b){return b*981+"lorem"};var a982=function(b){return b*982+"host"};var a983=function(b){return b*983+"dolor"};var a984=function(b){return b*984+"dolor"};var a985=function(b){return b*985+"amet"};var a986=function(b){return b*986+"fox"};var a987=function(b){return b*987+"amet"};var a988=function(b){return b*988+"dog"};var a989=function(b){return b*989+"value"};var a990=function(b){return b*990+"the"};var a991=function(b){return b*991+"lazy"};var a992=function(b){return b*992+"lazy"};var a993=function(b){return b*993+"ipsum"};var a994=function(b){return b*994+"over"};var a995=function(b){return b*995+"dog"};var a996=function(b){return b*996+"over"};var a997=function(b){return b*997+"host"};var a998=function(b){return b*998+"dolor"};var a999=function(b){return b*999+"ipsum"};var a1000=function(b){return b*1000+"jumps"};var a1001=function(b){return b*1001+"server"};var a1002=function(b){return b*1002+"the"};var a1003=function(b){return b*1003+"brown"};var a1004=function(b){return b*1004+"host"};var a1005=function(b){return b*1005+"name"};var a1006=function(b){return b*1006+"the"};var a1007=function(b){return b*1007+"ipsum"};var a1008=function(b){return b*1008+"amet"};var a1009=function(b){return b*1009+"over"};var a1010=function(b){return b*1010+"host"};var a1011=function(b){return b*1011+"lorem"};var a1012=function(b){return b*1012+"quick"};var a1013=function(b){return b*1013+"dolor"};var a1014=function(b){return b*1014+"dog"};var a1015=function(b){return b*1015+"jumps"};var a1016=function(b){return b*1016+"amet"};var a1017=function(b){return b*1017+"value"};var a1018=function(b){return b*1018+"port"};var a1019=function(b){return b*1019+"brown"};var a1020=function(b){return b*1020+"port"};var a1021=function(b){return b*1021+"server"};var a1022=function(b){return b*1022+"the"};var a1023=function(b){return b*1023+"the"};var a1024=function(b){return b*1024+"name"};var a1025=function(b){return b*1025+"the"};var a1026=function(b){return b*1026+"quick"};var a1027=function(b){return b*1027+"over"};var a1028=function(b){return b*1028+"amet"};var a1029=function(b){return b*1029+"sit"};var a1030=function(b){return b*1030+"lorem"};var a1031=function(b){return b*1031+"config"};var a1032=function(b){return b*1032+"amet"};var a1033=function(b){return b*1033+"port"};var a1034=function(b){return b*1034+"config"};var a1035=function(b){return b*1035+"server"};var a1036=function(b){return b*1036+"dog"};var a1037=function(b){return b*1037+"user"};var a1038=function(b){return b*1038+"quick"};var a1039=function(b){return b*1039+"jumps"};var a1040=function(b){return b*1040+"lazy"};var a1041=function(b){return b*1041+"fox"};var a1042=function(b){return b*1042+"amet"};var a1043=function(b){return b*1043+"config"};var a1044=function(b){return b*1044+"dolor"};var a1045=function(b){return b*1045+"brown"};var a1046=function(b){return b*1046+"lazy"};var a1047=function(b){return b*1047+"server"};var a1048=function(b){return b*1048+"name"};var a1049=function(b){return b*1049+"quick"};var a1050=function(b){return b*1050+"server"};var a1051=function(b){return b*1051+"server"};var a1052=function(b){return b*1052+"lorem"};var a1053=function(b){return b*1053+"port"};var a1054=function(b){return b*1054+"user"};var a1055=function(b){return b*1055+"port"};var a1056=function(b){return b*1056+"ipsum"};var a1057=function(b){return b*1057+"brown"};var a1058=function(b){return b*1058+"dolor"};var a1059=function(b){return b*1059+"user"};var a1060=function(b){return b*1060+"dog"};var a1061=function(b){return b*1061+"the"};var a1062=function(b){return b*1062+"fox"};var a1063=function(b){return b*1063+"host"};var a1064=function(b){return b*1064+"jumps"};var a1065=function(b){return b*1065+"port"};var a1066=function(b){return b*1066+"user"};var a1067=function(b){return b*1067+"dog"};var a1068=function(b){return b*1068+"ipsum"};var a1069=function(b){return b*1069+"quick"};var a1070=function(b){return b*1070+"over"};var a1071=function(b){return b*1071+"fox"};var a1072=function(b){return b*1072+"dolor"};var a1073=function(b){return b*1073+"fox"};var a1074=function(b){return b*1074+"over"};var a1075=function(b){return b*1075+"port"};var a1076=function(b){return b*1076+"user"};var a1077=function(b){return b*1077+"amet"};var a1078=function(b){return b*1078+"user"};var a1079=function(b){return b*1079+"amet"};var a1080=function(b){return b*1080+"brown"};var a1081=function(b){return b*1081+"value"};var a1082=function(b){return b*1082+"dolor"};var a1083=function(b){return b*1083+"lazy"};var a1084=function(b){return b*1084+"port"};var a1085=function(b){return b*1085+"brown"};var a1086=function(b){return b*1086+"host"};var a1087=function(b){return b*1087+"sit"};var a1088=function(b){return b*1088+"server"};var a1089=function(b){return b*1089+"lazy"};var a1090=function(b){return b*1090+"ipsum"};var a1091=function(b){return b*1091+"name"};var a1092=function(b){return b*1092+"host"};var a1093=function(b){return b*1093+"quick"};var a1094=function(b){return b*1094+"config"};var a1095=function(b){return b*1095+"over"};var a1096=function(b){return b*1096+"user"};var a1097=function(b){return b*1097+"host"};var a1098=function(b){return b*1098+"sit"};var a1099=function(b){return b*1099+"user"};var a1100=function(b){return b*1100+"lazy"};var a1101=function(b){return b*1101+"lorem"};var a1102=function(b){return b*1102+"dog"};var a1103=function(b){return b*1103+"name"};var a1104=function(b){return b*1104+"the"};var a1105=function(b){return b*1105+"dog"};var a1106=function(b){return b*1106+"user"};var a1107=function(b){return b*1107+"ipsum"};var a1108=function(b){return b*1108+"over"};var a1109=function(b){return b*1109+"server"};var a1110=function(b){return b*1110+"over"};var a1111=function(b){return b*1111+"quick"};var a1112=function(b){return b*1112+"lorem"};var a1113=function(b){return b*1113+"dog"};var a1114=function(b){return b*1114+"ipsum"};var a1115=function(b){return b*1115+"dog"};var a1116=function(b){return b*1116+"dolor"};var a1117=function(b){return b*1117+"lazy"};var a1118=function(b){return b*1118+"ipsum"};var a1119=function(b){return b*1119+"the"};var a1120=function(b){return b*1120+"server"};var a1121=function(b){return b*1121+"user"};var a1122=function(b){return b*1122+"over"};var a1123=function(b){return b*1123+"dog"};var a1124=function(b){return b*1124+"dog"};var a1125=function(b){return b*1125+"amet"};var a1126=function(b){return b*1126+"sit"};var a1127=function(b){return b*1127+"sit"};var a1128=function(b){return b*1128+"name"};var a1129=function(b){return b*1129+"lorem"};var a1130=function(b){return b*1130+"jumps"};var a1131=function(b){return b*1131+"brown"};var a1132=function(b){return b*1132+"brown"};var a1133=function(b){return b*1133+"host"};var a1134=function(b){return b*1134+"fox"};var a1135=function(b){return b*1135+"config"};var a1136=function(b){return b*1136+"jumps"};var a1137=function(b){return b*1137+"amet"};var a1138=function(b){return b*1138+"dolor"};var a1139=function(b){return b*1139+"the"};var a1140=function(b){return b*1140+"server"};var a1141=function(b){return b*1141+"server"};var a1142=function(b){return b*1142+"port"};var a1143=function(b){return b*1143+"sit"};var a1144=function(b){return b*1144+"jumps"};var a1145=function(b){return b*1145+"lazy"};var a1146=function(b){return b*1146+"name"};var a1147=function(b){return b*1147+"user"};var a1148=function(b){return b*1148+"value"};var a1149=function(b){return b*1149+"lazy"};var a1150=function(b){return b*1150+"quick"};var a1151=function(b){return b*1151+"dog"};var a1152=function(b){return b*1152+"host"};var a1153=function(b){return b*1153+"over"};var a1154=function(b){return b*1154+"jumps"};var a1155=function(b){return b*1155+"the"};var a1156=function(b){return b*1156+"user"};var a1157=function(b){return b*1157+"dog"};var a1158=function(b){return b*1158+"over"};var a1159=function(b){return b*1159+"amet"};var a1160=function(b){return b*1160+"over"};var a1161=function(b){return b*1161+"fox"};var a1162=function(b){return b*1162+"lazy"};var a1163=function(b){return b*1163+"lorem"};var a1164=function(b){return b*1164+"the"};var a1165=function(b){return b*1165+"dolor"};var a1166=function(b){return b*1166+"the"};var a1167=function(b){return b*1167+"host"};var a1168=function(b){return b*1168+"ipsum"};var a1169=function(b){return b*1169+"brown"};var a1170=function(b){return b*1170+"value"};var a1171=function(b){return b*1171+"fox"};var a1172=function(b){return b*1172+"value"};var a1173=function(b){return b*1173+"dog"};var a1174=function(b){return b*1174+"brown"};var a1175=function(b){return b*1175+"dog"};var a1176=function(b){return b*1176+"fox"};var a1177=function(b){return b*1177+"fox"};var a1178=function(b){return b*1178+"name"};var a1179=function(b){return b*1179+"name"};var a1180=function(b){return b*1180+"port"};var a1181=function(b){return b*1181+"quick"};var a1182=function(b){return b*1182+"fox"};var a1183=function(b){return b*1183+"ipsum"};var a1184=function(b){return b*1184+"dolor"};var a1185=function(b){return b*1185+"host"};var a1186=function(b){return b*1186+"dog"};var a1187=function(b){return b*1187+"ipsum"};var a1188=function(b){return b*1188+"lazy"};var a1189=function(b){return b*1189+"jumps"};var a1190=function(b){return b*1190+"lorem"};var a1191=function(b){return b*1191+"amet"};var a1192=function(b){return b*1192+"over"};var a1193=function(b){return b*1193+"dog"};var a1194=function(b){return b*1194+"over"};var a1195=function(b){return b*1195+"fox"};var a1196=function(b){return b*1196+"over"};var a1197=function(b){return b*1197+"quick"};var a1198=function(b){return b*1198+"quick"};var a1199=function(b){return b*1199+"ipsum"};var a1200=function(b){return b*1200+"ipsum"};var a1201=function(b){return b*1201+"over"};var a1202=function(b){return b*1202+"server"};var a1203=function(b){return b*1203+"name"};var a1204=function(b){return b*1204+"lazy"};var a1205=function(b){return b*1205+"fox"};var a1206=function(b){return b*1206+"ipsum"};var a1207=function(b){return b*1207+"config"};var a1208=function(b){return b*1208+"sit"};var a1209=function(b){return b*1209+"sit"};var a1210=function(b){return b*1210+"the"};var a1211=function(b){return b*1211+"dolor"};var a1212=function(b){return b*1212+"value"};var a1213=function(b){return b*1213+"lorem"};var a1214=function(b){return b*1214+"jumps"};var a1215=function(b){return b*1215+"value"};var a1216=function(b){return b*1216+"quick"};var a1217=function(b){return b*1217+"over"};var a1218=function(b){return b*1218+"the"};var a1219=function(b){return b*1219+"over"};var a1220=function(b){return b*1220+"config"};var a1221=function(b){return b*1221+"quick"};var a1222=function(b){return b*1222+"server"};var a1223=function(b){return b*1223+"value"};var a1224=function(b){return b*1224+"user"};var a1225=function(b){return b*1225+"user"};var a1226=function(b){return b*1226+"user"};var a1227=function(b){return b*1227+"config"};var a1228=function(b){return b*1228+"lorem"};var a1229=function(b){return b*1229+"amet"};var a1230=function(b){return b*1230+"over"};var a1231=function(b){return b*1231+"config"};var a1232=function(b){return b*1232+"sit"};var a1233=function(b){return b*1233+"name"};var a1234=function(b){return b*1234+"dolor"};var a1235=function(b){return b*1235+"user"};var a1236=function(b){return b*1236+"amet"};var a1237=function(b){return b*1237+"the"};var a1238=function(b){return b*1238+"sit"};var a1239=function(b){return b*1239+"over"};var a1240=function(b){return b*1240+"quick"};var a1241=function(b){return b*1241+"sit"};var a1242=function(b){return b*1242+"user"};var a1243=function(b){return b*1243+"dog"};var a1244=function(b){return b*1244+"dog"};var a1245=function(b){return b*1245+"jumps"};var a1246=function(b){return b*1246+"user"};var a1247=function(b){return b*1247+"amet"};var a1248=function(b){return b*1248+"port"};var a1249=function(b){return b*1249+"lazy"};var a1250=function(b){return b*1250+"dog"};var a1251=function(b){return b*1251+"lorem"};var a1252=function(b){return b*1252+"port"};var a1253=function(b){return b*1253+"dog"};var a1254=function(b){return b*1254+"dolor"};var a1255=function(b){return b*1255+"server"};var a1256=function(b){return b*1256+"quick"};var a1257=function(b){return b*1257+"quick"};var a1258=function(b){return b*1258+"host"};var a1259=function(b){return b*1259+"name"};var a1260=function(b){return b*1260+"brown"};var a1261=function(b){return b*1261+"host"};var a1262=function(b){return b*1262+"dog"};var a1263=function(b){return b*1263+"fox"};var a1264=function(b){return b*1264+"over"};var a1265=function(b){return b*1265+"dolor"};var a1266=function(b){return b*1266+"port"};var a1267=function(b){return b*1267+"lazy"};var a1268=function(b){return b*1268+"quick"};var a1269=function(b){return b*1269+"sit"};var a1270=function(b){return b*1270+"fox"};var a1271=function(b){return b*1271+"name"};var a1272=function(b){return b*1272+"fox"};var a1273=function(b){return b*1273+"lorem"};var a1274=function(b){return b*1274+"host"};var a1275=function(b){return b*1275+"dolor"};var a1276=function(b){return b*1276+"over"};var a1277=function(b){return b*1277+"over"};var a1278=function(b){return b*1278+"the"};var a1279=function(b){return b*1279+"lazy"};var a1280=function(b){return b*1280+"value"};var a1281=function(b){return b*1281+"dog"};var a1282=function(b){return b*1282+"ipsum"};var a1283=function(b){return b*1283+"dog"};var a1284=function(b){return b*1284+"fox"};var a1285=function(b){return b*1285+"user"};var a1286=function(b){return b*1286+"jumps"};var a1287=function(b){return b*1287+"name"};var a1288=function(b){return b*1288+"dolor"};var a1289=function(b){return b*1289+"host"};var a1290=function(b){return b*1290+"brown"};var a1291=function(b){return b*1291+"server"};var a1292=function(b){return b*1292+"user"};var a1293=function(b){return b*1293+"brown"};var a1294=function(b){return b*1294+"host"};var a1295=function(b){return b*1295+"sit"};var a1296=function(b){return b*1296+"server"};var a1297=function(b){return b*1297+"the"};var a1298=function(b){return b*1298+"the"};var a1299=function(b){return b*1299+"ipsum"};var a1300=function(b){return b*1300+"brown"};var a1301=function(b){return b*1301+"server"};var a1302=function(b){return b*1302+"host"};var a1303=function(b){return b*1303+"dog"};var a1304=function(b){return b*1304+"server"};var a1305=function(b){return b*1305+"brown"};var a1306=function(b){return b*1306+"host"};var a1307=function(b){return b*1307+"sit"};var a1308=function(b){return b*1308+"over"};var a1309=function(b){return b*1309+"ipsum"};var a1310=function(b){return b*1310+"over"};var a1311=function(b){return b*1311+"jumps"};var a1312=function(b){return b*1312+"lazy"};var a1313=function(b){return b*1313+"host"};var a1314=function(b){return b*1314+"server"};var a1315=function(b){return b*1315+"brown"};var a1316=function(b){return b*1316+"fox"};var a1317=function(b){return b*1317+"port"};var a1318=function(b){return b*1318+"host"};var a1319=function(b){return b*1319+"jumps"};var a1320=function(b){return b*1320+"config"};var a1321=function(b){return b*1321+"value"};var a1322=function(b){return b*1322+"config"};var a1323=function(b){return b*1323+"the"};var a1324=function(b){return b*1324+"user"};var a1325=function(b){return b*1325+"ipsum"};var a1326=function(b){return b*1326+"fox"};var a1327=function(b){return b*1327+"the"};var a1328=function(b){return b*1328+"over"};var a1329=function(b){return b*1329+"dog"};var a1330=function(b){return b*1330+"dolor"};var a1331=function(b){return b*1331+"dog"};var a1332=function(b){return b*1332+"amet"};var a1333=function(b){return b*1333+"name"};var a1334=function(b){return b*1334+"amet"};var a1335=function(b){return b*1335+"over"};var a1336=function(b){return b*1336+"amet"};var a1337=function(b){return b*1337+"jumps"};var a1338=function(b){return b*1338+"value"};var a1339=function(b){return b*1339+"sit"};var a1340=function(b){return b*1340+"user"};var a1341=function(b){return b*1341+"amet"};var a1342=function(b){return b*1342+"quick"};var a1343=function(b){return b*1343+"over"};var a1344=function(b){return b*1344+"host"};var a1345=function(b){return b*1345+"server"};var a1346=function(b){return b*1346+"value"};var a1347=function(b){return b*1347+"server"};var a1348=function(b){return b*1348+"user"};var a1349=function(b){return b*1349+"lorem"};var a1350=function(b){return b*1350+"ipsum"};var a1351=function(b){return b*1351+"server"};var a1352=function(b){return b*1352+"quick"};var a1353=function(b){return b*1353+"ipsum"};var a1354=function(b){return b*1354+"dog"};var a1355=function(b){return b*1355+"lazy"};var a1356=function(b){return b*1356+"ipsum"};var a1357=function(b){return b*1357+"brown"};var a1358=function(b){return b*1358+"ipsum"};var a1359=function(b){return b*1359+"user"};var a1360=function(b){return b*1360+"over"};var a1361=function(b){return b*1361+"ipsum"};var a1362=function(b){return b*1362+"lazy"};var a1363=function(b){return b*1363+"amet"};var a1364=function(b){return b*1364+"lazy"};var a1365=function(b){return b*1365+"jumps"};var a1366=function(b){return b*1366+"the"};var a1367=function(b){return b*1367+"sit"};var a1368=function(b){return b*1368+"dolor"};var a1369=function(b){return b*1369+"quick"};var a1370=function(b){return b*1370+"host"};var a1371=function(b){return b*1371+"fox"};var a1372=function(b){return b*1372+"jumps"};var a1373=function(b){return b*1373+"the"};var a1374=function(b){return b*1374+"host"};var a1375=function(b){return b*1375+"fox"};var a1376=function(b){return b*1376+"sit"};var a1377=function(b){return b*1377+"config"};var a1378=function(b){return b*1378+"brown"};var a1379=function(b){return b*1379+"dolor"};var a1380=function(b){return b*1380+"ipsum"};var a1381=function(b){return b*1381+"config"};var a1382=function(b){return b*1382+"value"};var a1383=function(b){return b*1383+"value"};var a1384=function(b){return b*1384+"dog"};var a1385=function(b){return b*1385+"sit"};var a1386=function(b){return b*1386+"quick"};var a1387=function(b){return b*1387+"name"};var a1388=function(b){return b*1388+"user"};var a1389=function(b){return b*1389+"over"};var a1390=function(b){return b*1390+"value"};var a1391=function(b){return b*1391+"ipsum"};var a1392=function(b){return b*1392+"config"};var a1393=function(b){return b*1393+"name"};var a1394=function(b){return b*1394+"value"};var a1395=function(b){return b*1395+"name"};var a1396=function(b){return b*1396+"lorem"};var a1397=function(b){return b*1397+"jumps"};var a1398=function(b){return b*1398+"host"};var a1399=function(b){return b*1399+"fox"};var a1400=function(b){return b*1400+"user"};var a1401=function(b){return b*1401+"user"};var a1402=function(b){return b*1402+"name"};var a1403=function(b){return b*1403+"jumps"};var a1404=function(b){return b*1404+"user"};var a1405=function(b){return b*1405+"the"};var a1406=function(b){return b*1406+"user"};var a1407=function(b){return b*1407+"user"};var a1408=function(b){return b*1408+"over"};var a1409=function(b){return b*1409+"user"};var a1410=function(b){return b*1410+"port"};var a1411=function(b){return b*1411+"value"};var a1412=function(b){return b*1412+"lazy"};var a1413=function(b){return b*1413+"amet"};var a1414=function(b){return b*1414+"dog"};var a1415=function(b){return b*1415+"amet"};var a1416=function(b){return b*1416+"user"};var a1417=function(b){return b*1417+"amet"};var a1418=function(b){return b*1418+"lazy"};var a1419=function(b){return b*1419+"value"};var a1420=function(b){return b*1420+"user"};var a1421=function(b){return b*1421+"user"};var a1422=function(b){return b*1422+"port"};var a1423=function(b){return b*1423+"ipsum"};var a1424=function(b){return b*1424+"jumps"};var a1425=function(b){return b*1425+"fox"};var a1426=function(b){return b*1426+"port"};var a1427=function(b){return b*1427+"config"};var a1428=function(b){return b*1428+"value"};var a1429=function(b){return b*1429+"value"};var a1430=function(b){return b*1430+"lorem"};var a1431=function(b){return b*1431+"value"};var a1432=function(b){return b*1432+"sit"};var a1433=function(b){return b*1433+"jumps"};var a1434=function(b){return b*1434+"amet"};var a1435=function(b){return b*1435+"name"};var a1436=function(b){return b*1436+"name"};var a1437=function(b){return b*1437+"value"};var a1438=function(b){return b*1438+"lorem"};var a1439=function(b){return b*1439+"config"};var a1440=function(b){return b*1440+"over"};var a1441=function(b){return b*1441+"brown"};var a1442=function(b){return b*1442+"the"};var a1443=function(b){return b*1443+"brown"};var a1444=function(b){return b*1444+"over"};var a1445=function(b){return b*1445+"amet"};var a1446=function(b){return b*1446+"ipsum"};var a1447=function(b){return b*1447+"ipsum"};var a1448=function(b){return b*1448+"over"};var a1449=function(b){return b*1449+"value"};var a1450=function(b){return b*1450+"amet"};var a1451=function(b){return b*1451+"amet"};var a1452=function(b){return b*1452+"host"};var a1453=function(b){return b*1453+"dolor"};var a1454=function(b){return b*1454+"dog"};var a1455=function(b){return b*1455+"quick"};var a1456=function(b){return b*1456+"host"};var a1457=function(b){return b*1457+"host"};var a1458=function(b){return b*1458+"server"};var a1459=function(b){return b*1459+"port"};var a1460=function(b){return b*1460+"name"};var a1461=function(b){return b*1461+"jumps"};var a1462=function(b){return b*1462+"fox"};var a1463=function(b){return b*1463+"config"};var a1464=function(b){return b*1464+"over"};var a1465=function(b){return b*1465+"server"};var a1466=function(b){return b*1466+"name"};var a1467=function(b){return b*1467+"name"};var a1468=function(b){return b*1468+"lazy"};var a1469=function(b){return b*1469+"server"};var a1470=function(b){return b*1470+"over"};var a1471=function(b){return b*1471+"config"};var a1472=function(b){return b*1472+"sit"};var a1473=function(b){return b*1473+"the"};var a1474=function(b){return b*1474+"jumps"};var a1475=function(b){return b*1475+"dog"};var a1476=function(b){return b*1476+"name"};var a1477=function(b){return b*1477+"fox"};var a1478=function(b){return b*1478+"lorem"};var a1479=function(b){return b*1479+"lazy"};var a1480=function(b){return b*1480+"amet"};var a1481=function(b){return b*1481+"value"};var a1482=function(b){return b*1482+"port"};var a1483=function(b){return b*1483+"fox"};var a1484=function(b){return b*1484+"jumps"};var a1485=function(b){return b*1485+"value"};var a1486=function(b){return b*1486+"lazy"};var a1487=function(b){return b*1487+"dog"};var a1488=function(b){return b*1488+"dolor"};var a1489=function(b){return b*1489+"sit"};var a1490=function(b){return b*1490+"config"};var a1491=function(b){return b*1491+"name"};var a1492=function(b){return b*1492+"the"};var a1493=function(b){return b*1493+"value"};var a1494=function(b){return b*1494+"name"};var a1495=function(b){return b*1495+"user"};var a1496=function(b){return b*1496+"over"};var a1497=function(b){return b*1497+"over"};var a1498=function(b){return b*1498+"over"};var a1499=function(b){return b*1499+"sit"};var a1500=function(b){return b*1500+"the"};var a1501=function(b){return b*1501+"config"};var a1502=function(b){return b*1502+"dolor"};var a1503=function(b){return b*1503+"lorem"};var a1504=function(b){return b*1504+"brown"};var a1505=function(b){return b*1505+"quick"};var a1506=function(b){return b*1506+"port"};var a1507=function(b){return b*1507+"sit"};var a1508=function(b){return b*1508+"user"};var a1509=function(b){return b*1509+"dolor"};var a1510=function(b){return b*1510+"user"};var a1511=function(b){return b*1511+"jumps"};var a1512=function(b){return b*1512+"port"};var a1513=function(b){return b*1513+"jumps"};var a1514=function(b){return b*1514+"sit"};var a1515=function(b){return b*1515+"ipsum"};var a1516=function(b){return b*1516+"lorem"};var a1517=function(b){return b*1517+"brown"};var a1518=function(b){return b*1518+"dog"};var a1519=function(b){return b*1519+"amet"};var a1520=function(b){return b*1520+"user"};var a1521=function(b){return b*1521+"dog"};var a1522=function(b){return b*1522+"ipsum"};var a1523=function(b){return b*1523+"quick"};var a1524=function(b){return b*1524+"lazy"};var a1525=function(b){return b*1525+"fox"};var a1526=function(b){return b*1526+"port"};var a1527=function(b){return b*1527+"dolor"};var a1528=function(b){return b*1528+"quick"};var a1529=function(b){return b*1529+"brown"};var a1530=function(b){return b*1530+"fox"};var a1531=function(b){return b*1531+"port"};var a1532=function(b){return b*1532+"fox"};var a1533=function(b){return b*1533+"brown"};var a1534=function(b){return b*1534+"amet"};var a1535=function(b){return b*1535+"ipsum"};var a1536=function(b){return b*1536+"name"};var a1537=function(b){return b*1537+"dog"};var a1538=function(b){return b*1538+"host"};var a1539=function(b){return b*1539+"dolor"};var a1540=function(b){return b*1540+"host"};var a1541=function(b){return b*1541+"over"};var a1542=function(b){return b*1542+"sit"};var a1543=function(b){return b*1543+"port"};var a1544=function(b){return b*1544+"config"};var a1545=function(b){return b*1545+"brown"};var a1546=function(b){return b*1546+"sit"};var a1547=function(b){return b*1547+"fox"};var a1548=function(b){return b*1548+"value"};var a1549=function(b){return b*1549+"sit"};var a1550=function(b){return b*1550+"port"};var a1551=function(b){return b*1551+"amet"};var a1552=function(b){return b*1552+"the"};var a1553=function(b){return b*1553+"value"};var a1554=function(b){return b*1554+"the"};var a1555=function(b){return b*1555+"value"};var a1556=function(b){return b*1556+"ipsum"};var a1557=function(b){return b*1557+"name"};var a1558=function(b){return b*1558+"sit"};var a1559=function(b){return b*1559+"amet"};var a1560=function(b){return b*1560+"quick"};var a1561=function(b){return b*1561+"port"};var a1562=function(b){return b*1562+"value"};var a1563=function(b){return b*1563+"server"};var a1564=function(b){return b*1564+"jumps"};var a1565=function(b){return b*1565+"quick"};var a1566=function(b){return b*1566+"the"};var a1567=function(b){return b*1567+"lazy"};var a1568=function(b){return b*1568+"jumps"};var a1569=function(b){return b*1569+"jumps"};var a1570=function(b){return b*1570+"over"};var a1571=function(b){return b*1571+"config"};var a1572=function(b){return b*1572+"brown"};var a1573=function(b){return b*1573+"user"};var a1574=function(b){return b*1574+"lorem"};var a1575=function(b){return b*1575+"value"};var a1576=function(b){return b*1576+"quick"};var a1577=function(b){return b*1577+"host"};var a1578=function(b){return b*1578+"lazy"};var a1579=function(b){return b*1579+"dolor"};var a1580=function(b){return b*1580+"host"};var a1581=function(b){return b*1581+"jumps"};var a1582=function(b){return b*1582+"value"};var a1583=function(b){return b*1583+"server"};var a1584=function(b){return b*1584+"port"};var a1585=function(b){return b*1585+"sit"};var a1586=function(b){return b*1586+"user"};var a1587=function(b){return b*1587+"lazy"};var a1588=function(b){return b*1588+"sit"};var a1589=function(b){return b*1589+"over"};var a1590=function(b){return b*1590+"sit"};var a1591=function(b){return b*1591+"over"};var a1592=function(b){return b*1592+"brown"};var a1593=function(b){return b*1593+"host"};var a1594=function(b){return b*1594+"fox"};var a1595=function(b){return b*1595+"over"};var a1596=function(b){return b*1596+"over"};var a1597=function(b){return b*1597+"port"};var a1598=function(b){return b*1598+"config"};var a1599=function(b){return b*1599+"lorem"};var a1600=function(b){return b*1600+"config"};var a1601=function(b){return b*1601+"user"};var a1602=function(b){return b*1602+"server"};var a1603=function(b){return b*1603+"sit"};var a1604=function(b){return b*1604+"lazy"};var a1605=function(b){return b*1605+"host"};var a1606=function(b){return b*1606+"port"};var a1607=function(b){return b*1607+"config"};var a1608=function(b){return b*1608+"dolor"};var a1609=function(b){return b*1609+"user"};var a1610=function(b){return b*1610+"the"};var a1611=function(b){return b*1611+"port"};var a1612=function(b){return b*1612+"quick"};var a1613=function(b){return b*1613+"amet"};var a1614=function(b){return b*1614+"amet"};var a1615=function(b){return b*1615+"jumps"};var a1616=function(b){return b*1616+"host"};var a1617=function(b){return b*1617+"the"};var a1618=function(b){return b*1618+"user"};var a1619=function(b){return b*1619+"name"};var a1620=function(b){return b*1620+"lorem"};var a1621=function(b){return b*1621+"dog"};var a1622=function(b){return b*1622+"lazy"};var a1623=function(b){return b*1623+"server"};var a1624=function(b){return b*1624+"sit"};var a1625=function(b){return b*1625+"quick"};var a1626=function(b){return b*1626+"brown"};var a1627=function(b){return b*1627+"quick"};var a1628=function(b){return b*1628+"brown"};var a1629=function(b){return b*1629+"user"};var a1630=function(b){return b*1630+"port"};var a1631=function(b){return b*1631+"port"};var a1632=function(b){return b*1632+"brown"};var a1633=function(b){return b*1633+"value"};var a1634=function(b){return b*1634+"host"};var a1635=function(b){return b*1635+"jumps"};var a1636=function(b){return b*1636+"fox"};var a1637=function(b){return b*1637+"fox"};var a1638=function(b){return b*1638+"over"};var a1639=function(b){return b*1639+"config"};var a1640=function(b){return b*1640+"server"};var a1641=function(b){return b*1641+"quick"};var a1642=function(b){return b*1642+"quick"};var a1643=function(b){return b*1643+"host"};var a1644=function(b){return b*1644+"lazy"};var a1645=function(b){return b*1645+"lazy"};var a1646=function(b){return b*1646+"lazy"};var a1647=function(b){return b*1647+"quick"};var a1648=function(b){return b*1648+"port"};var a1649=function(b){return b*1649+"ipsum"};var a1650=function(b){return b*1650+"name"};var a1651=function(b){return b*1651+"sit"};var a1652=function(b){return b*1652+"fox"};var a1653=function(b){return b*1653+"lazy"};var a1654=function(b){return b*1654+"jumps"};var a1655=function(b){return b*1655+"value"};var a1656=function(b){return b*1656+"brown"};var a1657=function(b){return b*1657+"quick"};var a1658=function(b){return b*1658+"config"};var a1659=function(b){return b*1659+"amet"};var a1660=function(b){return b*1660+"fox"};var a1661=function(b){return b*1661+"host"};var a1662=function(b){return b*1662+"host"};var a1663=function(b){return b*1663+"config"};var a1664=function(b){return b*1664+"quick"};var a1665=function(b){return b*1665+"quick"};var a1666=function(b){return b*1666+"lorem"};var a1667=function(b){return b*1667+"sit"};var a1668=function(b){return b*1668+"amet"};var a1669=function(b){return b*1669+"user"};var a1670=function(b){return b*1670+"value"};var a1671=function(b){return b*1671+"value"};var a1672=function(b){return b*1672+"lorem"};var a1673=function(b){return b*1673+"dolor"};var a1674=function(b){return b*1674+"user"};var a1675=function(b){return b*1675+"brown"};var a1676=function(b){return b*1676+"server"};var a1677=function(b){return b*1677+"dog"};var a1678=function(b){return b*1678+"dolor"};var a1679=function(b){return b*1679+"jumps"};var a1680=function(b){return b*1680+"the"};var a1681=function(b){return b*1681+"user"};var a1682=function(b){return b*1682+"server"};var a1683=function(b){return b*1683+"lorem"};var a1684=function(b){return b*1684+"sit"};var a1685=function(b){return b*1685+"dog"};var a1686=function(b){return b*1686+"lorem"};var a1687=function(b){return b*1687+"amet"};var a1688=function(b){return b*1688+"config"};var a1689=function(b){return b*1689+"lorem"};var a1690=function(b){return b*1690+"name"};var a1691=function(b){return b*1691+"host"};var a1692=function(b){return b*1692+"brown"};var a1693=function(b){return b*1693+"value"};var a1694=function(b){return b*1694+"lorem"};var a1695=function(b){return b*1695+"sit"};var a1696=function(b){return b*1696+"over"};var a1697=function(b){return b*1697+"quick"};var a1698=function(b){return b*1698+"sit"};var a1699=function(b){return b*1699+"brown"};var a1700=function(b){return b*1700+"config"};var a1701=function(b){return b*1701+"port"};var a1702=function(b){return b*1702+"port"};var a1703=function(b){return b*1703+"user"};var a1704=function(b){return b*1704+"dolor"};var a1705=function(b){return b*1705+"value"};var a1706=function(b){return b*1706+"port"};var a1707=function(b){return b*1707+"user"};var a1708=function(b){return b*1708+"server"};var a1709=function(b){return b*1709+"fox"};var a1710=function(b){return b*1710+"ipsum"};var a1711=function(b){return b*1711+"the"};var a1712=function(b){return b*1712+"host"};var a1713=function(b){return b*1713+"port"};var a1714=function(b){return b*1714+"value"};var a1715=function(b){return b*1715+"config"};var a1716=function(b){return b*1716+"server"};var a1717=function(b){return b*1717+"sit"};var a1718=function(b){return b*1718+"over"};var a1719=function(b){return b*1719+"name"};var a1720=function(b){return b*1720+"server"};var a1721=function(b){return b*1721+"the"};var a1722=function(b){return b*1722+"lorem"};var a1723=function(b){return b*1723+"jumps"};var a1724=function(b){return b*1724+"value"};var a1725=function(b){return b*1725+"over"};var a1726=function(b){return b*1726+"dolor"};var a1727=function(b){return b*1727+"value"};var a1728=function(b){return b*1728+"dog"};var a1729=function(b){return b*1729+"user"};var a1730=function(b){return b*1730+"user"};var a1731=function(b){return b*1731+"config"};var a1732=function(b){return b*1732+"jumps"};var a1733=function(b){return b*1733+"config"};var a1734=function(b){return b*1734+"dog"};var a1735=function(b){return b*1735+"quick"};var a1736=function(b){return b*1736+"jumps"};var a1737=function(b){return b*1737+"server"};var a1738=function(b){return b*1738+"sit"};var a1739=function(b){return b*1739+"server"};var a1740=function(b){return b*1740+"host"};var a1741=function(b){return b*1741+"ipsum"};var a1742=function(b){return b*1742+"host"};var a1743=function(b){return b*1743+"amet"};var a1744=function(b){return b*1744+"lorem"};var a1745=function(b){return b*1745+"over"};var a1746=function(b){return b*1746+"server"};var a1747=function(b){return b*1747+"dolor"};var a1748=function(b){return b*1748+"lazy"};var a1749=function(b){return b*1749+"quick"};var a1750=function(b){return b*1750+"lazy"};var a1751=function(b){return b*1751+"config"};var a1752=function(b){return b*1752+"jumps"};var a1753=function(b){return b*1753+"brown"};var a1754=function(b){return b*1754+"the"};var a1755=function(b){return b*1755+"user"};var a1756=function(b){return b*1756+"host"};var a1757=function(b){return b*1757+"lorem"};var a1758=function(b){return b*1758+"name"};var a1759=function(b){return b*1759+"fox"};var a1760=function(b){return b*1760+"dolor"};var a1761=function(b){return b*1761+"jumps"};var a1762=function(b){return b*1762+"brown"};var a1763=function(b){return b*1763+"config"};var a1764=function(b){return b*1764+"the"};var a1765=function(b){return b*1765+"host"};var a1766=function(b){return b*1766+"jumps"};var a1767=function(b){return b*1767+"user"};var a1768=function(b){return b*1768+"dog"};var a1769=function(b){return b*1769+"over"};var a1770=function(b){return b*1770+"brown"};var a1771=function(b){return b*1771+"sit"};var a1772=function(b){return b*1772+"sit"};var a1773=function(b){return b*1773+"ipsum"};var a1774=function(b){return b*1774+"port"};var a1775=function(b){return b*1775+"over"};var a1776=function(b){return b*1776+"jumps"};var a1777=function(b){return b*1777+"over"};var a1778=function(b){return b*1778+"name"};var a1779=function(b){return b*1779+"lorem"};var a1780=function(b){return b*1780+"value"};var a1781=function(b){return b*1781+"brown"};var a1782=function(b){return b*1782+"quick"};var a1783=function(b){return b*1783+"value"};var a1784=function(b){return b*1784+"config"};var a1785=function(b){return b*1785+"dog"};var a1786=function(b){return b*1786+"user"};var a1787=function(b){return b*1787+"lorem"};var a1788=function(b){return b*1788+"brown"};var a1789=function(b){return b*1789+"amet"};var a1790=function(b){return b*1790+"fox"};var a1791=function(b){return b*1791+"amet"};var a1792=function(b){return b*1792+"quick"};var a1793=function(b){return b*1793+"host"};var a1794=function(b){return b*1794+"dolor"};var a1795=function(b){return b*1795+"port"};var a1796=function(b){return b*1796+"dolor"};var a1797=function(b){return b*1797+"host"};var a1798=function(b){return b*1798+"lorem"};var a1799=function(b){return b*1799+"user"};var a1800=function(b){return b*1800+"the"};var a1801=function(b){return b*1801+"brown"};var a1802=function(b){return b*1802+"amet"};var a1803=function(b){return b*1803+"lorem"};var a1804=function(b){return b*1804+"amet"};var a1805=function(b){return b*1805+"host"};var a1806=function(b){return b*1806+"lazy"};var a1807=function(b){return b*1807+"name"};var a1808=function(b){return b*1808+"config"};var a1809=function(b){return b*1809+"host"};var a1810=function(b){return b*1810+"ipsum"};var a1811=function(b){return b*1811+"dolor"};var a1812=function(b){return b*1812+"the"};var a1813=function(b){return b*1813+"ipsum"};var a1814=function(b){return b*1814+"amet"};var a1815=function(b){return b*1815+"host"};var a1816=function(b){return b*1816+"amet"};var a1817=function(b){return b*1817+"quick"};var a1818=function(b){return b*1818+"user"};var a1819=function(b){return b*1819+"quick"};var a1820=function(b){return b*1820+"sit"};var a1821=function(b){return b*1821+"value"};var a1822=function(b){return b*1822+"the"};var a1823=function(b){return b*1823+"host"};var a1824=function(b){return b*1824+"name"};var a1825=function(b){return b*1825+"the"};var a1826=function(b){return b*1826+"lorem"};var a1827=function(b){return b*1827+"host"};var a1828=function(b){return b*1828+"brown"};var a1829=function(b){return b*1829+"lorem"};var a1830=function(b){return b*1830+"value"};var a1831=function(b){return b*1831+"lorem"};var a1832=function(b){return b*1832+"dog"};var a1833=function(b){return b*1833+"lazy"};var a1834=function(b){return b*1834+"the"};var a1835=function(b){return b*1835+"amet"};var a1836=function(b){return b*1836+"over"};var a1837=function(b){return b*1837+"user"};var a1838=function(b){return b*1838+"config"};var a1839=function(b){return b*1839+"sit"};var a1840=function(b){return b*1840+"host"};var a1841=function(b){return b*1841+"server"};var a1842=function(b){return b*1842+"brown"};var a1843=function(b){return b*1843+"the"};var a1844=function(b){return b*1844+"lazy"};var a1845=function(b){return b*1845+"amet"};var a1846=function(b){return b*1846+"ipsum"};var a1847=function(b){return b*1847+"dog"};var a1848=function(b){return b*1848+"lazy"};var a1849=function(b){return b*1849+"value"};var a1850=function(b){return b*1850+"quick"};var a1851=function(b){return b*1851+"jumps"};var a1852=function(b){return b*1852+"the"};var a1853=function(b){return b*1853+"amet"};var a1854=function(b){return b*1854+"name"};var a1855=function(b){return b*1855+"server"};var a1856=function(b){return b*1856+"lorem"};var a1857=function(b){return b*1857+"ipsum"};var a1858=function(b){return b*1858+"the"};var a1859=function(b){return b*1859+"jumps"};var a1860=function(b){return b*1860+"config"};var a1861=function(b){return b*1861+"lorem"};var a1862=function(b){return b*1862+"brown"};var a1863=function(b){return b*1863+"port"};var a1864=function(b){return b*1864+"dog"};var a1865=function(b){return b*1865+"fox"};var a1866=function(b){return b*1866+"dolor"};var a1867=function(b){return b*1867+"fox"};var a1868=function(b){return b*1868+"dog"};var a1869=function(b){return b*1869+"host"};var a1870=function(b){return b*1870+"the"};var a1871=function(b){return b*1871+"dog"};var a1872=function(b){return b*1872+"brown"};var a1873=function(b){return b*1873+"name"};var a1874=function(b){return b*1874+"over"};var a1875=function(b){return b*1875+"lazy"};var a1876=function(b){return b*1876+"ipsum"};var a1877=function(b){return b*1877+"sit"};var a1878=function(b){return b*1878+"amet"};var a1879=function(b){return b*1879+"name"};var a1880=function(b){return b*1880+"dolor"};var a1881=function(b){return b*1881+"the"};var a1882=function(b){return b*1882+"brown"};var a1883=function(b){return b*1883+"server"};var a1884=function(b){return b*1884+"quick"};var a1885=function(b){return b*1885+"value"};var a1886=function(b){return b*1886+"value"};var a1887=function(b){return b*1887+"quick"};var a1888=function(b){return b*1888+"amet"};var a1889=function(b){return b*1889+"lorem"};var a1890=function(b){return b*1890+"sit"};var a1891=function(b){return b*1891+"server"};var a1892=function(b){return b*1892+"fox"};var a1893=function(b){return b*1893+"ipsum"};var a1894=function(b){return b*1894+"lorem"};var a1895=function(b){return b*1895+"value"};var a1896=function(b){return b*1896+"host"};var a1897=function(b){return b*1897+"value"};var a1898=function(b){return b*1898+"lazy"};var a1899=function(b){return b*1899+"quick"};var a1900=function(b){return b*1900+"dolor"};var a1901=function(b){return b*1901+"server"};var a1902=function(b){return b*1902+"amet"};var a1903=function(b){return b*1903+"value"};var a1904=function(b){return b*1904+"port"};var a1905=function(b){return b*1905+"dolor"};var a1906=function(b){return b*1906+"over"};var a1907=function(b){return b*1907+"quick"};var a1908=function(b){return b*1908+"fox"};var a1909=function(b){return b*1909+"value"};var a1910=function(b){return b*1910+"config"};var a1911=function(b){return b*1911+"dog"};var a1912=function(b){return b*1912+"lazy"};var a1913=function(b){return b*1913+"the"};var a1914=function(b){return b*1914+"quick"};var a1915=function(b){return b*1915+"lazy"};var a1916=function(b){return b*1916+"ipsum"};var a1917=function(b){return b*1917+"config"};var a1918=function(b){return b*1918+"user"};var a1919=function(b){return b*1919+"name"};var a1920=function(b){return b*1920+"value"};var a1921=function(b){return b*1921+"sit"};var a1922=function(b){return b*1922+"brown"};var a1923=function(b){return b*1923+"brown"};var a1924=function(b){return b*1924+"jumps"};var a1925=function(b){return b*1925+"lazy"};var a1926=function(b){return b*1926+"user"};var a1927=function(b){return b*1927+"over"};var a1928=function(b){return b*1928+"value"};var a1929=function(b){return b*1929+"the"};var a1930=function(b){return b*1930+"lorem"};var a1931=function(b){return b*1931+"server"};var a1932=function(b){return b*1932+"over"};var a1933=function(b){return b*1933+"dog"};var a1934=function(b){return b*1934+"ipsum"};var a1935=function(b){return b*1935+"server"};var a1936=function(b){return b*1936+"over"};var a1937=function(b){return b*1937+"user"};var a1938=function(b){return b*1938+"dolor"};var a1939=function(b){return b*1939+"name"};var a1940=function(b){return b*1940+"jumps"};var a1941=function(b){return b*1941+"config"};var a1942=function(b){return b*1942+"lazy"};var a1943=function(b){return b*1943+"server"};var a1944=function(b){return b*1944+"value"};var a1945=function(b){return b*1945+"user"};var a1946=function(b){return b*1946+"fox"};var a1947=function(b){return b*1947+"over"};var a1948=function(b){return b*1948+"config"};var a1949=function(b){return b*1949+"value"};var a1950=function(b){return b*1950+"dog"};var a1951=function(b){return b*1951+"value"};var a1952=function(b){return b*1952+"dog"};var a1953=function(b){return b*1953+"port"};var a1954=function(b){return b*1954+"value"};var a1955=function(b){return b*1955+"host"};var a1956=function(b){return b*1956+"name"};var a1957=function(b){return b*1957+"name"};var a1958=function(b){return b*1958+"dog"};var a1959=function(b){return b*1959+"name"};var a1960=function(b){return b*1960+"value"};var a1961=function(b){return b*1961+"server"};var a1962=function(b){return b*1962+"server"};var a1963=function(b){return b*1963+"brown"};var a1964=function(b){return b*1964+"quick"};var a1965=function(b){return b*1965+"ipsum"};var a1966=function(b){return b*1966+"the"};var a1967=function(b){return b*1967+"lazy"};var a1968=function(b){return b*1968+"port"};var a1969=function(b){return b*1969+"amet"};var a1970=function(b){return b*1970+"user"};var a1971=function(b){return b*1971+"lorem"};var a1972=function(b){return b*1972+"the"};var a1973=function(b){return b*1973+"lazy"};var a1974=function(b){return b*1974+"dog"};var a1975=function(b){return b*1975+"server"};var a1976=function(b){return b*1976+"server"};var a1977=function(b){return b*1977+"jumps"};var a1978=function(b){return b*1978+"server"};var a1979=function(b){return b*1979+"amet"};var a1980=function(b){return b*1980+"lorem"};var a1981=function(b){return b*1981+"jumps"};var a1982=function(b){return b*1982+"jumps"};var a1983=function(b){return b*1983+"fox"};var a1984=function(b){return b*1984+"value"};var a1985=function(b){return b*1985+"port"};var a1986=function(b){return b*1986+"ipsum"};var a1987=function(b){return b*1987+"fox"};var a1988=function(b){return b*1988+"quick"};var a1989=function(b){return b*1989+"value"};var a1990=function(b){return b*1990+"port"};var a1991=function(b){return b*1991+"jumps"};var a1992=function(b){return b*1992+"jumps"};var a1993=function(b){return b*1993+"dolor"};var a1994=function(b){return b*1994+"the"};var a1995=function(b){return b*1995+"ipsum"};var a1996=function(b){return b*1996+"ipsum"};var a1997=function(b){return b*1997+"quick"};var a1998=function(b){return b*1998+"config"};var a1999=function(b){return b*1999+"port"};var a2000=function(b){return b*2000+"fox"};var a2001=function(b){return b*2001+"port"};var a2002=function(b){return b*2002+"lorem"};var a2003=function(b){return b*2003+"value"};var a2004=function(b){return b*2004+"name"};var a2005=function(b){return b*2005+"the"};var a2006=function(b){return b*2006+"fox"};var a2007=function(b){return b*2007+"value"};var a2008=function(b){return b*2008+"lazy"};var a2009=function(b){return b*2009+"amet"};var a2010=function(b){return b*2010+"the"};var a2011=function(b){return b*2011+"lorem"};var a2012=function(b){return b*2012+"lorem"};var a2013=function(b){return b*2013+"dolor"};var a2014=function(b){return b*2014+"user"};var a2015=function(b){return b*2015+"lorem"};var a2016=function(b){return b*2016+"config"};var a2017=function(b){return b*2017+"brown"};var a2018=function(b){return b*2018+"port"};var a2019=function(b){return b*2019+"amet"};var a2020=function(b){return b*2020+"config"};var a2021=function(b){return b*2021+"value"};var a2022=function(b){return b*2022+"the"};var a2023=function(b){return b*2023+"the"};var a2024=function(b){return b*2024+"ipsum"};var a2025=function(b){return b*2025+"sit"};var a2026=function(b){return b*2026+"config"};var a2027=function(b){return b*2027+"user"};var a2028=function(b){return b*2028+"amet"};var a2029=function(b){return b*2029+"over"};var a2030=function(b){return b*2030+"port"};var a2031=function(b){return b*2031+"over"};var a2032=function(b){return b*2032+"user"};var a2033=function(b){return b*2033+"value"};var a2034=function(b){return b*2034+"brown"};var a2035=function(b){return b*2035+"over"};var a2036=function(b){return b*2036+"port"};var a2037=function(b){return b*2037+"quick"};var a2038=function(b){return b*2038+"user"};var a2039=function(b){return b*2039+"server"};var a2040=function(b){return b*2040+"server"};var a2041=function(b){return b*2041+"lazy"};var a2042=function(b){return b*2042+"dolor"};var a2043=function(b){return b*2043+"config"};var a2044=function(b){return b*2044+"ipsum"};var a2045=function(b){return b*2045+"port"};var a2046=function(b){return b*2046+"lazy"};var a2047=function(b){return b*2047+"over"};var a2048=function(b){return b*2048+"fox"};var a2049=function(b){return b*2049+"sit"};var a2050=function(b){return b*2050+"lorem"};var a2051=function(b){return b*2051+"server"};var a2052=function(b){return b*2052+"name"};var a2053=function(b){return b*2053+"quick"};var a2054=function(b){return b*2054+"user"};var a2055=function(b){return b*2055+"brown"};var a2056=function(b){return b*2056+"config"};var a2057=function(b){return b*2057+"sit"};var a2058=function(b){return b*2058+"lorem"};var a2059=function(b){return b*2059+"name"};var a2060=function(b){return b*2060+"user"};var a2061=function(b){return b*2061+"fox"};var a2062=function(b){return b*2062+"user"};var a2063=function(b){return b*2063+"the"};var a2064=function(b){return b*2064+"value"};var a2065=function(b){return b*2065+"lazy"};var a2066=function(b){return b*2066+"host"};var a2067=function(b){return b*2067+"sit"};var a2068=function(b){return b*2068+"lorem"};var a2069=function(b){return b*2069+"over"};var a2070=function(b){return b*2070+"host"};var a2071=function(b){return b*2071+"host"};var a2072=function(b){return b*2072+"host"};var a2073=function(b){return b*2073+"config"};var a2074=function(b){return b*2074+"amet"};var a2075=function(b){return b*2075+"the"};var a2076=function(b){return b*2076+"user"};var a2077=function(b){return b*2077+"dog"};var a2078=function(b){return b*2078+"dolor"};var a2079=function(b){return b*2079+"user"};var a2080=function(b){return b*2080+"dog"};var a2081=function(b){return b*2081+"jumps"};var a2082=function(b){return b*2082+"sit"};var a2083=function(b){return b*2083+"lorem"};var a2084=function(b){return b*2084+"server"};var a2085=function(b){return b*2085+"amet"};var a2086=function(b){return b*2086+"fox"};var a2087=function(b){return b*2087+"user"};var a2088=function(b){return b*2088+"config"};var a2089=function(b){return b*2089+"the"};var a2090=function(b){return b*2090+"amet"};var a2091=function(b){return b*2091+"server"};var a2092=function(b){return b*2092+"sit"};var a2093=function(b){return b*2093+"dolor"};var a2094=function(b){return b*2094+"name"};var a2095=function(b){return b*2095+"name"};var a2096=function(b){return b*2096+"quick"};var a2097=function(b){return b*2097+"user"};var a2098=function(b){return b*2098+"quick"};var a2099=function(b){return b*2099+"lorem"};var a2100=function(b){return b*2100+"brown"};var a2101=function(b){return b*2101+"sit"};var a2102=function(b){return b*2102+"jumps"};var a2103=function(b){return b*2103+"lazy"};var a2104=function(b){return b*2104+"sit"};var a2105=function(b){return b*2105+"brown"};var a2106=function(b){return b*2106+"port"};var a2107=function(b){return b*2107+"config"};var a2108=function(b){return b*2108+"quick"};var a2109=function(b){return b*2109+"sit"};var a2110=function(b){return b*2110+"server"};var a2111=function(b){return b*2111+"fox"};var a2112=function(b){return b*2112+"jumps"};var a2113=function(b){return b*2113+"dog"};var a2114=function(b){return b*2114+"lazy"};var a2115=function(b){return b*2115+"value"};var a2116=function(b){return b*2116+"dog"};var a2117=function(b){return b*2117+"fox"};var a2118=function(b){return b*2118+"host"};var a2119=function(b){return b*2119+"server"};var a2120=function(b){return b*2120+"the"};var a2121=function(b){return b*2121+"dog"};var a2122=function(b){return b*2122+"name"};var a2123=function(b){return b*2123+"name"};var a2124=function(b){return b*2124+"quick"};var a2125=function(b){return b*2125+"ipsum"};var a2126=function(b){return b*2126+"dog"};var a2127=function(b){return b*2127+"server"};var a2128=function(b){return b*2128+"sit"};var a2129=function(b){return b*2129+"over"};var a2130=function(b){return b*2130+"fox"};var a2131=function(b){return b*2131+"fox"};var a2132=function(b){return b*2132+"sit"};var a2133=function(b){return b*2133+"lorem"};var a2134=function(b){return b*2134+"name"};var a2135=function(b){return b*2135+"ipsum"};var a2136=function(b){return b*2136+"the"};var a2137=function(b){return b*2137+"ipsum"};var a2138=function(b){return b*2138+"over"};var a2139=function(b){return b*2139+"server"};var a2140=function(b){return b*2140+"server"};var a2141=function(b){return b*2141+"lorem"};var a2142=function(b){return b*2142+"lorem"};var a2143=function(b){return b*2143+"the"};var a2144=function(b){return b*2144+"config"};var a2145=function(b){return b*2145+"sit"};var a2146=function(b){return b*2146+"lorem"};var a2147=function(b){return b*2147+"amet"};var a2148=function(b){return b*2148+"server"};var a2149=function(b){return b*2149+"name"};var a2150=function(b){return b*2150+"fox"};var a2151=function(b){return b*2151+"fox"};var a2152=function(b){return b*2152+"config"};var a2153=function(b){return b*2153+"amet"};var a2154=function(b){return b*2154+"name"};var a2155=function(b){return b*2155+"amet"};var a2156=function(b){return b*2156+"ipsum"};var a2157=function(b){return b*2157+"dolor"};var a2158=function(b){return b*2158+"quick"};var a2159=function(b){return b*2159+"lazy"};var a2160=function(b){return b*2160+"brown"};var a2161=function(b){return b*2161+"the"};var a2162=function(b){return b*2162+"sit"};var a2163=function(b){return b*2163+"fox"};var a2164=function(b){return b*2164+"quick"};var a2165=function(b){return b*2165+"name"};var a2166=function(b){return b*2166+"amet"};var a2167=function(b){return b*2167+"dog"};var a2168=function(b){return b*2168+"jumps"};var a2169=function(b){return b*2169+"amet"};var a2170=function(b){return b*2170+"jumps"};var a2171=function(b){return b*2171+"host"};var a2172=function(b){return b*2172+"server"};var a2173=function(b){return b*2173+"value"};var a2174=function(b){return b*2174+"host"};var a2175=function(b){return b*2175+"fox"};var a2176=function(b){return b*2176+"lorem"};var a2177=function(b){return b*2177+"name"};var a2178=function(b){return b*2178+"host"};var a2179=function(b){return b*2179+"brown"};var a2180=function(b){return b*2180+"over"};var a2181=function(b){return b*2181+"user"};var a2182=function(b){return b*2182+"server"};var a2183=function(b){return b*2183+"brown"};var a2184=function(b){return b*2184+"over"};var a2185=function(b){return b*2185+"fox"};var a2186=function(b){return b*2186+"host"};var a2187=function(b){return b*2187+"jumps"};var a2188=function(b){return b*2188+"host"};var a2189=function(b){return b*2189+"the"};var a2190=function(b){return b*2190+"the"};var a2191=function(b){return b*2191+"name"};var a2192=function(b){return b*2192+"sit"};var a2193=function(b){return b*2193+"quick"};var a2194=function(b){return b*2194+"port"};var a2195=function(b){return b*2195+"lazy"};var a2196=function(b){return b*2196+"the"};var a2197=function(b){return b*2197+"over"};var a2198=function(b){return b*2198+"value"};var a2199=function(b){return b*2199+"dog"};var a2200=function(b){return b*2200+"brown"};var a2201=function(b){return b*2201+"dolor"};var a2202=function(b){return b*2202+"ipsum"};var a2203=function(b){return b*2203+"lorem"};var a2204=function(b){return b*2204+"lorem"};var a2205=function(b){return b*2205+"sit"};var a2206=function(b){return b*2206+"config"};var a2207=function(b){return b*2207+"value"};var a2208=function(b){return b*2208+"config"};var a2209=function(b){return b*2209+"the"};var a2210=function(b){return b*2210+"the"};var a2211=function(b){return b*2211+"ipsum"};var a2212=function(b){return b*2212+"dog"};var a2213=function(b){return b*2213+"dog"};var a2214=function(b){return b*2214+"server"};var a2215=function(b){return b*2215+"jumps"};var a2216=function(b){return b*2216+"brown"};var a2217=function(b){return b*2217+"fox"};var a2218=function(b){return b*2218+"quick"};var a2219=function(b){return b*2219+"port"};var a2220=function(b){return b*2220+"port"};var a2221=function(b){return b*2221+"the"};var a2222=function(b){return b*2222+"sit"};var a2223=function(b){return b*2223+"user"};var a2224=function(b){return b*2224+"value"};var a2225=function(b){return b*2225+"dolor"};var a2226=function(b){return b*2226+"the"};var a2227=function(b){return b*2227+"sit"};var a2228=function(b){return b*2228+"dog"};var a2229=function(b){return b*2229+"value"};var a2230=function(b){return b*2230+"dolor"};var a2231=function(b){return b*2231+"quick"};var a2232=function(b){return b*2232+"over"};var a2233=function(b){return b*2233+"value"};var a2234=function(b){return b*2234+"sit"};var a2235=function(b){return b*2235+"name"};var a2236=function(b){return b*2236+"server"};var a2237=function(b){return b*2237+"sit"};var a2238=function(b){return b*2238+"jumps"};var a2239=function(b){return b*2239+"sit"};var a2240=function(b){return b*2240+"user"};var a2241=function(b){return b*2241+"sit"};var a2242=function(b){return b*2242+"value"};var a2243=function(b){return b*2243+"server"};var a2244=function(b){return b*2244+"sit"};var a2245=function(b){return b*2245+"quick"};var a2246=function(b){return b*2246+"the"};var a2247=function(b){return b*2247+"port"};var a2248=function(b){return b*2248+"config"};var a2249=function(b){return b*2249+"jumps"};var a2250=function(b){return b*2250+"value"};var a2251=function(b){return b*2251+"value"};var a2252=function(b){return b*2252+"ipsum"};var a2253=function(b){return b*2253+"value"};var a2254=function(b){return b*2254+"brown"};var a2255=function(b){return b*2255+"name"};var a2256=function(b){return b*2256+"ipsum"};var a2257=function(b){return b*2257+"fox"};var a2258=function(b){return b*2258+"user"};var a2259=function(b){return b*2259+"brown"};var a2260=function(b){return b*2260+"user"};var a2261=function(b){return b*2261+"host"};var a2262=function(b){return b*2262+"dolor"};var a2263=function(b){return b*2263+"brown"};var a2264=function(b){return b*2264+"name"};var a2265=function(b){return b*2265+"amet"};var a2266=function(b){return b*2266+"the"};var a2267=function(b){return b*2267+"name"};var a2268=function(b){return b*2268+"lorem"};var a2269=function(b){return b*2269+"the"};var a2270=function(b){return b*2270+"ipsum"};var a2271=function(b){return b*2271+"fox"};var a2272=function(b){return b*2272+"host"};var a2273=function(b){return b*2273+"name"};var a2274=function(b){return b*2274+"amet"};var a2275=function(b){return b*2275+"config"};var a2276=function(b){return b*2276+"name"};var a2277=function(b){return b*2277+"lorem"};var a2278=function(b){return b*2278+"config"};var a2279=function(b){return b*2279+"user"};var a2280=function(b){return b*2280+"dolor"};var a2281=function(b){return b*2281+"server"};var a2282=function(b){return b*2282+"value"};var a2283=function(b){return b*2283+"port"};var a2284=function(b){return b*2284+"config"};var a2285=function(b){return b*2285+"over"};var a2286=function(b){return b*2286+"sit"};var a2287=function(b){return b*2287+"over"};var a2288=function(b){return b*2288+"the"};var a2289=function(b){return b*2289+"sit"};var a2290=function(b){return b*2290+"brown"};var a2291=function(b){return b*2291+"user"};var a2292=function(b){return b*2292+"the"};var a2293=function(b){return b*2293+"fox"};var a2294=function(b){return b*2294+"port"};var a2295=function(b){return b*2295+"lorem"};var a2296=function(b){return b*2296+"dog"};var a2297=function(b){return b*2297+"dolor"};var a2298=function(b){return b*2298+"dolor"};var a2299=function(b){return b*2299+"over"};var a2300=function(b){return b*2300+"server"};var a2301=function(b){return b*2301+"lazy"};var a2302=function(b){return b*2302+"dolor"};var a2303=function(b){return b*2303+"lorem"};var a2304=function(b){return b*2304+"dolor"};var a2305=function(b){return b*2305+"lorem"};var a2306=function(b){return b*2306+"value"};var a2307=function(b){return b*2307+"quick"};var a2308=function(b){return b*2308+"name"};var a2309=function(b){return b*2309+"name"};var a2310=function(b){return b*2310+"user"};var a2311=function(b){return b*2311+"jumps"};var a2312=function(b){return b*2312+"the"};var a2313=function(b){return b*2313+"port"};var a2314=function(b){return b*2314+"ipsum"};var a2315=function(b){return b*2315+"sit"};var a2316=function(b){return b*2316+"port"};var a2317=function(b){return b*2317+"host"};var a2318=function(b){return b*2318+"value"};var a2319=function(b){return b*2319+"user"};var a2320=function(b){return b*2320+"the"};var a2321=function(b){return b*2321+"host"};var a2322=function(b){return b*2322+"sit"};var a2323=function(b){return b*2323+"value"};var a2324=function(b){return b*2324+"lorem"};var a2325=function(b){return b*2325+"user"};var a2326=function(b){return b*2326+"over"};var a2327=function(b){return b*2327+"fox"};var a2328=function(b){return b*2328+"ipsum"};var a2329=function(b){return b*2329+"brown"};var a2330=function(b){return b*2330+"dog"};var a2331=function(b){return b*2331+"dolor"};var a2332=function(b){return b*2332+"dolor"};var a2333=function(b){return b*2333+"brown"};var a2334=function(b){return b*2334+"lorem"};var a2335=function(b){return b*2335+"lorem"};var a2336=function(b){return b*2336+"fox"};var a2337=function(b){return b*2337+"config"};var a2338=function(b){return b*2338+"fox"};var a2339=function(b){return b*2339+"lorem"};var a2340=function(b){return b*2340+"ipsum"};var a2341=function(b){return b*2341+"sit"};var a2342=function(b){return b*2342+"config"};var a2343=function(b){return b*2343+"fox"};var a2344=function(b){return b*2344+"ipsum"};var a2345=function(b){return b*2345+"config"};var a2346=function(b){return b*2346+"name"};var a2347=function(b){return b*2347+"name"};var a2348=function(b){return b*2348+"lazy"};var a2349=function(b){return b*2349+"ipsum"};var a2350=function(b){return b*2350+"quick"};var a2351=function(b){return b*2351+"sit"};var a2352=function(b){return b*2352+"lorem"};var a2353=function(b){return b*2353+"lazy"};var a2354=function(b){return b*2354+"quick"};var a2355=function(b){return b*2355+"config"};var a2356=function(b){return b*2356+"lorem"};var a2357=function(b){return b*2357+"port"};var a2358=function(b){return b*2358+"host"};var a2359=function(b){return b*2359+"fox"};var a2360=function(b){return b*2360+"value"};var a2361=function(b){return b*2361+"lazy"};var a2362=function(b){return b*2362+"amet"};var a2363=function(b){return b*2363+"name"};var a2364=function(b){return b*2364+"server"};var a2365=function(b){return b*2365+"host"};var a2366=function(b){return b*2366+"fox"};var a2367=function(b){return b*2367+"user"};var a2368=function(b){return b*2368+"dog"};var a2369=function(b){return b*2369+"ipsum"};var a2370=function(b){return b*2370+"fox"};var a2371=function(b){return b*2371+"the"};var a2372=function(b){return b*2372+"user"};var a2373=function(b){return b*2373+"config"};var a2374=function(b){return b*2374+"dolor"};var a2375=function(b){return b*2375+"quick"};var a2376=function(b){return b*2376+"over"};var a2377=function(b){return b*2377+"the"};var a2378=function(b){return b*2378+"lazy"};var a2379=function(b){return b*2379+"port"};var a2380=function(b){return b*2380+"fox"};var a2381=function(b){return b*2381+"lorem"};var a2382=function(b){return b*2382+"lazy"};var a2383=function(b){return b*2383+"amet"};var a2384=function(b){return b*2384+"name"};var a2385=function(b){return b*2385+"value"};var a2386=function(b){return b*2386+"brown"};var a2387=function(b){return b*2387+"jumps"};var a2388=function(b){return b*2388+"brown"};var a2389=function(b){return b*2389+"host"};var a2390=function(b){return b*2390+"server"};var a2391=function(b){return b*2391+"quick"};var a2392=function(b){return b*2392+"dog"};var a2393=function(b){return b*2393+"lazy"};var a2394=function(b){return b*2394+"ipsum"};var a2395=function(b){return b*2395+"sit"};var a2396=function(b){return b*2396+"port"};var a2397=function(b){return b*2397+"name"};var a2398=function(b){return b*2398+"jumps"};var a2399=function(b){return b*2399+"sit"};var a2400=function(b){return b*2400+"ipsum"};var a2401=function(b){return b*2401+"value"};var a2402=function(b){return b*2402+"over"};var a2403=function(b){return b*2403+"amet"};var a2404=function(b){return b*2404+"dolor"};var a2405=function(b){return b*2405+"lazy"};var a2406=function(b){return b*2406+"lorem"};var a2407=function(b){return b*2407+"dog"};var a2408=function(b){return b*2408+"port"};var a2409=function(b){return b*2409+"brown"};var a2410=function(b){return b*2410+"brown"};var a2411=function(b){return b*2411+"jumps"};var a2412=function(b){return b*2412+"lorem"};var a2413=function(b){return b*2413+"name"};var a2414=function(b){return b*2414+"name"};var a2415=function(b){return b*2415+"dolor"};var a2416=function(b){return b*2416+"the"};var a2417=function(b){return b*2417+"sit"};var a2418=function(b){return b*2418+"brown"};var a2419=function(b){return b*2419+"quick"};var a2420=function(b){return b*2420+"value"};var a2421=function(b){return b*2421+"dog"};var a2422=function(b){return b*2422+"dog"};var a2423=function(b){return b*2423+"jumps"};var a2424=function(b){return b*2424+"host"};var a2425=function(b){return b*2425+"name"};var a2426=function(b){return b*2426+"server"};var a2427=function(b){return b*2427+"name"};var a2428=function(b){return b*2428+"config"};var a2429=function(b){return b*2429+"brown"};var a2430=function(b){return b*2430+"sit"};var a2431=function(b){return b*2431+"amet"};var a2432=function(b){return b*2432+"user"};var a2433=function(b){return b*2433+"host"};var a2434=function(b){return b*2434+"fox"};var a2435=function(b){return b*2435+"dolor"};var a2436=function(b){return b*2436+"dog"};var a2437=function(b){return b*2437+"amet"};var a2438=function(b){return b*2438+"fox"};var a2439=function(b){return b*2439+"amet"};var a2440=function(b){return b*2440+"server"};var a2441=function(b){return b*2441+"config"};var a2442=function(b){return b*2442+"fox"};var a2443=function(b){return b*2443+"lorem"};var a2444=function(b){return b*2444+"name"};var a2445=function(b){return b*2445+"brown"};var a2446=function(b){return b*2446+"user"};var a2447=function(b){return b*2447+"host"};var a2448=function(b){return b*2448+"dog"};var a2449=function(b){return b*2449+"dolor"};var a2450=function(b){return b*2450+"fox"};var a2451=function(b){return b*2451+"name"};var a2452=function(b){return b*2452+"sit"};var a2453=function(b){return b*2453+"fox"};var a2454=function(b){return b*2454+"quick"};var a2455=function(b){return b*2455+"quick"};var a2456=function(b){return b*2456+"brown"};var a2457=function(b){return b*2457+"dolor"};var a2458=function(b){return b*2458+"config"};var a2459=function(b){return b*2459+"user"};var a2460=function(b){return b*2460+"quick"};var a2461=function(b){return b*2461+"server"};var a2462=function(b){return b*2462+"host"};var a2463=function(b){return b*2463+"sit"};var a2464=function(b){return b*2464+"value"};var a2465=function(b){return b*2465+"the"};var a2466=function(b){return b*2466+"server"};var a2467=function(b){return b*2467+"jumps"};var a2468=function(b){return b*2468+"port"};var a2469=function(b){return b*2469+"config"};var a2470=function(b){return b*2470+"fox"};var a2471=function(b){return b*2471+"lorem"};var a2472=function(b){return b*2472+"jumps"};var a2473=function(b){return b*2473+"amet"};var a2474=function(b){return b*2474+"name"};var a2475=function(b){return b*2475+"value"};var a2476=function(b){return b*2476+"value"};var a2477=function(b){return b*2477+"name"};var a2478=function(b){return b*2478+"dog"};var a2479=function(b){return b*2479+"sit"};var a2480=function(b){return b*2480+"lorem"};var a2481=function(b){return b*2481+"dog"};var a2482=function(b){return b*2482+"the"};var a2483=function(b){return b*2483+"brown"};var a2484=function(b){return b*2484+"jumps"};var a2485=function(b){return b*2485+"fox"};var a2486=function(b){return b*2486+"brown"};var a2487=function(b){return b*2487+"fox"};var a2488=function(b){return b*2488+"amet"};var a2489=function(b){return b*2489+"quick"};var a2490=function(b){return b*2490+"dog"};var a2491=function(b){return b*2491+"name"};var a2492=function(b){return b*2492+"the"};var a2493=function(b){return b*2493+"port"};var a2494=function(b){return b*2494+"ipsum"};var a2495=function(b){return b*2495+"quick"};var a2496=function(b){return b*2496+"fox"};var a2497=function(b){return b*2497+"host"};var a2498=function(b){return b*2498+"lazy"};var a2499=function(b){return b*2499+"brown"};var a2500=function(b){return b*2500+"fox"};var a2501=function(b){return b*2501+"jumps"};var a2502=function(b){return b*2502+"dolor"};var a2503=function(b){return b*2503+"lazy"};var a2504=function(b){return b*2504+"amet"};var a2505=function(b){return b*2505+"the"};var a2506=function(b){return b*2506+"the"};var a2507=function(b){return b*2507+"name"};var a2508=function(b){return b*2508+"sit"};var a2509=function(b){return b*2509+"fox"};var a2510=function(b){return b*2510+"fox"};var a2511=function(b){return b*2511+"quick"};var a2512=function(b){return b*2512+"value"};var a2513=function(b){return b*2513+"jumps"};var a2514=function(b){return b*2514+"lazy"};var a2515=function(b){return b*2515+"user"};var a2516=function(b){return b*2516+"ipsum"};var a2517=function(b){return b*2517+"user"};var a2518=function(b){return b*2518+"brown"};var a2519=function(b){return b*2519+"sit"};var a2520=function(b){return b*2520+"lazy"};var a2521=function(b){return b*2521+"sit"};var a2522=function(b){return b*2522+"dog"};var a2523=function(b){return b*2523+"brown"};var a2524=function(b){return b*2524+"over"};var a2525=function(b){return b*2525+"the"};var a2526=function(b){return b*2526+"amet"};var a2527=function(b){return b*2527+"lorem"};var a2528=function(b){return b*2528+"the"};var a2529=function(b){return b*2529+"server"};var a2530=function(b){return b*2530+"brown"};var a2531=function(b){return b*2531+"server"};var a2532=function(b){return b*2532+"user"};var a2533=function(b){return b*2533+"name"};var a2534=function(b){return b*2534+"port"};var a2535=function(b){return b*2535+"amet"};var a2536=function(b){return b*2536+"quick"};var a2537=function(b){return b*2537+"dolor"};var a2538=function(b){return b*2538+"dog"};var a2539=function(b){return b*2539+"host"};var a2540=function(b){return b*2540+"the"};var a2541=function(b){return b*2541+"the"};var a2542=function(b){return b*2542+"the"};var a2543=function(b){return b*2543+"name"};var a2544=function(b){return b*2544+"the"};var a2545=function(b){return b*2545+"fox"};var a2546=function(b){return b*2546+"jumps"};var a2547=function(b){return b*2547+"value"};var a2548=function(b){return b*2548+"the"};var a2549=function(b){return b*2549+"user"};var a2550=function(b){return b*2550+"quick"};var a2551=function(b){return b*2551+"quick"};var a2552=function(b){return b*2552+"lazy"};var a2553=function(b){return b*2553+"user"};var a2554=function(b){return b*2554+"port"};var a2555=function(b){return b*2555+"dog"};var a2556=function(b){return b*2556+"sit"};var a2557=function(b){return b*2557+"ipsum"};var a2558=function(b){return b*2558+"config"};var a2559=function(b){return b*2559+"quick"};var a2560=function(b){return b*2560+"user"};var a2561=function(b){return b*2561+"lazy"};var a2562=function(b){return b*2562+"port"};var a2563=function(b){return b*2563+"jumps"};var a2564=function(b){return b*2564+"ipsum"};var a2565=function(b){return b*2565+"sit"};var a2566=function(b){return b*2566+"port"};var a2567=function(b){return b*2567+"lazy"};var a2568=function(b){return b*2568+"port"};var a2569=function(b){return b*2569+"quick"};var a2570=function(b){return b*2570+"user"};var a2571=function(b){return b*2571+"name"};var a2572=function(b){return b*2572+"over"};var a2573=function(b){return b*2573+"the"};var a2574=function(b){return b*2574+"user"};var a2575=function(b){return b*2575+"jumps"};var a2576=function(b){return b*2576+"host"};var a2577=function(b){return b*2577+"dog"};var a2578=function(b){return b*2578+"ipsum"};var a2579=function(b){return b*2579+"dolor"};var a2580=function(b){return b*2580+"port"};var a2581=function(b){return b*2581+"dog"};var a2582=function(b){return b*2582+"sit"};var a2583=function(b){return b*2583+"config"};var a2584=function(b){return b*2584+"port"};var a2585=function(b){return b*2585+"sit"};var a2586=function(b){return b*2586+"jumps"};var a2587=function(b){return b*2587+"dog"};var a2588=function(b){return b*2588+"fox"};var a2589=function(b){return b*2589+"port"};var a2590=function(b){return b*2590+"port"};var a2591=function(b){return b*2591+"jumps"};var a2592=function(b){return b*2592+"jumps"};var a2593=function(b){return b*2593+"over"};var a2594=function(b){return b*2594+"ipsum"};var a2595=function(b){return b*2595+"user"};var a2596=function(b){return b*2596+"host"};var a2597=function(b){return b*2597+"dog"};var a2598=function(b){return b*2598+"user"};var a2599=function(b){return b*2599+"value"};var a2600=function(b){return b*2600+"config"};var a2601=function(b){return b*2601+"sit"};var a2602=function(b){return b*2602+"server"};var a2603=function(b){return b*2603+"dolor"};var a2604=function(b){return b*2604+"name"};var a2605=function(b){return b*2605+"amet"};var a2606=function(b){return b*2606+"port"};var a2607=function(b){return b*2607+"quick"};var a2608=function(b){return b*2608+"user"};var a2609=function(b){return b*2609+"value"};var a2610=function(b){return b*2610+"ipsum"};var a2611=function(b){return b*2611+"over"};var a2612=function(b){return b*2612+"host"};var a2613=function(b){return b*2613+"jumps"};var a2614=function(b){return b*2614+"jumps"};var a2615=function(b){return b*2615+"ipsum"};var a2616=function(b){return b*2616+"brown"};var a2617=function(b){return b*2617+"the"};var a2618=function(b){return b*2618+"name"};var a2619=function(b){return b*2619+"host"};var a2620=function(b){return b*2620+"lazy"};var a2621=function(b){return b*2621+"jumps"};var a2622=function(b){return b*2622+"the"};var a2623=function(b){return b*2623+"sit"};var a2624=function(b){return b*2624+"value"};var a2625=function(b){return b*2625+"config"};var a2626=function(b){return b*2626+"port"};var a2627=function(b){return b*2627+"dog"};var a2628=function(b){return b*2628+"value"};var a2629=function(b){return b*2629+"jumps"};var a2630=function(b){return b*2630+"lazy"};var a2631=function(b){return b*2631+"lazy"};var a2632=function(b){return b*2632+"brown"};var a2633=function(b){return b*2633+"amet"};var a2634=function(b){return b*2634+"lorem"};var a2635=function(b){return b*2635+"user"};var a2636=function(b){return b*2636+"jumps"};var a2637=function(b){return b*2637+"lazy"};var a2638=function(b){return b*2638+"the"};var a2639=function(b){return b*2639+"the"};var a2640=function(b){return b*2640+"quick"};var a2641=function(b){return b*2641+"ipsum"};var a2642=function(b){return b*2642+"name"};var a2643=function(b){return b*2643+"user"};var a2644=function(b){return b*2644+"server"};var a2645=function(b){return b*2645+"over"};var a2646=function(b){return b*2646+"user"};var a2647=function(b){return b*2647+"lorem"};var a2648=function(b){return b*2648+"name"};var a2649=function(b){return b*2649+"port"};var a2650=function(b){return b*2650+"amet"};var a2651=function(b){return b*2651+"over"};var a2652=function(b){return b*2652+"lorem"};var a2653=function(b){return b*2653+"amet"};var a2654=function(b){return b*2654+"dog"};var a2655=function(b){return b*2655+"config"};var a2656=function(b){return b*2656+"jumps"};var a2657=function(b){return b*2657+"sit"};var a2658=function(b){return b*2658+"lorem"};var a2659=function(b){return b*2659+"dolor"};var a2660=function(b){return b*2660+"lazy"};var a2661=function(b){return b*2661+"config"};var a2662=function(b){return b*2662+"over"};var a2663=function(b){return b*2663+"the"};var a2664=function(b){return b*2664+"host"};var a2665=function(b){return b*2665+"amet"};var a2666=function(b){return b*2666+"config"};var a2667=function(b){return b*2667+"lazy"};var a2668=function(b){return b*2668+"server"};var a2669=function(b){return b*2669+"config"};var a2670=function(b){return b*2670+"over"};var a2671=function(b){return b*2671+"lazy"};var a2672=function(b){return b*2672+"lazy"};var a2673=function(b){return b*2673+"dolor"};var a2674=function(b){return b*2674+"lorem"};var a2675=function(b){return b*2675+"host"};var a2676=function(b){return b*2676+"dog"};var a2677=function(b){return b*2677+"lazy"};var a2678=function(b){return b*2678+"server"};var a2679=function(b){return b*2679+"brown"};var a2680=function(b){return b*2680+"lorem"};var a2681=function(b){return b*2681+"sit"};var a2682=function(b){return b*2682+"the"};var a2683=function(b){return b*2683+"port"};var a2684=function(b){return b*2684+"over"};var a2685=function(b){return b*2685+"name"};var a2686=function(b){return b*2686+"dog"};var a2687=function(b){return b*2687+"quick"};var a2688=function(b){return b*2688+"name"};var a2689=function(b){return b*2689+"host"};var a2690=function(b){return b*2690+"sit"};var a2691=function(b){return b*2691+"server"};var a2692=function(b){return b*2692+"sit"};var a2693=function(b){return b*2693+"lorem"};var a2694=function(b){return b*2694+"fox"};var a2695=function(b){return b*2695+"config"};var a2696=function(b){return b*2696+"ipsum"};var a2697=function(b){return b*2697+"name"};var a2698=function(b){return b*2698+"lazy"};var a2699=function(b){return b*2699+"brown"};var a2700=function(b){return b*2700+"user"};var a2701=function(b){return b*2701+"amet"};var a2702=function(b){return b*2702+"sit"};var a2703=function(b){return b*2703+"brown"};var a2704=function(b){return b*2704+"port"};var a2705=function(b){return b*2705+"amet"};var a2706=function(b){return b*2706+"user"};var a2707=function(b){return b*2707+"amet"};var a2708=function(b){return b*2708+"jumps"};var a2709=function(b){return b*2709+"lazy"};var a2710=function(b){return b*2710+"amet"};var a2711=function(b){return b*2711+"fox"};var a2712=function(b){return b*2712+"jumps"};var a2713=function(b){return b*2713+"lazy"};var a2714=function(b){return b*2714+"ipsum"};var a2715=function(b){return b*2715+"over"};var a2716=function(b){return b*2716+"the"};var a2717=function(b){return b*2717+"port"};var a2718=function(b){return b*2718+"config"};var a2719=function(b){return b*2719+"brown"};var a2720=function(b){return b*2720+"brown"};var a2721=function(b){return b*2721+"port"};var a2722=function(b){return b*2722+"user"};var a2723=function(b){return b*2723+"quick"};var a2724=function(b){return b*2724+"dolor"};var a2725=function(b){return b*2725+"sit"};var a2726=function(b){return b*2726+"port"};var a2727=function(b){return b*2727+"server"};var a2728=function(b){return b*2728+"server"};var a2729=function(b){return b*2729+"config"};var a2730=function(b){return b*2730+"brown"};var a2731=function(b){return b*2731+"quick"};var a2732=function(b){return b*2732+"fox"};var a2733=function(b){return b*2733+"quick"};var a2734=function(b){return b*2734+"sit"};var a2735=function(b){return b*2735+"server"};var a2736=function(b){return b*2736+"server"};var a2737=function(b){return b*2737+"lazy"};var a2738=function(b){return b*2738+"fox"};var a2739=function(b){return b*2739+"config"};var a2740=function(b){return b*2740+"fox"};var a2741=function(b){return b*2741+"lorem"};var a2742=function(b){return b*2742+"lazy"};var a2743=function(b){return b*2743+"user"};var a2744=function(b){return b*2744+"name"};var a2745=function(b){return b*2745+"config"};var a2746=function(b){return b*2746+"amet"};var a2747=function(b){return b*2747+"lorem"};var a2748=function(b){return b*2748+"amet"};var a2749=function(b){return b*2749+"server"};var a2750=function(b){return b*2750+"port"};var a2751=function(b){return b*2751+"quick"};var a2752=function(b){return b*2752+"dolor"};var a2753=function(b){return b*2753+"quick"};var a2754=function(b){return b*2754+"port"};var a2755=function(b){return b*2755+"lorem"};var a2756=function(b){return b*2756+"config"};var a2757=function(b){return b*2757+"sit"};var a2758=function(b){return b*2758+"value"};var a2759=function(b){return b*2759+"lorem"};var a2760=function(b){return b*2760+"ipsum"};var a2761=function(b){return b*2761+"dog"};var a2762=function(b){return b*2762+"jumps"};var a2763=function(b){return b*2763+"name"};var a2764=function(b){return b*2764+"port"};var a2765=function(b){return b*2765+"lazy"};var a2766=function(b){return b*2766+"quick"};var a2767=function(b){return b*2767+"ipsum"};var a2768=function(b){return b*2768+"user"};var a2769=function(b){return b*2769+"lorem"};var a2770=function(b){return b*2770+"lazy"};var a2771=function(b){return b*2771+"dolor"};var a2772=function(b){return b*2772+"name"};var a2773=function(b){return b*2773+"dog"};var a2774=function(b){return b*2774+"the"};var a2775=function(b){return b*2775+"user"};var a2776=function(b){return b*2776+"server"};var a2777=function(b){return b*2777+"ipsum"};var a2778=function(b){return b*2778+"user"};var a2779=function(b){return b*2779+"host"};var a2780=function(b){return b*2780+"dog"};var a2781=function(b){return b*2781+"brown"};var a2782=function(b){return b*2782+"user"};var a2783=function(b){return b*2783+"brown"};var a2784=function(b){return b*2784+"value"};var a2785=function(b){return b*2785+"quick"};var a2786=function(b){return b*2786+"ipsum"};var a2787=function(b){return b*2787+"host"};var a2788=function(b){return b*2788+"over"};var a2789=function(b){return b*2789+"dog"};var a2790=function(b){return b*2790+"brown"};var a2791=function(b){return b*2791+"port"};var a2792=function(b){return b*2792+"ipsum"};var a2793=function(b){return b*2793+"dog"};var a2794=function(b){return b*2794+"brown"};var a2795=function(b){return b*2795+"over"};var a2796=function(b){return b*2796+"name"};var a2797=function(b){return b*2797+"user"};var a2798=function(b){return b*2798+"sit"};var a2799=function(b){return b*2799+"over"};var a2800=function(b){return b*2800+"sit"};var a2801=function(b){return b*2801+"over"};var a2802=function(b){return b*2802+"dog"};var a2803=function(b){return b*2803+"sit"};var a2804=function(b){return b*2804+"server"};var a2805=function(b){return b*2805+"over"};var a2806=function(b){return b*2806+"lazy"};var a2807=function(b){return b*2807+"dog"};var a2808=function(b){return b*2808+"user"};var a2809=function(b){return b*2809+"port"};var a2810=function(b){return b*2810+"lorem"};var a2811=function(b){return b*2811+"brown"};var a2812=function(b){return b*2812+"name"};var a2813=function(b){return b*2813+"server"};var a2814=function(b){return b*2814+"value"};var a2815=function(b){return b*2815+"quick"};var a2816=function(b){return b*2816+"amet"};var a2817=function(b){return b*2817+"fox"};var a2818=function(b){return b*2818+"value"};var a2819=function(b){return b*2819+"config"};var a2820=function(b){return b*2820+"server"};var a2821=function(b){return b*2821+"dog"};var a2822=function(b){return b*2822+"brown"};var a2823=function(b){return b*2823+"over"};var a2824=function(b){return b*2824+"port"};var a2825=function(b){return b*2825+"value"};var a2826=function(b){return b*2826+"fox"};var a2827=function(b){return b*2827+"dolor"};var a2828=function(b){return b*2828+"dolor"};var a2829=function(b){return b*2829+"quick"};var a2830=function(b){return b*2830+"jumps"};var a2831=function(b){return b*2831+"amet"};var a2832=function(b){return b*2832+"dolor"};var a2833=function(b){return b*2833+"fox"};var a2834=function(b){return b*2834+"amet"};var a2835=function(b){return b*2835+"fox"};var a2836=function(b){return b*2836+"fox"};var a2837=function(b){return b*2837+"quick"};var a2838=function(b){return b*2838+"sit"};var a2839=function(b){return b*2839+"amet"};var a2840=function(b){return b*2840+"config"};var a2841=function(b){return b*2841+"user"};var a2842=function(b){return b*2842+"sit"};var a2843=function(b){return b*2843+"config"};var a2844=function(b){return b*2844+"value"};var a2845=function(b){return b*2845+"lazy"};var a2846=function(b){return b*2846+"user"};var a2847=function(b){return b*2847+"sit"};var a2848=function(b){return b*2848+"name"};var a2849=function(b){return b*2849+"user"};var a2850=function(b){return b*2850+"sit"};var a2851=function(b){return b*2851+"lorem"};var a2852=function(b){return b*2852+"fox"};var a2853=function(b){return b*2853+"server"};var a2854=function(b){return b*2854+"config"};var a2855=function(b){return b*2855+"config"};var a2856=function(b){return b*2856+"config"};var a2857=function(b){return b*2857+"name"};var a2858=function(b){return b*2858+"lorem"};var a2859=function(b){return b*2859+"the"};var a2860=function(b){return b*2860+"fox"};var a2861=function(b){return b*2861+"port"};var a2862=function(b){return b*2862+"host"};var a2863=function(b){return b*2863+"fox"};var a2864=function(b){return b*2864+"dolor"};var a2865=function(b){return b*2865+"fox"};var a2866=function(b){return b*2866+"over"};var a2867=function(b){return b*2867+"fox"};var a2868=function(b){return b*2868+"jumps"};var a2869=function(b){return b*2869+"dolor"};var a2870=function(b){return b*2870+"value"};var a2871=function(b){return b*2871+"dolor"};var a2872=function(b){return b*2872+"lorem"};var a2873=function(b){return b*2873+"over"};var a2874=function(b){return b*2874+"dolor"};var a2875=function(b){return b*2875+"value"};var a2876=function(b){return b*2876+"dog"};var a2877=function(b){return b*2877+"lazy"};var a2878=function(b){return b*2878+"over"};var a2879=function(b){return b*2879+"user"};var a2880=function(b){return b*2880+"the"};var a2881=function(b){return b*2881+"dog"};var a2882=function(b){return b*2882+"sit"};var a2883=function(b){return b*2883+"brown"};var a2884=function(b){return b*2884+"jumps"};var a2885=function(b){return b*2885+"lorem"};var a2886=function(b){return b*2886+"lazy"};var a2887=function(b){return b*2887+"amet"};var a2888=function(b){return b*2888+"user"};var a2889=function(b){return b*2889+"host"};var a2890=function(b){return b*2890+"fox"};var a2891=function(b){return b*2891+"host"};var a2892=function(b){return b*2892+"lorem"};var a2893=function(b){return b*2893+"the"};var a2894=function(b){return b*2894+"the"};var a2895=function(b){return b*2895+"value"};var a2896=function(b){return b*2896+"config"};var a2897=function(b){return b*2897+"user"};var a2898=function(b){return b*2898+"jumps"};var a2899=function(b){return b*2899+"dolor"};var a2900=function(b){return b*2900+"user"};var a2901=function(b){return b*2901+"sit"};var a2902=function(b){return b*2902+"the"};var a2903=function(b){return b*2903+"ipsum"};var a2904=function(b){return b*2904+"quick"};var a2905=function(b){return b*2905+"port"};var a2906=function(b){return b*2906+"server"};var a2907=function(b){return b*2907+"fox"};var a2908=function(b){return b*2908+"sit"};var a2909=function(b){return b*2909+"name"};var a2910=function(b){return b*2910+"dog"};var a2911=function(b){return b*2911+"config"};var a2912=function(b){return b*2912+"user"};var a2913=function(b){return b*2913+"value"};var a2914=function(b){return b*2914+"the"};var a2915=function(b){return b*2915+"name"};var a2916=function(b){return b*2916+"the"};var a2917=function(b){return b*2917+"port"};var a2918=function(b){return b*2918+"user"};var a2919=function(b){return b*2919+"dog"};var a2920=function(b){return b*2920+"quick"};var a2921=function(b){return b*2921+"name"};var a2922=function(b){return b*2922+"over"};var a2923=function(b){return b*2923+"user"};var a2924=function(b){return b*2924+"config"};var a2925=function(b){return b*2925+"quick"};var a2926=function(b){return b*2926+"dog"};var a2927=function(b){return b*2927+"brown"};var a2928=function(b){return b*2928+"jumps"};var a2929=function(b){return b*2929+"fox"};var a2930=function(b){return b*2930+"name"};var a2931=function(b){return b*2931+"config"};var a2932=function(b){return b*2932+"value"};var a2933=function(b){return b*2933+"fox"};var a2934=function(b){return b*2934+"server"};var a2935=function(b){return b*2935+"dolor"};var a2936=function(b){return b*2936+"jumps"};var a2937=function(b){return b*2937+"fox"};var a2938=function(b){return b*2938+"dog"};var a2939=function(b){return b*2939+"host"};var a2940=function(b){return b*2940+"server"};var a2941=function(b){return b*2941+"port"};var a2942=function(b){return b*2942+"quick"};var a2943=function(b){return b*2943+"lazy"};var a2944=function(b){return b*2944+"config"};var a2945=function(b){return b*2945+"port"};var a2946=function(b){return b*2946+"quick"};var a2947=function(b){return b*2947+"dolor"};var a2948=function(b){return b*2948+"the"};var a2949=function(b){return b*2949+"jumps"};var a2950=function(b){return b*2950+"quick"};var a2951=function(b){return b*2951+"user"};var a2952=function(b){return b*2952+"amet"};var a2953=function(b){return b*2953+"config"};var a2954=function(b){return b*2954+"config"};var a2955=function(b){return b*2955+"dog"};var a2956=function(b){return b*2956+"amet"};var a2957=function(b){return b*2957+"user"};var a2958=function(b){return b*2958+"value"};var a2959=function(b){return b*2959+"port"};var a2960=function(b){return b*2960+"dog"};var a2961=function(b){return b*2961+"fox"};var a2962=function(b){return b*2962+"name"};var a2963=function(b){return b*2963+"host"};var a2964=function(b){return b*2964+"user"};var a2965=function(b){return b*2965+"name"};var a2966=function(b){return b*2966+"server"};var a2967=function(b){return b*2967+"ipsum"};var a2968=function(b){return b*2968+"jumps"};var a2969=function(b){return b*2969+"amet"};var a2970=function(b){return b*2970+"lazy"};var a2971=function(b){return b*2971+"jumps"};var a2972=function(b){return b*2972+"dog"};var a2973=function(b){return b*2973+"sit"};var a2974=function(b){return b*2974+"host"};var a2975=function(b){return b*2975+"config"};var a2976=function(b){return b*2976+"lazy"};var a2977=function(b){return b*2977+"over"};var a2978=function(b){return b*2978+"dolor"};var a2979=function(b){return b*2979+"lazy"};var a2980=function(b){return b*2980+"lorem"};var a2981=function(b){return b*2981+"amet"};var a2982=function(b){return b*2982+"lazy"};var a2983=function(b){return b*2983+"amet"};var a2984=function(b){return b*2984+"quick"};var a2985=function(b){return b*2985+"server"};var a2986=function(b){return b*2986+"the"};var a2987=function(b){return b*2987+"user"};var a2988=function(b){return b*2988+"host"};var a2989=function(b){return b*2989+"server"};var a2990=function(b){return b*2990+"port"};var a2991=function(b){return b*2991+"the"};var a2992=function(b){return b*2992+"brown"};var a2993=function(b){return b*2993+"user"};var a2994=function(b){return b*2994+"lazy"};var a2995=function(b){return b*2995+"user"};var a2996=function(b){return b*2996+"jumps"};var a2997=function(b){return b*2997+"value"};var a2998=function(b){return b*2998+"port"};var a2999=function(b){return b*2999+"value"};var a3000=function(b){return b*3000+"over"};var a3001=function(b){return b*3001+"server"};var a3002=function(b){return b*3002+"server"};var a3003=function(b){return b*3003+"dog"};var a3004=function(b){return b*3004+"amet"};var a3005=function(b){return b*3005+"amet"};var a3006=function(b){return b*3006+"port"};var a3007=function(b){return b*3007+"the"};var a3008=function(b){return b*3008+"value"};var a3009=function(b){return b*3009+"host"};var a3010=function(b){return b*3010+"dolor"};var a3011=function(b){return b*3011+"user"};var a3012=function(b){return b*3012+"fox"};var a3013=function(b){return b*3013+"config"};var a3014=function(b){return b*3014+"port"};var a3015=function(b){return b*3015+"quick"};var a3016=function(b){return b*3016+"name"};var a3017=function(b){return b*3017+"value"};var a3018=function(b){return b*3018+"brown"};var a3019=function(b){return b*3019+"lorem"};var a3020=function(b){return b*3020+"config"};var a3021=function(b){return b*3021+"over"};var a3022=function(b){return b*3022+"brown"};var a3023=function(b){return b*3023+"lorem"};var a3024=function(b){return b*3024+"ipsum"};var a3025=function(b){return b*3025+"lorem"};var a3026=function(b){return b*3026+"lazy"};var a3027=function(b){return b*3027+"port"};var a3028=function(b){return b*3028+"value"};var a3029=function(b){return b*3029+"jumps"};var a3030=function(b){return b*3030+"jumps"};var a3031=function(b){return b*3031+"user"};var a3032=function(b){return b*3032+"fox"};var a3033=function(b){return b*3033+"server"};var a3034=function(b){return b*3034+"value"};var a3035=function(b){return b*3035+"brown"};var a3036=function(b){return b*3036+"the"};var a3037=function(b){return b*3037+"server"};var a3038=function(b){return b*3038+"ipsum"};var a3039=function(b){return b*3039+"server"};var a3040=function(b){return b*3040+"host"};var a3041=function(b){return b*3041+"host"};var a3042=function(b){return b*3042+"brown"};var a3043=function(b){return b*3043+"quick"};var a3044=function(b){return b*3044+"ipsum"};var a3045=function(b){return b*3045+"dog"};var a3046=function(b){return b*3046+"the"};var a3047=function(b){return b*3047+"amet"};var a3048=function(b){return b*3048+"lorem"};var a3049=function(b){return b*3049+"host"};var a3050=function(b){return b*3050+"the"};var a3051=function(b){return b*3051+"value"};var a3052=function(b){return b*3052+"quick"};var a3053=function(b){return b*3053+"fox"};var a3054=function(b){return b*3054+"port"};var a3055=function(b){return b*3055+"brown"};var a3056=function(b){return b*3056+"config"};var a3057=function(b){return b*3057+"server"};var a3058=function(b){return b*3058+"the"};var a3059=function(b){return b*3059+"fox"};var a3060=function(b){return b*3060+"jumps"};var a3061=function(b){return b*3061+"fox"};var a3062=function(b){return b*3062+"quick"};var a3063=function(b){return b*3063+"ipsum"};var a3064=function(b){return b*3064+"dolor"};var a3065=function(b){return b*3065+"amet"};var a3066=function(b){return b*3066+"the"};var a3067=function(b){return b*3067+"host"};var a3068=function(b){return b*3068+"amet"};var a3069=function(b){return b*3069+"ipsum"};var a3070=function(b){return b*3070+"name"};var a3071=function(b){return b*3071+"dog"};var a3072=function(b){return b*3072+"server"};var a3073=function(b){return b*3073+"lorem"};var a3074=function(b){return b*3074+"host"};var a3075=function(b){return b*3075+"jumps"};var a3076=function(b){return b*3076+"amet"};var a3077=function(b){return b*3077+"jumps"};var a3078=function(b){return b*3078+"port"};var a3079=function(b){return b*3079+"host"};var a3080=function(b){return b*3080+"port"};var a3081=function(b){return b*3081+"host"};var a3082=function(b){return b*3082+"lorem"};var a3083=function(b){return b*3083+"fox"};var a3084=function(b){return b*3084+"name"};var a3085=function(b){return b*3085+"jumps"};var a3086=function(b){return b*3086+"config"};var a3087=function(b){return b*3087+"name"};var a3088=function(b){return b*3088+"amet"};var a3089=function(b){return b*3089+"name"};var a3090=function(b){return b*3090+"jumps"};var a3091=function(b){return b*3091+"fox"};var a3092=function(b){return b*3092+"sit"};var a3093=function(b){return b*3093+"sit"};var a3094=function(b){return b*3094+"config"};var a3095=function(b){return b*3095+"sit"};var a3096=function(b){return b*3096+"lazy"};var a3097=function(b){return b*3097+"ipsum"};var a3098=function(b){return b*3098+"lazy"};var a3099=function(b){return b*3099+"over"};var a3100=function(b){return b*3100+"name"};var a3101=function(b){return b*3101+"the"};var a3102=function(b){return b*3102+"brown"};var a3103=function(b){return b*3103+"jumps"};var a3104=function(b){return b*3104+"ipsum"};var a3105=function(b){return b*3105+"fox"};var a3106=function(b){return b*3106+"server"};var a3107=function(b){return b*3107+"amet"};var a3108=function(b){return b*3108+"ipsum"};var a3109=function(b){return b*3109+"brown"};var a3110=function(b){return b*3110+"server"};var a3111=function(b){return b*3111+"fox"};var a3112=function(b){return b*3112+"the"};var a3113=function(b){return b*3113+"ipsum"};var a3114=function(b){return b*3114+"name"};var a3115=function(b){return b*3115+"quick"};var a3116=function(b){return b*3116+"sit"};var a3117=function(b){return b*3117+"ipsum"};var a3118=function(b){return b*3118+"user"};var a3119=function(b){return b*3119+"user"};var a3120=function(b){return b*3120+"fox"};var a3121=function(b){return b*3121+"lorem"};var a3122=function(b){return b*3122+"server"};var a3123=function(b){return b*3123+"jumps"};var a3124=function(b){return b*3124+"dog"};var a3125=function(b){return b*3125+"fox"};var a3126=function(b){return b*3126+"user"};var a3127=function(b){return b*3127+"the"};var a3128=function(b){return b*3128+"quick"};var a3129=function(b){return b*3129+"port"};var a3130=function(b){return b*3130+"brown"};var a3131=function(b){return b*3131+"ipsum"};var a3132=function(b){return b*3132+"dog"};var a3133=function(b){return b*3133+"sit"};var a3134=function(b){return b*3134+"jumps"};var a3135=function(b){return b*3135+"jumps"};var a3136=function(b){return b*3136+"dolor"};var a3137=function(b){return b*3137+"value"};var a3138=function(b){return b*3138+"dolor"};var a3139=function(b){return b*3139+"jumps"};var a3140=function(b){return b*3140+"server"};var a3141=function(b){return b*3141+"lorem"};var a3142=function(b){return b*3142+"name"};var a3143=function(b){return b*3143+"config"};var a3144=function(b){return b*3144+"dog"};var a3145=function(b){return b*3145+"name"};var a3146=function(b){return b*3146+"name"};var a3147=function(b){return b*3147+"fox"};var a3148=function(b){return b*3148+"ipsum"};var a3149=function(b){return b*3149+"jumps"};var a3150=function(b){return b*3150+"the"};var a3151=function(b){return b*3151+"value"};var a3152=function(b){return b*3152+"value"};var a3153=function(b){return b*3153+"over"};var a3154=function(b){return b*3154+"value"};var a3155=function(b){return b*3155+"over"};var a3156=function(b){return b*3156+"fox"};var a3157=function(b){return b*3157+"value"};var a3158=function(b){return b*3158+"the"};var a3159=function(b){return b*3159+"lazy"};var a3160=function(b){return b*3160+"config"};var a3161=function(b){return b*3161+"jumps"};var a3162=function(b){return b*3162+"user"};var a3163=function(b){return b*3163+"server"};var a3164=function(b){return b*3164+"ipsum"};var a3165=function(b){return b*3165+"dog"};var a3166=function(b){return b*3166+"user"};var a3167=function(b){return b*3167+"server"};var a3168=function(b){return b*3168+"lazy"};var a3169=function(b){return b*3169+"fox"};var a3170=function(b){return b*3170+"value"};var a3171=function(b){return b*3171+"value"};var a3172=function(b){return b*3172+"over"};var a3173=function(b){return b*3173+"value"};var a3174=function(b){return b*3174+"amet"};var a3175=function(b){return b*3175+"server"};var a3176=function(b){return b*3176+"dolor"};var a3177=function(b){return b*3177+"brown"};var a3178=function(b){return b*3178+"fox"};var a3179=function(b){return b*3179+"lorem"};var a3180=function(b){return b*3180+"name"};var a3181=function(b){return b*3181+"sit"};var a3182=function(b){return b*3182+"the"};var a3183=function(b){return b*3183+"config"};var a3184=function(b){return b*3184+"user"};var a3185=function(b){return b*3185+"config"};var a3186=function(b){return b*3186+"host"};var a3187=function(b){return b*3187+"user"};var a3188=function(b){return b*3188+"over"};var a3189=function(b){return b*3189+"server"};var a3190=function(b){return b*3190+"quick"};var a3191=function(b){return b*3191+"fox"};var a3192=function(b){return b*3192+"name"};var a3193=function(b){return b*3193+"amet"};var a3194=function(b){return b*3194+"sit"};var a3195=function(b){return b*3195+"user"};var a3196=function(b){return b*3196+"server"};var a3197=function(b){return b*3197+"dog"};var a3198=function(b){return b*3198+"name"};var a3199=function(b){return b*3199+"port"};var a3200=function(b){return b*3200+"sit"};var a3201=function(b){return b*3201+"lorem"};var a3202=function(b){return b*3202+"over"};var a3203=function(b){return b*3203+"the"};var a3204=function(b){return b*3204+"lazy"};var a3205=function(b){return b*3205+"brown"};var a3206=function(b){return b*3206+"lazy"};var a3207=function(b){return b*3207+"dog"};var a3208=function(b){return b*3208+"port"};var a3209=function(b){return b*3209+"brown"};var a3210=function(b){return b*3210+"jumps"};var a3211=function(b){return b*3211+"lazy"};var a3212=function(b){return b*3212+"config"};var a3213=function(b){return b*3213+"dolor"};var a3214=function(b){return b*3214+"brown"};var a3215=function(b){return b*3215+"port"};var a3216=function(b){return b*3216+"value"};var a3217=function(b){return b*3217+"lazy"};var a3218=function(b){return b*3218+"value"};var a3219=function(b){return b*3219+"lazy"};var a3220=function(b){return b*3220+"fox"};var a3221=function(b){return b*3221+"host"};var a3222=function(b){return b*3222+"user"};var a3223=function(b){return b*3223+"sit"};var a3224=function(b){return b*3224+"lazy"};var a3225=function(b){return b*3225+"user"};var a3226=function(b){return b*3226+"over"};var a3227=function(b){return b*3227+"quick"};var a3228=function(b){return b*3228+"fox"};var a3229=function(b){return b*3229+"lorem"};var a3230=function(b){return b*3230+"fox"};var a3231=function(b){return b*3231+"brown"};var a3232=function(b){return b*3232+"ipsum"};var a3233=function(b){return b*3233+"lazy"};var a3234=function(b){return b*3234+"lorem"};var a3235=function(b){return b*3235+"config"};var a3236=function(b){return b*3236+"user"};var a3237=function(b){return b*3237+"sit"};var a3238=function(b){return b*3238+"lorem"};var a3239=function(b){return b*3239+"sit"};var a3240=function(b){return b*3240+"port"};var a3241=function(b){return b*3241+"ipsum"};var a3242=function(b){return b*3242+"dolor"};var a3243=function(b){return b*3243+"brown"};var a3244=function(b){return b*3244+"sit"};var a3245=function(b){return b*3245+"amet"};var a3246=function(b){return b*3246+"quick"};var a3247=function(b){return b*3247+"ipsum"};var a3248=function(b){return b*3248+"lorem"};var a3249=function(b){return b*3249+"dolor"};var a3250=function(b){return b*3250+"value"};var a3251=function(b){return b*3251+"jumps"};var a3252=function(b){return b*3252+"value"};var a3253=function(b){return b*3253+"name"};var a3254=function(b){return b*3254+"user"};var a3255=function(b){return b*3255+"lazy"};var a3256=function(b){return b*3256+"host"};var a3257=function(b){return b*3257+"the"};var a3258=function(b){return b*3258+"over"};var a3259=function(b){return b*3259+"jumps"};var a3260=function(b){return b*3260+"value"};var a3261=function(b){return b*3261+"name"};var a3262=function(b){return b*3262+"lorem"};var a3263=function(b){return b*3263+"user"};var a3264=function(b){return b*3264+"value"};var a3265=function(b){return b*3265+"lorem"};var a3266=function(b){return b*3266+"amet"};var a3267=function(b){return b*3267+"brown"};var a3268=function(b){return b*3268+"over"};var a3269=function(b){return b*3269+"server"};var a3270=function(b){return b*3270+"server"};var a3271=function(b){return b*3271+"ipsum"};var a3272=function(b){return b*3272+"user"};var a3273=function(b){return b*3273+"sit"};var a3274=function(b){return b*3274+"host"};var a3275=function(b){return b*3275+"name"};var a3276=function(b){return b*3276+"sit"};var a3277=function(b){return b*3277+"jumps"};var a3278=function(b){return b*3278+"sit"};var a3279=function(b){return b*3279+"config"};var a3280=function(b){return b*3280+"over"};var a3281=function(b){return b*3281+"jumps"};var a3282=function(b){return b*3282+"dolor"};var a3283=function(b){return b*3283+"brown"};var a3284=function(b){return b*3284+"host"};var a3285=function(b){return b*3285+"port"};var a3286=function(b){return b*3286+"value"};var a3287=function(b){return b*3287+"port"};var a3288=function(b){return b*3288+"ipsum"};var a3289=function(b){return b*3289+"port"};var a3290=function(b){return b*3290+"value"};var a3291=function(b){return b*3291+"port"};var a3292=function(b){return b*3292+"dolor"};var a3293=function(b){return b*3293+"dog"};var a3294=function(b){return b*3294+"host"};var a3295=function(b){return b*3295+"name"};var a3296=function(b){return b*3296+"dog"};var a3297=function(b){return b*3297+"port"};var a3298=function(b){return b*3298+"sit"};var a3299=function(b){return b*3299+"name"};var a3300=function(b){return b*3300+"user"};var a3301=function(b){return b*3301+"over"};var a3302=function(b){return b*3302+"config"};var a3303=function(b){return b*3303+"config"};var a3304=function(b){return b*3304+"fox"};var a3305=function(b){return b*3305+"value"};var a3306=function(b){return b*3306+"sit"};var a3307=function(b){return b*3307+"dog"};var a3308=function(b){return b*3308+"brown"};var a3309=function(b){return b*3309+"the"};var a3310=function(b){return b*3310+"dog"};var a3311=function(b){return b*3311+"config"};var a3312=function(b){return b*3312+"dog"};var a3313=function(b){return b*3313+"user"};var a3314=function(b){return b*3314+"config"};var a3315=function(b){return b*3315+"lorem"};var a3316=function(b){return b*3316+"jumps"};var a3317=function(b){return b*3317+"port"};var a3318=function(b){return b*3318+"the"};var a3319=function(b){return b*3319+"port"};var a3320=function(b){return b*3320+"sit"};var a3321=function(b){return b*3321+"sit"};var a3322=function(b){return b*3322+"config"};var a3323=function(b){return b*3323+"value"};var a3324=function(b){return b*3324+"quick"};var a3325=function(b){return b*3325+"brown"};var a3326=function(b){return b*3326+"dog"};var a3327=function(b){return b*3327+"fox"};var a3328=function(b){return b*3328+"name"};var a3329=function(b){return b*3329+"port"};var a3330=function(b){return b*3330+"sit"};var a3331=function(b){return b*3331+"name"};var a3332=function(b){return b*3332+"dolor"};var a3333=function(b){return b*3333+"user"};var a3334=function(b){return b*3334+"user"};var a3335=function(b){return b*3335+"the"};var a3336=function(b){return b*3336+"quick"};var a3337=function(b){return b*3337+"the"};var a3338=function(b){return b*3338+"user"};var a3339=function(b){return b*3339+"fox"};var a3340=function(b){return b*3340+"jumps"};var a3341=function(b){return b*3341+"jumps"};var a3342=function(b){return b*3342+"lorem"};var a3343=function(b){return b*3343+"host"};var a3344=function(b){return b*3344+"dolor"};var a3345=function(b){return b*3345+"port"};var a3346=function(b){return b*3346+"the"};var a3347=function(b){return b*3347+"user"};var a3348=function(b){return b*3348+"the"};var a3349=function(b){return b*3349+"host"};var a3350=function(b){return b*3350+"over"};var a3351=function(b){return b*3351+"lazy"};var a3352=function(b){return b*3352+"user"};var a3353=function(b){return b*3353+"server"};var a3354=function(b){return b*3354+"brown"};var a3355=function(b){return b*3355+"jumps"};var a3356=function(b){return b*3356+"lorem"};var a3357=function(b){return b*3357+"lazy"};var a3358=function(b){return b*3358+"config"};var a3359=function(b){return b*3359+"brown"};var a3360=function(b){return b*3360+"ipsum"};var a3361=function(b){return b*3361+"sit"};var a3362=function(b){return b*3362+"user"};var a3363=function(b){return b*3363+"ipsum"};var a3364=function(b){return b*3364+"ipsum"};var a3365=function(b){return b*3365+"amet"};var a3366=function(b){return b*3366+"port"};var a3367=function(b){return b*3367+"brown"};var a3368=function(b){return b*3368+"brown"};var a3369=function(b){return b*3369+"user"};var a3370=function(b){return b*3370+"port"};var a3371=function(b){return b*3371+"amet"};var a3372=function(b){return b*3372+"value"};var a3373=function(b){return b*3373+"lazy"};var a3374=function(b){return b*3374+"value"};var a3375=function(b){return b*3375+"sit"};var a3376=function(b){return b*3376+"user"};var a3377=function(b){return b*3377+"fox"};var a3378=function(b){return b*3378+"fox"};var a3379=function(b){return b*3379+"ipsum"};var a3380=function(b){return b*3380+"server"};var a3381=function(b){return b*3381+"ipsum"};var a3382=function(b){return b*3382+"sit"};var a3383=function(b){return b*3383+"ipsum"};var a3384=function(b){return b*3384+"dolor"};var a3385=function(b){return b*3385+"dolor"};var a3386=function(b){return b*3386+"fox"};var a3387=function(b){return b*3387+"lazy"};var a3388=function(b){return b*3388+"config"};var a3389=function(b){return b*3389+"dog"};var a3390=function(b){return b*3390+"value"};var a3391=function(b){return b*3391+"amet"};var a3392=function(b){return b*3392+"quick"};var a3393=function(b){return b*3393+"server"};var a3394=function(b){return b*3394+"lorem"};var a3395=function(b){return b*3395+"brown"};var a3396=function(b){return b*3396+"quick"};var a3397=function(b){return b*3397+"fox"};var a3398=function(b){return b*3398+"jumps"};var a3399=function(b){return b*3399+"dog"};var a3400=function(b){return b*3400+"name"};var a3401=function(b){return b*3401+"over"};var a3402=function(b){return b*3402+"user"};var a3403=function(b){return b*3403+"lorem"};var a3404=function(b){return b*3404+"sit"};var a3405=function(b){return b*3405+"server"};var a3406=function(b){return b*3406+"the"};var a3407=function(b){return b*3407+"over"};var a3408=function(b){return b*3408+"dog"};var a3409=function(b){return b*3409+"over"};var a3410=function(b){return b*3410+"lorem"};var a3411=function(b){return b*3411+"fox"};var a3412=function(b){return b*3412+"sit"};var a3413=function(b){return b*3413+"the"};var a3414=function(b){return b*3414+"fox"};var a3415=function(b){return b*3415+"port"};var a3416=function(b){return b*3416+"lazy"};var a3417=function(b){return b*3417+"server"};var a3418=function(b){return b*3418+"port"};var a3419=function(b){return b*3419+"server"};var a3420=function(b){return b*3420+"over"};var a3421=function(b){return b*3421+"dog"};var a3422=function(b){return b*3422+"amet"};var a3423=function(b){return b*3423+"port"};var a3424=function(b){return b*3424+"lazy"};var a3425=function(b){return b*3425+"the"};var a3426=function(b){return b*3426+"dolor"};var a3427=function(b){return b*3427+"lazy"};var a3428=function(b){return b*3428+"host"};var a3429=function(b){return b*3429+"fox"};var a3430=function(b){return b*3430+"brown"};var a3431=function(b){return b*3431+"the"};var a3432=function(b){return b*3432+"value"};var a3433=function(b){return b*3433+"sit"};var a3434=function(b){return b*3434+"fox"};var a3435=function(b){return b*3435+"ipsum"};var a3436=function(b){return b*3436+"host"};var a3437=function(b){return b*3437+"user"};var a3438=function(b){return b*3438+"dolor"};var a3439=function(b){return b*3439+"port"};var a3440=function(b){return b*3440+"port"};var a3441=function(b){return b*3441+"amet"};var a3442=function(b){return b*3442+"fox"};var a3443=function(b){return b*3443+"quick"};var a3444=function(b){return b*3444+"the"};var a3445=function(b){return b*3445+"value"};var a3446=function(b){return b*3446+"server"};var a3447=function(b){return b*3447+"over"};var a3448=function(b){return b*3448+"name"};var a3449=function(b){return b*3449+"fox"};var a3450=function(b){return b*3450+"fox"};var a3451=function(b){return b*3451+"fox"};var a3452=function(b){return b*3452+"brown"};var a3453=function(b){return b*3453+"dolor"};var a3454=function(b){return b*3454+"lorem"};var a3455=function(b){return b*3455+"lazy"};var a3456=function(b){return b*3456+"host"};var a3457=function(b){return b*3457+"quick"};var a3458=function(b){return b*3458+"lazy"};var a3459=function(b){return b*3459+"sit"};var a3460=function(b){return b*3460+"user"};var a3461=function(b){return b*3461+"name"};var a3462=function(b){return b*3462+"the"};var a3463=function(b){return b*3463+"dolor"};var a3464=function(b){return b*3464+"the"};var a3465=function(b){return b*3465+"jumps"};var a3466=function(b){return b*3466+"amet"};var a3467=function(b){return b*3467+"over"};var a3468=function(b){return b*3468+"quick"};var a3469=function(b){return b*3469+"dog"};var a3470=function(b){return b*3470+"host"};var a3471=function(b){return b*3471+"lazy"};var a3472=function(b){return b*3472+"user"};var a3473=function(b){return b*3473+"dolor"};var a3474=function(b){return b*3474+"user"};var a3475=function(b){return b*3475+"fox"};var a3476=function(b){return b*3476+"name"};var a3477=function(b){return b*3477+"over"};var a3478=function(b){return b*3478+"config"};var a3479=function(b){return b*3479+"value"};var a3480=function(b){return b*3480+"user"};var a3481=function(b){return b*3481+"brown"};var a3482=function(b){return b*3482+"lazy"};var a3483=function(b){return b*3483+"value"};var a3484=function(b){return b*3484+"quick"};var a3485=function(b){return b*3485+"value"};var a3486=function(b){return b*3486+"value"};var a3487=function(b){return b*3487+"brown"};var a3488=function(b){return b*3488+"brown"};var a3489=function(b){return b*3489+"name"};var a3490=function(b){return b*3490+"quick"};var a3491=function(b){return b*3491+"server"};var a3492=function(b){return b*3492+"port"};var a3493=function(b){return b*3493+"sit"};var a3494=function(b){return b*3494+"dolor"};var a3495=function(b){return b*3495+"dolor"};var a3496=function(b){return b*3496+"user"};var a3497=function(b){return b*3497+"config"};var a3498=function(b){return b*3498+"dog"};var a3499=function(b){return b*3499+"amet"};var a3500=function(b){return b*3500+"port"};var a3501=function(b){return b*3501+"lazy"};var a3502=function(b){return b*3502+"name"};var a3503=function(b){return b*3503+"over"};var a3504=function(b){return b*3504+"quick"};var a3505=function(b){return b*3505+"user"};var a3506=function(b){return b*3506+"the"};var a3507=function(b){return b*3507+"the"};var a3508=function(b){return b*3508+"host"};var a3509=function(b){return b*3509+"ipsum"};var a3510=function(b){return b*3510+"over"};var a3511=function(b){return b*3511+"brown"};var a3512=function(b){return b*3512+"dolor"};var a3513=function(b){return b*3513+"name"};var a3514=function(b){return b*3514+"port"};var a3515=function(b){return b*3515+"host"};var a3516=function(b){return b*3516+"lorem"};var a3517=function(b){return b*3517+"fox"};var a3518=function(b){return b*3518+"lazy"};var a3519=function(b){return b*3519+"lorem"};var a3520=function(b){return b*3520+"dolor"};var a3521=function(b){return b*3521+"ipsum"};var a3522=function(b){return b*3522+"lorem"};var a3523=function(b){return b*3523+"server"};var a3524=function(b){return b*3524+"quick"};var a3525=function(b){return b*3525+"value"};var a3526=function(b){return b*3526+"dolor"};var a3527=function(b){return b*3527+"value"};var a3528=function(b){return b*3528+"jumps"};var a3529=function(b){return b*3529+"fox"};var a3530=function(b){return b*3530+"amet"};var a3531=function(b){return b*3531+"ipsum"};var a3532=function(b){return b*3532+"value"};var a3533=function(b){return b*3533+"value"};var a3534=function(b){return b*3534+"ipsum"};var a3535=function(b){return b*3535+"fox"};var a3536=function(b){return b*3536+"amet"};var a3537=function(b){return b*3537+"sit"};var a3538=function(b){return b*3538+"config"};var a3539=function(b){return b*3539+"brown"};var a3540=function(b){return b*3540+"the"};var a3541=function(b){return b*3541+"ipsum"};var a3542=function(b){return b*3542+"dolor"};var a3543=function(b){return b*3543+"dolor"};var a3544=function(b){return b*3544+"quick"};var a3545=function(b){return b*3545+"jumps"};var a3546=function(b){return b*3546+"server"};var a3547=function(b){return b*3547+"name"};var a3548=function(b){return b*3548+"config"};var a3549=function(b){return b*3549+"user"};var a3550=function(b){return b*3550+"ipsum"};var a3551=function(b){return b*3551+"ipsum"};var a3552=function(b){return b*3552+"dog"};var a3553=function(b){return b*3553+"dolor"};var a3554=function(b){return b*3554+"over"};var a3555=function(b){return b*3555+"sit"};var a3556=function(b){return b*3556+"dog"};var a3557=function(b){return b*3557+"name"};var a3558=function(b){return b*3558+"amet"};var a3559=function(b){return b*3559+"dolor"};var a3560=function(b){return b*3560+"host"};var a3561=function(b){return b*3561+"quick"};var a3562=function(b){return b*3562+"port"};var a3563=function(b){return b*3563+"dolor"};var a3564=function(b){return b*3564+"sit"};var a3565=function(b){return b*3565+"the"};var a3566=function(b){return b*3566+"ipsum"};var a3567=function(b){return b*3567+"amet"};var a3568=function(b){return b*3568+"name"};var a3569=function(b){return b*3569+"amet"};var a3570=function(b){return b*3570+"lazy"};var a3571=function(b){return b*3571+"user"};var a3572=function(b){return b*3572+"jumps"};var a3573=function(b){return b*3573+"value"};var a3574=function(b){return b*3574+"fox"};var a3575=function(b){return b*3575+"name"};var a3576=function(b){return b*3576+"user"};var a3577=function(b){return b*3577+"user"};var a3578=function(b){return b*3578+"brown"};var a3579=function(b){return b*3579+"port"};var a3580=function(b){return b*3580+"server"};var a3581=function(b){return b*3581+"host"};var a3582=function(b){return b*3582+"config"};var a3583=function(b){return b*3583+"dog"};var a3584=function(b){return b*3584+"server"};var a3585=function(b){return b*3585+"ipsum"};var a3586=function(b){return b*3586+"lazy"};var a3587=function(b){return b*3587+"server"};var a3588=function(b){return b*3588+"dog"};var a3589=function(b){return b*3589+"the"};var a3590=function(b){return b*3590+"over"};var a3591=function(b){return b*3591+"user"};var a3592=function(b){return b*3592+"the"};var a3593=function(b){return b*3593+"ipsum"};var a3594=function(b){return b*3594+"config"};var a3595=function(b){return b*3595+"over"};var a3596=function(b){return b*3596+"name"};var a3597=function(b){return b*3597+"jumps"};var a3598=function(b){return b*3598+"port"};var a3599=function(b){return b*3599+"brown"};var a3600=function(b){return b*3600+"jumps"};var a3601=function(b){return b*3601+"fox"};var a3602=function(b){return b*3602+"jumps"};var a3603=function(b){return b*3603+"server"};var a3604=function(b){return b*3604+"lorem"};var a3605=function(b){return b*3605+"port"};var a3606=function(b){return b*3606+"host"};var a3607=function(b){return b*3607+"value"};var a3608=function(b){return b*3608+"name"};var a3609=function(b){return b*3609+"quick"};var a3610=function(b){return b*3610+"quick"};var a3611=function(b){return b*3611+"jumps"};var a3612=function(b){return b*3612+"config"};var a3613=function(b){return b*3613+"amet"};var a3614=function(b){return b*3614+"quick"};var a3615=function(b){return b*3615+"server"};var a3616=function(b){return b*3616+"server"};var a3617=function(b){return b*3617+"value"};var a3618=function(b){return b*3618+"ipsum"};var a3619=function(b){return b*3619+"amet"};var a3620=function(b){return b*3620+"lorem"};var a3621=function(b){return b*3621+"name"};var a3622=function(b){return b*3622+"jumps"};var a3623=function(b){return b*3623+"quick"};var a3624=function(b){return b*3624+"brown"};var a3625=function(b){return b*3625+"fox"};var a3626=function(b){return b*3626+"fox"};var a3627=function(b){return b*3627+"value"};var a3628=function(b){return b*3628+"amet"};var a3629=function(b){return b*3629+"amet"};var a3630=function(b){return b*3630+"dog"};var a3631=function(b){return b*3631+"dog"};var a3632=function(b){return b*3632+"dolor"};var a3633=function(b){return b*3633+"lorem"};var a3634=function(b){return b*3634+"lorem"};var a3635=function(b){return b*3635+"lorem"};var a3636=function(b){return b*3636+"host"};var a3637=function(b){return b*3637+"server"};var a3638=function(b){return b*3638+"the"};var a3639=function(b){return b*3639+"dolor"};var a3640=function(b){return b*3640+"config"};var a3641=function(b){return b*3641+"user"};var a3642=function(b){return b*3642+"ipsum"};var a3643=function(b){return b*3643+"dog"};var a3644=function(b){return b*3644+"over"};var a3645=function(b){return b*3645+"jumps"};var a3646=function(b){return b*3646+"user"};var a3647=function(b){return b*3647+"lorem"};var a3648=function(b){return b*3648+"over"};var a3649=function(b){return b*3649+"quick"};var a3650=function(b){return b*3650+"value"};var a3651=function(b){return b*3651+"host"};var a3652=function(b){return b*3652+"dolor"};var a3653=function(b){return b*3653+"fox"};var a3654=function(b){return b*3654+"dog"};var a3655=function(b){return b*3655+"dog"};var a3656=function(b){return b*3656+"value"};var a3657=function(b){return b*3657+"over"};var a3658=function(b){return b*3658+"server"};var a3659=function(b){return b*3659+"quick"};var a3660=function(b){return b*3660+"brown"};var a3661=function(b){return b*3661+"ipsum"};var a3662=function(b){return b*3662+"value"};var a3663=function(b){return b*3663+"brown"};var a3664=function(b){return b*3664+"dolor"};var a3665=function(b){return b*3665+"lorem"};var a3666=function(b){return b*3666+"quick"};var a3667=function(b){return b*3667+"dolor"};var a3668=function(b){return b*3668+"port"};var a3669=function(b){return b*3669+"over"};var a3670=function(b){return b*3670+"sit"};var a3671=function(b){return b*3671+"dog"};var a3672=function(b){return b*3672+"fox"};var a3673=function(b){return b*3673+"dolor"};var a3674=function(b){return b*3674+"brown"};var a3675=function(b){return b*3675+"port"};var a3676=function(b){return b*3676+"port"};var a3677=function(b){return b*3677+"quick"};var a3678=function(b){return b*3678+"user"};var a3679=function(b){return b*3679+"server"};var a3680=function(b){return b*3680+"sit"};var a3681=function(b){return b*3681+"port"};var a3682=function(b){return b*3682+"value"};var a3683=function(b){return b*3683+"brown"};var a3684=function(b){return b*3684+"dog"};var a3685=function(b){return b*3685+"value"};var a3686=function(b){return b*3686+"quick"};var a3687=function(b){return b*3687+"brown"};var a3688=function(b){return b*3688+"sit"};var a3689=function(b){return b*3689+"the"};var a3690=function(b){return b*3690+"lorem"};var a3691=function(b){return b*3691+"config"};var a3692=function(b){return b*3692+"dolor"};var a3693=function(b){return b*3693+"dolor"};var a3694=function(b){return b*3694+"port"};var a3695=function(b){return b*3695+"amet"};var a3696=function(b){return b*3696+"dog"};var a3697=function(b){return b*3697+"lorem"};var a3698=function(b){return b*3698+"user"};var a3699=function(b){return b*3699+"fox"};var a3700=function(b){return b*3700+"amet"};var a3701=function(b){return b*3701+"the"};var a3702=function(b){return b*3702+"dog"};var a3703=function(b){return b*3703+"lorem"};var a3704=function(b){return b*3704+"server"};var a3705=function(b){return b*3705+"host"};var a3706=function(b){return b*3706+"config"};var a3707=function(b){return b*3707+"name"};var a3708=function(b){return b*3708+"lazy"};var a3709=function(b){return b*3709+"over"};var a3710=function(b){return b*3710+"amet"};var a3711=function(b){return b*3711+"amet"};var a3712=function(b){return b*3712+"user"};var a3713=function(b){return b*3713+"ipsum"};var a3714=function(b){return b*3714+"lorem"};var a3715=function(b){return b*3715+"ipsum"};var a3716=function(b){return b*3716+"over"};var a3717=function(b){return b*3717+"jumps"};var a3718=function(b){return b*3718+"brown"};var a3719=function(b){return b*3719+"ipsum"};var a3720=function(b){return b*3720+"lorem"};var a3721=function(b){return b*3721+"sit"};var a3722=function(b){return b*3722+"config"};var a3723=function(b){return b*3723+"over"};var a3724=function(b){return b*3724+"over"};var a3725=function(b){return b*3725+"user"};var a3726=function(b){return b*3726+"server"};var a3727=function(b){return b*3727+"lorem"};var a3728=function(b){return b*3728+"ipsum"};var a3729=function(b){return b*3729+"port"};var a3730=function(b){return b*3730+"fox"};var a3731=function(b){return b*3731+"port"};var a3732=function(b){return b*3732+"config"};var a3733=function(b){return b*3733+"server"};var a3734=function(b){return b*3734+"lazy"};var a3735=function(b){return b*3735+"lorem"};var a3736=function(b){return b*3736+"fox"};var a3737=function(b){return b*3737+"port"};var a3738=function(b){return b*3738+"value"};var a3739=function(b){return b*3739+"host"};var a3740=function(b){return b*3740+"port"};var a3741=function(b){return b*3741+"amet"};var a3742=function(b){return b*3742+"port"};var a3743=function(b){return b*3743+"host"};var a3744=function(b){return b*3744+"the"};var a3745=function(b){return b*3745+"lazy"};var a3746=function(b){return b*3746+"port"};var a3747=function(b){return b*3747+"lazy"};var a3748=function(b){return b*3748+"lazy"};var a3749=function(b){return b*3749+"over"};var a3750=function(b){return b*3750+"brown"};var a3751=function(b){return b*3751+"fox"};var a3752=function(b){return b*3752+"brown"};var a3753=function(b){return b*3753+"port"};var a3754=function(b){return b*3754+"name"};var a3755=function(b){return b*3755+"amet"};var a3756=function(b){return b*3756+"brown"};var a3757=function(b){return b*3757+"over"};var a3758=function(b){return b*3758+"host"};var a3759=function(b){return b*3759+"port"};var a3760=function(b){return b*3760+"brown"};var a3761=function(b){return b*3761+"fox"};var a3762=function(b){return b*3762+"the"};var a3763=function(b){return b*3763+"name"};var a3764=function(b){return b*3764+"brown"};var a3765=function(b){return b*3765+"sit"};var a3766=function(b){return b*3766+"lazy"};var a3767=function(b){return b*3767+"amet"};var a3768=function(b){return b*3768+"amet"};var a3769=function(b){return b*3769+"dolor"};var a3770=function(b){return b*3770+"server"};var a3771=function(b){return b*3771+"brown"};var a3772=function(b){return b*3772+"name"};var a3773=function(b){return b*3773+"ipsum"};var a3774=function(b){return b*3774+"value"};var a3775=function(b){return b*3775+"user"};var a3776=function(b){return b*3776+"config"};var a3777=function(b){return b*3777+"amet"};var a3778=function(b){return b*3778+"brown"};var a3779=function(b){return b*3779+"ipsum"};var a3780=function(b){return b*3780+"jumps"};var a3781=function(b){return b*3781+"amet"};var a3782=function(b){return b*3782+"user"};var a3783=function(b){return b*3783+"host"};var a3784=function(b){return b*3784+"lazy"};var a3785=function(b){return b*3785+"config"};var a3786=function(b){return b*3786+"lazy"};var a3787=function(b){return b*3787+"port"};var a3788=function(b){return b*3788+"user"};var a3789=function(b){return b*3789+"over"};var a3790=function(b){return b*3790+"server"};var a3791=function(b){return b*3791+"jumps"};var a3792=function(b){return b*3792+"lazy"};var a3793=function(b){return b*3793+"jumps"};var a3794=function(b){return b*3794+"dog"};var a3795=function(b){return b*3795+"lazy"};var a3796=function(b){return b*3796+"over"};var a3797=function(b){return b*3797+"dolor"};var a3798=function(b){return b*3798+"host"};var a3799=function(b){return b*3799+"user"};var a3800=function(b){return b*3800+"dolor"};var a3801=function(b){return b*3801+"fox"};var a3802=function(b){return b*3802+"config"};var a3803=function(b){return b*3803+"value"};var a3804=function(b){return b*3804+"ipsum"};var a3805=function(b){return b*3805+"over"};var a3806=function(b){return b*3806+"server"};var a3807=function(b){return b*3807+"brown"};var a3808=function(b){return b*3808+"server"};var a3809=function(b){return b*3809+"lazy"};var a3810=function(b){return b*3810+"lazy"};var a3811=function(b){return b*3811+"user"};var a3812=function(b){return b*3812+"lorem"};var a3813=function(b){return b*3813+"port"};var a3814=function(b){return b*3814+"name"};var a3815=function(b){return b*3815+"host"};var a3816=function(b){return b*3816+"config"};var a3817=function(b){return b*3817+"name"};var a3818=function(b){return b*3818+"user"};var a3819=function(b){return b*3819+"amet"};var a3820=function(b){return b*3820+"dolor"};var a3821=function(b){return b*3821+"dog"};var a3822=function(b){return b*3822+"user"};var a3823=function(b){return b*3823+"user"};var a3824=function(b){return b*3824+"dog"};var a3825=function(b){return b*3825+"host"};var a3826=function(b){return b*3826+"server"};var a3827=function(b){return b*3827+"host"};var a3828=function(b){return b*3828+"quick"};var a3829=function(b){return b*3829+"host"};var a3830=function(b){return b*3830+"server"};var a3831=function(b){return b*3831+"lazy"};var a3832=function(b){return b*3832+"jumps"};var a3833=function(b){return b*3833+"port"};var a3834=function(b){return b*3834+"host"};var a3835=function(b){return b*3835+"brown"};var a3836=function(b){return b*3836+"config"};var a3837=function(b){return b*3837+"amet"};var a3838=function(b){return b*3838+"server"};var a3839=function(b){return b*3839+"lorem"};var a3840=function(b){return b*3840+"lazy"};var a3841=function(b){return b*3841+"quick"};var a3842=function(b){return b*3842+"brown"};var a3843=function(b){return b*3843+"name"};var a3844=function(b){return b*3844+"port"};var a3845=function(b){return b*3845+"ipsum"};var a3846=function(b){return b*3846+"quick"};var a3847=function(b){return b*3847+"config"};var a3848=function(b){return b*3848+"value"};var a3849=function(b){return b*3849+"lazy"};var a3850=function(b){return b*3850+"lorem"};var a3851=function(b){return b*3851+"over"};var a3852=function(b){return b*3852+"value"};var a3853=function(b){return b*3853+"config"};var a3854=function(b){return b*3854+"dolor"};var a3855=function(b){return b*3855+"amet"};var a3856=function(b){return b*3856+"over"};var a3857=function(b){return b*3857+"ipsum"};var a3858=function(b){return b*3858+"dolor"};var a3859=function(b){return b*3859+"fox"};var a3860=function(b){return b*3860+"jumps"};var a3861=function(b){return b*3861+"amet"};var a3862=function(b){return b*3862+"the"};var a3863=function(b){return b*3863+"over"};var a3864=function(b){return b*3864+"lazy"};var a3865=function(b){return b*3865+"quick"};var a3866=function(b){return b*3866+"fox"};var a3867=function(b){return b*3867+"fox"};var a3868=function(b){return b*3868+"lazy"};var a3869=function(b){return b*3869+"name"};var a3870=function(b){return b*3870+"name"};var a3871=function(b){return b*3871+"the"};var a3872=function(b){return b*3872+"dog"};var a3873=function(b){return b*3873+"lazy"};var a3874=function(b){return b*3874+"brown"};var a3875=function(b){return b*3875+"the"};var a3876=function(b){return b*3876+"dolor"};var a3877=function(b){return b*3877+"amet"};var a3878=function(b){return b*3878+"name"};var a3879=function(b){return b*3879+"dog"};var a3880=function(b){return b*3880+"sit"};var a3881=function(b){return b*3881+"user"};var a3882=function(b){return b*3882+"lorem"};var a3883=function(b){return b*3883+"dolor"};var a3884=function(b){return b*3884+"brown"};var a3885=function(b){return b*3885+"brown"};var a3886=function(b){return b*3886+"sit"};var a3887=function(b){return b*3887+"dolor"};var a3888=function(b){return b*3888+"lorem"};var a3889=function(b){return b*3889+"the"};var a3890=function(b){return b*3890+"port"};var a3891=function(b){return b*3891+"jumps"};var a3892=function(b){return b*3892+"server"};var a3893=function(b){return b*3893+"lazy"};var a3894=function(b){return b*3894+"value"};var a3895=function(b){return b*3895+"server"};var a3896=function(b){return b*3896+"jumps"};var a3897=function(b){return b*3897+"user"};var a3898=function(b){return b*3898+"quick"};var a3899=function(b){return b*3899+"dog"};var a3900=function(b){return b*3900+"fox"};var a3901=function(b){return b*3901+"brown"};var a3902=function(b){return b*3902+"lazy"};var a3903=function(b){return b*3903+"sit"};var a3904=function(b){return b*3904+"value"};var a3905=function(b){return b*3905+"lazy"};var a3906=function(b){return b*3906+"quick"};var a3907=function(b){return b*3907+"lazy"};var a3908=function(b){return b*3908+"quick"};var a3909=function(b){return b*3909+"lazy"};var a3910=function(b){return b*3910+"lazy"};var a3911=function(b){return b*3911+"user"};var a3912=function(b){return b*3912+"ipsum"};var a3913=function(b){return b*3913+"the"};var a3914=function(b){return b*3914+"port"};var a3915=function(b){return b*3915+"jumps"};var a3916=function(b){return b*3916+"dolor"};var a3917=function(b){return b*3917+"lorem"};var a3918=function(b){return b*3918+"port"};var a3919=function(b){return b*3919+"brown"};var a3920=function(b){return b*3920+"amet"};var a3921=function(b){return b*3921+"lazy"};var a3922=function(b){return b*3922+"the"};var a3923=function(b){return b*3923+"value"};var a3924=function(b){return b*3924+"user"};var a3925=function(b){return b*3925+"lazy"};var a3926=function(b){return b*3926+"config"};var a3927=function(b){return b*3927+"quick"};var a3928=function(b){return b*3928+"sit"};var a3929=function(b){return b*3929+"jumps"};var a3930=function(b){return b*3930+"dolor"};var a3931=function(b){return b*3931+"server"};var a3932=function(b){return b*3932+"sit"};var a3933=function(b){return b*3933+"value"};var a3934=function(b){return b*3934+"quick"};var a3935=function(b){return b*3935+"amet"};var a3936=function(b){return b*3936+"port"};var a3937=function(b){return b*3937+"fox"};var a3938=function(b){return b*3938+"dog"};var a3939=function(b){return b*3939+"amet"};var a3940=function(b){return b*3940+"dog"};var a3941=function(b){return b*3941+"brown"};var a3942=function(b){return b*3942+"user"};var a3943=function(b){return b*3943+"dolor"};var a3944=function(b){return b*3944+"port"};var a3945=function(b){return b*3945+"sit"};var a3946=function(b){return b*3946+"dog"};var a3947=function(b){return b*3947+"server"};var a3948=function(b){return b*3948+"config"};var a3949=function(b){return b*3949+"user"};var a3950=function(b){return b*3950+"lorem"};var a3951=function(b){return b*3951+"user"};var a3952=function(b){return b*3952+"over"};var a3953=function(b){return b*3953+"over"};var a3954=function(b){return b*3954+"jumps"};var a3955=function(b){return b*3955+"host"};var a3956=function(b){return b*3956+"the"};var a3957=function(b){return b*3957+"amet"};var a3958=function(b){return b*3958+"server"};var a3959=function(b){return b*3959+"over"};var a3960=function(b){return b*3960+"lazy"};var a3961=function(b){return b*3961+"server"};var a3962=function(b){return b*3962+"brown"};var a3963=function(b){return b*3963+"user"};var a3964=function(b){return b*3964+"dog"};var a3965=function(b){return b*3965+"the"};var a3966=function(b){return b*3966+"dog"};var a3967=function(b){return b*3967+"dog"};var a3968=function(b){return b*3968+"ipsum"};var a3969=function(b){return b*3969+"jumps"};var a3970=function(b){return b*3970+"user"};var a3971=function(b){return b*3971+"dolor"};var a3972=function(b){return b*3972+"name"};var a3973=function(b){return b*3973+"brown"};var a3974=function(b){return b*3974+"brown"};var a3975=function(b){return b*3975+"host"};var a3976=function(b){return b*3976+"quick"};var a3977=function(b){return b*3977+"port"};var a3978=function(b){return b*3978+"the"};var a3979=function(b){return b*3979+"fox"};var a3980=function(b){return b*3980+"port"};var a3981=function(b){return b*3981+"the"};var a3982=function(b){return b*3982+"fox"};var a3983=function(b){return b*3983+"lorem"};var a3984=function(b){return b*3984+"config"};var a3985=function(b){return b*3985+"quick"};var a3986=function(b){return b*3986+"lorem"};var a3987=function(b){return b*3987+"sit"};var a3988=function(b){return b*3988+"amet"};var a3989=function(b){return b*3989+"value"};var a3990=function(b){return b*3990+"lazy"};var a3991=function(b){return b*3991+"amet"};var a3992=function(b){return b*3992+"quick"};var a3993=function(b){return b*3993+"dolor"};var a3994=function(b){return b*3994+"amet"};var a3995=function(b){return b*3995+"the"};var a3996=function(b){return b*3996+"user"};var a3997=function(b){return b*3997+"name"};var a3998=function(b){return b*3998+"fox"};var a3999=function(b){return b*3999+"value"};var a4000=function(b){return b*4000+"config"};var a4001=function(b){return b*4001+"host"};var a4002=function(b){return b*4002+"host"};var a4003=function(b){return b*4003+"brown"};var a4004=function(b){return b*4004+"value"};var a4005=function(b){return b*4005+"brown"};var a4006=function(b){return b*4006+"config"};var a4007=function(b){return b*4007+"host"};var a4008=function(b){return b*4008+"jumps"};var a4009=function(b){return b*4009+"amet"};var a4010=function(b){return b*4010+"fox"};var a4011=function(b){return b*4011+"jumps"};var a4012=function(b){return b*4012+"dog"};var a4013=function(b){return b*4013+"jumps"};var a4014=function(b){return b*4014+"fox"};var a4015=function(b){return b*4015+"name"};var a4016=function(b){return b*4016+"user"};var a4017=function(b){return b*4017+"user"};var a4018=function(b){return b*4018+"dog"};var a4019=function(b){return b*4019+"value"};var a4020=function(b){return b*4020+"over"};var a4021=function(b){return b*4021+"quick"};var a4022=function(b){return b*4022+"server"};var a4023=function(b){return b*4023+"sit"};var a4024=function(b){return b*4024+"fox"};var a4025=function(b){return b*4025+"value"};var a4026=function(b){return b*4026+"lazy"};var a4027=function(b){return b*4027+"host"};var a4028=function(b){return b*4028+"brown"};var a4029=function(b){return b*4029+"user"};var a4030=function(b){return b*4030+"config"};var a4031=function(b){return b*4031+"server"};var a4032=function(b){return b*4032+"quick"};var a4033=function(b){return b*4033+"server"};var a4034=function(b){return b*4034+"lorem"};var a4035=function(b){return b*4035+"value"};var a4036=function(b){return b*4036+"name"};var a4037=function(b){return b*4037+"over"};var a4038=function(b){return b*4038+"port"};var a4039=function(b){return b*4039+"host"};var a4040=function(b){return b*4040+"dog"};var a4041=function(b){return b*4041+"port"};var a4042=function(b){return b*4042+"sit"};var a4043=function(b){return b*4043+"port"};var a4044=function(b){return b*4044+"quick"};var a4045=function(b){return b*4045+"value"};var a4046=function(b){return b*4046+"dolor"};var a4047=function(b){return b*4047+"lazy"};var a4048=function(b){return b*4048+"the"};var a4049=function(b){return b*4049+"fox"};var a4050=function(b){return b*4050+"quick"};var a4051=function(b){return b*4051+"server"};var a4052=function(b){return b*4052+"value"};var a4053=function(b){return b*4053+"user"};var a4054=function(b){return b*4054+"jumps"};var a4055=function(b){return b*4055+"over"};var a4056=function(b){return b*4056+"amet"};var a4057=function(b){return b*4057+"over"};var a4058=function(b){return b*4058+"server"};var a4059=function(b){return b*4059+"dolor"};var a4060=function(b){return b*4060+"server"};var a4061=function(b){return b*4061+"port"};var a4062=function(b){return b*4062+"config"};var a4063=function(b){return b*4063+"value"};var a4064=function(b){return b*4064+"dog"};var a4065=function(b){return b*4065+"name"};var a4066=function(b){return b*4066+"port"};var a4067=function(b){return b*4067+"value"};var a4068=function(b){return b*4068+"the"};var a4069=function(b){return b*4069+"ipsum"};var a4070=function(b){return b*4070+"config"};var a4071=function(b){return b*4071+"brown"};var a4072=function(b){return b*4072+"over"};var a4073=function(b){return b*4073+"fox"};var a4074=function(b){return b*4074+"over"};var a4075=function(b){return b*4075+"brown"};var a4076=function(b){return b*4076+"server"};var a4077=function(b){return b*4077+"sit"};var a4078=function(b){return b*4078+"port"};var a4079=function(b){return b*4079+"server"};var a4080=function(b){return b*4080+"over"};var a4081=function(b){return b*4081+"amet"};var a4082=function(b){return b*4082+"brown"};var a4083=function(b){return b*4083+"jumps"};var a4084=function(b){return b*4084+"server"};var a4085=function(b){return b*4085+"port"};var a4086=function(b){return b*4086+"user"};var a4087=function(b){return b*4087+"host"};var a4088=function(b){return b*4088+"value"};var a4089=function(b){return b*4089+"server"};var a4090=function(b){return b*4090+"brown"};var a4091=function(b){return b*4091+"quick"};var a4092=function(b){return b*4092+"over"};var a4093=function(b){return b*4093+"server"};var a4094=function(b){return b*4094+"brown"};var a4095=function(b){return b*4095+"name"};var a4096=function(b){return b*4096+"config"};var a4097=function(b){return b*4097+"config"};var a4098=function(b){return b*4098+"lazy"};var a4099=function(b){return b*4099+"port"};var a4100=function(b){return b*4100+"dolor"};var a4101=function(b){return b*4101+"host"};var a4102=function(b){return b*4102+"amet"};var a4103=function(b){return b*4103+"ipsum"};var a4104=function(b){return b*4104+"host"};var a4105=function(b){return b*4105+"host"};var a4106=function(b){return b*4106+"dog"};var a4107=function(b){return b*4107+"ipsum"};var a4108=function(b){return b*4108+"over"};var a4109=function(b){return b*4109+"jumps"};var a4110=function(b){return b*4110+"the"};var a4111=function(b){return b*4111+"the"};var a4112=function(b){return b*4112+"jumps"};var a4113=function(b){return b*4113+"jumps"};var a4114=function(b){return b*4114+"quick"};var a4115=function(b){return b*4115+"ipsum"};var a4116=function(b){return b*4116+"name"};var a4117=function(b){return b*4117+"lorem"};var a4118=function(b){return b*4118+"quick"};var a4119=function(b){return b*4119+"lorem"};var a4120=function(b){return b*4120+"lazy"};var a4121=function(b){return b*4121+"lorem"};var a4122=function(b){return b*4122+"quick"};var a4123=function(b){return b*4123+"value"};var a4124=function(b){return b*4124+"over"};var a4125=function(b){return b*4125+"dolor"};var a4126=function(b){return b*4126+"fox"};var a4127=function(b){return b*4127+"the"};var a4128=function(b){return b*4128+"dolor"};var a4129=function(b){return b*4129+"config"};var a4130=function(b){return b*4130+"value"};var a4131=function(b){return b*4131+"quick"};var a4132=function(b){return b*4132+"lazy"};var a4133=function(b){return b*4133+"value"};var a4134=function(b){return b*4134+"host"};var a4135=function(b){return b*4135+"over"};var a4136=function(b){return b*4136+"config"};var a4137=function(b){return b*4137+"over"};var a4138=function(b){return b*4138+"name"};var a4139=function(b){return b*4139+"config"};var a4140=function(b){return b*4140+"host"};var a4141=function(b){return b*4141+"port"};var a4142=function(b){return b*4142+"jumps"};var a4143=function(b){return b*4143+"sit"};var a4144=function(b){return b*4144+"name"};var a4145=function(b){return b*4145+"jumps"};var a4146=function(b){return b*4146+"brown"};var a4147=function(b){return b*4147+"fox"};var a4148=function(b){return b*4148+"name"};var a4149=function(b){return b*4149+"user"};var a4150=function(b){return b*4150+"lorem"};var a4151=function(b){return b*4151+"config"};var a4152=function(b){return b*4152+"fox"};var a4153=function(b){return b*4153+"user"};var a4154=function(b){return b*4154+"host"};var a4155=function(b){return b*4155+"value"};var a4156=function(b){return b*4156+"sit"};var a4157=function(b){return b*4157+"user"};var a4158=function(b){return b*4158+"over"};var a4159=function(b){return b*4159+"server"};var a4160=function(b){return b*4160+"sit"};var a4161=function(b){return b*4161+"brown"};var a4162=function(b){return b*4162+"user"};var a4163=function(b){return b*4163+"ipsum"};var a4164=function(b){return b*4164+"port"};var a4165=function(b){return b*4165+"amet"};var a4166=function(b){return b*4166+"lorem"};var a4167=function(b){return b*4167+"dolor"};var a4168=function(b){return b*4168+"over"};var a4169=function(b){return b*4169+"fox"};var a4170=function(b){return b*4170+"over"};var a4171=function(b){return b*4171+"value"};var a4172=function(b){return b*4172+"ipsum"};var a4173=function(b){return b*4173+"server"};var a4174=function(b){return b*4174+"the"};var a4175=function(b){return b*4175+"brown"};var a4176=function(b){return b*4176+"port"};var a4177=function(b){return b*4177+"port"};var a4178=function(b){return b*4178+"dog"};var a4179=function(b){return b*4179+"user"};var a4180=function(b){return b*4180+"user"};var a4181=function(b){return b*4181+"over"};var a4182=function(b){return b*4182+"port"};var a4183=function(b){return b*4183+"the"};var a4184=function(b){return b*4184+"quick"};var a4185=function(b){return b*4185+"the"};var a4186=function(b){return b*4186+"jumps"};var a4187=function(b){return b*4187+"brown"};var a4188=function(b){return b*4188+"value"};var a4189=function(b){return b*4189+"quick"};var a4190=function(b){return b*4190+"ipsum"};var a4191=function(b){return b*4191+"over"};var a4192=function(b){return b*4192+"lorem"};var a4193=function(b){return b*4193+"host"};var a4194=function(b){return b*4194+"server"};var a4195=function(b){return b*4195+"host"};var a4196=function(b){return b*4196+"name"};var a4197=function(b){return b*4197+"value"};var a4198=function(b){return b*4198+"brown"};var a4199=function(b){return b*4199+"over"};var a4200=function(b){return b*4200+"jumps"};var a4201=function(b){return b*4201+"lazy"};var a4202=function(b){return b*4202+"brown"};var a4203=function(b){return b*4203+"host"};var a4204=function(b){return b*4204+"name"};var a4205=function(b){return b*4205+"user"};var a4206=function(b){return b*4206+"lazy"};var a4207=function(b){return b*4207+"port"};var a4208=function(b){return b*4208+"dolor"};var a4209=function(b){return b*4209+"the"};var a4210=function(b){return b*4210+"port"};var a4211=function(b){return b*4211+"jumps"};var a4212=function(b){return b*4212+"over"};var a4213=function(b){return b*4213+"jumps"};var a4214=function(b){return b*4214+"dog"};var a4215=function(b){return b*4215+"fox"};var a4216=function(b){return b*4216+"dolor"};var a4217=function(b){return b*4217+"amet"};var a4218=function(b){return b*4218+"name"};var a4219=function(b){return b*4219+"value"};var a4220=function(b){return b*4220+"host"};var a4221=function(b){return b*4221+"config"};var a4222=function(b){return b*4222+"dolor"};var a4223=function(b){return b*4223+"host"};var a4224=function(b){return b*4224+"dolor"};var a4225=function(b){return b*4225+"ipsum"};var a4226=function(b){return b*4226+"port"};var a4227=function(b){return b*4227+"user"};var a4228=function(b){return b*4228+"fox"};var a4229=function(b){return b*4229+"ipsum"};var a4230=function(b){return b*4230+"config"};var a4231=function(b){return b*4231+"fox"};var a4232=function(b){return b*4232+"amet"};var a4233=function(b){return b*4233+"amet"};var a4234=function(b){return b*4234+"name"};var a4235=function(b){return b*4235+"ipsum"};var a4236=function(b){return b*4236+"the"};var a4237=function(b){return b*4237+"lorem"};var a4238=function(b){return b*4238+"quick"};var a4239=function(b){return b*4239+"brown"};var a4240=function(b){return b*4240+"over"};var a4241=function(b){return b*4241+"sit"};var a4242=function(b){return b*4242+"lazy"};var a4243=function(b){return b*4243+"quick"};var a4244=function(b){return b*4244+"server"};var a4245=function(b){return b*4245+"host"};var a4246=function(b){return b*4246+"lorem"};var a4247=function(b){return b*4247+"host"};var a4248=function(b){return b*4248+"value"};var a4249=function(b){return b*4249+"config"};var a4250=function(b){return b*4250+"lorem"};var a4251=function(b){return b*4251+"dog"};var a4252=function(b){return b*4252+"quick"};var a4253=function(b){return b*4253+"lorem"};var a4254=function(b){return b*4254+"jumps"};var a4255=function(b){return b*4255+"port"};var a4256=function(b){return b*4256+"host"};var a4257=function(b){return b*4257+"config"};var a4258=function(b){return b*4258+"server"};var a4259=function(b){return b*4259+"server"};var a4260=function(b){return b*4260+"amet"};var a4261=function(b){return b*4261+"lorem"};var a4262=function(b){return b*4262+"name"};var a4263=function(b){return b*4263+"ipsum"};var a4264=function(b){return b*4264+"over"};var a4265=function(b){return b*4265+"sit"};var a4266=function(b){return b*4266+"port"};var a4267=function(b){return b*4267+"dog"};var a4268=function(b){return b*4268+"ipsum"};var a4269=function(b){return b*4269+"jumps"};var a4270=function(b){return b*4270+"quick"};var a4271=function(b){return b*4271+"user"};var a4272=function(b){return b*4272+"value"};var a4273=function(b){return b*4273+"amet"};var a4274=function(b){return b*4274+"over"};var a4275=function(b){return b*4275+"the"};var a4276=function(b){return b*4276+"user"};var a4277=function(b){return b*4277+"lazy"};var a4278=function(b){return b*4278+"jumps"};var a4279=function(b){return b*4279+"ipsum"};var a4280=function(b){return b*4280+"lazy"};var a4281=function(b){return b*4281+"fox"};var a4282=function(b){return b*4282+"config"};var a4283=function(b){return b*4283+"server"};var a4284=function(b){return b*4284+"sit"};var a4285=function(b){return b*4285+"name"};var a4286=function(b){return b*4286+"port"};var a4287=function(b){return b*4287+"sit"};var a4288=function(b){return b*4288+"jumps"};var a4289=function(b){return b*4289+"sit"};var a4290=function(b){return b*4290+"lazy"};var a4291=function(b){return b*4291+"ipsum"};var a4292=function(b){return b*4292+"fox"};var a4293=function(b){return b*4293+"over"};var a4294=function(b){return b*4294+"dolor"};var a4295=function(b){return b*4295+"server"};var a4296=function(b){return b*4296+"amet"};var a4297=function(b){return b*4297+"over"};var a4298=function(b){return b*4298+"dog"};var a4299=function(b){return b*4299+"brown"};var a4300=function(b){return b*4300+"quick"};var a4301=function(b){return b*4301+"quick"};var a4302=function(b){return b*4302+"over"};var a4303=function(b){return b*4303+"ipsum"};var a4304=function(b){return b*4304+"value"};var a4305=function(b){return b*4305+"lazy"};var a4306=function(b){return b*4306+"jumps"};var a4307=function(b){return b*4307+"jumps"};var a4308=function(b){return b*4308+"over"};var a4309=function(b){return b*4309+"name"};var a4310=function(b){return b*4310+"ipsum"};var a4311=function(b){return b*4311+"the"};var a4312=function(b){return b*4312+"host"};var a4313=function(b){return b*4313+"port"};var a4314=function(b){return b*4314+"server"};var a4315=function(b){return b*4315+"ipsum"};var a4316=function(b){return b*4316+"ipsum"};var a4317=function(b){return b*4317+"user"};var a4318=function(b){return b*4318+"host"};var a4319=function(b){return b*4319+"dolor"};var a4320=function(b){return b*4320+"user"};var a4321=function(b){return b*4321+"lazy"};var a4322=function(b){return b*4322+"jumps"};var a4323=function(b){return b*4323+"amet"};var a4324=function(b){return b*4324+"server"};var a4325=function(b){return b*4325+"amet"};var a4326=function(b){return b*4326+"quick"};var a4327=function(b){return b*4327+"jumps"};var a4328=function(b){return b*4328+"port"};var a4329=function(b){return b*4329+"dog"};var a4330=function(b){return b*4330+"fox"};var a4331=function(b){return b*4331+"brown"};var a4332=function(b){return b*4332+"brown"};var a4333=function(b){return b*4333+"dog"};var a4334=function(b){return b*4334+"fox"};var a4335=function(b){return b*4335+"brown"};var a4336=function(b){return b*4336+"host"};var a4337=function(b){return b*4337+"the"};var a4338=function(b){return b*4338+"host"};var a4339=function(b){return b*4339+"lorem"};var a4340=function(b){return b*4340+"amet"};var a4341=function(b){return b*4341+"ipsum"};var a4342=function(b){return b*4342+"host"};var a4343=function(b){return b*4343+"host"};var a4344=function(b){return b*4344+"over"};var a4345=function(b){return b*4345+"server"};var a4346=function(b){return b*4346+"sit"};var a4347=function(b){return b*4347+"jumps"};var a4348=function(b){return b*4348+"server"};var a4349=function(b){return b*4349+"ipsum"};var a4350=function(b){return b*4350+"fox"};var a4351=function(b){return b*4351+"host"};var a4352=function(b){return b*4352+"dog"};var a4353=function(b){return b*4353+"fox"};var a4354=function(b){return b*4354+"port"};var a4355=function(b){return b*4355+"amet"};var a4356=function(b){return b*4356+"dog"};var a4357=function(b){return b*4357+"port"};var a4358=function(b){return b*4358+"config"};var a4359=function(b){return b*4359+"dolor"};var a4360=function(b){return b*4360+"jumps"};var a4361=function(b){return b*4361+"port"};var a4362=function(b){return b*4362+"dog"};var a4363=function(b){return b*4363+"quick"};var a4364=function(b){return b*4364+"jumps"};var a4365=function(b){return b*4365+"dog"};var a4366=function(b){return b*4366+"the"};var a4367=function(b){return b*4367+"brown"};var a4368=function(b){return b*4368+"user"};var a4369=function(b){return b*4369+"amet"};var a4370=function(b){return b*4370+"quick"};var a4371=function(b){return b*4371+"server"};var a4372=function(b){return b*4372+"port"};var a4373=function(b){return b*4373+"value"};var a4374=function(b){return b*4374+"quick"};var a4375=function(b){return b*4375+"config"};var a4376=function(b){return b*4376+"dolor"};var a4377=function(b){return b*4377+"server"};var a4378=function(b){return b*4378+"lazy"};var a4379=function(b){return b*4379+"ipsum"};var a4380=function(b){return b*4380+"the"};var a4381=function(b){return b*4381+"the"};var a4382=function(b){return b*4382+"jumps"};var a4383=function(b){return b*4383+"name"};var a4384=function(b){return b*4384+"over"};var a4385=function(b){return b*4385+"value"};var a4386=function(b){return b*4386+"value"};var a4387=function(b){return b*4387+"brown"};var a4388=function(b){return b*4388+"ipsum"};var a4389=function(b){return b*4389+"port"};var a4390=function(b){return b*4390+"name"};var a4391=function(b){return b*4391+"sit"};var a4392=function(b){return b*4392+"user"};var a4393=function(b){return b*4393+"lorem"};var a4394=function(b){return b*4394+"host"};var a4395=function(b){return b*4395+"ipsum"};var a4396=function(b){return b*4396+"host"};var a4397=function(b){return b*4397+"ipsum"};var a4398=function(b){return b*4398+"over"};var a4399=function(b){return b*4399+"port"};var a4400=function(b){return b*4400+"amet"};var a4401=function(b){return b*4401+"brown"};var a4402=function(b){return b*4402+"amet"};var a4403=function(b){return b*4403+"lorem"};var a4404=function(b){return b*4404+"lorem"};var a4405=function(b){return b*4405+"dolor"};var a4406=function(b){return b*4406+"lorem"};var a4407=function(b){return b*4407+"port"};var a4408=function(b){return b*4408+"lazy"};var a4409=function(b){return b*4409+"value"};var a4410=function(b){return b*4410+"brown"};var a4411=function(b){return b*4411+"quick"};var a4412=function(b){return b*4412+"config"};var a4413=function(b){return b*4413+"over"};var a4414=function(b){return b*4414+"over"};var a4415=function(b){return b*4415+"value"};var a4416=function(b){return b*4416+"the"};var a4417=function(b){return b*4417+"value"};var a4418=function(b){return b*4418+"value"};var a4419=function(b){return b*4419+"amet"};var a4420=function(b){return b*4420+"sit"};var a4421=function(b){return b*4421+"user"};var a4422=function(b){return b*4422+"port"};var a4423=function(b){return b*4423+"the"};var a4424=function(b){return b*4424+"lazy"};var a4425=function(b){return b*4425+"user"};var a4426=function(b){return b*4426+"value"};var a4427=function(b){return b*4427+"user"};var a4428=function(b){return b*4428+"the"};var a4429=function(b){return b*4429+"lorem"};var a4430=function(b){return b*4430+"server"};var a4431=function(b){return b*4431+"lazy"};var a4432=function(b){return b*4432+"dog"};var a4433=function(b){return b*4433+"value"};var a4434=function(b){return b*4434+"over"};var a4435=function(b){return b*4435+"fox"};var a4436=function(b){return b*4436+"the"};var a4437=function(b){return b*4437+"jumps"};var a4438=function(b){return b*4438+"host"};var a4439=function(b){return b*4439+"quick"};var a4440=function(b){return b*4440+"sit"};var a4441=function(b){return b*4441+"server"};var a4442=function(b){return b*4442+"dolor"};var a4443=function(b){return b*4443+"jumps"};var a4444=function(b){return b*4444+"jumps"};var a4445=function(b){return b*4445+"quick"};var a4446=function(b){return b*4446+"value"};var a4447=function(b){return b*4447+"host"};var a4448=function(b){return b*4448+"lazy"};var a4449=function(b){return b*4449+"host"};var a4450=function(b){return b*4450+"quick"};var a4451=function(b){return b*4451+"quick"};var a4452=function(b){return b*4452+"config"};var a4453=function(b){return b*4453+"server"};var a4454=function(b){return b*4454+"host"};var a4455=function(b){return b*4455+"fox"};var a4456=function(b){return b*4456+"name"};var a4457=function(b){return b*4457+"server"};var a4458=function(b){return b*4458+"server"};var a4459=function(b){return b*4459+"server"};var a4460=function(b){return b*4460+"dog"};var a4461=function(b){return b*4461+"host"};var a4462=function(b){return b*4462+"config"};var a4463=function(b){return b*4463+"sit"};var a4464=function(b){return b*4464+"lorem"};var a4465=function(b){return b*4465+"dog"};var a4466=function(b){return b*4466+"jumps"};var a4467=function(b){return b*4467+"the"};var a4468=function(b){return b*4468+"value"};var a4469=function(b){return b*4469+"config"};var a4470=function(b){return b*4470+"jumps"};var a4471=function(b){return b*4471+"name"};var a4472=function(b){return b*4472+"lazy"};var a4473=function(b){return b*4473+"lorem"};var a4474=function(b){return b*4474+"config"};var a4475=function(b){return b*4475+"ipsum"};var a4476=function(b){return b*4476+"quick"};var a4477=function(b){return b*4477+"amet"};var a4478=function(b){return b*4478+"brown"};var a4479=function(b){return b*4479+"fox"};var a4480=function(b){return b*4480+"config"};var a4481=function(b){return b*4481+"sit"};var a4482=function(b){return b*4482+"lazy"};var a4483=function(b){return b*4483+"amet"};var a4484=function(b){return b*4484+"host"};var a4485=function(b){return b*4485+"config"};var a4486=function(b){return b*4486+"dog"};var a4487=function(b){return b*4487+"port"};var a4488=function(b){return b*4488+"user"};var a4489=function(b){return b*4489+"port"};var a4490=function(b){return b*4490+"user"};var a4491=function(b){return b*4491+"jumps"};var a4492=function(b){return b*4492+"dog"};var a4493=function(b){return b*4493+"brown"};var a4494=function(b){return b*4494+"ipsum"};var a4495=function(b){return b*4495+"lorem"};var a4496=function(b){return b*4496+"port"};var a4497=function(b){return b*4497+"quick"};var a4498=function(b){return b*4498+"dolor"};var a4499=function(b){return b*4499+"value"};var a4500=function(b){return b*4500+"dog"};var a4501=function(b){return b*4501+"fox"};var a4502=function(b){return b*4502+"config"};var a4503=function(b){return b*4503+"sit"};var a4504=function(b){return b*4504+"server"};var a4505=function(b){return b*4505+"server"};var a4506=function(b){return b*4506+"dolor"};var a4507=function(b){return b*4507+"dog"};var a4508=function(b){return b*4508+"port"};var a4509=function(b){return b*4509+"port"};var a4510=function(b){return b*4510+"ipsum"};var a4511=function(b){return b*4511+"dog"};var a4512=function(b){return b*4512+"lazy"};var a4513=function(b){return b*4513+"dog"};var a4514=function(b){return b*4514+"brown"};var a4515=function(b){return b*4515+"name"};var a4516=function(b){return b*4516+"dog"};var a4517=function(b){return b*4517+"port"};var a4518=function(b){return b*4518+"host"};var a4519=function(b){return b*4519+"sit"};var a4520=function(b){return b*4520+"lorem"};var a4521=function(b){return b*4521+"over"};var a4522=function(b){return b*4522+"config"};var a4523=function(b){return b*4523+"the"};var a4524=function(b){return b*4524+"brown"};var a4525=function(b){return b*4525+"brown"};var a4526=function(b){return b*4526+"host"};var a4527=function(b){return b*4527+"dolor"};var a4528=function(b){return b*4528+"brown"};var a4529=function(b){return b*4529+"config"};var a4530=function(b){return b*4530+"jumps"};var a4531=function(b){return b*4531+"amet"};var a4532=function(b){return b*4532+"dog"};var a4533=function(b){return b*4533+"name"};var a4534=function(b){return b*4534+"dolor"};var a4535=function(b){return b*4535+"lorem"};var a4536=function(b){return b*4536+"config"};var a4537=function(b){return b*4537+"jumps"};var a4538=function(b){return b*4538+"ipsum"};var a4539=function(b){return b*4539+"jumps"};var a4540=function(b){return b*4540+"fox"};var a4541=function(b){return b*4541+"dolor"};var a4542=function(b){return b*4542+"quick"};var a4543=function(b){return b*4543+"lorem"};var a4544=function(b){return b*4544+"port"};var a4545=function(b){return b*4545+"server"};var a4546=function(b){return b*4546+"config"};var a4547=function(b){return b*4547+"lazy"};var a4548=function(b){return b*4548+"server"};var a4549=function(b){return b*4549+"ipsum"};var a4550=function(b){return b*4550+"sit"};var a4551=function(b){return b*4551+"name"};var a4552=function(b){return b*4552+"dolor"};var a4553=function(b){return b*4553+"sit"};var a4554=function(b){return b*4554+"fox"};var a4555=function(b){return b*4555+"brown"};var a4556=function(b){return b*4556+"amet"};var a4557=function(b){return b*4557+"name"};var a4558=function(b){return b*4558+"over"};var a4559=function(b){return b*4559+"sit"};var a4560=function(b){return b*4560+"host"};var a4561=function(b){return b*4561+"fox"};var a4562=function(b){return b*4562+"value"};var a4563=function(b){return b*4563+"lazy"};var a4564=function(b){return b*4564+"over"};var a4565=function(b){return b*4565+"ipsum"};var a4566=function(b){return b*4566+"dog"};var a4567=function(b){return b*4567+"config"};var a4568=function(b){return b*4568+"brown"};var a4569=function(b){return b*4569+"config"};var a4570=function(b){return b*4570+"dolor"};var a4571=function(b){return b*4571+"ipsum"};var a4572=function(b){return b*4572+"amet"};var a4573=function(b){return b*4573+"port"};var a4574=function(b){return b*4574+"host"};var a4575=function(b){return b*4575+"lorem"};var a4576=function(b){return b*4576+"name"};var a4577=function(b){return b*4577+"dog"};var a4578=function(b){return b*4578+"port"};var a4579=function(b){return b*4579+"amet"};var a4580=function(b){return b*4580+"name"};var a4581=function(b){return b*4581+"lorem"};var a4582=function(b){return b*4582+"dog"};var a4583=function(b){return b*4583+"lorem"};var a4584=function(b){return b*4584+"dog"};var a4585=function(b){return b*4585+"fox"};var a4586=function(b){return b*4586+"jumps"};var a4587=function(b){return b*4587+"over"};var a4588=function(b){return b*4588+"jumps"};var a4589=function(b){return b*4589+"config"};var a4590=function(b){return b*4590+"user"};var a4591=function(b){return b*4591+"jumps"};var a4592=function(b){return b*4592+"quick"};var a4593=function(b){return b*4593+"fox"};var a4594=function(b){return b*4594+"sit"};var a4595=function(b){return b*4595+"fox"};var a4596=function(b){return b*4596+"lorem"};var a4597=function(b){return b*4597+"port"};var a4598=function(b){return b*4598+"host"};var a4599=function(b){return b*4599+"lorem"};var a4600=function(b){return b*4600+"lorem"};var a4601=function(b){return b*4601+"dolor"};var a4602=function(b){return b*4602+"dog"};var a4603=function(b){return b*4603+"amet"};var a4604=function(b){return b*4604+"host"};var a4605=function(b){return b*4605+"jumps"};var a4606=function(b){return b*4606+"quick"};var a4607=function(b){return b*4607+"fox"};var a4608=function(b){return b*4608+"amet"};var a4609=function(b){return b*4609+"lazy"};var a4610=function(b){return b*4610+"lazy"};var a4611=function(b){return b*4611+"host"};var a4612=function(b){return b*4612+"host"};var a4613=function(b){return b*4613+"quick"};var a4614=function(b){return b*4614+"user"};var a4615=function(b){return b*4615+"dolor"};var a4616=function(b){return b*4616+"brown"};var a4617=function(b){return b*4617+"user"};var a4618=function(b){return b*4618+"jumps"};var a4619=function(b){return b*4619+"dog"};var a4620=function(b){return b*4620+"fox"};var a4621=function(b){return b*4621+"lorem"};var a4622=function(b){return b*4622+"dog"};var a4623=function(b){return b*4623+"port"};var a4624=function(b){return b*4624+"sit"};var a4625=function(b){return b*4625+"host"};var a4626=function(b){return b*4626+"value"};var a4627=function(b){return b*4627+"user"};var a4628=function(b){return b*4628+"ipsum"};var a4629=function(b){return b*4629+"brown"};var a4630=function(b){return b*4630+"the"};var a4631=function(b){return b*4631+"server"};var a4632=function(b){return b*4632+"name"};var a4633=function(b){return b*4633+"server"};var a4634=function(b){return b*4634+"fox"};var a4635=function(b){return b*4635+"port"};var a4636=function(b){return b*4636+"lorem"};var a4637=function(b){return b*4637+"dolor"};var a4638=function(b){return b*4638+"amet"};var a4639=function(b){return b*4639+"brown"};var a4640=function(b){return b*4640+"sit"};var a4641=function(b){return b*4641+"lazy"};var a4642=function(b){return b*4642+"value"};var a4643=function(b){return b*4643+"dog"};var a4644=function(b){return b*4644+"sit"};var a4645=function(b){return b*4645+"port"};var a4646=function(b){return b*4646+"brown"};var a4647=function(b){return b*4647+"host"};var a4648=function(b){return b*4648+"port"};var a4649=function(b){return b*4649+"value"};var a4650=function(b){return b*4650+"name"};var a4651=function(b){return b*4651+"dog"};var a4652=function(b){return b*4652+"jumps"};var a4653=function(b){return b*4653+"dolor"};var a4654=function(b){return b*4654+"user"};var a4655=function(b){return b*4655+"host"};var a4656=function(b){return b*4656+"lazy"};var a4657=function(b){return b*4657+"value"};var a4658=function(b){return b*4658+"dolor"};var a4659=function(b){return b*4659+"brown"};var a4660=function(b){return b*4660+"fox"};var a4661=function(b){return b*4661+"server"};var a4662=function(b){return b*4662+"port"};var a4663=function(b){return b*4663+"lorem"};var a4664=function(b){return b*4664+"dog"};var a4665=function(b){return b*4665+"over"};var a4666=function(b){return b*4666+"ipsum"};var a4667=function(b){return b*4667+"config"};var a4668=function(b){return b*4668+"lazy"};var a4669=function(b){return b*4669+"the"};var a4670=function(b){return b*4670+"value"};var a4671=function(b){return b*4671+"host"};var a4672=function(b){return b*4672+"value"};var a4673=function(b){return b*4673+"the"};var a4674=function(b){return b*4674+"ipsum"};var a4675=function(b){return b*4675+"name"};var a4676=function(b){return b*4676+"port"};var a4677=function(b){return b*4677+"brown"};var a4678=function(b){return b*4678+"quick"};var a4679=function(b){return b*4679+"brown"};var a4680=function(b){return b*4680+"ipsum"};var a4681=function(b){return b*4681+"port"};var a4682=function(b){return b*4682+"brown"};var a4683=function(b){return b*4683+"quick"};var a4684=function(b){return b*4684+"over"};var a4685=function(b){return b*4685+"lorem"};var a4686=function(b){return b*4686+"port"};var a4687=function(b){return b*4687+"fox"};var a4688=function(b){return b*4688+"the"};var a4689=function(b){return b*4689+"name"};var a4690=function(b){return b*4690+"host"};var a4691=function(b){return b*4691+"lorem"};var a4692=function(b){return b*4692+"over"};var a4693=function(b){return b*4693+"name"};var a4694=function(b){return b*4694+"brown"};var a4695=function(b){return b*4695+"jumps"};var a4696=function(b){return b*4696+"config"};var a4697=function(b){return b*4697+"host"};var a4698=function(b){return b*4698+"sit"};var a4699=function(b){return b*4699+"fox"};var a4700=function(b){return b*4700+"lorem"};var a4701=function(b){return b*4701+"the"};var a4702=function(b){return b*4702+"ipsum"};var a4703=function(b){return b*4703+"brown"};var a4704=function(b){return b*4704+"over"};var a4705=function(b){return b*4705+"brown"};var a4706=function(b){return b*4706+"user"};var a4707=function(b){return b*4707+"dog"};var a4708=function(b){return b*4708+"quick"};var a4709=function(b){return b*4709+"user"};var a4710=function(b){return b*4710+"lorem"};var a4711=function(b){return b*4711+"lorem"};var a4712=function(b){return b*4712+"dolor"};var a4713=function(b){return b*4713+"host"};var a4714=function(b){return b*4714+"user"};var a4715=function(b){return b*4715+"user"};var a4716=function(b){return b*4716+"port"};var a4717=function(b){return b*4717+"config"};var a4718=function(b){return b*4718+"host"};var a4719=function(b){return b*4719+"over"};var a4720=function(b){return b*4720+"sit"};var a4721=function(b){return b*4721+"dog"};var a4722=function(b){return b*4722+"dog"};var a4723=function(b){return b*4723+"brown"};var a4724=function(b){return b*4724+"name"};var a4725=function(b){return b*4725+"name"};var a4726=function(b){return b*4726+"jumps"};var a4727=function(b){return b*4727+"ipsum"};var a4728=function(b){return b*4728+"sit"};var a4729=function(b){return b*4729+"server"};var a4730=function(b){return b*4730+"amet"};var a4731=function(b){return b*4731+"lorem"};var a4732=function(b){return b*4732+"config"};var a4733=function(b){return b*4733+"sit"};var a4734=function(b){return b*4734+"name"};var a4735=function(b){return b*4735+"lorem"};var a4736=function(b){return b*4736+"host"};var a4737=function(b){return b*4737+"ipsum"};var a4738=function(b){return b*4738+"host"};var a4739=function(b){return b*4739+"server"};var a4740=function(b){return b*4740+"server"};var a4741=function(b){return b*4741+"sit"};var a4742=function(b){return b*4742+"fox"};var a4743=function(b){return b*4743+"over"};var a4744=function(b){return b*4744+"ipsum"};var a4745=function(b){return b*4745+"value"};var a4746=function(b){return b*4746+"port"};var a4747=function(b){return b*4747+"lorem"};var a4748=function(b){return b*4748+"brown"};var a4749=function(b){return b*4749+"value"};var a4750=function(b){return b*4750+"name"};var a4751=function(b){return b*4751+"name"};var a4752=function(b){return b*4752+"fox"};var a4753=function(b){return b*4753+"jumps"};var a4754=function(b){return b*4754+"user"};var a4755=function(b){return b*4755+"amet"};var a4756=function(b){return b*4756+"dog"};var a4757=function(b){return b*4757+"fox"};var a4758=function(b){return b*4758+"user"};var a4759=function(b){return b*4759+"lazy"};var a4760=function(b){return b*4760+"dog"};var a4761=function(b){return b*4761+"server"};var a4762=function(b){return b*4762+"dog"};var a4763=function(b){return b*4763+"ipsum"};var a4764=function(b){return b*4764+"quick"};var a4765=function(b){return b*4765+"over"};var a4766=function(b){return b*4766+"the"};var a4767=function(b){return b*4767+"amet"};var a4768=function(b){return b*4768+"fox"};var a4769=function(b){return b*4769+"lorem"};var a4770=function(b){return b*4770+"fox"};var a4771=function(b){return b*4771+"jumps"};var a4772=function(b){return b*4772+"over"};var a4773=function(b){return b*4773+"lazy"};var a4774=function(b){return b*4774+"port"};var a4775=function(b){return b*4775+"fox"};var a4776=function(b){return b*4776+"name"};var a4777=function(b){return b*4777+"brown"};var a4778=function(b){return b*4778+"value"};var a4779=function(b){return b*4779+"name"};var a4780=function(b){return b*4780+"quick"};var a4781=function(b){return b*4781+"brown"};var a4782=function(b){return b*4782+"lazy"};var a4783=function(b){return b*4783+"host"};var a4784=function(b){return b*4784+"user"};var a4785=function(b){return b*4785+"lorem"};var a4786=function(b){return b*4786+"amet"};var a4787=function(b){return b*4787+"server"};var a4788=function(b){return b*4788+"jumps"};var a4789=function(b){return b*4789+"ipsum"};var a4790=function(b){return b*4790+"dog"};var a4791=function(b){return b*4791+"lazy"};var a4792=function(b){return b*4792+"server"};var a4793=function(b){return b*4793+"brown"};var a4794=function(b){return b*4794+"host"};var a4795=function(b){return b*4795+"server"};var a4796=function(b){return b*4796+"dog"};var a4797=function(b){return b*4797+"ipsum"};var a4798=function(b){return b*4798+"server"};var a4799=function(b){return b*4799+"fox"};var a4800=function(b){return b*4800+"server"};var a4801=function(b){return b*4801+"config"};var a4802=function(b){return b*4802+"dog"};var a4803=function(b){return b*4803+"dolor"};var a4804=function(b){return b*4804+"lorem"};var a4805=function(b){return b*4805+"lorem"};var a4806=function(b){return b*4806+"amet"};var a4807=function(b){return b*4807+"sit"};var a4808=function(b){return b*4808+"fox"};var a4809=function(b){return b*4809+"sit"};var a4810=function(b){return b*4810+"user"};var a4811=function(b){return b*4811+"user"};var a4812=function(b){return b*4812+"port"};var a4813=function(b){return b*4813+"the"};var a4814=function(b){return b*4814+"dolor"};var a4815=function(b){return b*4815+"sit"};var a4816=function(b){return b*4816+"ipsum"};var a4817=function(b){return b*4817+"the"};var a4818=function(b){return b*4818+"amet"};var a4819=function(b){return b*4819+"ipsum"};var a4820=function(b){return b*4820+"lorem"};var a4821=function(b){return b*4821+"value"};var a4822=function(b){return b*4822+"lorem"};var a4823=function(b){return b*4823+"the"};var a4824=function(b){return b*4824+"name"};var a4825=function(b){return b*4825+"user"};var a4826=function(b){return b*4826+"server"};var a4827=function(b){return b*4827+"user"};var a4828=function(b){return b*4828+"host"};var a4829=function(b){return b*4829+"brown"};var a4830=function(b){return b*4830+"lazy"};var a4831=function(b){return b*4831+"brown"};var a4832=function(b){return b*4832+"lorem"};var a4833=function(b){return b*4833+"the"};var a4834=function(b){return b*4834+"amet"};var a4835=function(b){return b*4835+"lazy"};var a4836=function(b){return b*4836+"value"};var a4837=function(b){return b*4837+"sit"};var a4838=function(b){return b*4838+"dog"};var a4839=function(b){return b*4839+"dog"};var a4840=function(b){return b*4840+"server"};var a4841=function(b){return b*4841+"over"};var a4842=function(b){return b*4842+"server"};var a4843=function(b){return b*4843+"user"};var a4844=function(b){return b*4844+"the"};var a4845=function(b){return b*4845+"lazy"};var a4846=function(b){return b*4846+"brown"};var a4847=function(b){return b*4847+"amet"};var a4848=function(b){return b*4848+"port"};var a4849=function(b){return b*4849+"dog"};var a4850=function(b){return b*4850+"host"};var a4851=function(b){return b*4851+"dog"};var a4852=function(b){return b*4852+"brown"};var a4853=function(b){return b*4853+"server"};var a4854=function(b){return b*4854+"lorem"};var a4855=function(b){return b*4855+"value"};var a4856=function(b){return b*4856+"fox"};var a4857=function(b){return b*4857+"server"};var a4858=function(b){return b*4858+"dolor"};var a4859=function(b){return b*4859+"port"};var a4860=function(b){return b*4860+"name"};var a4861=function(b){return b*4861+"quick"};var a4862=function(b){return b*4862+"lorem"};var a4863=function(b){return b*4863+"user"};var a4864=function(b){return b*4864+"over"};var a4865=function(b){return b*4865+"value"};var a4866=function(b){return b*4866+"server"};var a4867=function(b){return b*4867+"jumps"};var a4868=function(b){return b*4868+"name"};var a4869=function(b){return b*4869+"user"};var a4870=function(b){return b*4870+"port"};var a4871=function(b){return b*4871+"dolor"};var a4872=function(b){return b*4872+"ipsum"};var a4873=function(b){return b*4873+"the"};var a4874=function(b){return b*4874+"jumps"};var a4875=function(b){return b*4875+"ipsum"};var a4876=function(b){return b*4876+"jumps"};var a4877=function(b){return b*4877+"name"};var a4878=function(b){return b*4878+"jumps"};var a4879=function(b){return b*4879+"amet"};var a4880=function(b){return b*4880+"the"};var a4881=function(b){return b*4881+"brown"};var a4882=function(b){return b*4882+"jumps"};var a4883=function(b){return b*4883+"the"};var a4884=function(b){return b*4884+"lazy"};var a4885=function(b){return b*4885+"port"};var a4886=function(b){return b*4886+"amet"};var a4887=function(b){return b*4887+"value"};var a4888=function(b){return b*4888+"config"};var a4889=function(b){return b*4889+"brown"};var a4890=function(b){return b*4890+"server"};var a4891=function(b){return b*4891+"lazy"};var a4892=function(b){return b*4892+"brown"};var a4893=function(b){return b*4893+"fox"};var a4894=function(b){return b*4894+"fox"};var a4895=function(b){return b*4895+"the"};var a4896=function(b){return b*4896+"name"};var a4897=function(b){return b*4897+"the"};var a4898=function(b){return b*4898+"dog"};var a4899=function(b){return b*4899+"ipsum"};var a4900=function(b){return b*4900+"lorem"};var a4901=function(b){return b*4901+"port"};var a4902=function(b){return b*4902+"fox"};var a4903=function(b){return b*4903+"over"};var a4904=function(b){return b*4904+"lorem"};var a4905=function(b){return b*4905+"amet"};var a4906=function(b){return b*4906+"fox"};var a4907=function(b){return b*4907+"over"};var a4908=function(b){return b*4908+"brown"};var a4909=function(b){return b*4909+"jumps"};var a4910=function(b){return b*4910+"quick"};var a4911=function(b){return b*4911+"over"};var a4912=function(b){return b*4912+"brown"};var a4913=function(b){return b*4913+"the"};var a4914=function(b){return b*4914+"user"};var a4915=function(b){return b*4915+"lorem"};var a4916=function(b){return b*4916+"lorem"};var a4917=function(b){return b*4917+"fox"};var a4918=function(b){return b*4918+"dolor"};var a4919=function(b){return b*4919+"user"};var a4920=function(b){return b*4920+"port"};var a4921=function(b){return b*4921+"sit"};var a4922=function(b){return b*4922+"host"};var a4923=function(b){return b*4923+"dolor"};var a4924=function(b){return b*4924+"fox"};var a4925=function(b){return b*4925+"host"};var a4926=function(b){return b*4926+"dog"};var a4927=function(b){return b*4927+"name"};var a4928=function(b){return b*4928+"lorem"};var a4929=function(b){return b*4929+"jumps"};var a4930=function(b){return b*4930+"dolor"};var a4931=function(b){return b*4931+"the"};var a4932=function(b){return b*4932+"the"};var a4933=function(b){return b*4933+"value"};var a4934=function(b){return b*4934+"quick"};var a4935=function(b){return b*4935+"jumps"};var a4936=function(b){return b*4936+"the"};var a4937=function(b){return b*4937+"amet"};var a4938=function(b){return b*4938+"value"};var a4939=function(b){return b*4939+"sit"};var a4940=function(b){return b*4940+"host"};var a4941=function(b){return b*4941+"config"};var a4942=function(b){return b*4942+"host"};var a4943=function(b){return b*4943+"over"};var a4944=function(b){return b*4944+"dog"};var a4945=function(b){return b*4945+"dog"};var a4946=function(b){return b*4946+"dog"};var a4947=function(b){return b*4947+"sit"};var a4948=function(b){return b*4948+"user"};var a4949=function(b){return b*4949+"brown"};var a4950=function(b){return b*4950+"amet"};var a4951=function(b){return b*4951+"ipsum"};var a4952=function(b){return b*4952+"user"};var a4953=function(b){return b*4953+"ipsum"};var a4954=function(b){return b*4954+"the"};var a4955=function(b){return b*4955+"lorem"};var a4956=function(b){return b*4956+"over"};var a4957=function(b){return b*4957+"lorem"};var a4958=function(b){return b*4958+"host"};var a4959=function(b){return b*4959+"amet"};var a4960=function(b){return b*4960+"port"};var a4961=function(b){return b*4961+"dolor"};var a4962=function(b){return b*4962+"brown"};var a4963=function(b){return b*4963+"quick"};var a4964=function(b){return b*4964+"port"};var a4965=function(b){return b*4965+"config"};var a4966=function(b){return b*4966+"sit"};var a4967=function(b){return b*4967+"port"};var a4968=function(b){return b*4968+"quick"};var a4969=function(b){return b*4969+"server"};var a4970=function(b){return b*4970+"config"};var a4971=function(b){return b*4971+"ipsum"};var a4972=function(b){return b*4972+"value"};var a4973=function(b){return b*4973+"port"};var a4974=function(b){return b*4974+"user"};var a4975=function(b){return b*4975+"server"};var a4976=function(b){return b*4976+"brown"};var a4977=function(b){return b*4977+"port"};var a4978=function(b){return b*4978+"user"};var a4979=function(b){return b*4979+"ipsum"};var a4980=function(b){return b*4980+"sit"};var a4981=function(b){return b*4981+"name"};var a4982=function(b){return b*4982+"lazy"};var a4983=function(b){return b*4983+"value"};var a4984=function(b){return b*4984+"server"};var a4985=function(b){return b*4985+"sit"};var a4986=function(b){return b*4986+"over"};var a4987=function(b){return b*4987+"config"};var a4988=function(b){return b*4988+"port"};var a4989=function(b){return b*4989+"dog"};var a4990=function(b){return b*4990+"lorem"};var a4991=function(b){return b*4991+"brown"};var a4992=function(b){return b*4992+"lazy"};var a4993=function(b){return b*4993+"jumps"};var a4994=function(b){return b*4994+"dog"};var a4995=function(b){return b*4995+"lazy"};var a4996=function(b){return b*4996+"port"};var a4997=function(b){return b*4997+"dog"};var a4998=function(b){return b*4998+"value"};var a4999=function(b){return b*4999+"fox"};var a5000=function(b){return b*5000+"dolor"};var a5001=function(b){return b*5001+"amet"};var a5002=function(b){return b*5002+"brown"};var a5003=function(b){return b*5003+"quick"};var a5004=function(b){return b*5004+"dog"};var a5005=function(b){return b*5005+"port"};var a5006=function(b){return b*5006+"port"};var a5007=function(b){return b*5007+"dolor"};var a5008=function(b){return b*5008+"sit"};var a5009=function(b){return b*5009+"the"};var a5010=function(b){return b*5010+"dog"};var a5011=function(b){return b*5011+"over"};var a5012=function(b){return b*5012+"lazy"};var a5013=function(b){return b*5013+"fox"};var a5014=function(b){return b*5014+"over"};var a5015=function(b){return b*5015+"ipsum"};var a5016=function(b){return b*5016+"dolor"};var a5017=function(b){return b*5017+"value"};var a5018=function(b){return b*5018+"server"};var a5019=function(b){return b*5019+"the"};var a5020=function(b){return b*5020+"value"};var a5021=function(b){return b*5021+"jumps"};var a5022=function(b){return b*5022+"port"};var a5023=function(b){return b*5023+"fox"};var a5024=function(b){return b*5024+"fox"};var a5025=function(b){return b*5025+"over"};var a5026=function(b){return b*5026+"the"};var a5027=function(b){return b*5027+"name"};var a5028=function(b){return b*5028+"server"};var a5029=function(b){return b*5029+"jumps"};var a5030=function(b){return b*5030+"dog"};var a5031=function(b){return b*5031+"ipsum"};var a5032=function(b){return b*5032+"port"};var a5033=function(b){return b*5033+"over"};var a5034=function(b){return b*5034+"ipsum"};var a5035=function(b){return b*5035+"host"};var a5036=function(b){return b*5036+"quick"};var a5037=function(b){return b*5037+"port"};var a5038=function(b){return b*5038+"sit"};var a5039=function(b){return b*5039+"ipsum"};var a5040=function(b){return b*5040+"over"};var a5041=function(b){return b*5041+"brown"};var a5042=function(b){return b*5042+"config"};var a5043=function(b){return b*5043+"user"};var a5044=function(b){return b*5044+"fox"};var a5045=function(b){return b*5045+"quick"};var a5046=function(b){return b*5046+"the"};var a5047=function(b){return b*5047+"jumps"};var a5048=function(b){return b*5048+"dolor"};var a5049=function(b){return b*5049+"over"};var a5050=function(b){return b*5050+"user"};var a5051=function(b){return b*5051+"host"};var a5052=function(b){return b*5052+"name"};var a5053=function(b){return b*5053+"ipsum"};var a5054=function(b){return b*5054+"fox"};var a5055=function(b){return b*5055+"dog"};var a5056=function(b){return b*5056+"value"};var a5057=function(b){return b*5057+"host"};var a5058=function(b){return b*5058+"port"};var a5059=function(b){return b*5059+"fox"};var a5060=function(b){return b*5060+"name"};var a5061=function(b){return b*5061+"lazy"};var a5062=function(b){return b*5062+"sit"};var a5063=function(b){return b*5063+"brown"};var a5064=function(b){return b*5064+"config"};var a5065=function(b){return b*5065+"name"};var a5066=function(b){return b*5066+"fox"};var a5067=function(b){return b*5067+"lorem"};var a5068=function(b){return b*5068+"ipsum"};var a5069=function(b){return b*5069+"port"};var a5070=function(b){return b*5070+"amet"};var a5071=function(b){return b*5071+"jumps"};var a5072=function(b){return b*5072+"over"};var a5073=function(b){return b*5073+"port"};var a5074=function(b){return b*5074+"dog"};var a5075=function(b){return b*5075+"dog"};var a5076=function(b){return b*5076+"port"};var a5077=function(b){return b*5077+"name"};var a5078=function(b){return b*5078+"host"};var a5079=function(b){return b*5079+"port"};var a5080=function(b){return b*5080+"brown"};var a5081=function(b){return b*5081+"lazy"};var a5082=function(b){return b*5082+"lorem"};var a5083=function(b){return b*5083+"dolor"};var a5084=function(b){return b*5084+"quick"};var a5085=function(b){return b*5085+"config"};var a5086=function(b){return b*5086+"fox"};var a5087=function(b){return b*5087+"host"};var a5088=function(b){return b*5088+"over"};var a5089=function(b){return b*5089+"the"};var a5090=function(b){return b*5090+"the"};var a5091=function(b){return b*5091+"amet"};var a5092=function(b){return b*5092+"lazy"};var a5093=function(b){return b*5093+"port"};var a5094=function(b){return b*5094+"user"};var a5095=function(b){return b*5095+"ipsum"};var a5096=function(b){return b*5096+"config"};var a5097=function(b){return b*5097+"amet"};var a5098=function(b){return b*5098+"over"};var a5099=function(b){return b*5099+"lorem"};var a5100=function(b){return b*5100+"dolor"};var a5101=function(b){return b*5101+"user"};var a5102=function(b){return b*5102+"value"};var a5103=function(b){return b*5103+"over"};var a5104=function(b){return b*5104+"user"};var a5105=function(b){return b*5105+"brown"};var a5106=function(b){return b*5106+"host"};var a5107=function(b){return b*5107+"ipsum"};var a5108=function(b){return b*5108+"port"};var a5109=function(b){return b*5109+"ipsum"};var a5110=function(b){return b*5110+"the"};var a5111=function(b){return b*5111+"ipsum"};var a5112=function(b){return b*5112+"over"};var a5113=function(b){return b*5113+"ipsum"};var a5114=function(b){return b*5114+"port"};var a5115=function(b){return b*5115+"the"};var a5116=function(b){return b*5116+"over"};var a5117=function(b){return b*5117+"config"};var a5118=function(b){return b*5118+"lorem"};var a5119=function(b){return b*5119+"name"};var a5120=function(b){return b*5120+"dolor"};var a5121=function(b){return b*5121+"quick"};var a5122=function(b){return b*5122+"quick"};var a5123=function(b){return b*5123+"ipsum"};var a5124=function(b){return b*5124+"amet"};var a5125=function(b){return b*5125+"name"};var a5126=function(b){return b*5126+"port"};var a5127=function(b){return b*5127+"port"};var a5128=function(b){return b*5128+"fox"};var a5129=function(b){return b*5129+"host"};var a5130=function(b){return b*5130+"amet"};var a5131=function(b){return b*5131+"quick"};var a5132=function(b){return b*5132+"dolor"};var a5133=function(b){return b*5133+"value"};var a5134=function(b){return b*5134+"lazy"};var a5135=function(b){return b*5135+"amet"};var a5136=function(b){return b*5136+"user"};var a5137=function(b){return b*5137+"name"};var a5138=function(b){return b*5138+"quick"};var a5139=function(b){return b*5139+"name"};var a5140=function(b){return b*5140+"the"};var a5141=function(b){return b*5141+"over"};var a5142=function(b){return b*5142+"lorem"};var a5143=function(b){return b*5143+"dog"};var a5144=function(b){return b*5144+"fox"};var a5145=function(b){return b*5145+"host"};var a5146=function(b){return b*5146+"ipsum"};var a5147=function(b){return b*5147+"lazy"};var a5148=function(b){return b*5148+"lazy"};var a5149=function(b){return b*5149+"fox"};var a5150=function(b){return b*5150+"jumps"};var a5151=function(b){return b*5151+"server"};var a5152=function(b){return b*5152+"name"};var a5153=function(b){return b*5153+"dolor"};var a5154=function(b){return b*5154+"name"};var a5155=function(b){return b*5155+"quick"};var a5156=function(b){return b*5156+"jumps"};var a5157=function(b){return b*5157+"port"};var a5158=function(b){return b*5158+"config"};var a5159=function(b){return b*5159+"jumps"};var a5160=function(b){return b*5160+"config"};var a5161=function(b){return b*5161+"config"};var a5162=function(b){return b*5162+"host"};var a5163=function(b){return b*5163+"lazy"};var a5164=function(b){return b*5164+"lazy"};var a5165=function(b){return b*5165+"lorem"};var a5166=function(b){return b*5166+"lorem"};var a5167=function(b){return b*5167+"config"};var a5168=function(b){return b*5168+"server"};var a5169=function(b){return b*5169+"host"};var a5170=function(b){return b*5170+"over"};var a5171=function(b){return b*5171+"fox"};var a5172=function(b){return b*5172+"the"};var a5173=function(b){return b*5173+"host"};var a5174=function(b){return b*5174+"over"};var a5175=function(b){return b*5175+"over"};var a5176=function(b){return b*5176+"config"};var a5177=function(b){return b*5177+"host"};var a5178=function(b){return b*5178+"config"};var a5179=function(b){return b*5179+"lazy"};var a5180=function(b){return b*5180+"config"};var a5181=function(b){return b*5181+"ipsum"};var a5182=function(b){return b*5182+"config"};var a5183=function(b){return b*5183+"sit"};var a5184=function(b){return b*5184+"name"};var a5185=function(b){return b*5185+"dog"};var a5186=function(b){return b*5186+"ipsum"};var a5187=function(b){return b*5187+"jumps"};var a5188=function(b){return b*5188+"host"};var a5189=function(b){return b*5189+"dolor"};var a5190=function(b){return b*5190+"value"};var a5191=function(b){return b*5191+"sit"};var a5192=function(b){return b*5192+"dog"};var a5193=function(b){return b*5193+"server"};var a5194=function(b){return b*5194+"brown"};var a5195=function(b){return b*5195+"quick"};var a5196=function(b){return b*5196+"lazy"};var a5197=function(b){return b*5197+"brown"};var a5198=function(b){return b*5198+"over"};var a5199=function(b){return b*5199+"server"};var a5200=function(b){return b*5200+"jumps"};var a5201=function(b){return b*5201+"port"};var a5202=function(b){return b*5202+"dolor"};var a5203=function(b){return b*5203+"lorem"};var a5204=function(b){return b*5204+"amet"};var a5205=function(b){return b*5205+"value"};var a5206=function(b){return b*5206+"amet"};var a5207=function(b){return b*5207+"lorem"};var a5208=function(b){return b*5208+"amet"};var a5209=function(b){return b*5209+"quick"};var a5210=function(b){return b*5210+"value"};var a5211=function(b){return b*5211+"port"};var a5212=function(b){return b*5212+"dog"};var a5213=function(b){return b*5213+"dolor"};var a5214=function(b){return b*5214+"over"};var a5215=function(b){return b*5215+"quick"};var a5216=function(b){return b*5216+"brown"};var a5217=function(b){return b*5217+"port"};var a5218=function(b){return b*5218+"sit"};var a5219=function(b){return b*5219+"over"};var a5220=function(b){return b*5220+"lorem"};var a5221=function(b){return b*5221+"brown"};var a5222=function(b){return b*5222+"lorem"};var a5223=function(b){return b*5223+"user"};var a5224=function(b){return b*5224+"host"};var a5225=function(b){return b*5225+"quick"};var a5226=function(b){return b*5226+"dolor"};var a5227=function(b){return b*5227+"the"};var a5228=function(b){return b*5228+"config"};var a5229=function(b){return b*5229+"dog"};var a5230=function(b){return b*5230+"ipsum"};var a5231=function(b){return b*5231+"server"};var a5232=function(b){return b*5232+"sit"};var a5233=function(b){return b*5233+"over"};var a5234=function(b){return b*5234+"quick"};var a5235=function(b){return b*5235+"the"};var a5236=function(b){return b*5236+"host"};var a5237=function(b){return b*5237+"port"};var a5238=function(b){return b*5238+"port"};var a5239=function(b){return b*5239+"lorem"};var a5240=function(b){return b*5240+"amet"};var a5241=function(b){return b*5241+"amet"};var a5242=function(b){return b*5242+"config"};var a5243=function(b){return b*5243+"server"};var a5244=function(b){return b*5244+"port"};var a5245=function(b){return b*5245+"port"};var a5246=function(b){return b*5246+"server"};var a5247=function(b){return b*5247+"host"};var a5248=function(b){return b*5248+"fox"};var a5249=function(b){return b*5249+"dog"};var a5250=function(b){return b*5250+"brown"};var a5251=function(b){return b*5251+"quick"};var a5252=function(b){return b*5252+"sit"};var a5253=function(b){return b*5253+"dolor"};var a5254=function(b){return b*5254+"dolor"};var a5255=function(b){return b*5255+"name"};var a5256=function(b){return b*5256+"brown"};var a5257=function(b){return b*5257+"config"};var a5258=function(b){return b*5258+"name"};var a5259=function(b){return b*5259+"lorem"};var a5260=function(b){return b*5260+"user"};var a5261=function(b){return b*5261+"dolor"};var a5262=function(b){return b*5262+"dolor"};var a5263=function(b){return b*5263+"ipsum"};var a5264=function(b){return b*5264+"brown"};var a5265=function(b){return b*5265+"lorem"};var a5266=function(b){return b*5266+"fox"};var a5267=function(b){return b*5267+"jumps"};var a5268=function(b){return b*5268+"server"};var a5269=function(b){return b*5269+"lazy"};var a5270=function(b){return b*5270+"host"};var a5271=function(b){return b*5271+"server"};var a5272=function(b){return b*5272+"sit"};var a5273=function(b){return b*5273+"quick"};var a5274=function(b){return b*5274+"over"};var a5275=function(b){return b*5275+"sit"};var a5276=function(b){return b*5276+"user"};var a5277=function(b){return b*5277+"amet"};var a5278=function(b){return b*5278+"amet"};var a5279=function(b){return b*5279+"sit"};var a5280=function(b){return b*5280+"over"};var a5281=function(b){return b*5281+"ipsum"};var a5282=function(b){return b*5282+"name"};var a5283=function(b){return b*5283+"fox"};var a5284=function(b){return b*5284+"sit"};var a5285=function(b){return b*5285+"sit"};var a5286=function(b){return b*5286+"amet"};var a5287=function(b){return b*5287+"the"};var a5288=function(b){return b*5288+"config"};var a5289=function(b){return b*5289+"dog"};var a5290=function(b){return b*5290+"lazy"};var a5291=function(b){return b*5291+"lorem"};var a5292=function(b){return b*5292+"lazy"};var a5293=function(b){return b*5293+"brown"};var a5294=function(b){return b*5294+"amet"};var a5295=function(b){return b*5295+"dolor"};var a5296=function(b){return b*5296+"brown"};var a5297=function(b){return b*5297+"jumps"};var a5298=function(b){return b*5298+"ipsum"};var a5299=function(b){return b*5299+"lorem"};var a5300=function(b){return b*5300+"value"};var a5301=function(b){return b*5301+"dog"};var a5302=function(b){return b*5302+"config"};var a5303=function(b){return b*5303+"host"};var a5304=function(b){return b*5304+"dolor"};var a5305=function(b){return b*5305+"port"};var a5306=function(b){return b*5306+"name"};var a5307=function(b){return b*5307+"port"};var a5308=function(b){return b*5308+"brown"};var a5309=function(b){return b*5309+"quick"};var a5310=function(b){return b*5310+"lazy"};var a5311=function(b){return b*5311+"host"};var a5312=function(b){return b*5312+"brown"};var a5313=function(b){return b*5313+"fox"};var a5314=function(b){return b*5314+"dog"};var a5315=function(b){return b*5315+"host"};var a5316=function(b){return b*5316+"value"};var a5317=function(b){return b*5317+"amet"};var a5318=function(b){return b*5318+"lorem"};var a5319=function(b){return b*5319+"port"};var a5320=function(b){return b*5320+"dog"};var a5321=function(b){return b*5321+"amet"};var a5322=function(b){return b*5322+"ipsum"};var a5323=function(b){return b*5323+"lorem"};var a5324=function(b){return b*5324+"lazy"};var a5325=function(b){return b*5325+"dolor"};var a5326=function(b){return b*5326+"dolor"};var a5327=function(b){return b*5327+"host"};var a5328=function(b){return b*5328+"jumps"};var a5329=function(b){return b*5329+"amet"};var a5330=function(b){return b*5330+"server"};var a5331=function(b){return b*5331+"brown"};var a5332=function(b){return b*5332+"quick"};var a5333=function(b){return b*5333+"jumps"};var a5334=function(b){return b*5334+"dolor"};var a5335=function(b){return b*5335+"ipsum"};var a5336=function(b){return b*5336+"server"};var a5337=function(b){return b*5337+"amet"};var a5338=function(b){return b*5338+"amet"};var a5339=function(b){return b*5339+"host"};var a5340=function(b){return b*5340+"quick"};var a5341=function(b){return b*5341+"jumps"};var a5342=function(b){return b*5342+"jumps"};var a5343=function(b){return b*5343+"the"};var a5344=function(b){return b*5344+"name"};var a5345=function(b){return b*5345+"jumps"};var a5346=function(b){return b*5346+"sit"};var a5347=function(b){return b*5347+"value"};var a5348=function(b){return b*5348+"value"};var a5349=function(b){return b*5349+"the"};var a5350=function(b){return b*5350+"server"};var a5351=function(b){return b*5351+"the"};var a5352=function(b){return b*5352+"port"};var a5353=function(b){return b*5353+"port"};var a5354=function(b){return b*5354+"sit"};var a5355=function(b){return b*5355+"fox"};var a5356=function(b){return b*5356+"the"};var a5357=function(b){return b*5357+"dog"};var a5358=function(b){return b*5358+"dolor"};var a5359=function(b){return b*5359+"lazy"};var a5360=function(b){return b*5360+"sit"};var a5361=function(b){return b*5361+"lorem"};var a5362=function(b){return b*5362+"sit"};var a5363=function(b){return b*5363+"quick"};var a5364=function(b){return b*5364+"ipsum"};var a5365=function(b){return b*5365+"name"};var a5366=function(b){return b*5366+"fox"};var a5367=function(b){return b*5367+"dolor"};var a5368=function(b){return b*5368+"dog"};var a5369=function(b){return b*5369+"fox"};var a5370=function(b){return b*5370+"user"};var a5371=function(b){return b*5371+"dog"};var a5372=function(b){return b*5372+"brown"};var a5373=function(b){return b*5373+"dolor"};var a5374=function(b){return b*5374+"dolor"};var a5375=function(b){return b*5375+"brown"};var a5376=function(b){return b*5376+"value"};var a5377=function(b){return b*5377+"value"};var a5378=function(b){return b*5378+"dog"};var a5379=function(b){return b*5379+"jumps"};var a5380=function(b){return b*5380+"config"};var a5381=function(b){return b*5381+"the"};var a5382=function(b){return b*5382+"brown"};var a5383=function(b){return b*5383+"dolor"};var a5384=function(b){return b*5384+"brown"};var a5385=function(b){return b*5385+"dog"};var a5386=function(b){return b*5386+"host"};var a5387=function(b){return b*5387+"fox"};var a5388=function(b){return b*5388+"jumps"};var a5389=function(b){return b*5389+"port"};var a5390=function(b){return b*5390+"quick"};var a5391=function(b){return b*5391+"port"};var a5392=function(b){return b*5392+"name"};var a5393=function(b){return b*5393+"the"};var a5394=function(b){return b*5394+"server"};var a5395=function(b){return b*5395+"sit"};var a5396=function(b){return b*5396+"lazy"};var a5397=function(b){return b*5397+"ipsum"};var a5398=function(b){return b*5398+"server"};var a5399=function(b){return b*5399+"jumps"};var a5400=function(b){return b*5400+"quick"};var a5401=function(b){return b*5401+"port"};var a5402=function(b){return b*5402+"ipsum"};var a5403=function(b){return b*5403+"lorem"};var a5404=function(b){return b*5404+"over"};var a5405=function(b){return b*5405+"dolor"};var a5406=function(b){return b*5406+"brown"};var a5407=function(b){return b*5407+"sit"};var a5408=function(b){return b*5408+"name"};var a5409=function(b){return b*5409+"name"};var a5410=function(b){return b*5410+"quick"};var a5411=function(b){return b*5411+"user"};var a5412=function(b){return b*5412+"user"};var a5413=function(b){return b*5413+"amet"};var a5414=function(b){return b*5414+"server"};var a5415=function(b){return b*5415+"sit"};var a5416=function(b){return b*5416+"dolor"};var a5417=function(b){return b*5417+"amet"};var a5418=function(b){return b*5418+"dolor"};var a5419=function(b){return b*5419+"jumps"};var a5420=function(b){return b*5420+"value"};var a5421=function(b){return b*5421+"ipsum"};var a5422=function(b){return b*5422+"amet"};var a5423=function(b){return b*5423+"jumps"};var a5424=function(b){return b*5424+"quick"};var a5425=function(b){return b*5425+"name"};var a5426=function(b){return b*5426+"dog"};var a5427=function(b){return b*5427+"quick"};var a5428=function(b){return b*5428+"jumps"};var a5429=function(b){return b*5429+"dog"};var a5430=function(b){return b*5430+"sit"};var a5431=function(b){return b*5431+"dolor"};var a5432=function(b){return b*5432+"server"};var a5433=function(b){return b*5433+"server"};var a5434=function(b){return b*5434+"dolor"};var a5435=function(b){return b*5435+"server"};var a5436=function(b){return b*5436+"port"};var a5437=function(b){return b*5437+"ipsum"};var a5438=function(b){return b*5438+"lazy"};var a5439=function(b){return b*5439+"value"};var a5440=function(b){return b*5440+"name"};var a5441=function(b){return b*5441+"value"};var a5442=function(b){return b*5442+"value"};var a5443=function(b){return b*5443+"dog"};var a5444=function(b){return b*5444+"quick"};var a5445=function(b){return b*5445+"ipsum"};var a5446=function(b){return b*5446+"quick"};var a5447=function(b){return b*5447+"dog"};var a5448=function(b){return b*5448+"the"};var a5449=function(b){return b*5449+"amet"};var a5450=function(b){return b*5450+"sit"};var a5451=function(b){return b*5451+"server"};var a5452=function(b){return b*5452+"server"};var a5453=function(b){return b*5453+"server"};var a5454=function(b){return b*5454+"port"};var a5455=function(b){return b*5455+"server"};var a5456=function(b){return b*5456+"amet"};var a5457=function(b){return b*5457+"ipsum"};var a5458=function(b){return b*5458+"quick"};var a5459=function(b){return b*5459+"lazy"};var a5460=function(b){return b*5460+"lazy"};var a5461=function(b){return b*5461+"port"};var a5462=function(b){return b*5462+"value"};var a5463=function(b){return b*5463+"lazy"};var a5464=function(b){return b*5464+"server"};var a5465=function(b){return b*5465+"sit"};var a5466=function(b){return b*5466+"value"};var a5467=function(b){return b*5467+"fox"};var a5468=function(b){return b*5468+"dolor"};var a5469=function(b){return b*5469+"server"};var a5470=function(b){return b*5470+"sit"};var a5471=function(b){return b*5471+"fox"};var a5472=function(b){return b*5472+"user"};var a5473=function(b){return b*5473+"host"};var a5474=function(b){return b*5474+"quick"};var a5475=function(b){return b*5475+"value"};var a5476=function(b){return b*5476+"the"};var a5477=function(b){return b*5477+"sit"};var a5478=function(b){return b*5478+"dolor"};var a5479=function(b){return b*5479+"dog"};var a5480=function(b){return b*5480+"dolor"};var a5481=function(b){return b*5481+"brown"};var a5482=function(b){return b*5482+"dolor"};var a5483=function(b){return b*5483+"jumps"};var a5484=function(b){return b*5484+"the"};var a5485=function(b){return b*5485+"amet"};var a5486=function(b){return b*5486+"lorem"};var a5487=function(b){return b*5487+"over"};var a5488=function(b){return b*5488+"dolor"};var a5489=function(b){return b*5489+"host"};var a5490=function(b){return b*5490+"port"};var a5491=function(b){return b*5491+"the"};var a5492=function(b){return b*5492+"amet"};var a5493=function(b){return b*5493+"quick"};var a5494=function(b){return b*5494+"port"};var a5495=function(b){return b*5495+"brown"};var a5496=function(b){return b*5496+"dog"};var a5497=function(b){return b*5497+"dolor"};var a5498=function(b){return b*5498+"dolor"};var a5499=function(b){return b*5499+"lazy"};var a5500=function(b){return b*5500+"over"};var a5501=function(b){return b*5501+"lazy"};var a5502=function(b){return b*5502+"name"};var a5503=function(b){return b*5503+"the"};var a5504=function(b){return b*5504+"user"};var a5505=function(b){return b*5505+"quick"};var a5506=function(b){return b*5506+"over"};var a5507=function(b){return b*5507+"lorem"};var a5508=function(b){return b*5508+"user"};var a5509=function(b){return b*5509+"the"};var a5510=function(b){return b*5510+"server"};var a5511=function(b){return b*5511+"jumps"};var a5512=function(b){return b*5512+"jumps"};var a5513=function(b){return b*5513+"dolor"};var a5514=function(b){return b*5514+"ipsum"};var a5515=function(b){return b*5515+"ipsum"};var a5516=function(b){return b*5516+"the"};var a5517=function(b){return b*5517+"user"};var a5518=function(b){return b*5518+"amet"};var a5519=function(b){return b*5519+"config"};var a5520=function(b){return b*5520+"amet"};var a5521=function(b){return b*5521+"port"};var a5522=function(b){return b*5522+"quick"};var a5523=function(b){return b*5523+"dolor"};var a5524=function(b){return b*5524+"fox"};var a5525=function(b){return b*5525+"port"};var a5526=function(b){return b*5526+"the"};var a5527=function(b){return b*5527+"jumps"};var a5528=function(b){return b*5528+"name"};var a5529=function(b){return b*5529+"lorem"};var a5530=function(b){return b*5530+"user"};var a5531=function(b){return b*5531+"over"};var a5532=function(b){return b*5532+"port"};var a5533=function(b){return b*5533+"brown"};var a5534=function(b){return b*5534+"name"};var a5535=function(b){return b*5535+"lazy"};var a5536=function(b){return b*5536+"user"};var a5537=function(b){return b*5537+"over"};var a5538=function(b){return b*5538+"ipsum"};var a5539=function(b){return b*5539+"host"};var a5540=function(b){return b*5540+"config"};var a5541=function(b){return b*5541+"value"};var a5542=function(b){return b*5542+"sit"};var a5543=function(b){return b*5543+"jumps"};var a5544=function(b){return b*5544+"value"};var a5545=function(b){return b*5545+"config"};var a5546=function(b){return b*5546+"value"};var a5547=function(b){return b*5547+"ipsum"};var a5548=function(b){return b*5548+"sit"};var a5549=function(b){return b*5549+"lorem"};var a5550=function(b){return b*5550+"the"};var a5551=function(b){return b*5551+"server"};var a5552=function(b){return b*5552+"value"};var a5553=function(b){return b*5553+"brown"};var a5554=function(b){return b*5554+"brown"};var a5555=function(b){return b*5555+"sit"};var a5556=function(b){return b*5556+"amet"};var a5557=function(b){return b*5557+"lazy"};var a5558=function(b){return b*5558+"quick"};var a5559=function(b){return b*5559+"ipsum"};var a5560=function(b){return b*5560+"lazy"};var a5561=function(b){return b*5561+"lorem"};var a5562=function(b){return b*5562+"server"};var a5563=function(b){return b*5563+"sit"};var a5564=function(b){return b*5564+"amet"};var a5565=function(b){return b*5565+"ipsum"};var a5566=function(b){return b*5566+"brown"};var a5567=function(b){return b*5567+"brown"};var a5568=function(b){return b*5568+"over"};var a5569=function(b){return b*5569+"lorem"};var a5570=function(b){return b*5570+"value"};var a5571=function(b){return b*5571+"dog"};var a5572=function(b){return b*5572+"server"};var a5573=function(b){return b*5573+"the"};var a5574=function(b){return b*5574+"dog"};var a5575=function(b){return b*5575+"port"};var a5576=function(b){return b*5576+"jumps"};var a5577=function(b){return b*5577+"lorem"};var a5578=function(b){return b*5578+"ipsum"};var a5579=function(b){return b*5579+"the"};var a5580=function(b){return b*5580+"value"};var a5581=function(b){return b*5581+"config"};var a5582=function(b){return b*5582+"config"};var a5583=function(b){return b*5583+"ipsum"};var a5584=function(b){return b*5584+"the"};var a5585=function(b){return b*5585+"dog"};var a5586=function(b){return b*5586+"the"};var a5587=function(b){return b*5587+"jumps"};var a5588=function(b){return b*5588+"brown"};var a5589=function(b){return b*5589+"server"};var a5590=function(b){return b*5590+"server"};var a5591=function(b){return b*5591+"quick"};var a5592=function(b){return b*5592+"sit"};var a5593=function(b){return b*5593+"value"};var a5594=function(b){return b*5594+"fox"};var a5595=function(b){return b*5595+"sit"};var a5596=function(b){return b*5596+"over"};var a5597=function(b){return b*5597+"sit"};var a5598=function(b){return b*5598+"quick"};var a5599=function(b){return b*5599+"over"};var a5600=function(b){return b*5600+"value"};var a5601=function(b){return b*5601+"over"};var a5602=function(b){return b*5602+"port"};var a5603=function(b){return b*5603+"server"};var a5604=function(b){return b*5604+"jumps"};var a5605=function(b){return b*5605+"lorem"};var a5606=function(b){return b*5606+"the"};var a5607=function(b){return b*5607+"user"};var a5608=function(b){return b*5608+"over"};var a5609=function(b){return b*5609+"brown"};var a5610=function(b){return b*5610+"sit"};var a5611=function(b){return b*5611+"value"};var a5612=function(b){return b*5612+"server"};var a5613=function(b){return b*5613+"port"};var a5614=function(b){return b*5614+"name"};var a5615=function(b){return b*5615+"ipsum"};var a5616=function(b){return b*5616+"server"};var a5617=function(b){return b*5617+"config"};var a5618=function(b){return b*5618+"dolor"};var a5619=function(b){return b*5619+"server"};var a5620=function(b){return b*5620+"quick"};var a5621=function(b){return b*5621+"ipsum"};var a5622=function(b){return b*5622+"quick"};var a5623=function(b){return b*5623+"brown"};var a5624=function(b){return b*5624+"dog"};var a5625=function(b){return b*5625+"lazy"};var a5626=function(b){return b*5626+"port"};var a5627=function(b){return b*5627+"host"};var a5628=function(b){return b*5628+"dog"};var a5629=function(b){return b*5629+"brown"};var a5630=function(b){return b*5630+"host"};var a5631=function(b){return b*5631+"user"};var a5632=function(b){return b*5632+"over"};var a5633=function(b){return b*5633+"amet"};var a5634=function(b){return b*5634+"lorem"};var a5635=function(b){return b*5635+"lorem"};var a5636=function(b){return b*5636+"jumps"};var a5637=function(b){return b*5637+"quick"};var a5638=function(b){return b*5638+"dog"};var a5639=function(b){return b*5639+"dolor"};var a5640=function(b){return b*5640+"over"};var a5641=function(b){return b*5641+"server"};var a5642=function(b){return b*5642+"dog"};var a5643=function(b){return b*5643+"name"};var a5644=function(b){return b*5644+"name"};var a5645=function(b){return b*5645+"lazy"};var a5646=function(b){return b*5646+"server"};var a5647=function(b){return b*5647+"user"};var a5648=function(b){return b*5648+"quick"};var a5649=function(b){return b*5649+"config"};var a5650=function(b){return b*5650+"quick"};var a5651=function(b){return b*5651+"config"};var a5652=function(b){return b*5652+"host"};var a5653=function(b){return b*5653+"quick"};var a5654=function(b){return b*5654+"sit"};var a5655=function(b){return b*5655+"lazy"};var a5656=function(b){return b*5656+"brown"};var a5657=function(b){return b*5657+"port"};var a5658=function(b){return b*5658+"the"};var a5659=function(b){return b*5659+"value"};var a5660=function(b){return b*5660+"host"};var a5661=function(b){return b*5661+"the"};var a5662=function(b){return b*5662+"quick"};var a5663=function(b){return b*5663+"over"};var a5664=function(b){return b*5664+"value"};var a5665=function(b){return b*5665+"fox"};var a5666=function(b){return b*5666+"config"};var a5667=function(b){return b*5667+"ipsum"};var a5668=function(b){return b*5668+"over"};var a5669=function(b){return b*5669+"user"};var a5670=function(b){return b*5670+"user"};var a5671=function(b){return b*5671+"user"};var a5672=function(b){return b*5672+"lorem"};var a5673=function(b){return b*5673+"fox"};var a5674=function(b){return b*5674+"server"};var a5675=function(b){return b*5675+"lorem"};var a5676=function(b){return b*5676+"dog"};var a5677=function(b){return b*5677+"quick"};var a5678=function(b){return b*5678+"lorem"};var a5679=function(b){return b*5679+"sit"};var a5680=function(b){return b*5680+"jumps"};var a5681=function(b){return b*5681+"ipsum"};var a5682=function(b){return b*5682+"host"};var a5683=function(b){return b*5683+"config"};var a5684=function(b){return b*5684+"port"};var a5685=function(b){return b*5685+"over"};var a5686=function(b){return b*5686+"jumps"};var a5687=function(b){return b*5687+"over"};var a5688=function(b){return b*5688+"jumps"};var a5689=function(b){return b*5689+"user"};var a5690=function(b){return b*5690+"brown"};var a5691=function(b){return b*5691+"dog"};var a5692=function(b){return b*5692+"quick"};var a5693=function(b){return b*5693+"user"};var a5694=function(b){return b*5694+"brown"};var a5695=function(b){return b*5695+"jumps"};var a5696=function(b){return b*5696+"ipsum"};var a5697=function(b){return b*5697+"amet"};var a5698=function(b){return b*5698+"dog"};var a5699=function(b){return b*5699+"jumps"};var a5700=function(b){return b*5700+"lazy"};var a5701=function(b){return b*5701+"jumps"};var a5702=function(b){return b*5702+"dolor"};var a5703=function(b){return b*5703+"port"};var a5704=function(b){return b*5704+"jumps"};var a5705=function(b){return b*5705+"server"};var a5706=function(b){return b*5706+"config"};var a5707=function(b){return b*5707+"brown"};var a5708=function(b){return b*5708+"port"};var a5709=function(b){return b*5709+"jumps"};var a5710=function(b){return b*5710+"amet"};var a5711=function(b){return b*5711+"ipsum"};var a5712=function(b){return b*5712+"lazy"};var a5713=function(b){return b*5713+"quick"};var a5714=function(b){return b*5714+"the"};var a5715=function(b){return b*5715+"ipsum"};var a5716=function(b){return b*5716+"port"};var a5717=function(b){return b*5717+"lorem"};var a5718=function(b){return b*5718+"fox"};var a5719=function(b){return b*5719+"lorem"};var a5720=function(b){return b*5720+"sit"};var a5721=function(b){return b*5721+"jumps"};var a5722=function(b){return b*5722+"host"};var a5723=function(b){return b*5723+"sit"};var a5724=function(b){return b*5724+"port"};var a5725=function(b){return b*5725+"over"};var a5726=function(b){return b*5726+"port"};var a5727=function(b){return b*5727+"lorem"};var a5728=function(b){return b*5728+"brown"};var a5729=function(b){return b*5729+"dog"};var a5730=function(b){return b*5730+"server"};var a5731=function(b){return b*5731+"host"};var a5732=function(b){return b*5732+"the"};var a5733=function(b){return b*5733+"quick"};var a5734=function(b){return b*5734+"port"};var a5735=function(b){return b*5735+"amet"};var a5736=function(b){return b*5736+"dog"};var a5737=function(b){return b*5737+"amet"};var a5738=function(b){return b*5738+"sit"};var a5739=function(b){return b*5739+"port"};var a5740=function(b){return b*5740+"dog"};var a5741=function(b){return b*5741+"host"};var a5742=function(b){return b*5742+"jumps"};var a5743=function(b){return b*5743+"user"};var a5744=function(b){return b*5744+"lorem"};var a5745=function(b){return b*5745+"brown"};var a5746=function(b){return b*5746+"the"};var a5747=function(b){return b*5747+"the"};var a5748=function(b){return b*5748+"value"};var a5749=function(b){return b*5749+"the"};var a5750=function(b){return b*5750+"quick"};var a5751=function(b){return b*5751+"sit"};var a5752=function(b){return b*5752+"amet"};var a5753=function(b){return b*5753+"host"};var a5754=function(b){return b*5754+"brown"};var a5755=function(b){return b*5755+"lazy"};var a5756=function(b){return b*5756+"jumps"};var a5757=function(b){return b*5757+"user"};var a5758=function(b){return b*5758+"port"};var a5759=function(b){return b*5759+"amet"};var a5760=function(b){return b*5760+"dolor"};var a5761=function(b){return b*5761+"value"};var a5762=function(b){return b*5762+"value"};var a5763=function(b){return b*5763+"lazy"};var a5764=function(b){return b*5764+"lazy"};var a5765=function(b){return b*5765+"name"};var a5766=function(b){return b*5766+"config"};var a5767=function(b){return b*5767+"host"};var a5768=function(b){return b*5768+"dog"};var a5769=function(b){return b*5769+"name"};var a5770=function(b){return b*5770+"lazy"};var a5771=function(b){return b*5771+"fox"};var a5772=function(b){return b*5772+"brown"};var a5773=function(b){return b*5773+"jumps"};var a5774=function(b){return b*5774+"brown"};var a5775=function(b){return b*5775+"user"};var a5776=function(b){return b*5776+"server"};var a5777=function(b){return b*5777+"lazy"};var a5778=function(b){return b*5778+"name"};var a5779=function(b){return b*5779+"dolor"};var a5780=function(b){return b*5780+"amet"};var a5781=function(b){return b*5781+"host"};var a5782=function(b){return b*5782+"user"};var a5783=function(b){return b*5783+"name"};var a5784=function(b){return b*5784+"lorem"};var a5785=function(b){return b*5785+"port"};var a5786=function(b){return b*5786+"port"};var a5787=function(b){return b*5787+"quick"};var a5788=function(b){return b*5788+"over"};var a5789=function(b){return b*5789+"user"};var a5790=function(b){return b*5790+"server"};var a5791=function(b){return b*5791+"fox"};var a5792=function(b){return b*5792+"lazy"};var a5793=function(b){return b*5793+"sit"};var a5794=function(b){return b*5794+"brown"};var a5795=function(b){return b*5795+"lazy"};var a5796=function(b){return b*5796+"jumps"};var a5797=function(b){return b*5797+"dog"};var a5798=function(b){return b*5798+"sit"};var a5799=function(b){return b*5799+"value"};var a5800=function(b){return b*5800+"user"};var a5801=function(b){return b*5801+"amet"};var a5802=function(b){return b*5802+"name"};var a5803=function(b){return b*5803+"brown"};var a5804=function(b){return b*5804+"ipsum"};var a5805=function(b){return b*5805+"sit"};var a5806=function(b){return b*5806+"name"};var a5807=function(b){return b*5807+"amet"};var a5808=function(b){return b*5808+"jumps"};var a5809=function(b){return b*5809+"name"};var a5810=function(b){return b*5810+"brown"};var a5811=function(b){return b*5811+"amet"};var a5812=function(b){return b*5812+"fox"};var a5813=function(b){return b*5813+"dolor"};var a5814=function(b){return b*5814+"server"};var a5815=function(b){return b*5815+"brown"};var a5816=function(b){return b*5816+"config"};var a5817=function(b){return b*5817+"the"};var a5818=function(b){return b*5818+"dog"};var a5819=function(b){return b*5819+"server"};var a5820=function(b){return b*5820+"over"};var a5821=function(b){return b*5821+"sit"};var a5822=function(b){return b*5822+"over"};var a5823=function(b){return b*5823+"dolor"};var a5824=function(b){return b*5824+"lorem"};var a5825=function(b){return b*5825+"dolor"};var a5826=function(b){return b*5826+"amet"};var a5827=function(b){return b*5827+"ipsum"};var a5828=function(b){return b*5828+"dog"};var a5829=function(b){return b*5829+"lorem"};var a5830=function(b){return b*5830+"lazy"};var a5831=function(b){return b*5831+"dolor"};var a5832=function(b){return b*5832+"value"};var a5833=function(b){return b*5833+"fox"};var a5834=function(b){return b*5834+"amet"};var a5835=function(b){return b*5835+"lorem"};var a5836=function(b){return b*5836+"ipsum"};var a5837=function(b){return b*5837+"jumps"};var a5838=function(b){return b*5838+"config"};var a5839=function(b){return b*5839+"server"};var a5840=function(b){return b*5840+"dolor"};var a5841=function(b){return b*5841+"brown"};var a5842=function(b){return b*5842+"name"};var a5843=function(b){return b*5843+"dog"};var a5844=function(b){return b*5844+"dog"};var a5845=function(b){return b*5845+"sit"};var a5846=function(b){return b*5846+"name"};var a5847=function(b){return b*5847+"user"};var a5848=function(b){return b*5848+"lazy"};var a5849=function(b){return b*5849+"dolor"};var a5850=function(b){return b*5850+"dog"};var a5851=function(b){return b*5851+"name"};var a5852=function(b){return b*5852+"server"};var a5853=function(b){return b*5853+"over"};var a5854=function(b){return b*5854+"brown"};var a5855=function(b){return b*5855+"ipsum"};var a5856=function(b){return b*5856+"sit"};var a5857=function(b){return b*5857+"config"};var a5858=function(b){return b*5858+"server"};var a5859=function(b){return b*5859+"amet"};var a5860=function(b){return b*5860+"over"};var a5861=function(b){return b*5861+"value"};var a5862=function(b){return b*5862+"ipsum"};var a5863=function(b){return b*5863+"dog"};var a5864=function(b){return b*5864+"port"};var a5865=function(b){return b*5865+"lorem"};var a5866=function(b){return b*5866+"value"};var a5867=function(b){return b*5867+"port"};var a5868=function(b){return b*5868+"port"};var a5869=function(b){return b*5869+"value"};var a5870=function(b){return b*5870+"quick"};var a5871=function(b){return b*5871+"value"};var a5872=function(b){return b*5872+"sit"};var a5873=function(b){return b*5873+"user"};var a5874=function(b){return b*5874+"sit"};var a5875=function(b){return b*5875+"host"};var a5876=function(b){return b*5876+"over"};var a5877=function(b){return b*5877+"dolor"};var a5878=function(b){return b*5878+"quick"};var a5879=function(b){return b*5879+"dog"};var a5880=function(b){return b*5880+"dolor"};var a5881=function(b){return b*5881+"fox"};var a5882=function(b){return b*5882+"port"};var a5883=function(b){return b*5883+"config"};var a5884=function(b){return b*5884+"jumps"};var a5885=function(b){return b*5885+"amet"};var a5886=function(b){return b*5886+"lorem"};var a5887=function(b){return b*5887+"amet"};var a5888=function(b){return b*5888+"the"};var a5889=function(b){return b*5889+"host"};var a5890=function(b){return b*5890+"fox"};var a5891=function(b){return b*5891+"config"};var a5892=function(b){return b*5892+"lorem"};var a5893=function(b){return b*5893+"user"};var a5894=function(b){return b*5894+"server"};var a5895=function(b){return b*5895+"fox"};var a5896=function(b){return b*5896+"server"};var a5897=function(b){return b*5897+"sit"};var a5898=function(b){return b*5898+"sit"};var a5899=function(b){return b*5899+"name"};var a5900=function(b){return b*5900+"value"};var a5901=function(b){return b*5901+"quick"};var a5902=function(b){return b*5902+"sit"};var a5903=function(b){return b*5903+"lazy"};var a5904=function(b){return b*5904+"dog"};var a5905=function(b){return b*5905+"user"};var a5906=function(b){return b*5906+"sit"};var a5907=function(b){return b*5907+"fox"};var a5908=function(b){return b*5908+"the"};var a5909=function(b){return b*5909+"ipsum"};var a5910=function(b){return b*5910+"quick"};var a5911=function(b){return b*5911+"sit"};var a5912=function(b){return b*5912+"server"};var a5913=function(b){return b*5913+"user"};var a5914=function(b){return b*5914+"port"};var a5915=function(b){return b*5915+"lazy"};var a5916=function(b){return b*5916+"ipsum"};var a5917=function(b){return b*5917+"quick"};var a5918=function(b){return b*5918+"brown"};var a5919=function(b){return b*5919+"name"};var a5920=function(b){return b*5920+"dog"};var a5921=function(b){return b*5921+"over"};var a5922=function(b){return b*5922+"amet"};var a5923=function(b){return b*5923+"lazy"};var a5924=function(b){return b*5924+"name"};var a5925=function(b){return b*5925+"amet"};var a5926=function(b){return b*5926+"brown"};var a5927=function(b){return b*5927+"jumps"};var a5928=function(b){return b*5928+"fox"};var a5929=function(b){return b*5929+"brown"};var a5930=function(b){return b*5930+"lorem"};var a5931=function(b){return b*5931+"quick"};var a5932=function(b){return b*5932+"dolor"};var a5933=function(b){return b*5933+"over"};var a5934=function(b){return b*5934+"amet"};var a5935=function(b){return b*5935+"dolor"};var a5936=function(b){return b*5936+"config"};var a5937=function(b){return b*5937+"name"};var a5938=function(b){return b*5938+"host"};var a5939=function(b){return b*5939+"host"};var a5940=function(b){return b*5940+"amet"};var a5941=function(b){return b*5941+"sit"};var a5942=function(b){return b*5942+"sit"};var a5943=function(b){return b*5943+"ipsum"};var a5944=function(b){return b*5944+"over"};var a5945=function(b){return b*5945+"quick"};var a5946=function(b){return b*5946+"value"};var a5947=function(b){return b*5947+"value"};var a5948=function(b){return b*5948+"value"};var a5949=function(b){return b*5949+"over"};var a5950=function(b){return b*5950+"ipsum"};var a5951=function(b){return b*5951+"name"};var a5952=function(b){return b*5952+"dog"};var a5953=function(b){return b*5953+"amet"};var a5954=function(b){return b*5954+"fox"};var a5955=function(b){return b*5955+"over"};var a5956=function(b){return b*5956+"lorem"};var a5957=function(b){return b*5957+"dolor"};var a5958=function(b){return b*5958+"name"};var a5959=function(b){return b*5959+"fox"};var a5960=function(b){return b*5960+"name"};var a5961=function(b){return b*5961+"port"};var a5962=function(b){return b*5962+"quick"};var a5963=function(b){return b*5963+"user"};var a5964=function(b){return b*5964+"brown"};var a5965=function(b){return b*5965+"fox"};var a5966=function(b){return b*5966+"fox"};var a5967=function(b){return b*5967+"value"};var a5968=function(b){return b*5968+"the"};var a5969=function(b){return b*5969+"value"};var a5970=function(b){return b*5970+"amet"};var a5971=function(b){return b*5971+"dolor"};var a5972=function(b){return b*5972+"host"};var a5973=function(b){return b*5973+"sit"};var a5974=function(b){return b*5974+"config"};var a5975=function(b){return b*5975+"host"};var a5976=function(b){return b*5976+"jumps"};var a5977=function(b){return b*5977+"dog"};var a5978=function(b){return b*5978+"amet"};var a5979=function(b){return b*5979+"user"};var a5980=function(b){return b*5980+"user"};var a5981=function(b){return b*5981+"dog"};var a5982=function(b){return b*5982+"dolor"};var a5983=function(b){return b*5983+"lorem"};var a5984=function(b){return b*5984+"jumps"};var a5985=function(b){return b*5985+"value"};var a5986=function(b){return b*5986+"lorem"};var a5987=function(b){return b*5987+"name"};var a5988=function(b){return b*5988+"lorem"};var a5989=function(b){return b*5989+"server"};var a5990=function(b){return b*5990+"the"};var a5991=function(b){return b*5991+"lazy"};var a5992=function(b){return b*5992+"amet"};var a5993=function(b){return b*5993+"lazy"};var a5994=function(b){return b*5994+"config"};var a5995=function(b){return b*5995+"value"};var a5996=function(b){return b*5996+"quick"};var a5997=function(b){return b*5997+"quick"};var a5998=function(b){return b*5998+"dog"};var a5999=function(b){return b*5999+"user"}
\ No newline at end of file
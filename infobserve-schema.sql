@@ -2,15 +2,23 @@
  * This is the PostgreSQL schema that Infobserve uses to store processed events
  */
 
+CREATE TABLE IF NOT EXISTS EVENT_CONTENTS (
+  SHA256 BYTEA PRIMARY KEY, -- The SHA-256 of the raw content
+  CONTENT BYTEA NOT NULL, -- The zlib compressed raw content
+  SIZE INTEGER NOT NULL -- The size of the uncompressed raw content in bytes
+);
 CREATE TABLE IF NOT EXISTS EVENTS (
   ID SERIAL PRIMARY KEY,
   SOURCE TEXT, -- The service in which the event was found
-  RAW_CONTENT TEXT, -- The raw text of the event
+  RAW_CONTENT TEXT, -- The raw text of the events stored before EVENT_CONTENTS existed
+  CONTENT_SHA256 BYTEA REFERENCES EVENT_CONTENTS(SHA256), -- A reference to the raw content of the event
   FILENAME TEXT, -- The name of the file in which the event was found
   CREATOR TEXT, -- The name of the user that created the post that contained the event
   TIME_CREATED TIMESTAMPTZ, -- The time and date the event was created
   TIME_DISCOVERED TIMESTAMPTZ -- The time and date the event was discovered
 );
+-- Databases created before EVENT_CONTENTS existed
+ALTER TABLE EVENTS ADD COLUMN IF NOT EXISTS CONTENT_SHA256 BYTEA REFERENCES EVENT_CONTENTS(SHA256);
 CREATE TABLE IF NOT EXISTS MATCHES (
   ID SERIAL PRIMARY KEY,
   EVENT_ID INTEGER REFERENCES EVENTS(ID), -- A reference to the event in which the rule matched
@@ -26,27 +34,35 @@ CREATE TABLE IF NOT EXISTS BINARY_MATCH (
 CREATE TABLE IF NOT EXISTS ASCII_MATCH (
   ID SERIAL PRIMARY KEY,
   MATCH_ID INTEGER REFERENCES MATCHES(ID),
-  MATCHED_STRING TEXT -- The matched ASCII string
+  MATCHED_STRING TEXT, -- The matched ASCII string
+  IDENTIFIER TEXT, -- The identifier of the yara string that matched
+  STRING_OFFSET BIGINT, -- The offset of the matched string in the raw content
+  CONTEXT TEXT -- The raw content around the matched string
 );
+-- Databases created before the snippets were stored
+ALTER TABLE ASCII_MATCH ADD COLUMN IF NOT EXISTS IDENTIFIER TEXT;
+ALTER TABLE ASCII_MATCH ADD COLUMN IF NOT EXISTS STRING_OFFSET BIGINT;
+ALTER TABLE ASCII_MATCH ADD COLUMN IF NOT EXISTS CONTEXT TEXT;
 CREATE TABLE IF NOT EXISTS INDEX_CACHE (
   ID SERIAL PRIMARY KEY,
   SOURCE TEXT,
   SOURCE_ID TEXT, -- The Reason is each kind of source could have different definition of a unique id format.
   CACHED_TIME TIMESTAMP NOT NULL DEFAULT NOW()
 );
-
-CREATE OR REPLACE FUNCTION expire_cached_rows() RETURNS trigger
-  LANGUAGE plpgsql
-  AS $$
+-- Databases created before each id was cached once may hold duplicates, only the newest row of each is kept
+DO $$
 BEGIN
-  DELETE FROM INDEX_CACHE WHERE CACHED_TIME < NOW() - INTERVAL '2 hours';
-  RETURN NULL;
+  IF to_regclass('INDEX_CACHE_SOURCE_ID') IS NULL THEN
+    DELETE FROM INDEX_CACHE OLDER USING INDEX_CACHE NEWER
+      WHERE OLDER.SOURCE = NEWER.SOURCE AND OLDER.SOURCE_ID = NEWER.SOURCE_ID AND OLDER.ID < NEWER.ID;
+  END IF;
 END;
 $$;
+CREATE UNIQUE INDEX IF NOT EXISTS INDEX_CACHE_SOURCE_ID ON INDEX_CACHE (SOURCE, SOURCE_ID);
+-- Serves both the incremental syncs and the expiry of the cached ids of each source
+CREATE INDEX IF NOT EXISTS INDEX_CACHE_CACHED_TIME ON INDEX_CACHE (SOURCE, CACHED_TIME);
 
-
+-- The cached ids are expired by the IndexCache sweep task instead of a scan after every insert
 DROP TRIGGER IF EXISTS trigger_expire_cached_rows
   ON PUBLIC.INDEX_CACHE;
-CREATE TRIGGER trigger_expire_cached_rows
-  AFTER INSERT ON INDEX_CACHE
-  EXECUTE PROCEDURE expire_cached_rows();
+DROP FUNCTION IF EXISTS expire_cached_rows();
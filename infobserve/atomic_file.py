@@ -0,0 +1,36 @@
+"""Writes files atomically.
+
+Note: Imported by the scan pool workers, see `infobserve.processors.scan_pool` for what it may import.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_write(path, mode="wb"):
+    """Opens a temporary file next to `path`, which replaces `path` once the block exits.
+
+    So a crash never leaves a partially written file at `path`, and readers either see the old file or the new one.
+    If the block raises, the temporary file is removed and `path` is left as it was.
+
+    Arguments:
+        path (str|pathlib.Path): The path of the file to write.
+        mode (str): The mode the temporary file is opened with, "wb" or "w".
+
+    Yields:
+        (io.IOBase): The temporary file.
+    """
+    path = Path(path)
+    descriptor, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, mode) as temp_file:
+            yield temp_file
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,192 @@
+""" Content-addressed stores for the raw contents that go through the Redis queues """
+import asyncio
+import hashlib
+import os
+import time
+from pathlib import Path
+
+from infobserve.atomic_file import atomic_write
+
+from .logger import APP_LOGGER
+from .pools import RedisConnectionPool
+
+
+def content_key(data):
+    """
+    Arguments:
+        data (bytes): The content.
+
+    Returns:
+        (str): The key of the content in a blob store, the hex SHA-256 of the content.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def create_blob_store(type="disk", **kwargs):  # pylint: disable=redefined-builtin
+    """Creates a blob store from its configuration.
+
+    Arguments:
+        type (str): "disk" or "redis".
+        kwargs: The arguments of the store's constructor.
+
+    Returns:
+        (DiskBlobStore|RedisBlobStore): The blob store.
+    Raises:
+        ValueError: If the type is unknown.
+    """
+    if type == "disk":
+        return DiskBlobStore(**kwargs)
+    if type == "redis":
+        return RedisBlobStore(**kwargs)
+
+    raise ValueError(f"Unknown blob store type: {type}")
+
+
+class DiskBlobStore():
+    """Stores each content once, in a file named after its key.
+
+    Storing a content again renews it. Contents that have not been stored for `ttl` seconds are deleted
+    by `sweep`, so `ttl` should be well above the time an event may spend in the queues.
+    The files are read and written in the default executor, so that the event loop never waits on the disk.
+
+    Attributes:
+        directory (pathlib.Path): The directory of the blobs.
+        min_size (int): Contents smaller than this many bytes are not worth storing and stay in the queue payloads.
+        ttl (int): The number of seconds a blob is kept after it was last stored.
+    """
+
+    def __init__(self, directory=".blobs", min_size=4096, ttl=86400):
+        """Constructor
+        Arguments:
+            directory (str): The directory of the blobs.
+            min_size (int): Contents smaller than this many bytes should stay in the queue payloads.
+            ttl (int): The number of seconds a blob is kept after it was last stored.
+        """
+        self.directory = Path(directory)
+        self.min_size = min_size
+        self.ttl = ttl
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    async def put(self, data):
+        """
+        Arguments:
+            data (bytes): The content to store.
+
+        Returns:
+            (str): The key of the content.
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, self._put, data)
+
+    async def get_many(self, keys):
+        """
+        Arguments:
+            keys (list(str)): The keys of the contents.
+
+        Returns:
+            (list(bytes)): The content of each key, or None for the ones that are not stored.
+        """
+        return await asyncio.get_event_loop().run_in_executor(None, self._get_many, keys)
+
+    async def sweep(self, interval=3600):
+        """Deletes the expired blobs every `interval` seconds.
+        A sweep that fails is logged and tried again after the interval.
+
+        Arguments:
+            interval (int): The number of seconds between two sweeps.
+        """
+        loop = asyncio.get_event_loop()
+        while True:
+            try:
+                removed = await loop.run_in_executor(None, self._remove_expired)
+                APP_LOGGER.debug("Deleted %s expired blobs", removed)
+            except Exception:  # pylint: disable=broad-except
+                APP_LOGGER.exception("Failed to delete the expired blobs of %s", self.directory)
+            await asyncio.sleep(interval)
+
+    def _put(self, data):
+        key = content_key(data)
+        path = self.directory / key
+
+        if path.exists():
+            os.utime(path)
+            return key
+
+        # So that a blob is never read half-written
+        with atomic_write(path) as blob_file:
+            blob_file.write(data)
+
+        return key
+
+    def _get_many(self, keys):
+        blobs = []
+        for key in keys:
+            try:
+                blobs.append((self.directory / key).read_bytes())
+            except FileNotFoundError:
+                blobs.append(None)
+
+        return blobs
+
+    def _remove_expired(self):
+        expired_before = time.time() - self.ttl
+        removed = 0
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime < expired_before:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+
+        return removed
+
+
+class RedisBlobStore():
+    """Stores each content once, under its key in Redis, so that every node can read it.
+
+    Storing a content again renews its expiration.
+
+    Attributes:
+        min_size (int): Contents smaller than this many bytes are not worth storing and stay in the queue payloads.
+        ttl (int): The number of seconds a blob is kept after it was last stored.
+    """
+    KEY_PREFIX = "blob:"
+
+    def __init__(self, min_size=4096, ttl=86400):
+        """Constructor
+        Arguments:
+            min_size (int): Contents smaller than this many bytes should stay in the queue payloads.
+            ttl (int): The number of seconds a blob is kept after it was last stored.
+        """
+        self.min_size = min_size
+        self.ttl = ttl
+
+    async def put(self, data):
+        """
+        Arguments:
+            data (bytes): The content to store.
+
+        Returns:
+            (str): The key of the content.
+        """
+        key = content_key(data)
+        redis = RedisConnectionPool().commands
+
+        # Only the expiration of a content that is already stored is renewed, it is not sent again
+        if not await redis.expire(self.KEY_PREFIX + key, self.ttl):
+            await redis.set(self.KEY_PREFIX + key, data, expire=self.ttl, exist=redis.SET_IF_NOT_EXIST)
+
+        return key
+
+    async def get_many(self, keys):
+        """
+        Arguments:
+            keys (list(str)): The keys of the contents.
+
+        Returns:
+            (list(bytes)): The content of each key, or None for the ones that are not stored.
+        """
+        if not keys:
+            return []
+
+        return await RedisConnectionPool().commands.mget(*[self.KEY_PREFIX + key for key in keys])
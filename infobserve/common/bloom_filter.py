@@ -0,0 +1,175 @@
+""" The BloomFilter and ScalableBloomFilter classes implementation """
+import hashlib
+import math
+import struct
+
+# Each filter is written as its capacity, error rate, count, number of bits and number of hashes, then its bits
+_FILTER_HEADER = struct.Struct(">QdQQI")
+_FILTER_COUNT = struct.Struct(">I")
+
+
+class BloomFilter():
+    """A Bloom filter of a fixed capacity.
+
+    Keys are never reported missing once added, and keys that were never added are reported present with a
+    probability of about `error_rate` as long as at most `capacity` keys were added.
+
+    Attributes:
+        capacity (int): The number of keys the filter is sized for.
+        error_rate (float): The false positive probability at capacity.
+        count (int): The number of keys added.
+    """
+
+    def __init__(self, capacity, error_rate):
+        """Constructor
+        Arguments:
+            capacity (int): The number of keys the filter is sized for.
+            error_rate (float): The false positive probability at capacity.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self._num_bits = max(math.ceil(-capacity * math.log(error_rate) / math.log(2)**2), 8)
+        self._num_hashes = max(round(self._num_bits / capacity * math.log(2)), 1)
+        self._bits = bytearray((self._num_bits + 7) // 8)
+
+    def __contains__(self, key):
+        return all(self._bits[bit >> 3] & (1 << (bit & 7)) for bit in self._bit_positions(key))
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def size(self):
+        """The number of bytes of the bit array."""
+        return len(self._bits)
+
+    def add(self, key):
+        """
+        Arguments:
+            key (str): The key to add.
+        """
+        for bit in self._bit_positions(key):
+            self._bits[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def dump(self, file):
+        """
+        Arguments:
+            file (io.BufferedIOBase): The binary file to write the filter to.
+        """
+        file.write(_FILTER_HEADER.pack(self.capacity, self.error_rate, self.count, self._num_bits, self._num_hashes))
+        file.write(self._bits)
+
+    @classmethod
+    def load(cls, file):
+        """
+        Arguments:
+            file (io.BufferedIOBase): The binary file to read the filter from, as written by `dump`.
+
+        Returns:
+            (BloomFilter): The filter.
+        Raises:
+            ValueError: If the file is truncated.
+        """
+        header = file.read(_FILTER_HEADER.size)
+        if len(header) != _FILTER_HEADER.size:
+            raise ValueError("Truncated bloom filter")
+
+        bloom_filter = cls.__new__(cls)
+        (bloom_filter.capacity, bloom_filter.error_rate, bloom_filter.count, bloom_filter._num_bits,
+         bloom_filter._num_hashes) = _FILTER_HEADER.unpack(header)
+        bloom_filter._bits = bytearray(file.read((bloom_filter._num_bits + 7) // 8))
+        if len(bloom_filter._bits) != (bloom_filter._num_bits + 7) // 8:
+            raise ValueError("Truncated bloom filter")
+
+        return bloom_filter
+
+    def _bit_positions(self, key):
+        # Double hashing, the k positions are derived from the two halves of a single digest
+        digest = hashlib.blake2b(key.encode("UTF-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self._num_bits for i in range(self._num_hashes))
+
+
+class ScalableBloomFilter():
+    """A Bloom filter that grows with the number of keys added to it.
+
+    Once its newest filter is full a new one is added, `growth` times larger and with an error rate
+    `tightening` times smaller, so the overall false positive probability stays below about `error_rate`
+    however many keys are added (see Almeida et al., "Scalable Bloom Filters").
+
+    Attributes:
+        initial_capacity (int): The capacity of the first filter.
+        error_rate (float): The bound of the overall false positive probability.
+        growth (int): The ratio of the capacity of a filter to the capacity of the one before it.
+        tightening (float): The ratio of the error rate of a filter to the error rate of the one before it.
+    """
+
+    def __init__(self, initial_capacity=100000, error_rate=0.001, growth=2, tightening=0.5):
+        """Constructor
+        Arguments:
+            initial_capacity (int): The capacity of the first filter.
+            error_rate (float): The bound of the overall false positive probability.
+            growth (int): The ratio of the capacity of a filter to the capacity of the one before it.
+            tightening (float): The ratio of the error rate of a filter to the error rate of the one before it.
+        """
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self._filters = []
+
+    def __contains__(self, key):
+        # The newest filters are the largest and the likeliest to hold a recent key
+        return any(key in bloom_filter for bloom_filter in reversed(self._filters))
+
+    def __len__(self):
+        return sum(len(bloom_filter) for bloom_filter in self._filters)
+
+    @property
+    def size(self):
+        """The number of bytes of the bit arrays of every filter."""
+        return sum(bloom_filter.size for bloom_filter in self._filters)
+
+    def add(self, key):
+        """Adds the key, unless it is (probably) already present.
+
+        Arguments:
+            key (str): The key to add.
+        """
+        if key in self:
+            return
+
+        if not self._filters or len(self._filters[-1]) >= self._filters[-1].capacity:
+            # The error rates of the filters form a geometric series that sums up to `error_rate`
+            depth = len(self._filters)
+            self._filters.append(BloomFilter(self.initial_capacity * self.growth**depth,
+                                             self.error_rate * (1 - self.tightening) * self.tightening**depth))
+
+        self._filters[-1].add(key)
+
+    def dump(self, file):
+        """
+        Arguments:
+            file (io.BufferedIOBase): The binary file to write the filters to.
+        """
+        file.write(_FILTER_COUNT.pack(len(self._filters)))
+        for bloom_filter in self._filters:
+            bloom_filter.dump(file)
+
+    def load(self, file):
+        """Replaces the filters with the ones read from the file.
+
+        Arguments:
+            file (io.BufferedIOBase): The binary file to read the filters from, as written by `dump`.
+
+        Raises:
+            ValueError: If the file is truncated.
+        """
+        header = file.read(_FILTER_COUNT.size)
+        if len(header) != _FILTER_COUNT.size:
+            raise ValueError("Truncated bloom filter")
+
+        (count,) = _FILTER_COUNT.unpack(header)
+        self._filters = [BloomFilter.load(file) for _ in range(count)]
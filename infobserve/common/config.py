@@ -10,8 +10,37 @@ class Config():
     Attributes:
         YARA_RULES_PATHS (list of str): Contains the paths that yara will search for rules.
         YARA_EXTERNAL_VARS (dict): Contains external variables that yara can use.
+        YARA_SCAN_WORKERS (int): The number of processes yara matching is dispatched to (0 to match in-process).
+        YARA_RULES_CACHE_DIR (str): The directory compiled yara rulesets are cached in (None disables the cache).
+        YARA_RULES_RELOAD_INTERVAL (int): How often the yara rule files are checked for changes (0 disables it).
+        VERDICT_CACHE (dict): The configuration of the scan verdict cache (None disables the cache).
+        YARA_SCAN_TIMEOUT (int): The max number of seconds the scan of an event may take (0 for no limit).
+        YARA_MAX_SCAN_SIZE (int): The max size in bytes of an event that will be scanned (0 for no limit).
+        YARA_QUARANTINE_TIMEOUT (int): The max number of seconds the rescan of a quarantined event may take.
+        YARA_BATCH_SIZE (int): The max number of events the yara processor retrieves and scans together.
+        YARA_BATCH_TIMEOUT_MS (int): The max number of milliseconds the yara processor waits for a batch to fill up.
+        STORAGE_MODE (str): "full" stores the raw content of the matching events, "snippets" only the matched strings
+                            and the bytes around them.
+        SNIPPET_CONTEXT_BYTES (int): The number of bytes kept on each side of a matched string in snippets mode.
+        FULL_CONTENT_RULES (list(str)): The rules whose matching events are stored whole in snippets mode.
+        FULL_CONTENT_SOURCES (list(str)): The sources whose matching events are stored whole in snippets mode.
         GLOBAL_SCRAPE_INTERVAL (int): The global interval that infobserve will set in a source producer.
         PROCESSING_QUEUE_SIZE (int): The max size the processing queue can reach.
+        PROCESSING_QUEUE_HIGH_WATER (int): Sources hold back while the processing queue is above it (0 disables it).
+        PROCESSING_QUEUE_LOW_WATER (int): Sources resume once the processing queue drains down to it.
+        DB_QUEUE_SIZE (int): The max size the db queue can reach.
+        DB_QUEUE_HIGH_WATER (int): Sources and the yara processor hold back while the db queue is above it.
+        DB_QUEUE_LOW_WATER (int): They resume once the db queue drains down to it.
+        QUEUE_SPILL (dict): The configuration of the disk spilling of the simple queues (None disables it).
+        LOADER_BATCH_SIZE (int): The max number of events the postgres loader stores together.
+        LOADER_BATCH_TIMEOUT_MS (int): The max number of milliseconds the postgres loader waits for a batch to fill up.
+        LOADER_WORKERS (int): The number of tasks that store the processed events concurrently.
+        LOADER_MAX_RETRIES (int): The max number of times a batch is retried after a transient database error.
+        LOADER_RETRY_BACKOFF_MS (int): The number of milliseconds before the first retry of a batch.
+        DEAD_LETTER_PATH (str): The file the events the loaders could not store are appended to.
+        HTTP_CLIENT (dict): The connection limits and the timeouts of the HTTP connections shared by the sources.
+        INDEX_CACHE (dict): The configuration of the cache of the items the sources already fetched.
+        BLOB_STORE (dict): The configuration of the store the Redis queues put raw contents in (None disables it).
         LOGGING_LEVEL (str): The minimum level the logger will emmit messages.
         SOURCES (dict): A dictionary of dictionaries with the configuration of each source.
         DB_CONFIG (dict): A connection pool for the postgresql db server.
@@ -38,7 +67,35 @@ class Config():
         self.GLOBAL_SCRAPE_INTERVAL = yaml_file.get("global_scrape_interval", 60)  # In Seconds
         self.YARA_RULES_PATHS = yaml_file.get("yara_rules_paths", "yara/*.yar")
         self.YARA_EXTERNAL_VARS = yaml_file.get("yara_external_vars", None)
+        self.YARA_SCAN_WORKERS = yaml_file.get("yara_scan_workers", 0)
+        self.YARA_RULES_CACHE_DIR = yaml_file.get("yara_rules_cache_dir", None)
+        self.YARA_RULES_RELOAD_INTERVAL = yaml_file.get("yara_rules_reload_interval", 0)  # In Seconds
+        self.VERDICT_CACHE = yaml_file.get("verdict_cache", None)
+        self.YARA_SCAN_TIMEOUT = yaml_file.get("yara_scan_timeout", 60)  # In Seconds
+        self.YARA_MAX_SCAN_SIZE = yaml_file.get("yara_max_scan_size", 0)  # In Bytes
+        self.YARA_QUARANTINE_TIMEOUT = yaml_file.get("yara_quarantine_timeout", 300)  # In Seconds
+        self.YARA_BATCH_SIZE = yaml_file.get("yara_batch_size", 16)
+        self.YARA_BATCH_TIMEOUT_MS = yaml_file.get("yara_batch_timeout_ms", 20)  # In Milliseconds
+        self.STORAGE_MODE = yaml_file.get("storage_mode", "full")
+        self.SNIPPET_CONTEXT_BYTES = yaml_file.get("snippet_context_bytes", 256)  # In Bytes
+        self.FULL_CONTENT_RULES = yaml_file.get("full_content_rules", [])
+        self.FULL_CONTENT_SOURCES = yaml_file.get("full_content_sources", [])
         self.PROCESSING_QUEUE_SIZE = yaml_file.get("processing_queue_size", 0)
+        self.PROCESSING_QUEUE_HIGH_WATER = yaml_file.get("processing_queue_high_water", 0)
+        self.PROCESSING_QUEUE_LOW_WATER = yaml_file.get("processing_queue_low_water", None)
+        self.DB_QUEUE_SIZE = yaml_file.get("db_queue_size", 0)
+        self.DB_QUEUE_HIGH_WATER = yaml_file.get("db_queue_high_water", 0)
+        self.DB_QUEUE_LOW_WATER = yaml_file.get("db_queue_low_water", None)
+        self.QUEUE_SPILL = yaml_file.get("queue_spill", None)
+        self.HTTP_CLIENT = yaml_file.get("http_client", {})
+        self.INDEX_CACHE = yaml_file.get("index_cache", {"type": "postgres", "expiry": 7200})
+        self.BLOB_STORE = yaml_file.get("blob_store", None)
+        self.LOADER_BATCH_SIZE = yaml_file.get("loader_batch_size", 500)
+        self.LOADER_BATCH_TIMEOUT_MS = yaml_file.get("loader_batch_timeout_ms", 1000)  # In Milliseconds
+        self.LOADER_WORKERS = yaml_file.get("loader_workers", 1)
+        self.LOADER_MAX_RETRIES = yaml_file.get("loader_max_retries", 5)
+        self.LOADER_RETRY_BACKOFF_MS = yaml_file.get("loader_retry_backoff_ms", 500)  # In Milliseconds
+        self.DEAD_LETTER_PATH = yaml_file.get("dead_letter_path", "dead_events.log")
         self.LOGGING_LEVEL = yaml_file.get("log_level", "DEBUG")
         self.DB_CONFIG = yaml_file.get("postgres")
         self.REDIS_CONFIG = yaml_file.get("redis", None)
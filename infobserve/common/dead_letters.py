@@ -0,0 +1,105 @@
+""" The DeadLetterFile class implementation """
+import asyncio
+import os
+import struct
+from pathlib import Path
+
+from infobserve.events.wire import decode_event, encode_event
+
+from .logger import APP_LOGGER
+
+# Each record is the length of the encoded event followed by the encoded event
+_RECORD_LENGTH = struct.Struct(">I")
+
+
+class DeadLetterFile():
+    """An append-only file of the processed events the loaders could not store.
+
+    The events are written in the wire format with their raw contents inline, never through a blob store, whose
+    blobs expire, and every append is flushed to disk before it returns. The events are moved back to a queue
+    by `replay`, so that they are stored again, e.g. on the next start, once the database is reachable again.
+    The file I/O runs in the default executor.
+
+    Attributes:
+        path (pathlib.Path): The path of the file.
+    """
+
+    def __init__(self, path="dead_events.log"):
+        """Constructor
+        Arguments:
+            path (str): The path of the file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Appends never interleave, nor run while a replay takes the file over
+        self._lock = asyncio.Lock()
+
+    async def append(self, events):
+        """
+        Arguments:
+            events (list(infobserve.events.processed.ProcessedEvent)): The events to add to the file.
+        """
+        records = b"".join(self._record(event) for event in events)
+        async with self._lock:
+            await asyncio.get_event_loop().run_in_executor(None, self._write, records)
+
+    async def replay(self, queue):
+        """Moves the events of the file to a queue, so that they are stored again.
+
+        Delivery is at-least-once: the events are removed from disk only once the queue holds them, and the ones
+        of a replay cut short by a crash are replayed on the next call. Events appended meanwhile wait for the next
+        replay.
+
+        Arguments:
+            queue (infobserve.common.queue.ProcessingQueue): The queue the events are put in, oldest first.
+        """
+        loop = asyncio.get_event_loop()
+        async with self._lock:
+            payloads = await loop.run_in_executor(None, self._take)
+
+        if payloads:
+            APP_LOGGER.info("Replaying %s dead-lettered events from %s", len(payloads), self.path)
+            await queue.queue_events([decode_event(payload) for payload in payloads])
+        await loop.run_in_executor(None, self._remove_replayed)
+
+    @staticmethod
+    def _record(event):
+        payload = encode_event(event)
+        return _RECORD_LENGTH.pack(len(payload)) + payload
+
+    def _write(self, records):
+        with open(self.path, "ab") as dead_letters:
+            dead_letters.write(records)
+            dead_letters.flush()
+            os.fsync(dead_letters.fileno())
+
+    def _replay_path(self):
+        return self.path.with_name(self.path.name + ".replay")
+
+    def _take(self):
+        # A replay file left behind by a crash is replayed before the newer events
+        if not self._replay_path().exists():
+            try:
+                os.replace(self.path, self._replay_path())
+            except FileNotFoundError:
+                return []
+
+        data = self._replay_path().read_bytes()
+        payloads = []
+        position = 0
+        while position + _RECORD_LENGTH.size <= len(data):
+            (length,) = _RECORD_LENGTH.unpack_from(data, position)
+            position += _RECORD_LENGTH.size
+            # A record cut short by a crash ends the file
+            if position + length > len(data):
+                break
+            payloads.append(data[position:position + length])
+            position += length
+
+        return payloads
+
+    def _remove_replayed(self):
+        try:
+            os.remove(self._replay_path())
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,47 @@
+""" The HTTP connections shared by every source """
+import aiohttp
+
+from . import CONFIG
+from .pools import Singleton
+
+
+class HttpClient(metaclass=Singleton):
+    """The HTTP connections shared by every source.
+
+    Every session is created on the same connector, so the TCP and TLS connections to a host are kept alive
+    and reused across the poll cycles of every source, at most `limit_per_host` at a time, and the DNS
+    lookups are cached. Each source keeps its own session, for its default headers.
+    The limits and the timeouts are read from the `http_client` section of the configuration.
+    """
+
+    def __init__(self):
+        self._connector = None
+        self._timeout = None
+
+    def session(self, headers=None):
+        """Creates a session on the shared connections.
+
+        Arguments:
+            headers (dict): The headers sent with every request of the session.
+
+        Returns:
+            (aiohttp.ClientSession): The session. Closing it leaves the shared connections open.
+        """
+        if self._connector is None or self._connector.closed:
+            config = CONFIG.HTTP_CLIENT
+            self._connector = aiohttp.TCPConnector(limit=config.get("limit", 100),
+                                                   limit_per_host=config.get("limit_per_host", 10),
+                                                   ttl_dns_cache=config.get("ttl_dns_cache", 300),
+                                                   keepalive_timeout=config.get("keepalive_timeout", 30))
+            self._timeout = aiohttp.ClientTimeout(total=config.get("total_timeout", 60),
+                                                  connect=config.get("connect_timeout", 10),
+                                                  sock_read=config.get("read_timeout", 30))
+
+        return aiohttp.ClientSession(connector=self._connector, connector_owner=False, timeout=self._timeout,
+                                     headers=headers)
+
+    async def close(self):
+        """Closes the shared connections."""
+        if self._connector:
+            await self._connector.close()
+            self._connector = None
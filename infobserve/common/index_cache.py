@@ -1,43 +1,357 @@
-""" The IndexCache class implementation """
+""" The index caches, which remember the ids of the items each source has already fetched """
+import asyncio
+import io
+import struct
+import time
+from pathlib import Path
+
+from infobserve.atomic_file import atomic_write
 from infobserve.common import APP_LOGGER
-from infobserve.common.pools import PgPool
+from infobserve.common.bloom_filter import ScalableBloomFilter
+from infobserve.common.pools import PgPool, RedisConnectionPool
+
+# A persisted bloom index cache starts with the time its current generation was started at
+_ROTATED_AT = struct.Struct(">d")
+
+# The bloom index caches created so far, by the file they are persisted to
+_BLOOM_INDEX_CACHES = {}
+
+
+def create_index_cache(source, type="postgres", **kwargs):  # pylint: disable=redefined-builtin
+    """Creates the index cache of a source from its configuration.
+
+    Sources of the same type share their cached ids: they share the INDEX_CACHE rows or the Redis set of the
+    type, and a single bloom index cache, persisted to a single file, is created per type and directory.
+
+    Arguments:
+        source (str): The source name.
+        type (str): "postgres", "redis" or "bloom".
+        kwargs: The arguments of the cache's constructor.
+
+    Returns:
+        (IndexCache|RedisIndexCache|BloomIndexCache): The index cache.
+    Raises:
+        ValueError: If the type is unknown.
+    """
+    if type == "postgres":
+        return IndexCache(source, **kwargs)
+    if type == "redis":
+        return RedisIndexCache(source, **kwargs)
+    if type == "bloom":
+        path = (Path(kwargs.get("directory", BloomIndexCache.DEFAULT_DIRECTORY)) / f"{source}.bloom").resolve()
+        if path not in _BLOOM_INDEX_CACHES:
+            _BLOOM_INDEX_CACHES[path] = BloomIndexCache(source, **kwargs)
+        return _BLOOM_INDEX_CACHES[path]
+
+    raise ValueError(f"Unknown index cache type: {type}")
 
 
 class IndexCache():
-    """Manages the INDEX_CACHE table."""
+    """Manages the INDEX_CACHE table.
+
+    The cached ids of the source are kept in memory, in a dict of each id to the (monotonic) time it expires at,
+    so looking an id up does not depend on the size of the cache. Every query only fetches the rows cached
+    since the newest row of the previous one, which picks up the ids cached by other instances, and the ids
+    older than `expiry` are dropped locally, in the order they were cached. The rows older than `expiry`
+    are deleted by `sweep`, in batches.
 
-    def __init__(self, source):
+    Attributes:
+        source (str): The source name.
+        expiry (int): The number of seconds an id stays cached.
+        sweep_interval (int): The number of seconds between two deletions of the expired rows.
+        pool (infobserve.common.pools.PgPool): The pool that connections will be acquired.
+    """
+    # The max number of rows a single DELETE of `sweep` removes, so that it never holds its locks for long
+    SWEEP_BATCH_SIZE = 10000
+
+    def __init__(self, source, expiry=7200, sweep_interval=600):
         """Constructor
         Arguments:
             source (str): The source name.
+            expiry (int): The number of seconds an id stays cached.
+            sweep_interval (int): The number of seconds between two deletions of the expired rows.
         """
 
         self.source = source
+        self.expiry = expiry
+        self.sweep_interval = sweep_interval
+        self.pool = PgPool()
+        self._ids = {}
+        self._last_cached_time = None
 
     async def query_index_cache(self):
-        """Query the cache for indexed gists.
+        """Query the cache for indexed ids, syncing the ids cached since the last query first.
+
+        Returns:
+            (collections.abc.Set): The cached ids for the source.
+        """
+        async with self.pool.acquire() as conn:
+            # Rows cached at the same time as the newest one may have been committed after it was fetched,
+            # so they are fetched again. CACHED_TIME has no time zone, so it is only ever compared to
+            # LOCALTIMESTAMP and to itself, whatever the time zone of the session is
+            rows = await conn.fetch(
+                '''SELECT SOURCE_ID, CACHED_TIME, EXTRACT(EPOCH FROM LOCALTIMESTAMP - CACHED_TIME) AS AGE
+                FROM INDEX_CACHE
+                WHERE SOURCE = $1 AND CACHED_TIME >= GREATEST(LOCALTIMESTAMP - $2 * INTERVAL '1 second', $3::timestamp)
+                ORDER BY CACHED_TIME;''', self.source, self.expiry, self._last_cached_time)
+
+        now = time.monotonic()
+        for row in rows:
+            self._cache(row["source_id"], now + self.expiry - float(row["age"]))
+        if rows:
+            self._last_cached_time = rows[-1]["cached_time"]
+            APP_LOGGER.debug("Synced %s %s ids to the index cache", len(rows), self.source)
+
+        self._expire(now)
+        return self._ids.keys()
+
+    async def filter_uncached(self, source_ids):
+        """
+        Arguments:
+            source_ids (list(str)): The ids to look up.
+
+        Returns:
+            (list(str)): The ids that are not cached, in order.
+        """
+        cached_ids = await self.query_index_cache()
+        return [source_id for source_id in source_ids if source_id not in cached_ids]
+
+    async def update_index_cache(self, source_ids):
+        """Insert the indexed ids to cache. The ids that are already cached are left as they are.
+
+        Arguments:
+            source_ids (list(str)): The ids to cache.
+        """
+        expires_at = time.monotonic() + self.expiry
+        for source_id in source_ids:
+            self._cache(source_id, expires_at)
+
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                '''INSERT INTO INDEX_CACHE (SOURCE, SOURCE_ID) SELECT $1, unnest($2::text[])
+                ON CONFLICT (SOURCE, SOURCE_ID) DO NOTHING;''', self.source, list(source_ids))
+
+    async def sweep(self):
+        """Deletes the expired rows of the source every `sweep_interval` seconds.
+        A sweep that fails is logged and tried again after the interval.
+        """
+        while True:
+            try:
+                removed = await self._sweep_expired()
+                APP_LOGGER.debug("Deleted %s expired %s ids from the index cache", removed, self.source)
+            except Exception:  # pylint: disable=broad-except
+                APP_LOGGER.exception("Failed to delete the expired %s ids from the index cache", self.source)
+            await asyncio.sleep(self.sweep_interval)
+
+    async def _sweep_expired(self):
+        removed = 0
+        while True:
+            async with self.pool.acquire() as conn:
+                status = await conn.execute(
+                    '''DELETE FROM INDEX_CACHE WHERE ID IN (
+                        SELECT ID FROM INDEX_CACHE
+                        WHERE SOURCE = $1 AND CACHED_TIME < LOCALTIMESTAMP - $2 * INTERVAL '1 second' LIMIT $3);''',
+                    self.source, self.expiry, self.SWEEP_BATCH_SIZE)
+            # The status of a DELETE is "DELETE <count>"
+            count = int(status.split()[-1])
+            removed += count
+            if count < self.SWEEP_BATCH_SIZE:
+                return removed
+
+    def _cache(self, source_id, expires_at):
+        # Moved to the end, so that the ids stay in the order they expire
+        self._ids.pop(source_id, None)
+        self._ids[source_id] = expires_at
+
+    def _expire(self, now):
+        expired = []
+        for source_id, expires_at in self._ids.items():
+            if expires_at > now:
+                break
+            expired.append(source_id)
+
+        for source_id in expired:
+            del self._ids[source_id]
+
+
+class RedisIndexCache():
+    """Caches the ids of a source in a Redis sorted set, scored by the time each id expires at.
+
+    Every instance of infobserve that uses the same Redis shares the cache.
+
+    Attributes:
+        source (str): The source name.
+        expiry (int): The number of seconds an id stays cached.
+    """
+    KEY_PREFIX = "index_cache:"
+
+    def __init__(self, source, expiry=7200):
+        """Constructor
+        Arguments:
+            source (str): The source name.
+            expiry (int): The number of seconds an id stays cached.
+        """
+        self.source = source
+        self.expiry = expiry
+        self._key = self.KEY_PREFIX + source
 
+    async def filter_uncached(self, source_ids):
+        """
         Arguments:
-            pool (asyncpg.Pool): A connection pool to lease a db connection.
+            source_ids (list(str)): The ids to look up.
 
         Returns:
-            (list): Returns a list with the cached ids for the source.
+            (list(str)): The ids that are not cached, in order.
         """
+        if not source_ids:
+            return []
 
-        async with PgPool().acquire() as conn:
-            stmt = await conn.prepare(f"""SELECT SOURCE_ID FROM INDEX_CACHE WHERE SOURCE = '{self.source}' """)
-            results = await stmt.fetch()
+        pipeline = RedisConnectionPool().commands.pipeline()
+        for source_id in source_ids:
+            pipeline.zscore(self._key, source_id)
+        expiry_times = await pipeline.execute()
 
-        return [x["source_id"] for x in results]
+        now = time.time()
+        return [source_id for source_id, expires_at in zip(source_ids, expiry_times)
+                if expires_at is None or expires_at <= now]
 
     async def update_index_cache(self, source_ids):
-        """Insert the indexed gists ids to cache.
+        """Insert the indexed ids to cache, renewing the ones already cached.
+
+        Arguments:
+            source_ids (list(str)): The ids to cache.
+        """
+        if not source_ids:
+            return
+
+        now = time.time()
+        pairs = []
+        for source_id in source_ids:
+            pairs.extend((now + self.expiry, source_id))
 
+        pipeline = RedisConnectionPool().commands.pipeline()
+        pipeline.zadd(self._key, *pairs)
+        pipeline.zremrangebyscore(self._key, max=now)
+        # The set of a source that stops caching ids expires along with its last ids
+        pipeline.expire(self._key, self.expiry)
+        await pipeline.execute()
+
+
+class BloomIndexCache():
+    """Caches the ids of a source in scalable bloom filters, persisted to disk.
+
+    The ids are added to the current generation of the cache, and a new generation is started every `expiry`
+    seconds, or earlier once the current one has grown past half of `max_size` bytes, dropping the oldest one.
+    So an id is remembered for between one and two `expiry` periods, at a bounded memory cost of about
+    `max_size`, and, rarely, an id that was never cached is reported cached (about `error_rate` of them).
+    The generations are written to `<directory>/<source>.bloom`, at most every `save_interval` seconds and in
+    the default executor, and loaded on start. The ids cached since the last write are lost on a crash.
+
+    Attributes:
+        source (str): The source name.
+        expiry (int): The minimum number of seconds an id stays cached.
+        path (pathlib.Path): The file the cache is persisted to.
+        initial_capacity (int): The number of ids the first filter of a generation is sized for.
+        error_rate (float): The bound of the false positive probability of each generation.
+        max_size (int): The max number of bytes of the two generations.
+        save_interval (int): The min number of seconds between two writes of the cache.
+    """
+
+    DEFAULT_DIRECTORY = ".index-cache"
+
+    def __init__(self, source, expiry=86400, directory=DEFAULT_DIRECTORY, initial_capacity=100000, error_rate=0.001,
+                 max_size=64 * 2**20, save_interval=60):
+        """Constructor
         Arguments:
-            pool (asyncpg.Pool): A connection pool to lease a db connection.
+            source (str): The source name.
+            expiry (int): The minimum number of seconds an id stays cached.
+            directory (str): The directory the cache is persisted to.
+            initial_capacity (int): The number of ids the first filter of a generation is sized for.
+            error_rate (float): The bound of the false positive probability of each generation.
+            max_size (int): The max number of bytes of the two generations.
+            save_interval (int): The min number of seconds between two writes of the cache.
         """
-        async with PgPool().acquire() as conn:
-            data = list()
-            for source_id in source_ids:
-                data.append((self.source, source_id))
-            await conn.copy_records_to_table('index_cache', records=data, columns=["source", "source_id"])
+        self.source = source
+        self.expiry = expiry
+        self.path = Path(directory) / f"{source}.bloom"
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.max_size = max_size
+        self.save_interval = save_interval
+
+        self._next_save = 0
+        self._previous = self._new_generation()
+        self._current = self._new_generation()
+        self._rotated_at = time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    async def filter_uncached(self, source_ids):
+        """
+        Arguments:
+            source_ids (list(str)): The ids to look up.
+
+        Returns:
+            (list(str)): The ids that are (probably) not cached, in order.
+        """
+        self._rotate()
+        return [source_id for source_id in source_ids
+                if source_id not in self._current and source_id not in self._previous]
+
+    async def update_index_cache(self, source_ids):
+        """Insert the indexed ids to cache, renewing the ones already cached.
+
+        Arguments:
+            source_ids (list(str)): The ids to cache.
+        """
+        self._rotate()
+        for source_id in source_ids:
+            self._current.add(source_id)
+
+        if time.monotonic() >= self._next_save:
+            self._next_save = time.monotonic() + self.save_interval
+            await self.save()
+
+    async def save(self):
+        """Writes the cache to `path`."""
+        # The filters are copied on the loop, so that the write never sees them half-updated
+        snapshot = io.BytesIO()
+        snapshot.write(_ROTATED_AT.pack(self._rotated_at))
+        self._previous.dump(snapshot)
+        self._current.dump(snapshot)
+        await asyncio.get_event_loop().run_in_executor(None, self._write, snapshot.getvalue())
+
+    def _new_generation(self):
+        return ScalableBloomFilter(self.initial_capacity, self.error_rate)
+
+    def _rotate(self):
+        if time.time() - self._rotated_at < self.expiry and self._current.size < self.max_size / 2:
+            return
+
+        APP_LOGGER.debug("Starting a new generation of the %s index cache, %s ids were cached in the last one",
+                         self.source, len(self._current))
+        # After a long enough downtime both generations have expired
+        expired = time.time() - self._rotated_at >= 2 * self.expiry
+        self._previous = self._new_generation() if expired else self._current
+        self._current = self._new_generation()
+        self._rotated_at = time.time()
+
+    def _load(self):
+        try:
+            with open(self.path, "rb") as cache_file:
+                (rotated_at,) = _ROTATED_AT.unpack(cache_file.read(_ROTATED_AT.size))
+                self._previous.load(cache_file)
+                self._current.load(cache_file)
+        except FileNotFoundError:
+            return
+        except (OSError, struct.error, ValueError):
+            APP_LOGGER.warning("Could not load the %s index cache from %s, starting empty", self.source, self.path)
+            self._previous = self._new_generation()
+            self._current = self._new_generation()
+            return
+
+        self._rotated_at = rotated_at
+
+    def _write(self, data):
+        with atomic_write(self.path) as cache_file:
+            cache_file.write(data)
@@ -1,11 +1,13 @@
 """ Singleton Connection Pools for Postgresql and Redis """
 
 import sys
+from contextlib import asynccontextmanager
 
 import aioredis
 import asyncpg
 
 from . import APP_LOGGER, CONFIG
+from .exceptions import UnitializedRedisConnectionPool
 
 
 class Singleton(type):
@@ -51,13 +53,97 @@ class PgPool(metaclass=Singleton):
 
 
 class RedisConnectionPool(metaclass=Singleton):
+    """The Redis connections.
+
+    Non-blocking commands share the connections of a pool. Each one is sent on the least busy connection
+    without checking it out, so concurrent commands are pipelined. Blocking commands (e.g. BRPOP) would
+    hold a pooled connection while they wait, and would queue up behind each other on a shared one, so each
+    of them checks out a dedicated connection instead.
+
+    Attributes:
+        redis (aioredis.ConnectionsPool): The shared connection pool, or None if Redis is not configured.
+        commands (aioredis.Redis): Runs commands on the shared connection pool.
+    """
+    redis = None
+    commands = None
+
+    def __init__(self):
+        self._blocking_connections = []
+        self._idle_blocking_connections = []
 
     async def init_redis_pool(self):
         """Initialize Redis connection pool.
+
+        Its size is read from the `pool_minsize` and `pool_maxsize` keys of the redis configuration.
         """
         try:
-            self.redis: aioredis.RedisPool = await aioredis.create_pool(
-                (CONFIG.REDIS_CONFIG["host"], CONFIG.REDIS_CONFIG["port"]))
+            self.redis: aioredis.ConnectionsPool = await aioredis.create_pool(
+                self._address(),
+                minsize=CONFIG.REDIS_CONFIG.get("pool_minsize", 1),
+                maxsize=CONFIG.REDIS_CONFIG.get("pool_maxsize", 10))
+            self.commands = aioredis.Redis(self.redis)
         except KeyError:
             APP_LOGGER.error("Wrong configuration format for redis key in yaml")
             sys.exit(1)
+
+    async def blocking_connection(self):
+        """Opens a dedicated connection for blocking commands, outside of the shared pool.
+
+        Returns:
+            (aioredis.Redis): The dedicated connection. It should be reused for as long as it is open.
+        Raises:
+            UnitializedRedisConnectionPool: If `init_redis_pool` has not been called
+        """
+        if not self.redis:
+            raise UnitializedRedisConnectionPool()
+
+        connection = await aioredis.create_redis(self._address())
+        self._blocking_connections = [conn for conn in self._blocking_connections if not conn.closed]
+        self._blocking_connections.append(connection)
+        return connection
+
+    @asynccontextmanager
+    async def checkout_blocking(self):
+        """Checks out a dedicated connection for a blocking command.
+
+        An idle dedicated connection is reused, otherwise a new one is opened, so concurrent consumers each
+        block on their own connection. A connection whose command failed or was cancelled may still have
+        a reply on its way, so it is closed instead of being reused.
+
+        Yields:
+            (aioredis.Redis): The dedicated connection.
+        Raises:
+            UnitializedRedisConnectionPool: If `init_redis_pool` has not been called
+        """
+        connection = None
+        while self._idle_blocking_connections and connection is None:
+            connection = self._idle_blocking_connections.pop()
+            if connection.closed:
+                connection = None
+        if connection is None:
+            connection = await self.blocking_connection()
+
+        try:
+            yield connection
+        except BaseException:
+            connection.close()
+            raise
+
+        if not connection.closed:
+            self._idle_blocking_connections.append(connection)
+
+    async def close(self):
+        """Closes the shared pool and every dedicated connection."""
+        for connection in self._blocking_connections:
+            connection.close()
+            await connection.wait_closed()
+        self._blocking_connections = []
+        self._idle_blocking_connections = []
+
+        if self.redis:
+            self.redis.close()
+            await self.redis.wait_closed()
+
+    @staticmethod
+    def _address():
+        return CONFIG.REDIS_CONFIG["host"], CONFIG.REDIS_CONFIG["port"]
@@ -1,27 +1,64 @@
 import asyncio
-import pickle
+import weakref
 
-from aioredis import Redis
+from infobserve.events.wire import blob_key, decode_event, encode_event, raw_content_bytes
 
+from .config import CONFIG
 from .logger import APP_LOGGER
 from .pools import RedisConnectionPool
+from .redis_stream import RedisStream
+from .spill_queue import SpillQueue
 
 
 class ProcessingQueue:
     REDIS_QUEUE = "redis"
+    REDIS_STREAM_QUEUE = "redis-stream"
     SIMPLE_QUEUE = "simple"
 
-    def __init__(self, name, max_queue_size=0):
+    def __init__(self, name, max_queue_size=0, high_water_mark=0, low_water_mark=None, blob_store=None):
+        """
+        Args:
+            name (str): The name of the queue (the key of the Redis list or stream)
+            max_queue_size (int): The max size of the simple queue, puts block
+                                  while it is full (0 for no limit)
+            high_water_mark (int): The number of events left above which the queue
+                                   reports that it is saturated (0 never does)
+            low_water_mark (int): The number of events left the queue has to drain
+                                  down to before it stops reporting that it is saturated
+                                  (Defaults to half the high water mark)
+            blob_store (infobserve.common.blob_store.DiskBlobStore|RedisBlobStore):
+                        The store the raw contents of the events are put in, so that
+                        only their keys go through a Redis queue. A simple queue holds
+                        references to the events, so it does not use it
+        """
         self.name = name
+        self._blob_store = blob_store
+        self.high_water_mark = high_water_mark
+        self.low_water_mark = high_water_mark // 2 if low_water_mark is None else low_water_mark
+        self._saturated = False
 
         redis_pool = RedisConnectionPool()
-        if redis_pool.redis:
+        if redis_pool.redis and CONFIG.REDIS_CONFIG.get("queue", "list") == "stream":
+            self.type = self.REDIS_STREAM_QUEUE
+            self.__queue = RedisStream(redis_pool,
+                                       name,
+                                       group=CONFIG.REDIS_CONFIG.get("consumer_group", "infobserve"),
+                                       consumer=CONFIG.REDIS_CONFIG.get("consumer_name"),
+                                       claim_idle_ms=CONFIG.REDIS_CONFIG.get("claim_idle_ms", 60000))
+            self._compress_threshold = CONFIG.REDIS_CONFIG.get("compress_threshold", 4096)
+            # The id of the stream entry each event that has not been notified yet was read from
+            self._entry_ids = weakref.WeakKeyDictionary()
+        elif redis_pool.redis:
             self.type = self.REDIS_QUEUE
             self.__queue = redis_pool
+            self._compress_threshold = CONFIG.REDIS_CONFIG.get("compress_threshold", 4096)
         else:
             APP_LOGGER.info("No redis configuration found initializing simple queue")
             self.type = self.SIMPLE_QUEUE
-            self.__queue = asyncio.Queue(max_queue_size)
+            if CONFIG.QUEUE_SPILL:
+                self.__queue = SpillQueue(name, maxsize=max_queue_size, **CONFIG.QUEUE_SPILL)
+            else:
+                self.__queue = asyncio.Queue(max_queue_size)
 
     async def queue_event(self, event, block=True):
         """
@@ -39,13 +76,32 @@ class ProcessingQueue:
                                 full
         """
         if self.type == self.REDIS_QUEUE:
-            with await self.__queue.redis as conn:
-                redis = Redis(conn)
-                await redis.lpush(self.name, pickle.dumps(event))
+            await self.__queue.commands.lpush(self.name, *await self._encode([event]))
+        elif self.type == self.REDIS_STREAM_QUEUE:
+            await self.__queue.add(await self._encode([event]))
         else:
             put_method = self.__queue.put if block else self.__queue.put_nowait
             await put_method(event)
 
+    async def queue_events(self, events):
+        """
+        Inserts a batch of events into the processing queue, in order.
+        With Redis, the whole batch is pushed in a single round trip.
+
+        Args:
+            events (list(RawEvent)): The events to insert into the queue
+        """
+        if not events:
+            return
+
+        if self.type == self.REDIS_QUEUE:
+            await self.__queue.commands.lpush(self.name, *await self._encode(events))
+        elif self.type == self.REDIS_STREAM_QUEUE:
+            await self.__queue.add(await self._encode(events))
+        else:
+            for event in events:
+                await self.__queue.put(event)
+
     async def get_event(self, block=True):
         """
         Returns the next event to be processed from the queue
@@ -56,33 +112,209 @@ class ProcessingQueue:
                             if the processing queue if empty.
                             In such case, an exception is raised
         Returns:
-            The next Event object to be processed
+            The next Event object to be processed. Events whose raw content
+            is missing from the blob store are dropped and skipped
         Raises:
             asyncio.QueueEmpty: If `block` is False and the queue is empty
 
         """
         if self.type == self.REDIS_QUEUE:
-            with await self.__queue.redis as conn:
-                redis = Redis(conn)
-                get_method = redis.brpop if block else redis.rpop
-                pickled_event = await get_method(self.name)
-                return pickle.loads(pickled_event[1])
+            while True:
+                if block:
+                    async with self.__queue.checkout_blocking() as redis:
+                        _, payload = await redis.brpop(self.name)
+                else:
+                    payload = await self.__queue.commands.rpop(self.name)
+                    if payload is None:
+                        raise asyncio.QueueEmpty()
+                events = await self._decode([payload])
+                if events:
+                    return events[0]
+
+        if self.type == self.REDIS_STREAM_QUEUE:
+            while True:
+                entries = await self.__queue.read(1, block)
+                if not entries:
+                    raise asyncio.QueueEmpty()
+                events = await self._decode_entries(entries)
+                if events:
+                    return events[0]
 
         get_method = self.__queue.get if block else self.__queue.get_nowait
         return await get_method()
 
-    def notify(self):
+    async def get_events(self, max_events, timeout=0):
+        """
+        Returns a batch of the next events to be processed from the queue, in order.
+        Blocks until the first event is available and then returns as soon as
+        `max_events` have been collected or `timeout` seconds have passed.
+
+        Args:
+            max_events (int): The max number of events to return
+            timeout (float): The max number of seconds to wait for more events after the first one
+        Returns:
+            A list of at least one and at most `max_events` Event objects.
+            Each one of them should be followed by a call to `notify`
+        """
+        loop = asyncio.get_event_loop()
+
+        if self.type == self.REDIS_STREAM_QUEUE:
+            events = []
+            while not events:
+                entries = await self.__queue.read(max_events)
+                if len(entries) < max_events and timeout > 0:
+                    await asyncio.sleep(timeout)
+                    entries.extend(await self.__queue.read(max_events - len(entries), block=False))
+                events = await self._decode_entries(entries)
+            return events
+
+        events = [await self.get_event()]
+        deadline = loop.time() + timeout
+
+        if self.type == self.REDIS_QUEUE:
+            events.extend(await self._pop_available(max_events - len(events)))
+            remaining = deadline - loop.time()
+            if len(events) < max_events and remaining > 0:
+                await asyncio.sleep(remaining)
+                events.extend(await self._pop_available(max_events - len(events)))
+            return events
+
+        while len(events) < max_events:
+            try:
+                events.append(self.__queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                events.append(await asyncio.wait_for(self.__queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return events
+
+    async def _pop_available(self, max_events):
+        """
+        Atomically pops up to `max_events` of the events already in the Redis list, in a single round trip
+
+        Args:
+            max_events (int): The max number of events to pop
+        Returns:
+            A list of the Event objects that were popped, oldest first
+        """
+        if max_events <= 0:
+            return []
+
+        transaction = self.__queue.commands.multi_exec()
+        # Events are pushed on the left, so the oldest ones are at the right end of the list
+        payloads = transaction.lrange(self.name, -max_events, -1)
+        transaction.ltrim(self.name, 0, -max_events - 1)
+        await transaction.execute()
+
+        return await self._decode(list(reversed(await payloads)))
+
+    async def _encode(self, events):
+        """
+        Args:
+            events (list): The events to encode
+        Returns:
+            The wire format payloads of the events. With a blob store, the raw contents
+            that are large enough are put in the store and only their keys are encoded
+        """
+        payloads = []
+        for event in events:
+            key = None
+            if self._blob_store:
+                content = raw_content_bytes(event)
+                if len(content) >= self._blob_store.min_size:
+                    key = await self._blob_store.put(content)
+            payloads.append(encode_event(event, self._compress_threshold, blob_key=key))
+
+        return payloads
+
+    async def _decode(self, payloads):
+        """
+        Args:
+            payloads (list(bytes)): The wire format payloads of the events
+        Returns:
+            The decoded events, with the raw contents that were put in the blob store fetched in one go.
+            An event whose raw content is missing from the store (it expired, or no blob store is
+            configured on this node) can not be scanned, so it is dropped
+        """
+        return [event for event in await self._decode_all(payloads) if event is not None]
+
+    async def _decode_all(self, payloads):
+        """
+        Args:
+            payloads (list(bytes)): The wire format payloads of the events
+        Returns:
+            The decoded events, with None in place of the ones whose raw content is missing
+        """
+        keys = [blob_key(payload) for payload in payloads]
+        unique_keys = list({key for key in keys if key})
+        blobs = {}
+        if unique_keys and self._blob_store:
+            blobs = dict(zip(unique_keys, await self._blob_store.get_many(unique_keys)))
+
+        events = []
+        for payload, key in zip(payloads, keys):
+            blob = None
+            if key:
+                blob = blobs.get(key)
+                if blob is None:
+                    APP_LOGGER.error("Dropped an event of queue %s, its raw content (blob %s) is missing", self.name,
+                                     key)
+                    events.append(None)
+                    continue
+            events.append(decode_event(payload, blob))
+
+        return events
+
+    async def _decode_entries(self, entries):
+        """
+        Args:
+            entries (list(tuple(bytes, bytes))): The ids and the payloads of the stream entries
+        Returns:
+            The decoded events, each one remembered along with the id of its entry until it is notified.
+            The entries of the dropped events are acknowledged right away
+        """
+        events = []
+        for event, (entry_id, _) in zip(await self._decode_all([payload for _, payload in entries]), entries):
+            if event is None:
+                self.__queue.ack(entry_id)
+                continue
+            self._entry_ids[event] = entry_id
+            events.append(event)
+
+        return events
+
+    def notify(self, event=None):
         """
         Notifies processes that a task that has been inserted into the
         processing queue has been completed, using `asyncio.task_done`.
         Each call to `get_event` should be followed by a call to `notify`.
+        With Redis Streams, the entry the event was read from is acknowledged
+        (XACK), along with the next retrieval of events.
 
+        Args:
+            event: The event that has been processed, as returned by `get_event`
+                   or `get_events`. Required with Redis Streams
         Raises:
             ValueError: If called more times than than there were items
-                        placed in the processing queue
+                        placed in the processing queue, or, with Redis Streams,
+                        for an event that was not read from this queue or has
+                        already been notified
         """
         if self.type == self.REDIS_QUEUE:
             pass
+        elif self.type == self.REDIS_STREAM_QUEUE:
+            entry_id = self._entry_ids.pop(event, None) if event is not None else None
+            if entry_id is None:
+                raise ValueError(f"The event was not read from queue {self.name} or has already been notified")
+            self.__queue.ack(entry_id)
         else:
             self.__queue.task_done()
 
@@ -92,7 +324,7 @@ class ProcessingQueue:
         An Event is considered to be processed *after* a call to `notify`
         has been called.
         """
-        if self.type == self.REDIS_QUEUE:
+        if self.type in (self.REDIS_QUEUE, self.REDIS_STREAM_QUEUE):
             pass
         else:
             self.__queue.join()
@@ -101,20 +333,56 @@ class ProcessingQueue:
         """
         Returns:
             The Event objects that have not yet been processed by the queue.
+            With Redis Streams, the lag of the consumer group (including
+            the events delivered but not acknowledged yet).
         """
         if self.type == self.REDIS_QUEUE:
-            with await self.__queue.redis as conn:
-                redis = Redis(conn)
-                return await redis.llen(self.name)
+            return await self.__queue.commands.llen(self.name)
+        elif self.type == self.REDIS_STREAM_QUEUE:
+            return await self.__queue.lag()
         else:
-            return await self.__queue.qsize()
+            return self.__queue.qsize()
+
+    async def is_saturated(self):
+        """
+        Checks the number of events left against the water marks. Once the
+        queue goes above the high water mark it stays saturated until it
+        drains down to the low water mark, so that producers that back off
+        while it is saturated do not flap around a single threshold.
+
+        Returns:
+            True if producers should hold back new events
+        """
+        if not self.high_water_mark:
+            return False
+
+        events_left = await self.events_left()
+        if events_left >= self.high_water_mark:
+            if not self._saturated:
+                APP_LOGGER.warning("Queue %s reached its high water mark (%s events left)", self.name, events_left)
+            self._saturated = True
+        elif events_left <= self.low_water_mark:
+            if self._saturated:
+                APP_LOGGER.info("Queue %s drained down to its low water mark (%s events left)", self.name,
+                                events_left)
+            self._saturated = False
+
+        return self._saturated
+
+    async def close(self):
+        """
+        Closes the queue. The events left in a simple queue that spills
+        to disk are kept there, to be resumed on the next start.
+        """
+        if isinstance(self.__queue, SpillQueue):
+            await self.__queue.close()
 
     def max_size(self):
         """
         Returns:
             The max size of the queue (as defined in the constructor)
         """
-        if self.type == self.REDIS_QUEUE:
+        if self.type in (self.REDIS_QUEUE, self.REDIS_STREAM_QUEUE):
             return 0
         else:
             return self.__queue.maxsize
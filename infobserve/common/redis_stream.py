@@ -0,0 +1,188 @@
+""" The RedisStream class implementation """
+import asyncio
+import socket
+
+from aioredis.errors import ReplyError
+
+from .logger import APP_LOGGER
+
+
+class RedisStream():
+    """A Redis Stream consumed through a consumer group.
+
+    Every node that reads the stream with the same group shares its entries, and each entry is delivered
+    to a single consumer of the group. A delivered entry stays pending until it is acknowledged, after
+    which it is deleted from the stream. Entries that stay pending for longer than `claim_idle_ms`
+    (e.g. because their consumer crashed) are claimed by the next consumer that reads the stream.
+
+    Attributes:
+        name (str): The key of the stream.
+        group (str): The name of the consumer group.
+        consumer (str): The name of this consumer in the group. It should be unique per node and stable
+                        across restarts, so that a restarted node picks up the entries it left pending.
+        claim_idle_ms (int): The number of milliseconds an entry must be pending before other consumers claim it.
+    """
+    FIELD = b"event"
+
+    def __init__(self, pool, name, group="infobserve", consumer=None, claim_idle_ms=60000):
+        """Constructor
+        Arguments:
+            pool (infobserve.common.pools.RedisConnectionPool): The connections to Redis. Each blocking read checks
+                                                                out a dedicated connection, everything else uses the
+                                                                shared pool.
+            name (str): The key of the stream.
+            group (str): The name of the consumer group.
+            consumer (str): The name of this consumer in the group (Defaults to the hostname).
+            claim_idle_ms (int): The number of milliseconds an entry must be pending before other consumers claim it.
+        """
+        self.name = name
+        self.group = group
+        self.consumer = consumer or socket.gethostname()
+        self.claim_idle_ms = claim_idle_ms
+        self._pool = pool
+        self._group_ready = False
+        # The id the next read of the pending entries left over from a previous run starts after (None once all read)
+        self._history_id = "0"
+        # Held by the reader that pages through those entries, so that concurrent readers never deliver one twice
+        self._history_lock = asyncio.Lock()
+        self._next_claim = 0
+        # The ids of the delivered entries that have not been acknowledged yet, and of the ones that have been
+        # acknowledged since the last read
+        self._delivered = set()
+        self._acked = []
+
+    async def add(self, payloads):
+        """Appends entries to the stream, in order and in a single round trip.
+
+        Arguments:
+            payloads (list(bytes)): The payloads of the entries.
+        """
+        pipeline = self._pool.commands.pipeline()
+        for payload in payloads:
+            pipeline.xadd(self.name, {self.FIELD: payload})
+        await pipeline.execute()
+
+    async def read(self, count, block=True):
+        """Reads the next entries of the stream.
+
+        The acknowledgements since the last read are flushed first. Then this consumer's own pending entries
+        left over from a previous run are returned, followed by the entries claimed from idle consumers and
+        by the entries never delivered before.
+
+        Arguments:
+            count (int): The max number of entries to return.
+            block (bool): If True, blocks until at least one entry is available.
+
+        Returns:
+            (list(tuple(bytes, bytes))): The ids and the payloads of the entries, oldest first. Each entry must be
+                                         acknowledged with `ack`, by its id.
+        """
+        await self._ensure_group()
+        await self.flush()
+
+        redis = self._pool.commands
+
+        if self._history_id is not None:
+            async with self._history_lock:
+                # Another reader may have read the rest of the history while this one was waiting
+                if self._history_id is not None:
+                    entries = await self._read_group(redis, count, self._history_id, None)
+                    self._history_id = entries[-1][0] if len(entries) == count else None
+                    if entries:
+                        return self._deliver(entries)
+
+        entries = await self._claim_idle(redis, count)
+        if entries:
+            return self._deliver(entries)
+
+        if not block:
+            return self._deliver(await self._read_group(redis, count, ">", None))
+
+        async with self._pool.checkout_blocking() as blocking_redis:
+            entries = await self._read_group(blocking_redis, count, ">", 0)
+        return self._deliver(entries)
+
+    def ack(self, entry_id):
+        """Acknowledges a delivered entry.
+
+        The acknowledgement is sent along with the next read, or by `flush`.
+
+        Arguments:
+            entry_id (bytes): The id of the entry, as returned by `read`.
+
+        Raises:
+            ValueError: If the entry was not delivered by this stream, or has already been acknowledged.
+        """
+        if entry_id not in self._delivered:
+            raise ValueError(f"Entry {entry_id} of the {self.name} stream is not waiting for an acknowledgement")
+
+        self._delivered.remove(entry_id)
+        self._acked.append(entry_id)
+
+    async def flush(self):
+        """Sends the pending acknowledgements and deletes the acknowledged entries from the stream."""
+        if not self._acked:
+            return
+
+        ids, self._acked = self._acked, []
+        transaction = self._pool.commands.multi_exec()
+        transaction.xack(self.name, self.group, *ids)
+        for entry_id in ids:
+            transaction.xdel(self.name, entry_id)
+        await transaction.execute()
+
+    async def lag(self):
+        """
+        Returns:
+            (int): The number of entries that have not been acknowledged yet. Since acknowledged entries are deleted,
+                   this is the length of the stream, i.e. the entries never delivered plus the pending ones.
+        """
+        return await self._pool.commands.xlen(self.name)
+
+    async def _ensure_group(self):
+        if self._group_ready:
+            return
+
+        try:
+            await self._pool.commands.xgroup_create(self.name, self.group, latest_id="0", mkstream=True)
+            APP_LOGGER.info("Created consumer group %s of the %s stream", self.group, self.name)
+        except ReplyError as err:
+            if not str(err).startswith("BUSYGROUP"):
+                raise
+
+        self._group_ready = True
+
+    async def _read_group(self, redis, count, latest_id, timeout):
+        entries = await redis.xread_group(self.group,
+                                          self.consumer, [self.name],
+                                          timeout=timeout,
+                                          count=count,
+                                          latest_ids=[latest_id])
+        return [(entry_id, fields) for _, entry_id, fields in entries]
+
+    async def _claim_idle(self, redis, count):
+        """Claims up to `count` of the entries other consumers have left pending for longer than `claim_idle_ms`.
+        Checked at most once every `claim_idle_ms`.
+        """
+        loop = asyncio.get_event_loop()
+        if loop.time() < self._next_claim:
+            return []
+        self._next_claim = loop.time() + self.claim_idle_ms / 1000
+
+        pending = await redis.xpending(self.name, self.group, "-", "+", count)
+        stale = [
+            entry_id for entry_id, consumer, idle, _ in pending
+            if idle >= self.claim_idle_ms and consumer.decode() != self.consumer
+        ]
+        if not stale:
+            return []
+
+        # Entries another consumer claimed or acknowledged in the meanwhile are not returned
+        claimed = await redis.xclaim(self.name, self.group, self.consumer, self.claim_idle_ms, *stale)
+        if claimed:
+            APP_LOGGER.warning("Claimed %s idle entries of the %s stream", len(claimed), self.name)
+        return claimed
+
+    def _deliver(self, entries):
+        self._delivered.update(entry_id for entry_id, _ in entries)
+        return [(entry_id, fields[self.FIELD]) for entry_id, fields in entries]
@@ -0,0 +1,350 @@
+""" The SpillQueue class implementation """
+import asyncio
+import json
+import os
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from infobserve.atomic_file import atomic_write
+from infobserve.events.wire import decode_event, encode_event
+
+from .logger import APP_LOGGER
+
+# Each record of a segment file is the length of the encoded event followed by the encoded event
+_RECORD_LENGTH = struct.Struct(">I")
+
+
+class SpillQueue(asyncio.Queue):
+    """An asyncio.Queue that spills its events to disk.
+
+    Events are kept in memory until the raw contents in memory reach `memory_limit` bytes. Past that, events
+    are appended to segment files in `directory` and read back in order once the events in memory have been
+    consumed. Fully consumed segments are deleted. When closed, the events still in memory are spilled too,
+    so a SpillQueue created on the same directory and name resumes every event that was not retrieved.
+
+    The segment files are only ever touched by a dedicated I/O thread, so that the event loop never waits on
+    the disk: spilled events are written in the background and read ahead by `get`, which is the only way to
+    retrieve them (`get_nowait` raises QueueEmpty while the next event is still on disk).
+
+    Spilled events are delivered at least once. How far they have been retrieved is checkpointed every
+    `checkpoint_interval` events and on close, so after a crash the ones retrieved since the last checkpoint
+    are retrieved again. Events still in memory at a crash are lost.
+
+    Attributes:
+        name (str): The name of the queue, the prefix of its files.
+        directory (pathlib.Path): The directory of the segment files.
+        memory_limit (int): The max number of bytes of raw content kept in memory.
+        segment_size (int): The size in bytes past which a new segment file is started.
+        checkpoint_interval (int): The number of spilled events retrieved between two checkpoints.
+    """
+
+    # The max number of spilled events read from disk ahead of `get`
+    READ_AHEAD = 16
+
+    def __init__(self, name, directory, memory_limit=64 * 2**20, segment_size=64 * 2**20, compress_threshold=4096,
+                 checkpoint_interval=1000, maxsize=0):
+        """Constructor
+        Arguments:
+            name (str): The name of the queue, the prefix of its files.
+            directory (str): The directory of the segment files.
+            memory_limit (int): The max number of bytes of raw content kept in memory.
+            segment_size (int): The size in bytes past which a new segment file is started.
+            compress_threshold (int): Spilled raw contents of at least this many bytes are compressed.
+            checkpoint_interval (int): The number of spilled events retrieved between two checkpoints.
+            maxsize (int): The max number of events in the queue, in memory and on disk (0 for no limit).
+        """
+        self.name = name
+        self.directory = Path(directory)
+        self.memory_limit = memory_limit
+        self.segment_size = segment_size
+        self.checkpoint_interval = checkpoint_interval
+        self._compress_threshold = compress_threshold
+        super().__init__(maxsize)
+
+    async def get(self):
+        """Remove and return an item from the queue, reading it from disk if it was spilled."""
+        await self._wait_resumed()
+        while not (self._memory or self._read_ahead):
+            if self._spilled:
+                await self._refill()
+            else:
+                self._readable.clear()
+                await self._readable.wait()
+
+        return self.get_nowait()
+
+    def get_nowait(self):
+        """Remove and return an item that is in memory or has been read ahead from disk, else raise QueueEmpty."""
+        if not (self._memory or self._read_ahead):
+            raise asyncio.QueueEmpty
+        return super().get_nowait()
+
+    async def close(self):
+        """Spills the events still in memory ahead of the ones on disk and checkpoints how far the segments
+        have been retrieved, so that the queue can be resumed.
+        """
+        await self._wait_resumed()
+        await asyncio.get_event_loop().run_in_executor(self._io, self._close, list(self._memory), self._checkpoint)
+        self._spilled += len(self._memory)
+        self._memory.clear()
+        self._memory_size = 0
+        self._io.shutdown()
+
+    def _init(self, maxsize):
+        self._memory = deque()
+        self._memory_size = 0
+        # The spilled events read from disk, with the checkpoint each of them moves the queue to once retrieved
+        self._read_ahead = deque()
+        self._refilling = None
+        self._readable = asyncio.Event()
+        # The number of events on disk, read ahead or not, which are yet to be retrieved
+        self._spilled = 0
+        self._checkpoint = None
+        self._retrieved = 0
+
+        # The state of the segment files, which only the I/O thread uses
+        self._segments = deque()
+        self._reader = None
+        self._read_sequence = None
+        self._read_segments = []
+        self._writer = None
+        self._resume_offset = None
+
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"spill-{self.name}")
+        # The events spilled by a previous run are counted in the background, and are not retrieved before that
+        self._resuming = self._io.submit(self._resume)
+
+    def qsize(self):
+        """Number of events in the queue, in memory and on disk."""
+        self._apply_resumed()
+        return len(self._memory) + self._spilled
+
+    def empty(self):
+        """Return True if the queue is empty, in memory and on disk."""
+        return not self.qsize()
+
+    def _put(self, item):
+        size = len(getattr(item, "raw_content", None) or b"")
+        self._readable.set()
+        self._apply_resumed()
+
+        # Once anything has been spilled, newer events have to go after it to keep the order
+        if not self._spilled and self._resuming is None and \
+                (not self._memory or self._memory_size + size <= self.memory_limit):
+            self._memory.append(item)
+            self._memory_size += size
+            return
+
+        self._spilled += 1
+        self._submit(self._write, item)
+
+    def _get(self):
+        if self._memory:
+            item = self._memory.popleft()
+            self._memory_size -= len(getattr(item, "raw_content", None) or b"")
+            return item
+
+        item, self._checkpoint = self._read_ahead.popleft()
+        self._spilled -= 1
+        self._retrieved += 1
+        if not self._spilled:
+            self._clear()
+        elif not self._retrieved % self.checkpoint_interval:
+            self._submit(self._save_checkpoint, self._checkpoint)
+        return item
+
+    async def _wait_resumed(self):
+        if self._resuming is not None:
+            await asyncio.wrap_future(self._resuming)
+            self._apply_resumed()
+
+    def _apply_resumed(self):
+        if self._resuming is None or not self._resuming.done():
+            return
+
+        count, self._checkpoint = self._resuming.result()
+        self._resuming = None
+        # Resumed events have not been processed either
+        if count:
+            APP_LOGGER.info("Resumed %s events spilled by queue %s", count, self.name)
+            self._spilled += count
+            # asyncio.Queue has no public way to count items that bypass put(); this relies on CPython's
+            # put_nowait and task_done (3.4 through 3.13) tracking unfinished items in these two attributes
+            self._unfinished_tasks += count
+            self._finished.clear()
+            self._readable.set()
+
+    async def _refill(self):
+        # Concurrent getters share a single read, which outlives any of them being cancelled
+        if self._refilling is None:
+            self._refilling = asyncio.ensure_future(self._read_ahead_records())
+        await asyncio.shield(self._refilling)
+
+    async def _read_ahead_records(self):
+        try:
+            count = min(self.READ_AHEAD, self._spilled - len(self._read_ahead))
+            records = await asyncio.get_event_loop().run_in_executor(self._io, self._read_records, count)
+            self._read_ahead.extend(records)
+        finally:
+            self._refilling = None
+
+        # Spilled events whose writes failed are never read
+        if len(records) < count:
+            APP_LOGGER.error("Lost %s events spilled by queue %s", count - len(records), self.name)
+            self._spilled -= count - len(records)
+            if not self._spilled:
+                self._clear()
+
+    def _clear(self):
+        """Deletes every segment once all the spilled events have been retrieved."""
+        # The sequence numbers start over, so a checkpoint left behind would point into the new segments
+        self._checkpoint = None
+        self._retrieved = 0
+        self._submit(self._clear_segments)
+
+    def _submit(self, function, *args):
+        self._io.submit(function, *args).add_done_callback(self._log_failure)
+
+    def _log_failure(self, future):
+        if future.exception() is not None:
+            APP_LOGGER.error("Segment I/O of queue %s failed: %s", self.name, future.exception())
+
+    # The methods below run in the I/O thread
+
+    def _resume(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments = deque(sorted(self._find_segments()))
+        self._resume_offset = self._load_checkpoint()
+        return sum(self._count_records(sequence) for sequence in self._segments), self._resume_offset
+
+    def _close(self, memory, checkpoint):
+        self._save_checkpoint(checkpoint)
+        if memory:
+            sequence = self._segments[0] - 1 if self._segments else 0
+            with open(self._segment_path(sequence), "wb") as segment:
+                for item in memory:
+                    segment.write(self._record(item))
+            self._segments.appendleft(sequence)
+
+        for handle in (self._reader, self._writer):
+            if handle:
+                handle.close()
+        self._reader = self._writer = None
+
+    def _record(self, item):
+        payload = encode_event(item, self._compress_threshold)
+        return _RECORD_LENGTH.pack(len(payload)) + payload
+
+    def _write(self, item):
+        if self._writer is None or self._writer.tell() >= self.segment_size:
+            self._start_segment()
+
+        self._writer.write(self._record(item))
+
+    def _read_records(self, count):
+        if self._writer:
+            self._writer.flush()
+
+        records = []
+        while len(records) < count:
+            if self._reader is None:
+                sequences = [sequence for sequence in self._segments
+                             if self._read_sequence is None or sequence > self._read_sequence]
+                if not sequences:
+                    break
+                self._read_sequence = sequences[0]
+                self._reader = open(self._segment_path(self._read_sequence), "rb")
+                if self._resume_offset and self._resume_offset[0] == self._read_sequence:
+                    self._reader.seek(self._resume_offset[1])
+
+            header = self._reader.read(_RECORD_LENGTH.size)
+            length = _RECORD_LENGTH.unpack(header)[0] if len(header) == _RECORD_LENGTH.size else None
+            payload = self._reader.read(length) if length is not None else b""
+            # A record cut short by a crash ends its segment
+            if length is not None and len(payload) == length:
+                records.append((decode_event(payload), (self._read_sequence, self._reader.tell())))
+                continue
+
+            # The segment has been read, and is deleted once its events have been retrieved
+            self._reader.close()
+            self._reader = None
+            self._read_segments.append(self._read_sequence)
+
+        return records
+
+    def _start_segment(self):
+        if self._writer:
+            self._writer.close()
+
+        sequence = self._segments[-1] + 1 if self._segments else 0
+        self._segments.append(sequence)
+        self._writer = open(self._segment_path(sequence), "ab")
+
+    def _clear_segments(self):
+        for handle in (self._reader, self._writer):
+            if handle:
+                handle.close()
+        self._reader = self._writer = None
+        self._read_sequence = None
+        self._read_segments = []
+        self._resume_offset = None
+
+        while self._segments:
+            os.remove(self._segment_path(self._segments.popleft()))
+        self._save_checkpoint(None)
+
+    def _count_records(self, sequence):
+        count = 0
+        with open(self._segment_path(sequence), "rb") as segment:
+            size = os.fstat(segment.fileno()).st_size
+            if self._resume_offset and self._resume_offset[0] == sequence:
+                segment.seek(self._resume_offset[1])
+
+            header = segment.read(_RECORD_LENGTH.size)
+            while len(header) == _RECORD_LENGTH.size:
+                (length,) = _RECORD_LENGTH.unpack(header)
+                # A record cut short by a crash is not counted, and so never read
+                if segment.seek(length, os.SEEK_CUR) > size:
+                    break
+                count += 1
+                header = segment.read(_RECORD_LENGTH.size)
+
+        return count
+
+    def _find_segments(self):
+        for path in self.directory.glob(f"{self.name}.*.seg"):
+            try:
+                yield int(path.name[len(self.name) + 1:-len(".seg")])
+            except ValueError:
+                continue
+
+    def _segment_path(self, sequence):
+        return self.directory / f"{self.name}.{sequence}.seg"
+
+    def _checkpoint_path(self):
+        return self.directory / f"{self.name}.checkpoint"
+
+    def _load_checkpoint(self):
+        try:
+            checkpoint = json.loads(self._checkpoint_path().read_text())
+        except (OSError, ValueError):
+            return None
+
+        return checkpoint["segment"], checkpoint["offset"]
+
+    def _save_checkpoint(self, checkpoint):
+        if not checkpoint:
+            if self._checkpoint_path().exists():
+                os.remove(self._checkpoint_path())
+            return
+
+        with atomic_write(self._checkpoint_path(), "w") as checkpoint_file:
+            json.dump({"segment": checkpoint[0], "offset": checkpoint[1]}, checkpoint_file)
+
+        # The segments read before the checkpointed one have been retrieved in full
+        for sequence in [sequence for sequence in self._read_segments if sequence < checkpoint[0]]:
+            self._read_segments.remove(sequence)
+            self._segments.remove(sequence)
+            os.remove(self._segment_path(sequence))
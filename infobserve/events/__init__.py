@@ -2,3 +2,4 @@ from .gist import GistEvent
 from .paste import PasteEvent
 from .github import GithubEvent
 from .processed import ProcessedEvent
+from .raw import RawEvent
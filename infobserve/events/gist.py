@@ -13,7 +13,7 @@ class GistEvent(BaseEvent):
         size (int): The size in bytes.
         filename (string): The name of the file.
         creator (string): The name of the creator.
-        raw_content (string): The content.
+        raw_content (bytes): The content, as downloaded.
     """
 
     def __init__(self, raw_gist):
@@ -38,14 +38,12 @@ class GistEvent(BaseEvent):
             session (aio.http.session): An aio http session to avoid opening and closing connections.
 
         Returns:
-            raw_content (string): The content of the gist.
+            raw_content (bytes): The content of the gist. It is kept undecoded, only the matched strings
+                                 that get stored are decoded.
         """
         try:
             async with session.get(self.raw_url) as response:
-                try:
-                    self.raw_content = await response.text()
-                except UnicodeDecodeError:
-                    return None
+                self.raw_content = await response.read()
             return self.raw_content
         except asyncio.TimeoutError:
             return None
@@ -15,7 +15,7 @@ class GithubEvent(BaseEvent):
         size (int): The size in bytes.
         filename (string): The name of the file.
         creator (string): The name of the creator.
-        raw_content (string): The content.
+        raw_content (bytes): The content, as downloaded.
     """
 
     def __init__(self, github_event, session):
@@ -72,10 +72,8 @@ class Commit():
             if not self.file_ext_blacklist(raw_url[1]):
                 try:
                     async with self.session.get(raw_url[0]) as response:
-                        try:
-                            self.files_raw_data.append((await response.text(), raw_url[1]))
-                        except UnicodeDecodeError:
-                            APP_LOGGER.warning("Unicode Decoding error in filename:%s", raw_url[1])
+                        # Kept undecoded, so that files that are not valid UTF-8 are scanned as well
+                        self.files_raw_data.append((await response.read(), raw_url[1]))
                 except (asyncio.TimeoutError, TypeError):
                     APP_LOGGER.warning("Dropped raw url: %s filename: %s", raw_url[0], raw_url[1])
 
@@ -92,18 +90,18 @@ class Commit():
 class CommitEvent(BaseEvent):
     """The CommitEvent Class represents a file changed in a commit that belongs to a GitHubEvent"""
 
-    def __init__(self, github_event: GithubEvent, raw_content: str, filename: str):
+    def __init__(self, github_event: GithubEvent, raw_content: bytes, filename: str):
         """Instantiates the CommitEvent.
 
         Arguments:
             github_event (GithubEvent): The GithubEvent object the commit belongs to.
-            raw_content (str): The content of the file changed in str.
+            raw_content (bytes): The content of the file changed, as downloaded.
             filename (str): The filename of the file changed
         """
         BaseEvent.__init__(self, github_event.timestamp, source=github_event.source)
         self.id: str = github_event.id
         self.creator: str = github_event.creator
-        self.raw_content: str = raw_content
+        self.raw_content: bytes = raw_content
         self.filename: str = filename
 
     async def get_raw_content(self):
@@ -12,7 +12,7 @@ class PasteEvent(BaseEvent):
         size (int): The size in bytes.
         filename (string): The name of the file.
         creator (string): The name of the creator.
-        raw_content (string): The content.
+        raw_content (bytes): The content, UTF-8 encoded.
     """
 
     def __init__(self, paste):
@@ -38,10 +38,11 @@ class PasteEvent(BaseEvent):
             session (aio.http.session): An aio http session to avoid opening and closing connections.
 
         Returns:
-            raw_content (string): The content of the gist.
+            raw_content (bytes): The content of the paste. pbwrap only returns decoded text,
+                                 so it is encoded once here to match the other events.
         """
         try:
-            self.raw_content = self.paste.scrape_raw_text()
+            self.raw_content = self.paste.scrape_raw_text().encode("UTF-8")
         except UnicodeDecodeError:
             return None
         return self.raw_content
@@ -11,19 +11,21 @@ class ProcessedEvent(BaseEvent):
 
     Attributes:
         event_id (int): The id of the ProcessedEvent in the database.
-        raw_content (str): The whole text of the event
+        raw_content (bytes): The whole content of the event, undecoded. None if only the snippets around
+                             the matched strings are kept
         filename (str): The name of the file the event was taken from.
         creator (str): The user that is responsible for the event.
         time_discovered (datetime): The time the event was processed.
         matches (list(infobserve.matches.Match)): A list of the matches that fired up the YaraRules.
     """
 
-    def __init__(self, unprocessed, matches):
+    def __init__(self, unprocessed, matches, context_size=0):
         """The constructor.
 
         Arguments:
             unprocessed (infobserve.event.Event): An event object straight from a Source Producer Queue.
             matches (yara.Match): All the matches that triggered Yara Rules.
+            context_size (int): The number of bytes of the content kept on each side of every matched string.
         """
         super().__init__(unprocessed.timestamp, source=unprocessed.source)
         self.event_id = None
@@ -31,7 +33,7 @@ class ProcessedEvent(BaseEvent):
         self.filename = unprocessed.filename
         self.creator = unprocessed.creator
         self.time_discovered = datetime.now()
-        self.matches = ProcessedEvent._build_matches(matches)
+        self.matches = ProcessedEvent._build_matches(matches, self.raw_content, context_size)
 
     def set_event_id(self, event_id):
         """Setter method for the event_id.
@@ -60,16 +62,18 @@ class ProcessedEvent(BaseEvent):
         return self.raw_content
 
     @staticmethod
-    def _build_matches(matches):
+    def _build_matches(matches, content=None, context_size=0):
         """Construct the list of Match objects.
 
         Arguments:
             matches (list(str)): A list of the strings that matched.
+            content (bytes): The content the matches were found in.
+            context_size (int): The number of bytes of the content kept on each side of every matched string.
 
         Returns:
             matches_list (list(infobserve.matches.Match)): A list of the Match objects.
         """
         matches_list = list()
         for match in matches:
-            matches_list.append(Match(match))
+            matches_list.append(Match(match, content, context_size))
         return matches_list
@@ -0,0 +1,38 @@
+"""The implementation of the RawEvent Class."""
+from .base import BaseEvent
+
+
+class RawEvent(BaseEvent):
+    """An event reduced to the fields the processing pipeline needs.
+
+    Events of every source are decoded to RawEvents when they are read back from a Redis queue.
+
+    Attributes:
+        id (string): The id of the event in its source.
+        filename (string): The name of the file.
+        creator (string): The name of the creator.
+        raw_content (bytes): The content.
+    """
+
+    def __init__(self, timestamp, source, event_id, filename, creator, raw_content):
+        """Instantiates the RawEvent.
+
+        Arguments:
+            timestamp (datetime): The creation timestamp.
+            source (str): The source the event comes from.
+            event_id (str): The id of the event in its source.
+            filename (str): The name of the file.
+            creator (str): The name of the creator.
+            raw_content (bytes): The content.
+        """
+        BaseEvent.__init__(self, timestamp, source=source)
+        self.id = event_id
+        self.filename = filename
+        self.creator = creator
+        self.raw_content = raw_content
+
+    async def get_raw_content(self):
+        return self.raw_content
+
+    def is_valid(self):
+        return bool(self.raw_content)
@@ -0,0 +1,176 @@
+"""The compact, versioned wire format of the events that go through the Redis queues.
+
+Only the fields the pipeline needs are written, instead of pickling whole event objects
+(which for pastes drags the whole `pbwrap` Paste object along).
+
+Layout:
+    MAGIC (3 bytes) | VERSION (1 byte) | FLAGS (1 byte) | HEADER LENGTH (4 bytes, big endian) | HEADER | BODY
+
+The header is a UTF-8 JSON object with the metadata of the event and the body is the raw content,
+zlib compressed when the FLAG_COMPRESSED flag is set. When the FLAG_BLOB flag is set (since version 2),
+the body is instead the key the raw content was stored under in a blob store. Since version 3, the matched
+strings of processed events carry their identifier, offset and context, and processed events that only keep
+those snippets have an empty body. Payloads without
+the magic bytes are pickled events from producers that have not been upgraded yet and are still read.
+Consumers refuse payloads of a version newer than the one they know, so consumers must be upgraded first.
+"""
+import json
+import pickle
+import struct
+import zlib
+from collections import namedtuple
+from datetime import datetime
+
+from .processed import ProcessedEvent
+from .raw import RawEvent
+
+MAGIC = b"IBW"
+VERSION = 3
+FLAG_COMPRESSED = 0x01
+FLAG_BLOB = 0x02
+
+RAW_EVENT = "raw"
+PROCESSED_EVENT = "processed"
+
+_PREAMBLE = struct.Struct(">3sBBI")
+
+# The attributes of a yara.Match that infobserve.matches.Match reads
+_DecodedMatch = namedtuple("_DecodedMatch", ["rule", "tags", "strings"])
+
+
+def encode_event(event, compress_threshold=4096, blob_key=None):
+    """Encodes an event to the wire format.
+
+    Arguments:
+        event (infobserve.events.base.BaseEvent): A raw event of any source, or a ProcessedEvent
+        compress_threshold (int): Raw contents of at least this many bytes are compressed (0 never compresses)
+        blob_key (str): The key the raw content has been stored under in a blob store. If given,
+                        the key is encoded instead of the raw content
+
+    Returns:
+        (bytes): The encoded event
+    """
+    header = {
+        "source": event.source,
+        "timestamp": event.timestamp.isoformat(),
+        "filename": getattr(event, "filename", None),
+        "creator": getattr(event, "creator", None),
+    }
+
+    if isinstance(event, ProcessedEvent):
+        header["type"] = PROCESSED_EVENT
+        header["time_discovered"] = event.time_discovered.isoformat()
+        header["matches"] = [{
+            "rule": match.rule_matched,
+            "tags": list(match.tags_matched),
+            "strings": [{
+                "string": ascii_match.matched_string,
+                "identifier": ascii_match.identifier,
+                "offset": ascii_match.offset,
+                "context": ascii_match.context,
+            } for ascii_match in match.ascii_matches]
+        } for match in event.matches]
+        # Only the snippets around the matched strings are kept (since version 3)
+        header["snippets_only"] = event.raw_content is None
+    else:
+        header["type"] = RAW_EVENT
+        header["id"] = getattr(event, "id", None)
+
+    flags = 0
+    if blob_key:
+        body = blob_key.encode("ascii")
+        flags |= FLAG_BLOB
+    else:
+        body = raw_content_bytes(event)
+
+    if not blob_key and compress_threshold and len(body) >= compress_threshold:
+        body = zlib.compress(body, 1)
+        flags |= FLAG_COMPRESSED
+
+    encoded_header = json.dumps(header, separators=(",", ":")).encode("UTF-8")
+    return _PREAMBLE.pack(MAGIC, VERSION, flags, len(encoded_header)) + encoded_header + body
+
+
+def raw_content_bytes(event):
+    """
+    Arguments:
+        event (infobserve.events.base.BaseEvent): Any event
+
+    Returns:
+        (bytes): The raw content of the event, UTF-8 encoded if it is a string
+    """
+    body = event.raw_content or b""
+    return body.encode("UTF-8") if isinstance(body, str) else body
+
+
+def blob_key(payload):
+    """
+    Arguments:
+        payload (bytes): The encoded event
+
+    Returns:
+        (str): The key of the blob the raw content of the event was stored under, or None if it was encoded inline
+    """
+    if not payload.startswith(MAGIC):
+        return None
+
+    _, _, flags, header_length = _PREAMBLE.unpack_from(payload)
+    if not flags & FLAG_BLOB:
+        return None
+
+    return payload[_PREAMBLE.size + header_length:].decode("ascii")
+
+
+def decode_event(payload, blob=None):
+    """Decodes an event from the wire format.
+
+    Arguments:
+        payload (bytes): The encoded event
+        blob (bytes): The raw content of the event, if it was stored in a blob store
+
+    Returns:
+        (infobserve.events.RawEvent|infobserve.events.ProcessedEvent): The decoded event
+    Raises:
+        ValueError: If the payload was encoded with a newer version of the wire format,
+                    or its raw content was stored in a blob store and no `blob` was given
+    """
+    if not payload.startswith(MAGIC):
+        # Pickled by a producer that still uses the old format
+        return pickle.loads(payload)
+
+    _, version, flags, header_length = _PREAMBLE.unpack_from(payload)
+    if version > VERSION:
+        raise ValueError(f"Unsupported event wire format version: {version} (up to {VERSION} is supported)")
+
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(payload[_PREAMBLE.size:header_end].decode("UTF-8"))
+    body = payload[header_end:]
+    if flags & FLAG_BLOB:
+        if blob is None:
+            raise ValueError(f"The raw content of the event is in blob {body.decode('ascii')}, which was not given")
+        body = blob
+    elif flags & FLAG_COMPRESSED:
+        body = zlib.decompress(body)
+
+    timestamp = datetime.fromisoformat(header["timestamp"])
+
+    if header["type"] == PROCESSED_EVENT:
+        content = None if header.get("snippets_only") else body
+        raw_event = RawEvent(timestamp, header["source"], None, header["filename"], header["creator"], content)
+        # Before version 3 only the matched strings themselves were encoded
+        strings = [[string if isinstance(string, dict) else {"string": string} for string in match["strings"]]
+                   for match in header["matches"]]
+        matches = [
+            _DecodedMatch(match["rule"], match["tags"],
+                          [(string.get("offset"), string.get("identifier"), string["string"].encode("UTF-8"))
+                           for string in match_strings])
+            for match, match_strings in zip(header["matches"], strings)
+        ]
+        processed_event = ProcessedEvent(raw_event, matches)
+        processed_event.time_discovered = datetime.fromisoformat(header["time_discovered"])
+        for match, match_strings in zip(processed_event.matches, strings):
+            for ascii_match, string in zip(match.ascii_matches, match_strings):
+                ascii_match.context = string.get("context")
+        return processed_event
+
+    return RawEvent(timestamp, header["source"], header["id"], header["filename"], header["creator"], body)
@@ -1,100 +1,257 @@
 """ This module contains the PgLoader class."""
+import asyncio
+import hashlib
+import zlib
+
+import asyncpg
+
 from infobserve.common import APP_LOGGER
 from infobserve.common.pools import PgPool
+from infobserve.events.wire import raw_content_bytes
+
+# Errors after which storing the same batch again may succeed
+TRANSIENT_ERRORS = (
+    asyncpg.exceptions.PostgresConnectionError,
+    asyncpg.exceptions.InterfaceError,
+    asyncpg.exceptions.DeadlockDetectedError,
+    asyncpg.exceptions.SerializationError,
+    asyncpg.exceptions.TooManyConnectionsError,
+    asyncpg.exceptions.CannotConnectNowError,
+    asyncpg.exceptions.AdminShutdownError,
+    asyncio.TimeoutError,
+    OSError,
+)
 
 
 class PgLoader():
     """ProcessedEvent object consumer stores them into the Pgsql database.
 
+    The events are stored in batches. The ids of the events and their matches are allocated from the
+    table sequences up front, so that each table is written with a single COPY in one transaction.
+    The raw contents are stored zlib compressed in EVENT_CONTENTS, once per distinct content, and
+    referenced from EVENTS by their SHA-256. Events stored in snippet-only mode have no raw content, only
+    the context around each of their matched strings.
+    Several `process` tasks can consume the same queue, each one storing its batches on its own connection.
+    A batch that fails with a transient error is retried with an exponential backoff, and a batch that
+    still fails is moved to the dead-letter file. A batch that fails with any other error is split in
+    halves that are stored on their own, so that only the events that can not be stored are moved there.
+
     Attributes:
         _processing (boolean): Indicates if the PgLoader instance consumes a Queue.
         pool (infobserve.common.pools.PgPool): The pool that connections will be acquired.
         consume_queue (infobserve.common.queue.ProcessingQueue): The queue ProcessedEvent object will be consumed from.
+        batch_size (int): The max number of events stored together.
+        batch_timeout (float): The max number of seconds to wait for a batch to fill up.
+        max_retries (int): The max number of times a batch is retried after a transient error.
+        retry_backoff (float): The number of seconds before the first retry, doubled on every retry after it.
+        dead_letters (infobserve.common.dead_letters.DeadLetterFile): The file the events that could not be stored
+                                                                      are moved to. If None, they are dropped.
     """
 
-    def __init__(self, consume_queue):
+    def __init__(self,
+                 consume_queue,
+                 batch_size=500,
+                 batch_timeout=1,
+                 max_retries=5,
+                 retry_backoff=0.5,
+                 dead_letters=None):
         """
         Args:
             consume_queue (infobserve.processing.queue.ProcessingQueue):
                         An instance of the queue in which ProcessedEvent objects will
                         be retrieved.
+            batch_size (int): The max number of events stored together
+            batch_timeout (float): The max number of seconds to wait for a batch to fill up
+                                   after its first event has been retrieved
+            max_retries (int): The max number of times a batch is retried after a transient error
+            retry_backoff (float): The number of seconds before the first retry, doubled on every retry after it
+            dead_letters (infobserve.common.dead_letters.DeadLetterFile):
+                        The file the events that could not be stored are moved to.
+                        If None, they are dropped
         """
         self._processing = False
         self.pool = PgPool()
         self.consume_queue = consume_queue
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.dead_letters = dead_letters
 
     async def process(self):
         """Start Consuming the `consume_queue`.
 
-        This function loops endlessly fetching ProcessedEvent objects
-        and inserting them into the database along with the insertions of the
-        Match and AsciiMatch objects they contain.
+        This function loops endlessly fetching batches of ProcessedEvent objects
+        and inserting them into the database along with the Match and AsciiMatch
+        objects they contain.
         """
         self._processing = True
 
         while True:
-            processed_event = await self.consume_queue.get_event()
-            event_id = await self._insert_event(processed_event)
-            processed_event.set_event_id(event_id)
-            for match in processed_event.matches:
-                match_id = await self._insert_match(match)
-                match.set_match_id(match_id)
-                for ascii_match in match.ascii_matches:
-                    await self._insert_ascii_match(ascii_match)
-
-            APP_LOGGER.debug("Inserted event from %s source. Rule files matched: %s", processed_event.source,
-                             ", ".join(processed_event.get_rule_files()))
+            processed_events = await self.consume_queue.get_events(self.batch_size, self.batch_timeout)
+            try:
+                await self._store_batch(processed_events)
+            finally:
+                for processed_event in processed_events:
+                    self.consume_queue.notify(processed_event)
 
-    @staticmethod
-    async def _insert_event(processed_event):
-        """Insert an Event into the database.
+    async def _store_batch(self, processed_events):
+        """Insert a batch of Events, moving the ones that can not be stored to the dead-letter file.
+
+        After an error that is not transient, the two halves of the batch are stored on their own, down to
+        the single events that fail.
 
         Arguments:
-            processed_event (infobserve.events.processed.ProcessedEvent): The processed event that will be inserted
+            processed_events (list(infobserve.events.processed.ProcessedEvent)): The processed events to store.
+        """
+        try:
+            await self._insert_with_retries(processed_events)
+            return
+        except TRANSIENT_ERRORS as err:
+            APP_LOGGER.error("Failed to insert a batch of %s events after %s retries", len(processed_events),
+                             self.max_retries, exc_info=err)
+        except Exception as err:  # pylint: disable=broad-except
+            if len(processed_events) > 1:
+                APP_LOGGER.warning("Failed to insert a batch of %s events, storing its halves separately: %s",
+                                   len(processed_events), err)
+                middle = len(processed_events) // 2
+                await self._store_batch(processed_events[:middle])
+                await self._store_batch(processed_events[middle:])
+                return
+            APP_LOGGER.exception("Failed to insert an event from %s", processed_events[0].source)
 
-        Returns:
-            id (int): The id of the inserted ProcessedEvent.
+        if self.dead_letters:
+            await self.dead_letters.append(processed_events)
+            APP_LOGGER.warning("Moved %s events to %s", len(processed_events), self.dead_letters.path)
+
+    async def _insert_with_retries(self, processed_events):
+        """Insert a batch of Events, retrying after transient errors.
+
+        Arguments:
+            processed_events (list(infobserve.events.processed.ProcessedEvent)): The processed events to store.
+
+        Raises:
+            Exception: The error of the last attempt, if the batch could not be stored.
         """
-        async with PgPool().acquire() as conn:
-            res = await conn.fetch(
-                '''INSERT INTO EVENTS (source, raw_content, filename, creator, time_created, time_discovered)
-                VALUES ($1, $2, $3, $4, $5, $6) RETURNING id;''', processed_event.source, processed_event.raw_content,
-                processed_event.filename, processed_event.creator, processed_event.timestamp,
-                processed_event.time_discovered)
-            APP_LOGGER.debug("Inserted Event with id:%s", res[0]["id"])
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self._insert_events(processed_events)
+                APP_LOGGER.debug("Inserted %s events. Rule files matched: %s", len(processed_events),
+                                 ", ".join(sorted({rule for event in processed_events
+                                                   for rule in event.get_rule_files()})))
+                return
+            except TRANSIENT_ERRORS as err:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt
+                APP_LOGGER.warning("Failed to insert a batch of %s events, retrying in %s seconds: %s",
+                                   len(processed_events), delay, err)
+                await asyncio.sleep(delay)
 
-            return res[0]["id"]
+    async def _insert_events(self, processed_events):
+        """Insert a batch of Events, along with their Matches and AsciiMatches, in a single transaction.
+
+        Arguments:
+            processed_events (list(infobserve.events.processed.ProcessedEvent)): The processed events that will be
+                                                                                  inserted. Their ids and the ids of
+                                                                                  their matches are set.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                content_hashes = await self._insert_contents(conn, processed_events)
+
+                event_ids = await self._allocate_ids(conn, "events", len(processed_events))
+                for processed_event, event_id in zip(processed_events, event_ids):
+                    processed_event.set_event_id(event_id)
+
+                matches = [match for processed_event in processed_events for match in processed_event.matches]
+                match_ids = await self._allocate_ids(conn, "matches", len(matches))
+                for match, match_id in zip(matches, match_ids):
+                    match.set_match_id(match_id)
+
+                await conn.copy_records_to_table(
+                    "events",
+                    columns=[
+                        "id", "source", "content_sha256", "filename", "creator", "time_created", "time_discovered"
+                    ],
+                    records=[(processed_event.event_id, processed_event.source, content_hash, processed_event.filename,
+                              processed_event.creator, processed_event.timestamp, processed_event.time_discovered)
+                             for processed_event, content_hash in zip(processed_events, content_hashes)])
+
+                if matches:
+                    await conn.copy_records_to_table(
+                        "matches",
+                        columns=["id", "event_id", "rule_matched", "tags_matched"],
+                        records=[(match.match_id, match.event_id, match.rule_matched, list(match.tags_matched))
+                                 for match in matches])
+
+                ascii_matches = [ascii_match for match in matches for ascii_match in match.ascii_matches]
+                if ascii_matches:
+                    await conn.copy_records_to_table(
+                        "ascii_match",
+                        columns=["match_id", "matched_string", "identifier", "string_offset", "context"],
+                        records=[(ascii_match.match_id, str(ascii_match.matched_string), ascii_match.identifier,
+                                  ascii_match.offset, ascii_match.context) for ascii_match in ascii_matches])
 
     @staticmethod
-    async def _insert_match(match):
-        """Insert an Event into the database.
+    async def _insert_contents(conn, processed_events):
+        """Insert the raw contents of the Events that are not stored yet, compressed.
+        Events without a raw content are skipped.
 
         Arguments:
-            match (infobserve.matches.match.Match): The match object that will be inserted.
+            conn (asyncpg.connection.Connection): The connection to insert the contents with.
+            processed_events (list(infobserve.events.processed.ProcessedEvent)): The processed events.
 
         Returns:
-            id (int): The id of the inserted Match
+            content_hashes (list(bytes)): The SHA-256 of the raw content of each event, None for the events
+                                          without one.
         """
-        async with PgPool().acquire() as conn:
-            res = await conn.fetch(
-                '''INSERT INTO MATCHES (event_id, rule_matched, tags_matched) VALUES ($1, $2, $3) RETURNING id;''',
-                match.event_id, match.rule_matched, match.tags_matched)
+        contents = {}
+        content_hashes = []
+        for processed_event in processed_events:
+            if processed_event.raw_content is None:
+                content_hashes.append(None)
+                continue
+
+            content = raw_content_bytes(processed_event)
+            content_hash = hashlib.sha256(content).digest()
+            contents[content_hash] = content
+            content_hashes.append(content_hash)
+
+        if not contents:
+            return content_hashes
+
+        # Only the contents that are not already stored are compressed and sent
+        stored = await conn.fetch("SELECT sha256 FROM event_contents WHERE sha256 = ANY($1::bytea[]);", list(contents))
+        for row in stored:
+            del contents[row["sha256"]]
+
+        if contents:
+            # zlib releases the GIL, so the batch is compressed in the default executor, off the event loop
+            compressed = await asyncio.get_event_loop().run_in_executor(
+                None, lambda: [zlib.compress(content) for content in contents.values()])
+            await conn.execute(
+                '''INSERT INTO event_contents (sha256, content, size)
+                SELECT * FROM unnest($1::bytea[], $2::bytea[], $3::integer[]) ON CONFLICT DO NOTHING;''',
+                list(contents), compressed, [len(content) for content in contents.values()])
 
-            return res[0]["id"]
+        return content_hashes
 
     @staticmethod
-    async def _insert_ascii_match(ascii_match):
-        """Insert an AsciiMatch into the database.
+    async def _allocate_ids(conn, table, count):
+        """Allocate ids from the sequence of a table in a single round trip.
 
         Arguments:
-            ascii_match (infobserve.matches.match.Match): The AsciiMatch object that will be inserted.
+            conn (asyncpg.connection.Connection): The connection to allocate the ids with.
+            table (str): The table whose `id` sequence is used.
+            count (int): The number of ids to allocate.
 
         Returns:
-            id (int): The id of the inserted AsciiMatch
+            ids (list(int)): The allocated ids.
         """
-        async with PgPool().acquire() as conn:
-            res = await conn.fetch(
-                '''INSERT INTO ASCII_MATCH (match_id, matched_string) VALUES ($1, $2) RETURNING id;''',
-                ascii_match.match_id, str(ascii_match.matched_string))
+        if not count:
+            return []
 
-            return res[0]["id"]
+        rows = await conn.fetch("SELECT nextval(pg_get_serial_sequence($1, 'id')) AS id FROM generate_series(1, $2);",
+                                table, count)
+        return [row["id"] for row in rows]
@@ -8,14 +8,23 @@ class AsciiMatch():
         id (int): The id of the AsciiMatch row in the db table.
         match_id(int): The match_id that this AsciiMatch references in the database.
         matched_string(str): A string that triggered the yara rule
+        identifier(str): The identifier of the string in the yara rule, eg '$a'
+        offset(int): The offset of the string in the content of the event
+        context(str): The string along with the bytes around it, if they were kept
     """
 
-    def __init__(self, string):
+    def __init__(self, string, identifier=None, offset=None, context=None):
         """The constructor.
 
         Arguments:
             string (str): Just a str!
+            identifier (str): The identifier of the string in the yara rule
+            offset (int): The offset of the string in the content of the event
+            context (str): The string along with the bytes around it
         """
         self.id = None
         self.match_id = None
         self.matched_string = string
+        self.identifier = identifier
+        self.offset = offset
+        self.context = context
@@ -4,11 +4,13 @@ from infobserve.matches.ascii_match import AsciiMatch
 
 class Match():
 
-    def __init__(self, yara_match):
+    def __init__(self, yara_match, content=None, context_size=0):
         """The MatchBase constructor.
 
         Arguments:
             yara_match (yara.Match): A yara match object as returned by Yara.Rules.match. It contains the following
+            content (bytes): The content the match was found in
+            context_size (int): The number of bytes of the content kept on each side of every matched string
         Attributes:
             match_id (int): The id of the ProcessedEvent the Match references.
             event_id (int): The id of the Match in the database.
@@ -20,7 +22,7 @@ class Match():
         self.event_id = None
         self.rule_matched = yara_match.rule
         self.tags_matched = yara_match.tags
-        self.ascii_matches = Match._create_ascii_matches(yara_match.strings)
+        self.ascii_matches = Match._create_ascii_matches(yara_match.strings, content, context_size)
 
     def set_match_id(self, match_id):
         """Setter method for the match_id.
@@ -34,23 +36,38 @@ class Match():
             ascii_match.match_id = match_id
 
     @staticmethod
-    def _create_ascii_matches(strings):
+    def _create_ascii_matches(strings, content=None, context_size=0):
         """Construct the list of AsciiMatch objects.
 
         The strings return from the yara.Match object are a list of tuples with the following values
-        (line, 'string identifier eg '$a', 'actual string').
+        (offset, 'string identifier eg '$a', 'actual string').
+        The actual strings are bytes, only they are decoded and not the whole content of the event.
+        Undecodable bytes and NULs, which Postgres does not accept in TEXT columns, are replaced with U+FFFD.
         Arguments:
             strings (list(str)): A list of the strings matches from the yara.Match object.
+            content (bytes): The content the strings were found in.
+            context_size (int): The number of bytes of the content kept on each side of every string (0 keeps none).
 
         Returns:
             ascii_matches (list(infobserve.matches.AsciiMatches)): A list of the AsciiMatches objects.
         """
+        if isinstance(content, str):
+            content = content.encode('UTF-8')
+
         ascii_matches = list()
-        for string in strings:
-            ascii_matches.append(AsciiMatch(string[2].decode('UTF-8')))
+        for offset, identifier, data in strings:
+            context = None
+            if content and context_size:
+                start = max(offset - context_size, 0)
+                context = Match._decode(content[start:offset + len(data) + context_size])
+            ascii_matches.append(AsciiMatch(Match._decode(data), identifier, offset, context))
 
         return ascii_matches
 
+    @staticmethod
+    def _decode(data):
+        return data.decode('UTF-8', errors='replace').replace('\x00', '\ufffd')
+
     @staticmethod
     def _create_binary_matches():
         raise NotImplementedError
@@ -0,0 +1,173 @@
+"""Benchmarks the scan cost of each Yara rule file over a local corpus of recorded events.
+
+Usage:
+    python -m infobserve.processors.benchmark --corpus benchmarks/corpus "yara-rules/**/*.yar"
+    python -m infobserve.processors.benchmark --save-baseline benchmarks/baseline.json ...
+    python -m infobserve.processors.benchmark --baseline benchmarks/baseline.json --threshold 0.25 ...
+
+Each rule file is compiled on its own and matched against every file of the corpus, pass after pass,
+until a round has lasted at least `--min-time` seconds, so that even cheap rule files are timed well
+above the timer's noise. The time of a pass, the number of matches and the throughput are reported
+per rule file: rules are timed along with the other rules of their file, as they may depend on them
+(private rules, shared imports), and yara-python does not expose per-rule profiling. When a baseline
+is given, the command exits with a non-zero status if any rule file got slower than the allowed threshold.
+
+Note: This module has its own cli, so it should not import anything from `infobserve.common`
+      (which parses the cli and loads the config).
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import yara
+
+# Differences below this fraction of the baseline time are considered noise and never reported as regressions,
+# whatever the threshold
+NOISE_FLOOR = 0.05
+
+
+def resolve_rule_files(patterns):
+    """
+    Arguments:
+        patterns (list[str]): Rule file paths, relative to the current directory. Each item can contain wildcards
+
+    Returns:
+        (list[str]): The sorted paths of the rule files
+    """
+    rule_files = set()
+    for pattern in patterns:
+        if Path(pattern).is_file():
+            rule_files.add(Path(pattern).as_posix())
+        else:
+            rule_files.update(path.as_posix() for path in Path().glob(pattern) if path.is_file())
+
+    return sorted(rule_files)
+
+
+def load_corpus(corpus_dir):
+    """
+    Arguments:
+        corpus_dir (str): The directory of the recorded events, one event per file
+
+    Returns:
+        (list[bytes]): The contents of the recorded events
+    """
+    return [path.read_bytes() for path in sorted(Path(corpus_dir).rglob("*")) if path.is_file()]
+
+
+def benchmark_rule_file(rule_file, corpus, externals=None, rounds=3, min_time=0.2):
+    """Matches a single rule file against the whole corpus.
+
+    Arguments:
+        rule_file (str): The path of the rule file
+        corpus (list[bytes]): The contents of the recorded events
+        externals (dict[str: str]): The values of the external variables used in the rule file
+        rounds (int): How many rounds are timed, the fastest round is reported
+        min_time (float): The min number of seconds of a round, the corpus is scanned as many times as it takes
+
+    Returns:
+        (dict): The `seconds` of a pass over the corpus in the fastest round, the `matches` and
+                the `bytes_per_second` of the rule file
+    """
+    rules = yara.compile(filepath=rule_file, externals=externals)
+    corpus_size = sum(len(data) for data in corpus)
+    best = None
+    matches = 0
+
+    for _ in range(rounds):
+        passes = 0
+        started = time.perf_counter()
+        while True:
+            matches = 0
+            for data in corpus:
+                matches += len(rules.match(data=data))
+            passes += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = elapsed / passes if best is None else min(best, elapsed / passes)
+
+    return {
+        "seconds": best,
+        "matches": matches,
+        "bytes_per_second": corpus_size / best if best else float("inf"),
+    }
+
+
+def find_regressions(results, baseline, threshold):
+    """
+    Arguments:
+        results (dict[str: dict]): The benchmark results per rule file
+        baseline (dict[str: dict]): The baseline results per rule file
+        threshold (float): The allowed slowdown, as a fraction of the baseline time
+
+    Returns:
+        (list[str]): The rule files that got slower than the threshold allows
+    """
+    regressions = []
+    for rule_file, result in results.items():
+        previous = baseline.get(rule_file)
+        if not previous:
+            continue
+
+        slowdown = result["seconds"] - previous["seconds"]
+        if slowdown > previous["seconds"] * max(threshold, NOISE_FLOOR):
+            regressions.append(rule_file)
+
+    return regressions
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmarks the scan cost of each Yara rule file")
+
+    parser.add_argument("rule_files", nargs="*", default=["yara-rules/**/*.yar"],
+                        help="The rule file paths. Each item can contain wildcards")
+    parser.add_argument("--corpus", default="benchmarks/corpus", help="The directory of the recorded events")
+    parser.add_argument("--rounds", type=int, default=3, help="How many rounds are timed per rule file")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="The min number of seconds of a round, the corpus is scanned as many times as it takes")
+    parser.add_argument("--external", action="append", default=[], metavar="NAME=VALUE",
+                        help="An external variable used in the rule files")
+    parser.add_argument("--baseline", type=Path, help="Fail if a rule file got slower than this baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="The allowed slowdown as a fraction of the baseline time")
+    parser.add_argument("--save-baseline", type=Path, help="Save the results as the new baseline")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+    externals = dict(external.split("=", 1) for external in args.external) or None
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"The corpus directory ({args.corpus}) has no recorded events", file=sys.stderr)
+        return 2
+
+    results = {}
+    print(f"{'Rule file':60} {'Time (ms)':>10} {'Matches':>8} {'MB/s':>10}")
+    for rule_file in resolve_rule_files(args.rule_files):
+        result = benchmark_rule_file(rule_file, corpus, externals, args.rounds, args.min_time)
+        results[rule_file] = result
+        print(f"{rule_file:60} {result['seconds'] * 1000:10.2f} {result['matches']:8} "
+              f"{result['bytes_per_second'] / 2**20:10.2f}")
+
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    if args.baseline:
+        regressions = find_regressions(results, json.loads(args.baseline.read_text()), args.threshold)
+        for rule_file in regressions:
+            print(f"REGRESSION: {rule_file} is more than {args.threshold:.0%} slower than the baseline",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""An on-disk cache of compiled Yara rulesets.
+
+Compiled rulesets are saved with `yara.Rules.save` under a key built from the resolved
+paths and the contents of the rule files, the external variables and the yara-python version.
+As long as none of them changes, the ruleset is loaded with `yara.load` instead of being compiled.
+
+Note: Imported by the scan pool workers, see `infobserve.processors.scan_pool` for what it may import.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import yara
+
+from infobserve.atomic_file import atomic_write
+
+CACHE_FILE_SUFFIX = ".yarc"
+
+
+def ruleset_key(filepaths, externals=None):
+    """Builds the cache key of a ruleset.
+
+    Arguments:
+        filepaths (dict[str: str]): The Namespace to rulefile mapping
+        externals (dict[str: str]): The values of the external variables used in the rule files
+
+    Returns:
+        (str): The hex digest that identifies the ruleset
+    """
+    digest = hashlib.sha256(yara.__version__.encode())
+
+    for namespace, filepath in sorted(filepaths.items()):
+        resolved = Path(filepath).resolve()
+        digest.update(namespace.encode())
+        digest.update(resolved.as_posix().encode())
+        digest.update(resolved.read_bytes())
+
+    digest.update(json.dumps(externals, sort_keys=True, default=str).encode())
+
+    return digest.hexdigest()
+
+
+class RulesCache:
+    """Saves and loads compiled Yara rulesets to and from a cache directory.
+
+    Attributes:
+        cache_dir (pathlib.Path): The directory the compiled rulesets are saved in.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): The directory the compiled rulesets will be saved in. It is created if it does not exist
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key):
+        """
+        Args:
+            key (str): The key of the ruleset, as returned by `ruleset_key`
+        Returns:
+            (pathlib.Path): The path the compiled ruleset is (or would be) saved at
+        """
+        return self.cache_dir / (key + CACHE_FILE_SUFFIX)
+
+    def load(self, filepaths, externals=None, key=None):
+        """Loads a compiled ruleset from the cache, compiling and saving it on a cache miss.
+
+        Arguments:
+            filepaths (dict[str: str]): The Namespace to rulefile mapping
+            externals (dict[str: str]): The values of the external variables used in the rule files
+            key (str): The key of the ruleset, if it has already been calculated
+
+        Returns:
+            (yara.Rules, bool): The compiled ruleset and whether it was loaded from the cache
+        """
+        cached_path = self.path(key or ruleset_key(filepaths, externals))
+
+        if cached_path.is_file():
+            try:
+                return yara.load(filepath=cached_path.as_posix()), True
+            except yara.Error:
+                # A corrupt or incompatible cache file, it will be overwritten below
+                pass
+
+        rules = yara.compile(filepaths=filepaths, externals=externals)
+        self._save(rules, cached_path)
+
+        return rules, False
+
+    def prune(self, keys):
+        """Removes the compiled rulesets other than the given ones, e.g. the ones left behind by rule edits.
+
+        Arguments:
+            keys (iterable(str)): The keys of the rulesets to keep
+
+        Returns:
+            (int): The number of compiled rulesets removed
+        """
+        keys = set(keys)
+        removed = 0
+        for cached_path in self.cache_dir.glob("*" + CACHE_FILE_SUFFIX):
+            if cached_path.name[:-len(CACHE_FILE_SUFFIX)] in keys:
+                continue
+            try:
+                cached_path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                continue
+
+        return removed
+
+    def _save(self, rules, cached_path):
+        """Atomically saves a compiled ruleset, so that concurrent loads never see a partially written file.
+
+        Arguments:
+            rules (yara.Rules): The compiled ruleset
+            cached_path (pathlib.Path): The path to save the ruleset at
+        """
+        with atomic_write(cached_path) as cache_file:
+            rules.save(file=cache_file)
@@ -0,0 +1,176 @@
+"""The compiled Yara rulesets and the picklable matches they produce.
+
+The rule files are split in two rulesets. Files that define the `BlacklistRule` or any rule
+tagged as `blacklist` make up a cheap first pass, and the rest of the files the main ruleset.
+An event that hits the blacklist is never matched against the main ruleset.
+
+Note: Imported by the scan pool workers, see `infobserve.processors.scan_pool` for what it may import.
+"""
+import re
+from collections import namedtuple
+
+import yara
+
+from infobserve.processors.rules_cache import ruleset_key
+
+BLACKLIST_RULE = "BlacklistRule"
+BLACKLIST_TAG = "blacklist"
+
+# Matches a rule declaration up to its opening brace, capturing the rule name and its tags
+_RULE_HEADER = re.compile(rb"\brule\s+(\w+)\s*(?::([\w\s]*))?\{")
+
+
+class ScanMatch(namedtuple("ScanMatch", ["rule", "namespace", "tags", "meta", "strings"])):
+    """A picklable copy of a yara.Match object.
+
+    yara.Match objects can not cross process boundaries, so the workers return these instead.
+    They expose the same attributes that `infobserve.matches.Match` reads from a yara.Match.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_yara(cls, yara_match):
+        """Creates a ScanMatch from a yara.Match object.
+
+        Arguments:
+            yara_match (yara.Match): A match as returned by yara.Rules.match
+
+        Returns:
+            (ScanMatch): The picklable copy of the match
+        """
+        return cls(yara_match.rule, yara_match.namespace, list(yara_match.tags), dict(yara_match.meta),
+                   _string_tuples(yara_match.strings))
+
+
+def _string_tuples(strings):
+    """Flattens the matched strings of a yara.Match to (offset, identifier, data) tuples.
+
+    yara-python >= 4.3 returns StringMatch objects instead of tuples, which are not picklable.
+
+    Arguments:
+        strings (list): The `strings` attribute of a yara.Match object
+
+    Returns:
+        (list(tuple)): A (offset, identifier, data) tuple for each matched string
+    """
+    tuples = []
+    for string in strings:
+        if isinstance(string, tuple):
+            tuples.append(string)
+        else:
+            tuples.extend((instance.offset, string.identifier, instance.matched_data) for instance in string.instances)
+
+    return tuples
+
+
+def is_blacklist_match(match):
+    """
+    Arguments:
+        match (ScanMatch): A match, or anything with the `rule` and `tags` attributes of a yara.Match
+
+    Returns:
+        (bool): True if the match comes from a blacklist rule
+    """
+    return match.rule == BLACKLIST_RULE or BLACKLIST_TAG in match.tags
+
+
+def split_blacklist_rules(filepaths):
+    """Splits the rule files in the ones that define blacklist rules and the rest.
+
+    Arguments:
+        filepaths (dict[str: str]): The Namespace to rulefile mapping
+
+    Returns:
+        (dict[str: str], dict[str: str]): The blacklist and the main Namespace to rulefile mappings
+    """
+    blacklist, main = {}, {}
+
+    for namespace, filepath in filepaths.items():
+        with open(filepath, "rb") as rule_file:
+            content = rule_file.read()
+
+        has_blacklist = any(
+            name == BLACKLIST_RULE.encode() or BLACKLIST_TAG.encode() in (tags or b"").split()
+            for name, tags in _RULE_HEADER.findall(content))
+
+        if has_blacklist:
+            blacklist[namespace] = filepath
+        else:
+            main[namespace] = filepath
+
+    return blacklist, main
+
+
+class Ruleset:
+    """The blacklist and the main compiled rulesets.
+
+    Attributes:
+        blacklist (yara.Rules): The first pass ruleset, or None if there are no blacklist rules.
+        main (yara.Rules): The main ruleset, or None if all the rule files define blacklist rules.
+        cached (bool): True if every ruleset was loaded from the compiled ruleset cache.
+        keys (list(str)): The compiled ruleset cache keys of the rulesets, empty if the cache is not used.
+    """
+
+    def __init__(self, blacklist, main, cached=False, keys=()):
+        self.blacklist = blacklist
+        self.main = main
+        self.cached = cached
+        self.keys = list(keys)
+
+    @classmethod
+    def load(cls, filepaths, externals=None, rules_cache=None):
+        """Compiles the rule files, or loads them from the compiled ruleset cache.
+
+        Arguments:
+            filepaths (dict[str: str]): The Namespace to rulefile mapping
+            externals (dict[str: str]): The values of the external variables used in the rule files
+            rules_cache (infobserve.processors.rules_cache.RulesCache): The compiled ruleset cache, if any
+
+        Returns:
+            (Ruleset): The compiled rulesets
+        """
+        compiled = []
+        cached = True
+        keys = []
+
+        for subset in split_blacklist_rules(filepaths):
+            if not subset:
+                compiled.append(None)
+            elif rules_cache:
+                keys.append(ruleset_key(subset, externals))
+                rules, hit = rules_cache.load(subset, externals, key=keys[-1])
+                compiled.append(rules)
+                cached = cached and hit
+            else:
+                compiled.append(yara.compile(filepaths=subset, externals=externals))
+                cached = False
+
+        return cls(*compiled, cached=cached, keys=keys)
+
+    def match(self, data, timeout=0, fast=False):
+        """Matches the data against the blacklist and, unless it was hit, against the main ruleset.
+
+        Arguments:
+            data (bytes): The content to scan
+            timeout (int): The max number of seconds each pass may take (0 for no limit)
+            fast (bool): If True, yara stops looking for a string after its first occurrence
+
+        Returns:
+            (list(ScanMatch)): The matches found in the data. If the blacklist was hit, only the blacklist matches
+        Raises:
+            yara.TimeoutError: If a pass took longer than `timeout`
+        """
+        matches = []
+        kwargs = {"timeout": timeout, "fast": fast} if timeout else {"fast": fast}
+
+        if self.blacklist:
+            matches = [ScanMatch.from_yara(match) for match in self.blacklist.match(data=data, **kwargs)]
+            blacklisted = [match for match in matches if is_blacklist_match(match)]
+            if blacklisted:
+                return blacklisted
+
+        if self.main:
+            matches.extend(ScanMatch.from_yara(match) for match in self.main.match(data=data, **kwargs))
+
+        return matches
@@ -0,0 +1,88 @@
+"""A process pool that runs the Yara matching engine outside of the event loop.
+
+The workers are initialized once with the rule files and the external variables (loading
+the ruleset from the compiled ruleset cache when one is configured) and
+keep the compiled ruleset in a module level global, so every call only ships the data
+to be scanned and the (picklable) match results back.
+
+Note: Importing `infobserve.common` parses the cli and loads the config, which the worker processes
+      must not do. So neither this module nor anything it imports (`infobserve.processors.rulesets`,
+      `infobserve.processors.rules_cache` and `infobserve.atomic_file`) should import from it.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from infobserve.processors.rules_cache import RulesCache
+from infobserve.processors.rulesets import Ruleset
+
+# The compiled ruleset of the current worker process
+_WORKER_ENGINE = None
+
+
+def _init_worker(filepaths, externals, cache_dir):
+    """Loads the ruleset once, when the worker process starts.
+
+    Arguments:
+        filepaths (dict[str: str]): The Namespace to rulefile mapping
+        externals (dict[str: str]): The values of the external variables used in the rule files
+        cache_dir (str): The compiled ruleset cache directory. If None, the ruleset is compiled from source
+    """
+    global _WORKER_ENGINE  # pylint: disable=global-statement
+    _WORKER_ENGINE = Ruleset.load(filepaths, externals, RulesCache(cache_dir) if cache_dir else None)
+
+
+def _match(data, timeout, fast):
+    """Matches the data against the ruleset of the worker.
+
+    Arguments:
+        data (bytes): The content to scan
+        timeout (int): The max number of seconds each pass may take (0 for no limit)
+        fast (bool): If True, yara stops looking for a string after its first occurrence
+
+    Returns:
+        (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the data
+    """
+    return _WORKER_ENGINE.match(data, timeout, fast)
+
+
+class YaraScanPool:
+    """Dispatches Yara matching to a pool of worker processes.
+
+    Attributes:
+        workers (int): The number of worker processes.
+    """
+
+    def __init__(self, workers, filepaths, externals=None, cache_dir=None):
+        """
+        Args:
+            workers (int): The number of worker processes to start
+            filepaths (dict[str: str]): The Namespace to rulefile mapping
+            externals (dict[str: str]): The values of the external variables used in the rule files
+            cache_dir (str): The compiled ruleset cache directory the workers load the ruleset from
+        """
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(max_workers=workers,
+                                             initializer=_init_worker,
+                                             initargs=(filepaths, externals, cache_dir))
+
+    async def match(self, data, timeout=0, fast=False):
+        """Matches the data in one of the worker processes.
+
+        Arguments:
+            data (bytes): The content to scan
+            timeout (int): The max number of seconds each pass may take (0 for no limit)
+            fast (bool): If True, yara stops looking for a string after its first occurrence
+
+        Returns:
+            (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the data
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, _match, data, timeout, fast)
+
+    def shutdown(self, wait=True):
+        """Stops the worker processes.
+
+        Arguments:
+            wait (bool): If True, block until all pending scans have finished
+        """
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,129 @@
+""" The VerdictCache class implementation """
+import hashlib
+import pickle
+from collections import OrderedDict
+
+import aioredis
+
+from infobserve.common import APP_LOGGER
+from infobserve.common.pools import RedisConnectionPool
+
+
+class VerdictCache():
+    """Caches the Yara matches of already scanned content.
+
+    Verdicts are keyed by the SHA-256 of the scanned content and the fingerprint of the ruleset
+    that produced them, so a ruleset reload never serves stale verdicts. They are kept in a bounded
+    in-process LRU and, optionally, in Redis so that every node can reuse them.
+
+    Attributes:
+        max_size (int): The max number of verdicts kept in-process.
+        redis_ttl (int): The number of seconds verdicts are kept in Redis (0 disables the Redis tier).
+        stats_interval (int): Log the hit/miss counters every that many lookups (0 disables it).
+        hits (int): The number of lookups served from the in-process tier.
+        redis_hits (int): The number of lookups served from the Redis tier.
+        misses (int): The number of lookups that required a scan.
+        evictions (int): The number of verdicts evicted from the in-process tier.
+    """
+    KEY_PREFIX = "verdict:"
+
+    def __init__(self, max_size=10000, redis_ttl=0, stats_interval=1000):
+        """Constructor
+        Arguments:
+            max_size (int): The max number of verdicts kept in-process.
+            redis_ttl (int): The number of seconds verdicts are kept in Redis (0 disables the Redis tier).
+            stats_interval (int): Log the hit/miss counters every that many lookups (0 disables it).
+        """
+        self.max_size = max_size
+        self.redis_ttl = redis_ttl if RedisConnectionPool().redis else 0
+        self.stats_interval = stats_interval
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._verdicts = OrderedDict()
+
+    @staticmethod
+    def key(data, fingerprint):
+        """
+        Arguments:
+            data (str|bytes): The scanned content.
+            fingerprint (str): The fingerprint of the ruleset that scans the content.
+
+        Returns:
+            (str): The key of the verdict.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+
+        return f"{hashlib.sha256(data).hexdigest()}:{fingerprint}"
+
+    async def get(self, key):
+        """Looks the verdict up in-process and then in Redis.
+
+        Arguments:
+            key (str): The key of the verdict, as returned by `VerdictCache.key`.
+
+        Returns:
+            (list(infobserve.processors.rulesets.ScanMatch)): The cached matches or None on a cache miss.
+        """
+        verdict = self._verdicts.get(key)
+
+        if verdict is not None:
+            self._verdicts.move_to_end(key)
+            self.hits += 1
+        elif self.redis_ttl:
+            verdict = await self._redis_get(key)
+            if verdict is not None:
+                self.redis_hits += 1
+                self._store(key, verdict)
+
+        if verdict is None:
+            self.misses += 1
+
+        self._log_stats()
+        return verdict
+
+    async def put(self, key, matches):
+        """Stores a verdict in-process and in Redis.
+
+        Arguments:
+            key (str): The key of the verdict, as returned by `VerdictCache.key`.
+            matches (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the content.
+        """
+        self._store(key, matches)
+
+        if self.redis_ttl:
+            await self._redis_set(key, matches)
+
+    def _store(self, key, matches):
+        """Stores a verdict in the in-process LRU, evicting the least recently used one if it is full."""
+        self._verdicts[key] = matches
+        self._verdicts.move_to_end(key)
+
+        if len(self._verdicts) > self.max_size:
+            self._verdicts.popitem(last=False)
+            self.evictions += 1
+
+    async def _redis_get(self, key):
+        try:
+            pickled_verdict = await RedisConnectionPool().commands.get(self.KEY_PREFIX + key)
+        except (aioredis.RedisError, OSError) as err:
+            APP_LOGGER.warning("Verdict cache lookup in Redis failed: %s", err)
+            return None
+
+        return pickle.loads(pickled_verdict) if pickled_verdict is not None else None
+
+    async def _redis_set(self, key, matches):
+        try:
+            await RedisConnectionPool().commands.set(self.KEY_PREFIX + key,
+                                                     pickle.dumps(matches),
+                                                     expire=self.redis_ttl)
+        except (aioredis.RedisError, OSError) as err:
+            APP_LOGGER.warning("Verdict cache store in Redis failed: %s", err)
+
+    def _log_stats(self):
+        lookups = self.hits + self.redis_hits + self.misses
+        if self.stats_interval and lookups % self.stats_interval == 0:
+            APP_LOGGER.info("Verdict cache: %s lookups, %s hits, %s Redis hits, %s misses, %s evictions", lookups,
+                            self.hits, self.redis_hits, self.misses, self.evictions)
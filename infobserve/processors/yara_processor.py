@@ -1,4 +1,6 @@
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -6,11 +8,18 @@ import yara
 from infobserve.common import APP_LOGGER
 from infobserve.common.queue import ProcessingQueue
 from infobserve.events import ProcessedEvent
+from infobserve.processors.rules_cache import RulesCache, ruleset_key
+from infobserve.processors.rulesets import Ruleset, is_blacklist_match
+from infobserve.processors.scan_pool import YaraScanPool
+from infobserve.processors.verdict_cache import VerdictCache
 
-# TODO: Add exception handlers. Async functions don't notify anyone
-#       when they fail, so the whole script hangs
+# How many seconds the processor waits before checking again whether the db queue has drained
+BACKPRESSURE_INTERVAL = 1
 
-BLACKLIST_RULE = "BlacklistRule"
+# The whole raw content of every matching event is stored
+STORAGE_FULL = "full"
+# Only the context around the matched strings is stored, unless the rule or the source is configured otherwise
+STORAGE_SNIPPETS = "snippets"
 
 
 class YaraProcessor:
@@ -19,7 +28,24 @@ class YaraProcessor:
     Yara matching engine and adds them to the DB Queue (TBI)
     """
 
-    def __init__(self, rule_files, source_queue, db_queue, ext_vars=None):
+    def __init__(self,
+                 rule_files,
+                 source_queue,
+                 db_queue,
+                 ext_vars=None,
+                 scan_workers=0,
+                 rules_cache_dir=None,
+                 verdict_cache=None,
+                 scan_timeout=0,
+                 max_scan_size=0,
+                 quarantine_queue=None,
+                 quarantine_timeout=0,
+                 batch_size=1,
+                 batch_timeout=0,
+                 storage_mode=STORAGE_FULL,
+                 snippet_context=256,
+                 full_content_rules=None,
+                 full_content_sources=None):
         """
         Args:
             rule_files (list[str]): A list of paths to the Yara rule files
@@ -33,17 +59,62 @@ class YaraProcessor:
             ext_vars (dict[str: str]): A dictionary containing the values
                                        for any external variables used
                                        in the Yara rule files
+            scan_workers (int): The number of worker processes the matching
+                                will be dispatched to. If 0, the matching runs
+                                in threads of the event loop's process
+            rules_cache_dir (str): The directory compiled rulesets are cached in.
+                                   If None, the rules are compiled on every start
+            verdict_cache (infobserve.processors.verdict_cache.VerdictCache):
+                        The cache in which the matches of already scanned content
+                        are looked up. If None, every event is scanned
+            scan_timeout (int): The max number of seconds the scan of an event may take (0 for no limit)
+            max_scan_size (int): The max size of the raw content of an event that will be scanned (0 for no limit)
+            quarantine_queue (infobserve.processing.queue.ProcessingQueue):
+                        An instance of the queue in which events that timed out or
+                        were too large to scan will be inserted into. If None, they are dropped
+            quarantine_timeout (int): The max number of seconds the (fast mode) rescan of
+                                      a quarantined event may take (0 for no limit)
+            batch_size (int): The max number of events retrieved, scanned and forwarded together
+            batch_timeout (float): The max number of seconds to wait for a batch to fill up
+                                   after its first event has been retrieved
+            storage_mode (str): STORAGE_FULL to store the raw content of the matching events,
+                                STORAGE_SNIPPETS to store only the context around the matched strings
+            snippet_context (int): The number of bytes kept on each side of a matched string in snippets mode
+            full_content_rules (list[str]): The rules whose matching events are stored whole in snippets mode
+            full_content_sources (list[str]): The sources whose matching events are stored whole in snippets mode
         """
         self._processing = False
         self._rules = {}
+        self._rule_files = list(rule_files)
+        self._cmd_queue = asyncio.Queue()
+        self._reload_lock = asyncio.Lock()
 
         self._source_queue: ProcessingQueue = source_queue
         self._db_queue: ProcessingQueue = db_queue
         self._ext_vars = ext_vars
+        self._rules_cache_dir = rules_cache_dir
+        self._rules_cache = RulesCache(rules_cache_dir) if rules_cache_dir else None
+        self._verdict_cache: VerdictCache = verdict_cache
+        self._scan_timeout = scan_timeout
+        self._max_scan_size = max_scan_size
+        self._quarantine_queue: ProcessingQueue = quarantine_queue
+        self._quarantine_timeout = quarantine_timeout
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._storage_mode = storage_mode
+        self._snippet_context = snippet_context
+        self._full_content_rules = set(full_content_rules or ())
+        self._full_content_sources = set(full_content_sources or ())
+        if storage_mode not in (STORAGE_FULL, STORAGE_SNIPPETS):
+            raise ValueError(f"Unknown storage mode: {storage_mode}")
 
         # Generate rules along with their namespaces
         self._rules = YaraProcessor._generate_rules(rule_files)
+        self._ruleset_key = ruleset_key(self._rules, self._ext_vars)
         self._engine = self._compile_rules()
+        self._scan_pool = self._start_scan_pool(scan_workers) if scan_workers else None
+        # Without a scan pool, yara matches in threads (it releases the GIL), so that a slow scan never blocks the loop
+        self._match_executor = None if self._scan_pool else ThreadPoolExecutor(thread_name_prefix="yara-match")
 
     async def process(self):
         """
@@ -58,15 +129,124 @@ class YaraProcessor:
         items_remaining = sys.maxsize
         items_processed = 0
         while items_processed < items_remaining:
-            event = await self._source_queue.get_event()
+            if not self._cmd_queue.empty() and self._cmd_queue.get_nowait() == YaraProcessor._Command.STOP:
+                APP_LOGGER.info("Processing stopped")
+                break
+
+            # Leave the events in the source queue while the db queue can not keep up,
+            # so that the sources hold back as well
+            if await self._db_queue.is_saturated():
+                await asyncio.sleep(BACKPRESSURE_INTERVAL)
+                continue
+
+            events = await self._source_queue.get_events(self._batch_size, self._batch_timeout)
+
+            items_processed += len(events)
+            # With a scan pool the events of a batch are scanned in parallel
+            results = await asyncio.gather(*[self._process_event(event) for event in events], return_exceptions=True)
+
+            processed_events = []
+            for event, result in zip(events, results):
+                if isinstance(result, Exception):
+                    APP_LOGGER.error("Failed to process event %s from %s",
+                                     getattr(event, "id", None),
+                                     event.source,
+                                     exc_info=result)
+                elif result:
+                    processed_events.append(result)
+
+            try:
+                await self._db_queue.queue_events(processed_events)
+            finally:
+                for event in events:
+                    self._source_queue.notify(event)
 
-            items_processed += 1
-            matches = self._engine.match(data=event.raw_content)
+        self._processing = False
+
+    async def process_quarantine(self):
+        """
+        The consumer function for the quarantine queue.
+        Rescans the events that timed out or were too large, in fast mode and with the quarantine timeout,
+        so that pathological inputs only cost a bounded amount of throughput.
+        """
+        APP_LOGGER.info("Quarantine processing started")
+
+        while True:
+            event = await self._quarantine_queue.get_event()
+
+            try:
+                matches = await self._match(event.raw_content, timeout=self._quarantine_timeout, fast=True)
+                processed_event = self._to_processed_event(event, matches)
+                if processed_event:
+                    await self._db_queue.queue_event(processed_event)
+            except yara.TimeoutError:
+                APP_LOGGER.error("Dropped quarantined event %s from %s, the rescan timed out too", event.id,
+                                 event.source)
+            except Exception:  # pylint: disable=broad-except
+                APP_LOGGER.exception("Failed to rescan quarantined event %s from %s", event.id, event.source)
+            finally:
+                self._quarantine_queue.notify(event)
+
+    async def watch_rules(self, interval):
+        """
+        Polls the rule files and the paths they were resolved from every `interval` seconds
+        and reloads the rules as soon as any of them is added, removed or changed.
 
-            if matches and not self._has_blacklist(matches):
-                await self._db_queue.queue_event(ProcessedEvent(event, matches))
+        Args:
+            interval (float): The number of seconds between two checks
+        """
+        APP_LOGGER.info("Watching Yara rules for changes every %s seconds", interval)
+        failed_key = None
+        loop = asyncio.get_event_loop()
+
+        while True:
+            await asyncio.sleep(interval)
+
+            try:
+                key = await loop.run_in_executor(None, self._current_ruleset_key)
+            except OSError as err:
+                # A rule file was removed while its contents were being read
+                APP_LOGGER.warning("Could not read the Yara rules, will check again later: %s", err)
+                continue
+
+            if key not in (self._ruleset_key, failed_key):
+                APP_LOGGER.info("Yara rules changed on disk")
+                if not await self.reload_rules():
+                    failed_key = key
+
+    async def reload_rules(self):
+        """
+        Resolves the rule file paths again and compiles the new ruleset off the event loop.
+        The new ruleset is swapped in atomically between two events. If it fails to compile,
+        the old ruleset keeps being used.
 
-            self._source_queue.notify()
+        Returns:
+            (bool): True if the new ruleset was swapped in, False otherwise
+        """
+        loop = asyncio.get_event_loop()
+
+        async with self._reload_lock:
+            APP_LOGGER.info("Reloading Yara rules")
+            rules = YaraProcessor._generate_rules(self._rule_files)
+            ext_vars = self._ext_vars
+
+            try:
+                engine = await loop.run_in_executor(None, self._compile_rules, rules, ext_vars)
+            except (yara.Error, OSError) as err:
+                APP_LOGGER.error("Failed to reload the Yara rules, keeping the old ruleset: %s", err)
+                return False
+
+            old_pool = self._scan_pool
+            self._rules = rules
+            self._ruleset_key = ruleset_key(rules, ext_vars)
+            self._engine = engine
+            if old_pool:
+                # Scans already dispatched to the old pool finish with the old ruleset
+                self._scan_pool = self._start_scan_pool(old_pool.workers)
+                old_pool.shutdown(wait=False)
+
+            APP_LOGGER.info("Yara rules reloaded (%s rule files)", len(rules))
+            return True
 
     async def add_rules(self, rule_files, append=True, recompile=False):
         """
@@ -87,8 +267,10 @@ class YaraProcessor:
 
         if append:
             self._rules.update(new_rules)
+            self._rule_files.extend(rule_files)
         else:
             self._rules = new_rules
+            self._rule_files = list(rule_files)
 
         if recompile:
             await self.compile_rules()
@@ -110,36 +292,23 @@ class YaraProcessor:
         APP_LOGGER.info("Refreshing Yara external variables (%s)", "Appending" if append else "Replacing")
 
         if append:
-            self._ext_vars.update(ext_vars)
+            self._ext_vars = {**(self._ext_vars or {}), **ext_vars}
         else:
             self._ext_vars = ext_vars
 
         if recompile:
             await self.compile_rules()
 
-    async def compile_rules(self, immediately=False, block=False):
+    async def compile_rules(self):
         """
         (Re)Compiles the Yara rules using the rule files provided in the constructor or in `add_rules`.
-        If the processing method is running, Depending on the `force` argument,
-        it will either simply compile the Yara rules or tell the async method to recompile.
+        Compilation runs off the event loop and the new ruleset is swapped in between two events,
+        so it is safe to call while the `process` method is running.
 
-        Args:
-            immediately (bool): If True, the processor will simply be recompiled. This could be very dangerous if
-                                the `process` method is already running because thread safety is not guaranteed.
-                                If False, a Recompile command will be added to the processing queue and when the
-                                `process` method pops it from the queue, then the processor will be re-compiled safely.
-            block (bool): If True and `force` is False, then the process will block until the consumer method
-                          has popped the event out of the queue and notified that it was done recompiling
-                          (needs further testing)
-        """
-
-        APP_LOGGER.info("Recompiling Yara rules")
-        if not self._processing or immediately:
-            self._engine = self._compile_rules()
-        else:
-            await self._cmd_queue.queue_event(YaraProcessor._Command.RECOMPILE)
-            if block:
-                await self._cmd_queue.wait_all()
+        Returns:
+            (bool): True if the new ruleset was swapped in, False if it failed to compile
+        """
+        return await self.reload_rules()
 
     async def stop_processing(self, immediately=False):
         """
@@ -153,21 +322,151 @@ class YaraProcessor:
 
         APP_LOGGER.info("STOP signal received. Notifying processing method")
         if not immediately:
-            await self._cmd_queue.queue_event(YaraProcessor._Command.STOP)
+            await self._cmd_queue.put(YaraProcessor._Command.STOP)
         else:
             for _ in range(await self._source_queue.events_left()):
                 # Drop all current items
-                await self._source_queue.get()
-                self._source_queue.notify()
+                self._source_queue.notify(await self._source_queue.get_event())
+
+            await self._cmd_queue.put(YaraProcessor._Command.STOP)
+
+    async def _process_event(self, event):
+        """
+        Scans an event, or places it into the quarantine queue if it is too large or its scan timed out
+
+        Args:
+            event (infobserve.events.base.BaseEvent): The event to process
+        Returns:
+            (infobserve.events.ProcessedEvent): The event to place into the DB queue, or None
+        """
+        if self._max_scan_size and len(event.raw_content) > self._max_scan_size:
+            await self._quarantine(event, "is larger than the max scan size")
+            return None
+
+        try:
+            matches = await self._scan(event.raw_content)
+        except yara.TimeoutError:
+            await self._quarantine(event, "timed out")
+            return None
+
+        return self._to_processed_event(event, matches)
+
+    def _to_processed_event(self, event, matches):
+        """
+        Args:
+            event (infobserve.events.base.BaseEvent): The scanned event
+            matches (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the event
+        Returns:
+            (infobserve.events.ProcessedEvent): The processed event if it matched and the blacklist wasn't hit,
+                                                otherwise None. In snippets mode its raw content is dropped,
+                                                unless a full content rule matched or it came from a full
+                                                content source
+        """
+        if not matches or self._has_blacklist(matches):
+            return None
+
+        if self._storage_mode == STORAGE_FULL:
+            return ProcessedEvent(event, matches)
+
+        processed_event = ProcessedEvent(event, matches, self._snippet_context)
+        if (event.source not in self._full_content_sources
+                and not any(match.rule in self._full_content_rules for match in matches)):
+            processed_event.raw_content = None
+
+        return processed_event
+
+    async def _quarantine(self, event, reason):
+        """
+        Places the event into the quarantine queue to be rescanned later, or drops it if there is none
+
+        Args:
+            event (infobserve.events.base.BaseEvent): The event that could not be scanned
+            reason (str): Why the event could not be scanned
+        """
+        if self._quarantine_queue:
+            APP_LOGGER.warning("Quarantined event %s from %s, its scan %s", event.id, event.source, reason)
+            await self._quarantine_queue.queue_event(event)
+        else:
+            APP_LOGGER.warning("Dropped event %s from %s, its scan %s", event.id, event.source, reason)
+
+    async def _scan(self, data):
+        """
+        Returns the cached verdict for the data if there is one, otherwise matches the data and caches the verdict
+
+        Args:
+            data (bytes): The content to scan
+        Returns:
+            (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the data
+        """
+        if not self._verdict_cache:
+            return await self._match(data, timeout=self._scan_timeout)
+
+        # The key is built before matching, a reload during the scan must not file this verdict under the new ruleset
+        key = VerdictCache.key(data, self._ruleset_key)
+        matches = await self._verdict_cache.get(key)
+        if matches is None:
+            matches = await self._match(data, timeout=self._scan_timeout)
+            await self._verdict_cache.put(key, matches)
+
+        return matches
+
+    async def _match(self, data, timeout=0, fast=False):
+        """
+        Matches the data against the compiled rules, in a worker process if a scan pool is configured.
+
+        Args:
+            data (bytes): The content to scan
+            timeout (int): The max number of seconds each pass may take (0 for no limit)
+            fast (bool): If True, yara stops looking for a string after its first occurrence
+        Returns:
+            (list(infobserve.processors.rulesets.ScanMatch)): The matches found in the data
+        Raises:
+            yara.TimeoutError: If the scan took longer than `timeout`
+        """
+        if self._scan_pool:
+            return await self._scan_pool.match(data, timeout, fast)
+
+        # The engine is bound before the match starts, a reload swaps it for the next matches only
+        return await asyncio.get_event_loop().run_in_executor(self._match_executor, self._engine.match, data,
+                                                              timeout, fast)
+
+    def _compile_rules(self, rules=None, ext_vars=None):
+        """
+        Compiles the Yara rules, or loads them from the compiled ruleset cache if they haven't changed
+
+        Args:
+            rules (dict[str: str]): The Namespace to rulefile mapping. Defaults to the loaded rules
+            ext_vars (dict[str: str]): The external variables. Defaults to the loaded external variables
+        """
+        rules = self._rules if rules is None else rules
+        ext_vars = self._ext_vars if ext_vars is None else ext_vars
+
+        engine = Ruleset.load(rules, ext_vars, self._rules_cache)
+        APP_LOGGER.info("%s Yara rules", "Loaded cached" if engine.cached else "Compiled")
+        if self._rules_cache:
+            # The rulesets compiled before the rule files changed will not be loaded again
+            removed = self._rules_cache.prune(engine.keys)
+            if removed:
+                APP_LOGGER.debug("Removed %s stale compiled rulesets", removed)
 
-            await self._cmd_queue.queue_event(YaraProcessor._Command.STOP)
+        return engine
+
+    def _current_ruleset_key(self):
+        """
+        Returns:
+            (str): The key of the ruleset the rule file paths currently resolve to
+        """
+        return ruleset_key(YaraProcessor._generate_rules(self._rule_files), self._ext_vars)
 
-    def _compile_rules(self):
+    def _start_scan_pool(self, workers):
         """
-        Compiles the loaded Yara rules
+        Starts a pool of scanning processes for the loaded Yara rules.
+        Must be called after `_compile_rules`, so that the workers find the ruleset in the cache
+
+        Args:
+            workers (int): The number of worker processes
         """
-        APP_LOGGER.info("Recompiling Yara rules")
-        return yara.compile(filepaths=self._rules, externals=self._ext_vars)
+        return YaraScanPool(workers, self._rules, self._ext_vars, cache_dir=self._rules_cache_dir)
 
     @staticmethod
     def _generate_rules(rule_files):
@@ -202,11 +501,10 @@ class YaraProcessor:
     @staticmethod
     def _has_blacklist(matches):
         for match in matches:
-            # If the blacklist rule has matched as well, we ignore the entire event
-            if match.rule == BLACKLIST_RULE:
+            # If a blacklist rule has matched as well, we ignore the entire event
+            if is_blacklist_match(match):
                 return True
         return False
 
     class _Command(Enum):
-        RECOMPILE = 1
-        STOP = 2
+        STOP = 1
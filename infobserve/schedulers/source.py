@@ -1,4 +1,5 @@
 from infobserve.common import APP_LOGGER
+from infobserve.common.index_cache import BloomIndexCache, IndexCache
 from infobserve.sources.factory import SourceFactory
 
 
@@ -8,11 +9,15 @@ class SourceScheduler():
     Attributes:
         sources (list(infobserve.sources.BaseSource)): A list of the configured Sources
         sources_queue (infobserve.common.ProcessingQueue): The queue Sources throw their events.
+        downstream_queues (list(infobserve.common.ProcessingQueue)): The queues the events flow through after
+                                                                     `sources_queue`. Sources hold back while
+                                                                     any of them is saturated.
     """
 
-    def __init__(self, sources_queue, sources=None):
+    def __init__(self, sources_queue, sources=None, downstream_queues=None):
         self.sources = self._init_sources(sources)
         self.sources_queue = sources_queue
+        self.downstream_queues = downstream_queues or []
 
     @staticmethod
     def _init_sources(config):
@@ -29,7 +34,8 @@ class SourceScheduler():
         return sources
 
     def schedule(self, loop):
-        """ Creates tasks of the fetch_events_scheduled callable.
+        """ Creates tasks of the fetch_events_scheduled callable, and of the expiry of the sources' postgres
+        index caches.
 
         Arguments:
             loop (asyncio.AbstractEventLoop): The event loop the tasks will be scheduled to.
@@ -38,6 +44,26 @@ class SourceScheduler():
         """
         for source in self.sources:
             APP_LOGGER.debug("Scheduling Source:%s", source.name)
-            loop.create_task(source.fetch_events_scheduled(self.sources_queue))
+            loop.create_task(source.fetch_events_scheduled(self.sources_queue, self.downstream_queues))
+
+        # Sources of the same type share their cached ids, so a single sweep per type is enough
+        index_caches = {}
+        for source in self.sources:
+            index_cache = getattr(source, "_index_cache", None)
+            if isinstance(index_cache, IndexCache):
+                index_caches.setdefault(index_cache.source, index_cache)
+        for index_cache in index_caches.values():
+            loop.create_task(index_cache.sweep())
 
         return loop
+
+    async def close(self):
+        """Writes the index caches that are persisted to disk, with the ids cached since their last write."""
+        # Sources of the same type share their bloom index cache, which is written once
+        index_caches = []
+        for source in self.sources:
+            index_cache = getattr(source, "_index_cache", None)
+            if isinstance(index_cache, BloomIndexCache) and index_cache not in index_caches:
+                index_caches.append(index_cache)
+        for index_cache in index_caches:
+            await index_cache.save()
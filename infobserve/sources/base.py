@@ -2,6 +2,8 @@
 """
 from abc import ABCMeta, abstractmethod
 
+from infobserve.common import APP_LOGGER
+
 
 class SourceBase(metaclass=ABCMeta):
     """An abstract class to describe a base Source.
@@ -13,3 +15,19 @@ class SourceBase(metaclass=ABCMeta):
     @abstractmethod
     async def fetch_events(self):
         pass
+
+    async def queues_saturated(self, queues):
+        """Checks whether the events of the source should be held back.
+
+        Arguments:
+            queues (list(infobserve.common.queue.ProcessingQueue)): The queues the events of the source flow through.
+
+        Returns:
+            (bool): True if any of the queues is above its high water mark, so the scrape cycle should be skipped.
+        """
+        saturated = [queue.name for queue in queues if await queue.is_saturated()]
+        if saturated:
+            APP_LOGGER.warning("Source %s skipped a scrape cycle, saturated queues: %s", self.name,
+                               ", ".join(saturated))
+
+        return bool(saturated)
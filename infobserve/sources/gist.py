@@ -1,17 +1,17 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import aiohttp
 
-from infobserve.common import APP_LOGGER
+from infobserve.common import APP_LOGGER, CONFIG
 from infobserve.common.exceptions import BadCredentials
-from infobserve.common.index_cache import IndexCache
+from infobserve.common.http_client import HttpClient
+from infobserve.common.index_cache import IndexCache, create_index_cache
 from infobserve.common.queue import ProcessingQueue
 from infobserve.events import GistEvent
 
 from .base import SourceBase
-
-BAD_CREDENTIALS = "Bad credentials"
+from .github_polling import GithubPolling
 
 
 class GistSource(SourceBase):
@@ -27,8 +27,10 @@ class GistSource(SourceBase):
         _username (string): The username of the user to authenticate.
         _uri (string): Gitlab's api uri.
         _api_version (string): Gitlab's api version.
-        _index_cache(infobserve.common.index_cache.IndexCache): IndexCache object to query the postgres cache
+        _index_cache(infobserve.common.index_cache.IndexCache): The cache of the gists already fetched
         _timeout(float): The frequency the gists endpoint is queried
+        _http_session(aiohttp.ClientSession): The session of the source on the shared HTTP connections
+        _polling(GithubPolling): Sends the conditional requests and paces the polls as the api directs
     """
 
     def __init__(self, config: Dict, name: str = None):
@@ -38,15 +40,18 @@ class GistSource(SourceBase):
         self._username: Optional[Any] = config.get('username')
         self._uri: str = "https://api.github.com/gists/public?"
         self._api_version: str = "application/vnd.github.v3+json"
-        self._index_cache: IndexCache = IndexCache(self.SOURCE_TYPE)
+        self._index_cache: IndexCache = create_index_cache(self.SOURCE_TYPE,
+                                                           **config.get('index_cache', CONFIG.INDEX_CACHE))
         self.timeout: Union[float] = config.get('timeout', 60)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._polling: GithubPolling = GithubPolling(self.timeout)
 
     async def fetch_events(self) -> List[GistEvent]:
         """
         Fetches the most recent gists created.
 
         Returns:
-            event_list (list) : A list of GistEvent Objects.
+            event_list (list) : A list of GistEvent Objects. Empty if they have not changed since the last poll.
         """
 
         headers: Dict = {
@@ -55,49 +60,68 @@ class GistSource(SourceBase):
             "Authorization": f'token {self._oauth_token}'
         }
 
-        async with aiohttp.ClientSession() as session:
-            resp = await session.get(self._uri, headers=headers)
+        session = self._session(headers)
+        async with session.get(self._uri, headers=self._polling.headers()) as resp:
+            if resp.status == 401:
+                raise BadCredentials("Could not authenticate against github API with the provided credentials")
+            if not self._polling.update(resp):
+                APP_LOGGER.debug("GistSource: %s No new Gists", self.name)
+                return []
             gists = await resp.json()
-            event_list = []
-            tasks = []
+        event_list = []
+        tasks = []
+
+        APP_LOGGER.debug("GistSource: %s Fetched Recent %s Gists", self.name, len(gists))
+        if self._index_cache:
+            uncached_ids = set(await self._index_cache.filter_uncached([x["id"] for x in gists]))
+            gists = [x for x in gists if x["id"] in uncached_ids]
+        APP_LOGGER.debug("Gists number not in cache: %s", len(gists))
+
+        for gist in gists:
+            # Create GistEvent objects and create io intensive tasks.
+            ge = GistEvent(gist)
+
+            if ge.is_valid():
+                event_list.append(ge)
+                tasks.append(asyncio.create_task(ge.get_raw_content(session)))
+            else:
+                APP_LOGGER.warning("Dropped event with id:%s url not valid", ge.id)
+        # Check the index_cache.
+        if self._index_cache:
+            await self._index_cache.update_index_cache([x["id"] for x in gists])
+
+        # Fetch the raw content async.
+        await asyncio.gather(*tasks)
+        # filter out event with no raw_content.
+        event_list = [x for x in event_list if x.raw_content]
+        APP_LOGGER.debug("%s GistEvents send for processing", len(gists))
+        return event_list
+
+    def _session(self, headers: Dict) -> aiohttp.ClientSession:
+        """
+        Returns the session of the source on the shared HTTP connections, created on the first poll.
 
-            if isinstance(gists, dict) and gists["message"] == BAD_CREDENTIALS:
-                raise BadCredentials("Could not authenticate against github API with the provided credentials")
+        Arguments:
+            headers (dict): The headers sent with every request of the session.
+        """
+        if self._http_session is None:
+            self._http_session = HttpClient().session(headers)
+        return self._http_session
 
-            APP_LOGGER.debug("GistSource: %s Fetched Recent %s Gists", self.name, len(gists))
-            if self._index_cache:
-                cached_ids = await self._index_cache.query_index_cache()
-                gists = [x for x in gists if x["id"] not in cached_ids]
-            APP_LOGGER.debug("Gists number not in cache: %s", len(gists))
-
-            for gist in gists:
-                # Create GistEvent objects and create io intensive tasks.
-                ge = GistEvent(gist)
-
-                if ge.is_valid():
-                    event_list.append(ge)
-                    tasks.append(asyncio.create_task(ge.get_raw_content(session)))
-                else:
-                    APP_LOGGER.warning("Dropped event with id:%s url not valid", ge.id)
-            # Check the index_cache.
-            if self._index_cache:
-                await self._index_cache.update_index_cache([x["id"] for x in gists])
-
-            # Fetch the raw content async.
-            await asyncio.gather(*tasks)
-            # filter out event with no raw_content.
-            event_list = [x for x in event_list if x.raw_content]
-            APP_LOGGER.debug("%s GistEvents send for processing", len(gists))
-            return event_list
-
-    async def fetch_events_scheduled(self, queue: ProcessingQueue):
+    async def fetch_events_scheduled(self, queue: ProcessingQueue, downstream_queues: Sequence[ProcessingQueue] = ()):
         """
         Call the fetch_events method on a schedule.
+        Scrape cycles are skipped while any of the queues is saturated.
 
         Arguments:
            queue (ProcessingQueue): A processing queue to enqueue the events.
+           downstream_queues (list(ProcessingQueue)): The queues the events flow through after `queue`.
         """
         while True:
+            if await self.queues_saturated([queue, *downstream_queues]):
+                await asyncio.sleep(self.timeout)
+                continue
+
             try:
                 events: List[GistEvent] = await self.fetch_events()
                 for event in events:
@@ -105,4 +129,4 @@ class GistSource(SourceBase):
             except aiohttp.client_exceptions.ClientPayloadError:
                 APP_LOGGER.warning("There was an error retrieving the payload will retry in next cycle.")
 
-            await asyncio.sleep(self.timeout)
+            await asyncio.sleep(self._polling.delay())
@@ -1,14 +1,16 @@
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import aiohttp
 
-from infobserve.common import APP_LOGGER
-from infobserve.common.index_cache import IndexCache
+from infobserve.common import APP_LOGGER, CONFIG
+from infobserve.common.http_client import HttpClient
+from infobserve.common.index_cache import IndexCache, create_index_cache
 from infobserve.common.queue import ProcessingQueue
 from infobserve.events import GithubEvent
 
 from .base import SourceBase
+from .github_polling import GithubPolling
 
 BAD_CREDENTIALS = "Bad credentials"
 
@@ -26,9 +28,10 @@ class GithubSource(SourceBase):
         _oauth_token (string): The oauth token for the github api.
         _username (string): The username of the user to authenticate.
         _uri (string): Github's api uri.
-        _index_cache(infobserve.common.index_cache.IndexCache): IndexCache object to query the postgres cache
+        _index_cache(infobserve.common.index_cache.IndexCache): The cache of the events already fetched
         _timeout(float): The frequency the github public endpoint is queried
-        _etag(str): Returns no data if no changes detected in the api.
+        _http_session(aiohttp.ClientSession): The session of the source on the shared HTTP connections
+        _polling(GithubPolling): Sends the conditional requests and paces the polls as the api directs
     """
     API_VERSION: str = "application/vnd.github.v3+json"
 
@@ -38,9 +41,11 @@ class GithubSource(SourceBase):
         self._oauth_token: Optional[Any] = config.get('oauth')
         self._username: Optional[Any] = config.get('username')
         self._uri: str = "https://api.github.com/events"
-        self._index_cache: IndexCache = IndexCache(self.SOURCE_TYPE)
+        self._index_cache: IndexCache = create_index_cache(self.SOURCE_TYPE,
+                                                           **config.get('index_cache', CONFIG.INDEX_CACHE))
         self.timeout: Union[float] = config.get('timeout', 60)
-        self._etag: Optional[Any] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._polling: GithubPolling = GithubPolling(self.timeout)
 
     async def fetch_events(self) -> List[GithubEvent]:
         """
@@ -56,59 +61,75 @@ class GithubSource(SourceBase):
             "Authorization": f'token {self._oauth_token}'
         }
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            resp = await session.get(self._uri)
+        session = self._session(headers)
+        async with session.get(self._uri, headers=self._polling.headers()) as resp:
             APP_LOGGER.debug("GithubSource Response Headers: %s", resp.headers)
+            if not self._polling.update(resp):
+                APP_LOGGER.debug("GithubSource: %s No new Public Events", self.name)
+                return []
             github_events = await resp.json()
-            event_list: List[GithubEvent] = []
-            tasks = []
+        event_list: List[GithubEvent] = []
+        tasks = []
 
-            APP_LOGGER.debug("GithubSource: %s Fetched Recent %s Public Events", self.name, len(github_events))
+        APP_LOGGER.debug("GithubSource: %s Fetched Recent %s Public Events", self.name, len(github_events))
 
-            if self._index_cache:
-                cached_ids = await self._index_cache.query_index_cache()
-                # At the moment only PushEvent support we should productize more logic into helper classes
-                # To support all the event types.
-                github_events = [x for x in github_events if x["id"] not in cached_ids and x["type"] == "PushEvent"]
-            else:
-                github_events = [x for x in github_events if x["type"] == "PushEvent"]
+        # At the moment only PushEvent support we should productize more logic into helper classes
+        # To support all the event types.
+        github_events = [x for x in github_events if x["type"] == "PushEvent"]
+        if self._index_cache:
+            uncached_ids = set(await self._index_cache.filter_uncached([x["id"] for x in github_events]))
+            github_events = [x for x in github_events if x["id"] in uncached_ids]
 
-            APP_LOGGER.debug("Github Push Events number: %s", len(github_events))
+        APP_LOGGER.debug("Github Push Events number: %s", len(github_events))
 
-            for event in github_events:
-                # Create GistEvent objects and create io intensive tasks.
-                ge = GithubEvent(event, session)
+        for event in github_events:
+            # Create GistEvent objects and create io intensive tasks.
+            ge = GithubEvent(event, session)
 
-                try:
-                    event_list.append(ge)
-                    tasks.append(asyncio.create_task(ge.get_raw_content()))
-                except asyncio.TimeoutError:
-                    APP_LOGGER.warning("Dropped event with id:%s url not valid", ge.id)
+            try:
+                event_list.append(ge)
+                tasks.append(asyncio.create_task(ge.get_raw_content()))
+            except asyncio.TimeoutError:
+                APP_LOGGER.warning("Dropped event with id:%s url not valid", ge.id)
+
+        # Update the index_cache.
+        if self._index_cache:
+            await self._index_cache.update_index_cache([x["id"] for x in github_events])
 
-            # Update the index_cache.
-            if self._index_cache:
-                await self._index_cache.update_index_cache([x["id"] for x in github_events])
+        # Fetch the commits async.
+        await asyncio.gather(*tasks)
 
-            # Fetch the commits async.
-            await asyncio.gather(*tasks)
+        # Create an event for each commit
+        commit_event_list: List[GithubEvent] = [x for event in event_list for x in event.commit_raw_content()]
 
-            # Create an event for each commit
-            for event in event_list:
-                await event.get_raw_content()
+        APP_LOGGER.debug("%s Github Commits send for processing", len(commit_event_list))
+        return commit_event_list
 
-            commit_event_list: List[GithubEvent] = [x for x in event.commit_raw_content() for event in event_list]
+    def _session(self, headers: Dict) -> aiohttp.ClientSession:
+        """
+        Returns the session of the source on the shared HTTP connections, created on the first poll.
 
-            APP_LOGGER.debug("%s Github Commits send for processing", len(commit_event_list))
-            return commit_event_list
+        Arguments:
+            headers (dict): The headers sent with every request of the session.
+        """
+        if self._http_session is None:
+            self._http_session = HttpClient().session(headers)
+        return self._http_session
 
-    async def fetch_events_scheduled(self, queue: ProcessingQueue):
+    async def fetch_events_scheduled(self, queue: ProcessingQueue, downstream_queues: Sequence[ProcessingQueue] = ()):
         """
         Call the fetch_events method on a schedule.
+        Scrape cycles are skipped while any of the queues is saturated.
 
         Arguments:
            queue (ProcessingQueue): A processing queue to enqueue the events.
+           downstream_queues (list(ProcessingQueue)): The queues the events flow through after `queue`.
         """
         while True:
+            if await self.queues_saturated([queue, *downstream_queues]):
+                await asyncio.sleep(self.timeout)
+                continue
+
             try:
                 events: List[GithubEvent] = await self.fetch_events()
                 for event in events:
@@ -116,4 +137,4 @@ class GithubSource(SourceBase):
             except aiohttp.client_exceptions.ClientPayloadError:
                 APP_LOGGER.warning("There was an error retrieving the payload will retry in next cycle.")
 
-            await asyncio.sleep(self.timeout)
+            await asyncio.sleep(self._polling.delay())
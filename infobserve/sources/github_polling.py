@@ -0,0 +1,102 @@
+""" The GithubPolling class implementation """
+import time
+from typing import Dict, Optional
+
+import aiohttp
+
+from infobserve.common import APP_LOGGER
+
+
+class GithubPolling():
+    """Follows the polling directions of the GitHub API for a single endpoint.
+
+    The ETag of the last response is sent back in an If-None-Match header, so that an unchanged endpoint
+    answers with a 304, which costs no quota. The delay until the next poll is the longest of the configured
+    interval, the X-Poll-Interval of the last response and the pace at which the quota left (X-RateLimit-*)
+    lasts until it is reset, given the quota the last poll cycle used. A response that asks to back off
+    (Retry-After, e.g. on a secondary rate limit) delays the next poll until then.
+    Only a 200 carries new content, every other status is a poll with nothing to process.
+
+    Attributes:
+        interval (float): The configured number of seconds between two polls.
+        etag (str): The ETag of the last response that changed.
+    """
+
+    # The number of seconds to wait after a secondary rate limit that does not say for how long
+    SECONDARY_RATE_LIMIT_WAIT = 60
+
+    def __init__(self, interval: float):
+        """Constructor
+        Arguments:
+            interval (float): The configured number of seconds between two polls.
+        """
+        self.interval = interval
+        self.etag: Optional[str] = None
+        self._poll_interval = 0
+        self._remaining: Optional[int] = None
+        self._reset: Optional[int] = None
+        self._used_per_poll = 1
+        self._retry_at = 0.0
+
+    def headers(self) -> Dict:
+        """
+        Returns:
+            (dict): The conditional request headers of the next poll.
+        """
+        return {"If-None-Match": self.etag} if self.etag else {}
+
+    def update(self, response: aiohttp.ClientResponse) -> bool:
+        """Reads the polling directions of a response of the endpoint.
+
+        Arguments:
+            response (aiohttp.ClientResponse): The response of the last poll.
+
+        Returns:
+            (bool): True if the response carries new content to process, i.e. it is a 200.
+        """
+        headers = response.headers
+        if "X-Poll-Interval" in headers:
+            self._poll_interval = int(headers["X-Poll-Interval"])
+
+        if "X-RateLimit-Remaining" in headers and "X-RateLimit-Reset" in headers:
+            remaining, reset = int(headers["X-RateLimit-Remaining"]), int(headers["X-RateLimit-Reset"])
+            # Within the same window, the quota used since the last poll includes the requests it triggered
+            if self._remaining is not None and reset == self._reset:
+                self._used_per_poll = max(self._remaining - remaining, 1)
+            self._remaining, self._reset = remaining, reset
+
+        if response.status == 200:
+            self.etag = headers.get("ETag")
+            return True
+
+        if response.status == 304:
+            return False
+
+        # GitHub sends Retry-After in seconds
+        if headers.get("Retry-After", "").isdigit():
+            self._retry_at = time.time() + int(headers["Retry-After"])
+        elif response.status in (403, 429) and self._remaining != 0:
+            self._retry_at = time.time() + self.SECONDARY_RATE_LIMIT_WAIT
+
+        if response.status in (403, 429) and self._remaining == 0:
+            APP_LOGGER.warning("GitHub rate limit exceeded for %s, polling resumes after the reset", response.url)
+        else:
+            APP_LOGGER.warning("GitHub answered %s for %s, polling resumes in %.0f seconds", response.status,
+                               response.url, self.delay())
+        return False
+
+    def delay(self) -> float:
+        """
+        Returns:
+            (float): The number of seconds to wait before the next poll.
+        """
+        delay = max(self.interval, self._poll_interval, self._retry_at - time.time())
+        if self._remaining is None:
+            return delay
+
+        until_reset = max(self._reset - time.time(), 0)
+        if not self._remaining:
+            return max(delay, until_reset)
+
+        # The quota left is spread over the time until it is reset
+        return max(delay, until_reset * self._used_per_poll / self._remaining)
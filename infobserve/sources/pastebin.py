@@ -1,12 +1,12 @@
 import asyncio
 from json.decoder import JSONDecodeError
-from typing import List
+from typing import List, Sequence
 
 import aiohttp
 from pbwrap import AsyncPastebin, Paste  # type: ignore
 
-from infobserve.common import APP_LOGGER
-from infobserve.common.index_cache import IndexCache
+from infobserve.common import APP_LOGGER, CONFIG
+from infobserve.common.index_cache import IndexCache, create_index_cache
 from infobserve.common.queue import ProcessingQueue
 from infobserve.events import PasteEvent
 
@@ -22,7 +22,8 @@ class PastebinSource(SourceBase):
         self.SOURCE_TYPE: str = "pastebin"
         self.pastebin: AsyncPastebin = AsyncPastebin(dev_key=config.get("dev_key"))
         self.timeout: float = float(config.get("timeout"))
-        self._index_cache: IndexCache = IndexCache(self.SOURCE_TYPE)
+        self._index_cache: IndexCache = create_index_cache(self.SOURCE_TYPE,
+                                                           **config.get("index_cache", CONFIG.INDEX_CACHE))
 
     async def fetch_events(self):
         pastes: List[Paste] = self.pastebin.get_recent_pastes(limit=50)
@@ -30,8 +31,8 @@ class PastebinSource(SourceBase):
         tasks = []
 
         if self._index_cache:
-            cached_ids = await self._index_cache.query_index_cache()
-            pastes = [x for x in pastes if x.key not in cached_ids]
+            uncached_ids = set(await self._index_cache.filter_uncached([x.key for x in pastes]))
+            pastes = [x for x in pastes if x.key in uncached_ids]
             APP_LOGGER.debug("Pastes number not in cache: %s", len(pastes))
 
         for paste in pastes:
@@ -43,8 +44,8 @@ class PastebinSource(SourceBase):
             else:
                 APP_LOGGER.warning("Dropped event with id:%s url not valid", paste_event.id)
 
-            if self._index_cache:
-                await self._index_cache.update_index_cache([x.key for x in pastes])
+        if self._index_cache:
+            await self._index_cache.update_index_cache([x.key for x in pastes])
 
         await asyncio.gather(*tasks)  # Fetch the raw content async
         event_list = [x for x in event_list if x.raw_content]
@@ -52,14 +53,20 @@ class PastebinSource(SourceBase):
         APP_LOGGER.debug("%s PastebinEvents send for processing", len(event_list))
         return event_list
 
-    async def fetch_events_scheduled(self, queue: ProcessingQueue):
+    async def fetch_events_scheduled(self, queue: ProcessingQueue, downstream_queues: Sequence[ProcessingQueue] = ()):
         """
         Call the fetch_events method on a schedule.
+        Scrape cycles are skipped while any of the queues is saturated.
 
         Arguments:
            queue (ProcessingQueue): A processing queue to enqueue the events.
+           downstream_queues (list(ProcessingQueue)): The queues the events flow through after `queue`.
         """
         while True:
+            if await self.queues_saturated([queue, *downstream_queues]):
+                await asyncio.sleep(self.timeout)
+                continue
+
             try:
                 events = await self.fetch_events()
                 for event in events:
@@ -1,18 +1,23 @@
 """The main entrypoint and interface of the infobserver application.
 """
 import asyncio
+import signal
 
 from infobserve.common import APP_LOGGER, CONFIG
+from infobserve.common.blob_store import DiskBlobStore, create_blob_store
+from infobserve.common.dead_letters import DeadLetterFile
+from infobserve.common.http_client import HttpClient
 from infobserve.common.pools import RedisConnectionPool, PgPool
 from infobserve.common.queue import ProcessingQueue
 from infobserve.loaders.postgres import PgLoader
+from infobserve.processors.verdict_cache import VerdictCache
 from infobserve.processors.yara_processor import YaraProcessor
 from infobserve.schedulers.source import SourceScheduler
 
 __version__ = '0.1.0'
 
 
-def consumer_scheduler(loop, source_queue, db_queue):
+def consumer_scheduler(loop, source_queue, db_queue, quarantine_queue, dead_letters):
     """
     Creates a YaraProcessor, passing it the Yara rule file paths as read from the config file.
 
@@ -22,16 +27,71 @@ def consumer_scheduler(loop, source_queue, db_queue):
                                                                 sources
         db_queue (infobserve.common.queue.ProcessingQueue): The queue into which the processor will place any
                                                             matches
+        quarantine_queue (infobserve.common.queue.ProcessingQueue): The queue into which the processor will place
+                                                                    any events it failed to scan in time
+        dead_letters (infobserve.common.dead_letters.DeadLetterFile): The file the loaders will append any events
+                                                                      they failed to store to. Its events are queued
+                                                                      to be stored again
     """
     APP_LOGGER.debug("Starting Yara Processor")
-    consumer = YaraProcessor(CONFIG.YARA_RULES_PATHS, source_queue, db_queue)
-    db_consumer = PgLoader(db_queue)
+    verdict_cache = VerdictCache(**CONFIG.VERDICT_CACHE) if CONFIG.VERDICT_CACHE is not None else None
+    consumer = YaraProcessor(CONFIG.YARA_RULES_PATHS,
+                             source_queue,
+                             db_queue,
+                             ext_vars=CONFIG.YARA_EXTERNAL_VARS,
+                             scan_workers=CONFIG.YARA_SCAN_WORKERS,
+                             rules_cache_dir=CONFIG.YARA_RULES_CACHE_DIR,
+                             verdict_cache=verdict_cache,
+                             scan_timeout=CONFIG.YARA_SCAN_TIMEOUT,
+                             max_scan_size=CONFIG.YARA_MAX_SCAN_SIZE,
+                             quarantine_queue=quarantine_queue,
+                             quarantine_timeout=CONFIG.YARA_QUARANTINE_TIMEOUT,
+                             batch_size=CONFIG.YARA_BATCH_SIZE,
+                             batch_timeout=CONFIG.YARA_BATCH_TIMEOUT_MS / 1000,
+                             storage_mode=CONFIG.STORAGE_MODE,
+                             snippet_context=CONFIG.SNIPPET_CONTEXT_BYTES,
+                             full_content_rules=CONFIG.FULL_CONTENT_RULES,
+                             full_content_sources=CONFIG.FULL_CONTENT_SOURCES)
+    db_consumer = PgLoader(db_queue,
+                           batch_size=CONFIG.LOADER_BATCH_SIZE,
+                           batch_timeout=CONFIG.LOADER_BATCH_TIMEOUT_MS / 1000,
+                           max_retries=CONFIG.LOADER_MAX_RETRIES,
+                           retry_backoff=CONFIG.LOADER_RETRY_BACKOFF_MS / 1000,
+                           dead_letters=dead_letters)
+    loop.create_task(dead_letters.replay(db_queue))
     loop.create_task(consumer.process())
-    loop.create_task(db_consumer.process())
+    loop.create_task(consumer.process_quarantine())
+    for _ in range(CONFIG.LOADER_WORKERS):
+        loop.create_task(db_consumer.process())
+
+    # Hot-reload the Yara rules on SIGHUP and, if configured, whenever they change on disk
+    loop.add_signal_handler(signal.SIGHUP, lambda: loop.create_task(consumer.reload_rules()))
+    if CONFIG.YARA_RULES_RELOAD_INTERVAL:
+        loop.create_task(consumer.watch_rules(CONFIG.YARA_RULES_RELOAD_INTERVAL))
 
     return loop
 
 
+async def shutdown(loop, queues, sources_scheduler):
+    """
+    Closes the queues, the sources, the HTTP and the Redis connections and stops the loop.
+
+    Args:
+        loop (asyncio loop): The loop to stop
+        queues (list(infobserve.common.queue.ProcessingQueue)): The queues to close. Events left in
+                                                                queues that spill to disk are resumed
+                                                                on the next start
+        sources_scheduler (infobserve.schedulers.source.SourceScheduler): The scheduler of the sources
+    """
+    APP_LOGGER.info("Shutting down")
+    await sources_scheduler.close()
+    for queue in queues:
+        await queue.close()
+    await HttpClient().close()
+    await RedisConnectionPool().close()
+    loop.stop()
+
+
 def main():
     # Initialize Yara Processing queue
     main_loop = asyncio.get_event_loop()
@@ -45,13 +105,31 @@ def main():
     else:
         APP_LOGGER.warning("No Redis Connection Configured falling back to simple Asyncio Queues")
 
-    source_queue = ProcessingQueue("raw_events", CONFIG.PROCESSING_QUEUE_SIZE)
-    # TODO: Add DB queue size option in the config?
-    db_queue = ProcessingQueue("processed_events")
-    sources_scheduler = SourceScheduler(source_queue, sources=CONFIG.SOURCES)
+    blob_store = create_blob_store(**CONFIG.BLOB_STORE) if CONFIG.BLOB_STORE else None
+    if isinstance(blob_store, DiskBlobStore):
+        main_loop.create_task(blob_store.sweep())
+
+    source_queue = ProcessingQueue("raw_events",
+                                   CONFIG.PROCESSING_QUEUE_SIZE,
+                                   high_water_mark=CONFIG.PROCESSING_QUEUE_HIGH_WATER,
+                                   low_water_mark=CONFIG.PROCESSING_QUEUE_LOW_WATER,
+                                   blob_store=blob_store)
+    db_queue = ProcessingQueue("processed_events",
+                               CONFIG.DB_QUEUE_SIZE,
+                               high_water_mark=CONFIG.DB_QUEUE_HIGH_WATER,
+                               low_water_mark=CONFIG.DB_QUEUE_LOW_WATER,
+                               blob_store=blob_store)
+    quarantine_queue = ProcessingQueue("quarantined_events", blob_store=blob_store)
+    dead_letters = DeadLetterFile(CONFIG.DEAD_LETTER_PATH)
+    sources_scheduler = SourceScheduler(source_queue, sources=CONFIG.SOURCES, downstream_queues=[db_queue])
 
     main_loop = sources_scheduler.schedule(main_loop)
-    main_loop = consumer_scheduler(main_loop, source_queue, db_queue)
+    main_loop = consumer_scheduler(main_loop, source_queue, db_queue, quarantine_queue, dead_letters)
+
+    queues = [source_queue, db_queue, quarantine_queue]
+    for stop_signal in (signal.SIGINT, signal.SIGTERM):
+        main_loop.add_signal_handler(stop_signal,
+                                     lambda: main_loop.create_task(shutdown(main_loop, queues, sources_scheduler)))
 
     APP_LOGGER.debug("Consumer Scheduled")
     APP_LOGGER.info("Main Loop Initialized")
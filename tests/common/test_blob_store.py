@@ -0,0 +1,54 @@
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from infobserve.common.blob_store import DiskBlobStore, content_key
+
+
+@pytest.mark.asyncio
+async def test_same_content_is_stored_once(tmp_path):
+    store = DiskBlobStore(tmp_path)
+
+    key = await store.put(b"password = hunter2")
+    assert await store.put(b"password = hunter2") == key == content_key(b"password = hunter2")
+    assert len(list(tmp_path.iterdir())) == 1
+
+    assert await store.get_many([key]) == [b"password = hunter2"]
+
+
+@pytest.mark.asyncio
+async def test_missing_blobs_are_none(tmp_path):
+    store = DiskBlobStore(tmp_path)
+    key = await store.put(b"password = hunter2")
+
+    assert await store.get_many([content_key(b"gone"), key]) == [None, b"password = hunter2"]
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_expired_blobs(tmp_path):
+    store = DiskBlobStore(tmp_path, ttl=60)
+    expired = await store.put(b"password = hunter2")
+    kept = await store.put(b"token = 1234")
+    os.utime(tmp_path / expired, (time.time() - 120, time.time() - 120))
+
+    with patch("infobserve.common.blob_store.asyncio.sleep", AsyncMock(side_effect=asyncio.CancelledError)):
+        with pytest.raises(asyncio.CancelledError):
+            await store.sweep()
+
+    assert await store.get_many([expired, kept]) == [None, b"token = 1234"]
+
+
+@pytest.mark.asyncio
+async def test_sweep_survives_errors(tmp_path):
+    store = DiskBlobStore(tmp_path)
+    store._remove_expired = Mock(side_effect=[PermissionError(), 0])
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError])
+
+    with patch("infobserve.common.blob_store.asyncio.sleep", sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await store.sweep()
+
+    assert store._remove_expired.call_count == 2
@@ -0,0 +1,29 @@
+import io
+
+from infobserve.common.bloom_filter import ScalableBloomFilter
+
+
+def test_added_keys_are_always_found_and_few_others_are():
+    bloom_filter = ScalableBloomFilter(initial_capacity=1000, error_rate=0.01)
+    for index in range(10000):
+        bloom_filter.add(f"event-{index}")
+
+    assert all(f"event-{index}" in bloom_filter for index in range(10000))
+    # Within twice the 1% bound, to leave room for sampling noise
+    assert sum(f"other-{index}" in bloom_filter for index in range(10000)) < 200
+    assert len(bloom_filter._filters) > 1
+
+
+def test_dump_and_load_round_trip():
+    bloom_filter = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    for index in range(500):
+        bloom_filter.add(str(index))
+    file = io.BytesIO()
+    bloom_filter.dump(file)
+
+    loaded = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    loaded.load(io.BytesIO(file.getvalue()))
+
+    assert len(loaded) == len(bloom_filter)
+    assert all(str(index) in loaded for index in range(500))
+    assert loaded.size == bloom_filter.size
@@ -0,0 +1,50 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from infobserve.common.dead_letters import DeadLetterFile
+from infobserve.events import RawEvent
+
+
+def make_event(event_id):
+    return RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", event_id, "paste.txt", "Anonymous",
+                    b"password = hunter2" * 1000)
+
+
+@pytest.mark.asyncio
+async def test_events_are_replayed_once(tmp_path):
+    dead_letters = DeadLetterFile(tmp_path / "dead_events.log")
+    await dead_letters.append([make_event("first"), make_event("second")])
+    await dead_letters.append([make_event("third")])
+    queue = Mock(queue_events=AsyncMock())
+
+    await DeadLetterFile(tmp_path / "dead_events.log").replay(queue)
+
+    events = queue.queue_events.await_args.args[0]
+    assert [event.id for event in events] == ["first", "second", "third"]
+    assert events[0].raw_content == b"password = hunter2" * 1000
+    assert list(tmp_path.iterdir()) == []
+
+    await dead_letters.replay(queue)
+    assert queue.queue_events.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_interrupted_replay_is_resumed(tmp_path):
+    dead_letters = DeadLetterFile(tmp_path / "dead_events.log")
+    await dead_letters.append([make_event("first")])
+    with pytest.raises(ConnectionError):
+        await dead_letters.replay(Mock(queue_events=AsyncMock(side_effect=ConnectionError)))
+
+    await dead_letters.append([make_event("second")])
+    # A record cut short by a crash is skipped
+    with open(tmp_path / "dead_events.log.replay", "ab") as replay_file:
+        replay_file.write(b"\x00\x00\x10\x00partial")
+    queue = Mock(queue_events=AsyncMock())
+
+    await dead_letters.replay(queue)
+    await dead_letters.replay(queue)
+
+    assert [[event.id for event in call.args[0]] for call in queue.queue_events.await_args_list] == [["first"],
+                                                                                                    ["second"]]
@@ -0,0 +1,22 @@
+import pytest
+
+from infobserve.common.http_client import HttpClient
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_the_connections():
+    client = HttpClient()
+    first = client.session()
+    second = client.session({"Accept": "application/vnd.github.v3+json"})
+
+    connector = first.connector
+    assert second.connector is connector
+    assert connector.limit_per_host == 10
+    assert second.headers["Accept"] == "application/vnd.github.v3+json"
+
+    await first.close()
+    assert not connector.closed
+
+    await second.close()
+    await client.close()
+    assert connector.closed
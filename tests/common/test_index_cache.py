@@ -0,0 +1,208 @@
+# pylint: disable=redefined-outer-name
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from infobserve.common.index_cache import BloomIndexCache, IndexCache, RedisIndexCache, create_index_cache
+
+
+class FakeSortedSets:
+    """The sorted set commands of Redis, run in order by the pipeline they are queued on"""
+
+    def __init__(self):
+        self.sets = {}
+        self.ttls = {}
+
+    def pipeline(self):
+        commands = []
+
+        async def execute():
+            return [command() for command in commands]
+
+        pipeline = Mock(execute=execute)
+        for name in ("zscore", "zadd", "zremrangebyscore", "expire"):
+            method = getattr(self, name)
+            setattr(pipeline, name,
+                    lambda *args, method=method, **kwargs: commands.append(lambda: method(*args, **kwargs)))
+        return pipeline
+
+    def zscore(self, key, member):
+        return self.sets.get(key, {}).get(member)
+
+    def zadd(self, key, *pairs):
+        members = self.sets.setdefault(key, {})
+        for score, member in zip(pairs[::2], pairs[1::2]):
+            members[member] = score
+
+    def zremrangebyscore(self, key, max):  # pylint: disable=redefined-builtin
+        self.sets[key] = {member: score for member, score in self.sets.get(key, {}).items() if score > max}
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+
+class FakeConnection:
+    """Serves the INDEX_CACHE rows of its `rows` list that are newer than the cursor of the query"""
+
+    def __init__(self):
+        self.now = datetime(2020, 5, 22, 10, 30)
+        self.rows = []
+        self.execute = AsyncMock(return_value="INSERT 0 1")
+
+    async def fetch(self, query, source, expiry, last_cached_time):
+        # The naive CACHED_TIME cursor must not be compared to the timestamptz NOW()
+        assert "NOW()" not in query and "$3::timestamp" in query
+        oldest = max(self.now - timedelta(seconds=expiry), last_cached_time or datetime.min)
+        return [{"source_id": source_id, "cached_time": cached_time,
+                 "age": (self.now - cached_time).total_seconds()}
+                for row_source, source_id, cached_time in self.rows
+                if row_source == source and cached_time >= oldest]
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def index_cache(conn):
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    index_cache = IndexCache("gist", expiry=60)
+    index_cache.pool = Mock(acquire=acquire)
+    return index_cache
+
+
+@pytest.mark.asyncio
+async def test_only_new_rows_are_synced(index_cache, conn):
+    conn.rows = [("gist", "1", conn.now - timedelta(seconds=90)), ("gist", "2", conn.now - timedelta(seconds=10)),
+                 ("github", "3", conn.now)]
+
+    assert set(await index_cache.query_index_cache()) == {"2"}
+
+    conn.rows.append(("gist", "4", conn.now))
+    index_cache._cache = Mock(wraps=index_cache._cache)
+    assert set(await index_cache.query_index_cache()) == {"2", "4"}
+    # The newest row of the previous sync is fetched again, the older ones are not
+    assert [call.args[0] for call in index_cache._cache.call_args_list] == ["2", "4"]
+
+
+@pytest.mark.asyncio
+async def test_cached_ids_expire_locally(index_cache, conn):
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1000):
+        await index_cache.update_index_cache(["1", "2"])
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1030):
+        await index_cache.update_index_cache(["3"])
+
+    assert conn.execute.await_args.args[1:] == ("gist", ["3"])
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1070):
+        assert set(await index_cache.query_index_cache()) == {"3"}
+
+
+@pytest.mark.asyncio
+async def test_bloom_index_cache_is_persisted_and_expires(tmp_path):
+    with patch("infobserve.common.index_cache.time.time", return_value=1000):
+        index_cache = BloomIndexCache("github", expiry=60, directory=tmp_path)
+        await index_cache.update_index_cache(["1", "2"])
+
+    with patch("infobserve.common.index_cache.time.time", return_value=1070):
+        resumed = BloomIndexCache("github", expiry=60, directory=tmp_path)
+        assert await resumed.filter_uncached(["1", "2", "3"]) == ["3"]
+        await resumed.update_index_cache(["3"])
+
+    with patch("infobserve.common.index_cache.time.time", return_value=1140):
+        assert await resumed.filter_uncached(["1", "2", "3"]) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_in_batches(index_cache, conn):
+    index_cache.SWEEP_BATCH_SIZE = 2
+    conn.execute = AsyncMock(side_effect=["DELETE 2", "DELETE 2", "DELETE 1"])
+
+    with patch("infobserve.common.index_cache.asyncio.sleep", AsyncMock(side_effect=asyncio.CancelledError)):
+        with pytest.raises(asyncio.CancelledError):
+            await index_cache.sweep()
+
+    assert conn.execute.await_count == 3
+    assert conn.execute.await_args.args[1:] == ("gist", 60, 2)
+
+
+@pytest.mark.asyncio
+async def test_bloom_index_cache_is_saved_at_most_every_save_interval(tmp_path):
+    index_cache = BloomIndexCache("github", directory=tmp_path, save_interval=60)
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1000):
+        await index_cache.update_index_cache(["1"])
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1059):
+        await index_cache.update_index_cache(["2"])
+
+    assert await BloomIndexCache("github", directory=tmp_path).filter_uncached(["1", "2"]) == ["2"]
+
+    with patch("infobserve.common.index_cache.time.monotonic", return_value=1060):
+        await index_cache.update_index_cache(["3"])
+
+    assert await BloomIndexCache("github", directory=tmp_path).filter_uncached(["1", "2", "3", "4"]) == ["4"]
+    assert [path.name for path in tmp_path.iterdir()] == ["github.bloom"]
+
+
+def test_sources_of_the_same_type_share_their_bloom_index_cache(tmp_path):
+    # Rather than overwriting each other's file
+    index_cache = create_index_cache("github", type="bloom", directory=tmp_path)
+
+    assert create_index_cache("github", type="bloom", directory=str(tmp_path)) is index_cache
+    assert create_index_cache("gist", type="bloom", directory=tmp_path) is not index_cache
+    assert create_index_cache("github", type="bloom", directory=tmp_path / "other") is not index_cache
+
+
+@pytest.fixture
+def redis():
+    redis = FakeSortedSets()
+    with patch("infobserve.common.index_cache.RedisConnectionPool", return_value=Mock(commands=redis)):
+        yield redis
+
+
+@pytest.mark.asyncio
+async def test_redis_index_cache_expires_ids(redis):
+    index_cache = RedisIndexCache("gist", expiry=60)
+    with patch("infobserve.common.index_cache.time.time", return_value=1000):
+        await index_cache.update_index_cache(["1", "2"])
+    with patch("infobserve.common.index_cache.time.time", return_value=1030):
+        await index_cache.update_index_cache(["2", "3"])
+
+    assert redis.sets["index_cache:gist"] == {"1": 1060, "2": 1090, "3": 1090}
+    assert redis.ttls["index_cache:gist"] == 60
+
+    with patch("infobserve.common.index_cache.time.time", return_value=1060):
+        assert await index_cache.filter_uncached(["1", "2", "3", "4"]) == ["1", "4"]
+
+    # The expired ids are removed along with the next update
+    with patch("infobserve.common.index_cache.time.time", return_value=1061):
+        await index_cache.update_index_cache(["4"])
+    assert set(redis.sets["index_cache:gist"]) == {"2", "3", "4"}
+
+
+@pytest.mark.asyncio
+async def test_redis_index_cache_skips_empty_batches(redis):
+    index_cache = RedisIndexCache("gist")
+    redis.pipeline = Mock(side_effect=redis.pipeline)
+
+    assert await index_cache.filter_uncached([]) == []
+    await index_cache.update_index_cache([])
+
+    redis.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sweep_survives_errors(index_cache, conn):
+    conn.execute = AsyncMock(side_effect=[ConnectionResetError(), "DELETE 1"])
+    sleep = AsyncMock(side_effect=[None, asyncio.CancelledError])
+
+    with patch("infobserve.common.index_cache.asyncio.sleep", sleep):
+        with pytest.raises(asyncio.CancelledError):
+            await index_cache.sweep()
+
+    assert conn.execute.await_count == 2
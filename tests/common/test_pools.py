@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from infobserve.common.config import CONFIG
+from infobserve.common.exceptions import UnitializedRedisConnectionPool
+from infobserve.common.pools import RedisConnectionPool, Singleton
+from infobserve.common.queue import ProcessingQueue
+from infobserve.events import RawEvent
+from infobserve.events.wire import encode_event
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.closed = False
+        self.wait_closed = AsyncMock()
+
+    def close(self):
+        self.closed = True
+
+
+def make_event():
+    return RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", "0CeaNm8Y", "paste.txt", "Anonymous", b"hunter2")
+
+
+@pytest.fixture
+def aioredis():
+    with patch.object(CONFIG, "REDIS_CONFIG", {"host": "localhost", "port": 6379, "pool_maxsize": 4}), \
+            patch("infobserve.common.pools.aioredis") as aioredis:
+        aioredis.create_pool = AsyncMock(side_effect=lambda *args, **kwargs: FakeConnection())
+        aioredis.create_redis = AsyncMock(side_effect=lambda *args, **kwargs: FakeConnection())
+        yield aioredis
+
+
+@pytest.fixture
+def pool():
+    # A fresh pool, rather than the one shared by the whole process
+    Singleton._instances.pop(RedisConnectionPool, None)
+    yield RedisConnectionPool()
+    Singleton._instances.pop(RedisConnectionPool, None)
+
+
+@pytest.mark.asyncio
+async def test_blocking_connection_requires_the_pool(aioredis, pool):
+    with pytest.raises(UnitializedRedisConnectionPool):
+        await pool.blocking_connection()
+
+    aioredis.create_redis.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_commands_share_the_pool_and_blocking_commands_get_their_own_connection(aioredis, pool):
+    await pool.init_redis_pool()
+
+    aioredis.create_pool.assert_awaited_once_with(("localhost", 6379), minsize=1, maxsize=4)
+    aioredis.Redis.assert_called_once_with(pool.redis)
+    assert pool.commands is aioredis.Redis.return_value
+
+    first = await pool.blocking_connection()
+    second = await pool.blocking_connection()
+    assert first is not second and pool.redis not in (first, second)
+    aioredis.create_redis.assert_awaited_with(("localhost", 6379))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_blocking_commands_get_their_own_connection(aioredis, pool):
+    await pool.init_redis_pool()
+    queue = ProcessingQueue("test_events")
+    popped = asyncio.Event()
+    connections = []
+
+    async def brpop(connection, name):
+        connections.append(connection)
+        await popped.wait()
+        return name, encode_event(make_event())
+
+    with patch.object(FakeConnection, "brpop", brpop, create=True):
+        consumers = asyncio.gather(queue.get_event(), queue.get_event())
+        await asyncio.sleep(0)
+        popped.set()
+        await consumers
+
+        assert len(connections) == 2 and connections[0] is not connections[1]
+        # Once released, the connections are reused
+        await queue.get_event()
+        assert connections[2] in connections[:2]
+        assert aioredis.create_redis.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_or_failed_blocking_connections_are_not_reused(aioredis, pool):
+    await pool.init_redis_pool()
+
+    async with pool.checkout_blocking() as connection:
+        pass
+    connection.close()
+    async with pool.checkout_blocking() as reopened:
+        assert reopened is not connection and not reopened.closed
+    # The closed connection is no longer tracked by the pool
+    assert pool._blocking_connections == [reopened]
+
+    with pytest.raises(asyncio.CancelledError):
+        async with pool.checkout_blocking() as cancelled:
+            raise asyncio.CancelledError()
+    # A cancelled command may still have a reply on its way
+    assert cancelled is reopened and cancelled.closed
+    async with pool.checkout_blocking() as connection:
+        assert connection is not cancelled
+
+
+@pytest.mark.asyncio
+async def test_close_closes_the_pool_and_every_blocking_connection(aioredis, pool):
+    await pool.init_redis_pool()
+    connections = [await pool.blocking_connection(), await pool.blocking_connection()]
+
+    await pool.close()
+
+    for connection in connections + [pool.redis]:
+        assert connection.closed
+        connection.wait_closed.assert_awaited_once()
+    assert pool._blocking_connections == []
@@ -0,0 +1,97 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock, call, patch
+
+import pytest
+
+from infobserve.common.config import CONFIG
+from infobserve.common.queue import ProcessingQueue
+
+
+@pytest.mark.asyncio
+async def test_get_events_returns_available_events_in_order():
+    queue = ProcessingQueue("test_events")
+    await queue.queue_events(["first", "second", "third"])
+
+    assert await queue.get_events(2) == ["first", "second"]
+    assert await queue.get_events(2) == ["third"]
+
+
+@pytest.mark.asyncio
+async def test_get_events_waits_for_batch_to_fill_up():
+    queue = ProcessingQueue("test_events")
+    await queue.queue_event("first")
+
+    async def late_producer():
+        await asyncio.sleep(0.01)
+        await queue.queue_event("second")
+
+    producer = asyncio.create_task(late_producer())
+    assert await queue.get_events(2, timeout=1) == ["first", "second"]
+    await producer
+
+
+@pytest.mark.asyncio
+async def test_get_events_returns_partial_batch_after_timeout():
+    queue = ProcessingQueue("test_events")
+    await queue.queue_event("first")
+
+    assert await queue.get_events(10, timeout=0.01) == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_saturation_has_hysteresis():
+    queue = ProcessingQueue("test_events", high_water_mark=3, low_water_mark=1)
+    await queue.queue_events(["first", "second"])
+    assert not await queue.is_saturated()
+
+    await queue.queue_event("third")
+    assert await queue.is_saturated()
+
+    await queue.get_event()
+    assert await queue.is_saturated()
+
+    await queue.get_event()
+    assert not await queue.is_saturated()
+
+
+@pytest.mark.asyncio
+async def test_never_saturated_without_high_water_mark():
+    queue = ProcessingQueue("test_events")
+    await queue.queue_events(["first", "second"])
+
+    assert not await queue.is_saturated()
+
+
+@pytest.mark.asyncio
+async def test_redis_stream_events_are_acknowledged_by_entry():
+    stream = Mock(read=AsyncMock(return_value=[(b"1-0", b"first"), (b"2-0", b"second")]))
+    with patch("infobserve.common.queue.RedisConnectionPool", return_value=Mock(redis=object())), \
+            patch.object(CONFIG, "REDIS_CONFIG", {"queue": "stream"}), \
+            patch("infobserve.common.queue.RedisStream", return_value=stream), \
+            patch("infobserve.common.queue.decode_event", side_effect=lambda payload, _: Mock(payload=payload)):
+        queue = ProcessingQueue("test_events")
+        first, second = await queue.get_events(2)
+
+    queue.notify(second)
+    queue.notify(first)
+    assert stream.ack.call_args_list == [call(b"2-0"), call(b"1-0")]
+
+    with pytest.raises(ValueError):
+        queue.notify(first)
+
+
+@pytest.mark.asyncio
+async def test_events_with_a_missing_blob_are_dropped():
+    stream = Mock(read=AsyncMock(side_effect=[[(b"1-0", b"expired")], [(b"2-0", b"inline")]]))
+    blob_store = Mock(get_many=AsyncMock(return_value=[None]))
+    with patch("infobserve.common.queue.RedisConnectionPool", return_value=Mock(redis=object())), \
+            patch.object(CONFIG, "REDIS_CONFIG", {"queue": "stream"}), \
+            patch("infobserve.common.queue.RedisStream", return_value=stream), \
+            patch("infobserve.common.queue.blob_key", side_effect=lambda payload: payload == b"expired" and "key"), \
+            patch("infobserve.common.queue.decode_event", side_effect=lambda payload, _: Mock(payload=payload)):
+        queue = ProcessingQueue("test_events", blob_store=blob_store)
+        event = await queue.get_event()
+
+    # Instead of being scanned as empty, the event is dropped and its entry acknowledged
+    assert event.payload == b"inline"
+    stream.ack.assert_called_once_with(b"1-0")
@@ -0,0 +1,179 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+
+import pytest
+
+from infobserve.common.redis_stream import RedisStream
+
+
+class FakeBatch:
+    """A pipeline or a transaction, which runs its commands in order on execute"""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, command):
+        return lambda *args, **kwargs: self._commands.append(getattr(self._redis, command)(*args, **kwargs))
+
+    async def execute(self):
+        return [await command for command in self._commands]
+
+
+class FakeRedis:
+    """The stream commands of a single stream with a single consumer group"""
+
+    def __init__(self):
+        self.entries = {}
+        # The consumer and the (fake) time each pending entry was last delivered at
+        self.pending = {}
+        self.last_delivered = 0
+        self.time_ms = 0
+        self.closed = False
+        self._sequence = 0
+
+    def pipeline(self):
+        return FakeBatch(self)
+
+    def multi_exec(self):
+        return FakeBatch(self)
+
+    async def xgroup_create(self, name, group, latest_id, mkstream):
+        pass
+
+    async def xadd(self, name, fields):
+        self._sequence += 1
+        entry_id = f"{self._sequence}-0".encode()
+        self.entries[entry_id] = fields
+        return entry_id
+
+    async def xread_group(self, group, consumer, streams, timeout, count, latest_ids):
+        await asyncio.sleep(0)
+        if latest_ids[0] == ">":
+            entry_ids = [entry_id for entry_id in self.entries if _sequence(entry_id) > self.last_delivered][:count]
+            for entry_id in entry_ids:
+                self.pending[entry_id] = (consumer, self.time_ms)
+                self.last_delivered = _sequence(entry_id)
+        else:
+            start = _sequence(latest_ids[0])
+            entry_ids = sorted((entry_id for entry_id, (owner, _) in self.pending.items()
+                                if owner == consumer and _sequence(entry_id) > start),
+                               key=_sequence)[:count]
+
+        return [(streams[0], entry_id, self.entries[entry_id]) for entry_id in entry_ids]
+
+    async def xpending(self, name, group, start, stop, count):
+        return [[entry_id, owner.encode(), self.time_ms - delivered_at, 1]
+                for entry_id, (owner, delivered_at) in sorted(self.pending.items(), key=lambda item: item[0])][:count]
+
+    async def xclaim(self, name, group, consumer, min_idle_time, *entry_ids):
+        claimed = []
+        for entry_id in entry_ids:
+            if entry_id in self.pending and self.time_ms - self.pending[entry_id][1] >= min_idle_time:
+                self.pending[entry_id] = (consumer, self.time_ms)
+                claimed.append((entry_id, self.entries[entry_id]))
+        return claimed
+
+    async def xack(self, name, group, *entry_ids):
+        for entry_id in entry_ids:
+            self.pending.pop(entry_id, None)
+
+    async def xdel(self, name, entry_id):
+        self.entries.pop(entry_id, None)
+
+    async def xlen(self, name):
+        return len(self.entries)
+
+
+def _sequence(entry_id):
+    return int(entry_id.split(b"-")[0]) if isinstance(entry_id, bytes) else int(entry_id.split("-")[0])
+
+
+@pytest.fixture
+def redis():
+    return FakeRedis()
+
+
+def make_stream(redis, consumer="node-1", claim_idle_ms=60000):
+    @asynccontextmanager
+    async def checkout_blocking():
+        yield redis
+
+    pool = Mock(commands=redis, checkout_blocking=checkout_blocking)
+    return RedisStream(pool, "events", consumer=consumer, claim_idle_ms=claim_idle_ms)
+
+
+def payloads(entries):
+    return [payload for _, payload in entries]
+
+
+@pytest.mark.asyncio
+async def test_acknowledged_entries_are_deleted_on_flush(redis):
+    stream = make_stream(redis)
+    await stream.add([b"first", b"second", b"third"])
+
+    entries = await stream.read(3)
+    assert payloads(entries) == [b"first", b"second", b"third"]
+
+    # Entries are acknowledged by id, in any order
+    stream.ack(entries[2][0])
+    stream.ack(entries[0][0])
+    await stream.flush()
+
+    assert list(redis.entries) == [entries[1][0]]
+    assert list(redis.pending) == [entries[1][0]]
+    assert await stream.lag() == 1
+
+    with pytest.raises(ValueError):
+        stream.ack(entries[0][0])
+
+
+@pytest.mark.asyncio
+async def test_pending_entries_are_replayed_after_a_restart(redis):
+    stream = make_stream(redis)
+    await stream.add([b"first", b"second", b"third"])
+    entries = await stream.read(3)
+    stream.ack(entries[1][0])
+    await stream.flush()
+    await stream.add([b"fourth"])
+
+    restarted = make_stream(redis)
+    assert payloads(await restarted.read(1)) == [b"first"]
+    assert payloads(await restarted.read(1)) == [b"third"]
+    assert payloads(await restarted.read(1)) == [b"fourth"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_readers_replay_each_pending_entry_once(redis):
+    stream = make_stream(redis)
+    await stream.add([b"first", b"second", b"third", b"fourth"])
+    await stream.read(4)
+
+    restarted = make_stream(redis)
+    batches = await asyncio.gather(*[restarted.read(1, block=False) for _ in range(4)])
+
+    assert sorted(payload for batch in batches for payload in payloads(batch)) == \
+        [b"first", b"fourth", b"second", b"third"]
+
+
+@pytest.mark.asyncio
+async def test_idle_entries_of_other_consumers_are_claimed(redis):
+    crashed = make_stream(redis, consumer="node-1")
+    await crashed.add([b"first", b"second"])
+    await crashed.read(2)
+
+    other = make_stream(redis, consumer="node-2", claim_idle_ms=1000)
+    redis.time_ms = 999
+    assert await other.read(2, block=False) == []
+
+    other._next_claim = 0
+    redis.time_ms = 1000
+    entries = await other.read(2, block=False)
+    assert payloads(entries) == [b"first", b"second"]
+    assert {owner for owner, _ in redis.pending.values()} == {"node-2"}
+
+    for entry_id, _ in entries:
+        other.ack(entry_id)
+    await other.flush()
+    assert not redis.entries
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from infobserve.common.spill_queue import SpillQueue
+from infobserve.events import RawEvent
+
+
+def make_event(index):
+    return RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", str(index), "paste.txt", "Anonymous",
+                    b"password = hunter2" * 10)
+
+
+async def drain(queue):
+    ids = []
+    while not queue.empty():
+        ids.append((await queue.get()).id)
+        queue.task_done()
+    return ids
+
+
+async def settle(queue):
+    # Waits for the segment I/O submitted so far
+    await asyncio.get_event_loop().run_in_executor(queue._io, lambda: None)
+
+
+async def resume(name, directory, **kwargs):
+    queue = SpillQueue(name, directory, **kwargs)
+    await asyncio.wrap_future(queue._resuming)
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_events_past_the_memory_limit_are_spilled_in_order(tmp_path):
+    queue = await resume("raw_events", tmp_path, memory_limit=400, segment_size=500)
+    for index in range(10):
+        await queue.put(make_event(index))
+
+    assert queue.qsize() == 10
+    await settle(queue)
+    assert len(list(tmp_path.glob("raw_events.*.seg"))) > 1
+
+    assert await drain(queue) == [str(index) for index in range(10)]
+    await settle(queue)
+    assert not list(tmp_path.glob("raw_events.*.seg"))
+
+
+@pytest.mark.asyncio
+async def test_events_left_at_close_are_resumed(tmp_path):
+    queue = SpillQueue("raw_events", tmp_path, memory_limit=400, segment_size=500)
+    for index in range(10):
+        await queue.put(make_event(index))
+    assert [(await queue.get()).id for _ in range(3)] == ["0", "1", "2"]
+    await queue.close()
+
+    resumed = await resume("raw_events", tmp_path, memory_limit=400, segment_size=500)
+    assert resumed.qsize() == 7
+    assert await drain(resumed) == [str(index) for index in range(3, 10)]
+
+    await resumed.join()
+
+
+@pytest.mark.asyncio
+async def test_events_retrieved_since_the_last_checkpoint_are_retrieved_again_after_a_crash(tmp_path):
+    queue = await resume("raw_events", tmp_path, memory_limit=0, segment_size=500, checkpoint_interval=4)
+    for index in range(10):
+        await queue.put(make_event(index))
+    assert [(await queue.get()).id for _ in range(6)] == [str(index) for index in range(6)]
+    # A crash, without close. The first event was kept in memory, the next ones were checkpointed after the fourth
+    await settle(queue)
+
+    resumed = await resume("raw_events", tmp_path, memory_limit=0, segment_size=500)
+    assert await drain(resumed) == [str(index) for index in range(5, 10)]
+
+    # Segments are only touched by the I/O thread, and the retrieved ones are deleted
+    await resumed.close()
+    assert not list(tmp_path.glob("raw_events.*.seg"))
+    assert not (tmp_path / "raw_events.checkpoint").exists()
+
+
+@pytest.mark.asyncio
+async def test_getters_wait_for_events_put_later(tmp_path):
+    queue = await resume("raw_events", tmp_path, memory_limit=0)
+    getters = asyncio.gather(queue.get(), queue.get())
+    await asyncio.sleep(0)
+
+    await queue.put(make_event(0))
+    await queue.put(make_event(1))
+    # The first event is kept in memory, the second one is read back from disk
+    assert queue.get_nowait().id == "0"
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+    await queue.put(make_event(2))
+
+    assert sorted(event.id for event in await getters) == ["1", "2"]
@@ -95,13 +95,13 @@ async def test_get_raw_content(mock_aioresponse, gist_event):
     mock_aioresponse.get(gist_event.raw_url, body=custom_text, status=200)
     async with aiohttp.ClientSession() as session:
         text = await gist_event.get_raw_content(session)
-        assert text == "KappaKeepo"
+        assert text == b"KappaKeepo"
 
 
 @pytest.mark.asyncio
-async def test_get_raw_content_unicode_error(mock_aioresponse, gist_event):
+async def test_get_raw_content_not_utf8(mock_aioresponse, gist_event):
     custom_text = b"kapsdsd\xffdsdsds"
     mock_aioresponse.get(gist_event.raw_url, body=custom_text, status=200)
     async with aiohttp.ClientSession() as session:
         text = await gist_event.get_raw_content(session)
-        assert text is None
+        assert text == custom_text
@@ -50,4 +50,4 @@ async def test_get_raw_content(mock_aioresponse, paste_event):
 
     with patch.object(AsyncPaste, "scrape_raw_text", custom_event):
         text = await paste_event.get_raw_content()
-    assert text == "KappaKeepo"
+    assert text == b"KappaKeepo"
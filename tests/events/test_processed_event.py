@@ -34,3 +34,17 @@ def test_set_event_id(processed_event):
 def test_get_rule_files(processed_event):
     rules = processed_event.get_rule_files()
     assert rules == ["Example Rule"]
+
+
+def test_binary_strings_are_stored_without_nuls(mocked_match):
+    mocked_unprocessed_event = Mock()
+    mocked_unprocessed_event.source = "example"
+    mocked_unprocessed_event.timestamp = datetime(2020, 5, 22)
+    mocked_unprocessed_event.raw_content = b"\x7fELF\x00\x00key=\xff\x00secret\x00\x00"
+    mocked_match.strings = [(6, "$a", b"key=\xff\x00secret")]
+
+    processed_event = ProcessedEvent(mocked_unprocessed_event, [mocked_match], context_size=2)
+
+    ascii_match = processed_event.matches[0].ascii_matches[0]
+    assert ascii_match.matched_string == "key=��secret"
+    assert ascii_match.context == "��key=��secret��"
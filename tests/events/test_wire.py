@@ -0,0 +1,94 @@
+# pylint: disable=redefined-outer-name
+import pickle
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from infobserve.events import ProcessedEvent, RawEvent
+from infobserve.events.wire import MAGIC, blob_key, decode_event, encode_event
+
+
+@pytest.fixture
+def raw_event():
+    return RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", "0CeaNm8Y", "paste.txt", "Anonymous",
+                    b"password = hunter2\xff" * 1000)
+
+
+def test_raw_event_round_trip(raw_event):
+    decoded = decode_event(encode_event(raw_event))
+
+    assert isinstance(decoded, RawEvent)
+    for attribute in ("timestamp", "source", "id", "filename", "creator", "raw_content"):
+        assert getattr(decoded, attribute) == getattr(raw_event, attribute)
+
+
+def test_large_content_is_compressed(raw_event):
+    compressed = encode_event(raw_event)
+    uncompressed = encode_event(raw_event, compress_threshold=0)
+
+    assert len(compressed) < len(raw_event.raw_content) < len(uncompressed)
+    assert decode_event(compressed).raw_content == decode_event(uncompressed).raw_content
+
+
+def test_processed_event_round_trip(raw_event):
+    match = Mock()
+    match.rule = "GenericPasswordRule"
+    match.tags = ["password"]
+    match.strings = [(0, "$unquoted", b"password = hunter2")]
+    processed_event = ProcessedEvent(raw_event, [match])
+
+    decoded = decode_event(encode_event(processed_event))
+
+    assert isinstance(decoded, ProcessedEvent)
+    assert decoded.raw_content == raw_event.raw_content
+    assert decoded.time_discovered == processed_event.time_discovered
+    assert decoded.get_rule_files() == ["GenericPasswordRule"]
+    assert decoded.matches[0].tags_matched == ["password"]
+    assert decoded.matches[0].ascii_matches[0].matched_string == "password = hunter2"
+
+
+def test_pickled_payloads_are_still_read(raw_event):
+    assert decode_event(pickle.dumps(raw_event)).raw_content == raw_event.raw_content
+
+
+def test_newer_versions_are_refused(raw_event):
+    payload = bytearray(encode_event(raw_event))
+    payload[len(MAGIC)] = 255
+
+    with pytest.raises(ValueError):
+        decode_event(bytes(payload))
+
+
+def test_blob_reference_round_trip(raw_event):
+    payload = encode_event(raw_event, blob_key="c0ffee")
+
+    assert len(payload) < 256
+    assert blob_key(payload) == "c0ffee"
+    assert decode_event(payload, raw_event.raw_content).raw_content == raw_event.raw_content
+
+
+def test_inline_content_has_no_blob_key(raw_event):
+    assert blob_key(encode_event(raw_event)) is None
+    assert blob_key(pickle.dumps(raw_event)) is None
+
+
+def test_blob_reference_requires_blob(raw_event):
+    with pytest.raises(ValueError):
+        decode_event(encode_event(raw_event, blob_key="c0ffee"))
+
+
+def test_snippets_only_processed_event_round_trip(raw_event):
+    match = Mock()
+    match.rule = "GenericPasswordRule"
+    match.tags = ["password"]
+    match.strings = [(19, "$unquoted", b"password = hunter2")]
+    processed_event = ProcessedEvent(raw_event, [match], context_size=3)
+    processed_event.raw_content = None
+
+    decoded = decode_event(encode_event(processed_event))
+
+    assert decoded.raw_content is None
+    ascii_match = decoded.matches[0].ascii_matches[0]
+    assert (ascii_match.identifier, ascii_match.offset) == ("$unquoted", 19)
+    assert ascii_match.context == "r2�password = hunter2�pa"
@@ -0,0 +1,167 @@
+# pylint: disable=redefined-outer-name
+import hashlib
+import zlib
+from contextlib import asynccontextmanager
+from datetime import datetime
+from itertools import count
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from infobserve.events import ProcessedEvent, RawEvent
+from infobserve.loaders.postgres import PgLoader
+
+
+class FakeConnection:
+    """Allocates ids from in-memory sequences and records the copied rows and the stored contents"""
+
+    def __init__(self):
+        self.sequences = {}
+        self.copied = {}
+        self.contents = {}
+        self.copy_records_to_table = AsyncMock(side_effect=self._copy)
+
+    async def fetch(self, query, *args):
+        if "event_contents" in query:
+            return [{"sha256": content_hash} for content_hash in args[0] if content_hash in self.contents]
+
+        table, number = args
+        sequence = self.sequences.setdefault(table, count(1))
+        return [{"id": next(sequence)} for _ in range(number)]
+
+    async def execute(self, _query, hashes, contents, sizes):
+        for content_hash, content, size in zip(hashes, contents, sizes):
+            self.contents.setdefault(content_hash, (content, size))
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def _copy(self, table, columns, records):
+        self.copied[table] = [dict(zip(columns, record)) for record in records]
+
+
+def make_event(rules, content=b"password = hunter2"):
+    matches = []
+    for rule in rules:
+        match = Mock()
+        match.rule = rule
+        match.tags = ["password"]
+        match.strings = [(0, "$a", b"password = hunter2"), (40, "$b", b"passwd = hunter3")]
+        matches.append(match)
+
+    raw_event = RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", "0CeaNm8Y", "paste.txt", "Anonymous", content)
+    return ProcessedEvent(raw_event, matches)
+
+
+@pytest.fixture
+def conn():
+    return FakeConnection()
+
+
+@pytest.fixture
+def loader(conn):
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    loader = PgLoader(Mock())
+    loader.pool = Mock(acquire=acquire)
+    return loader
+
+
+@pytest.mark.asyncio
+async def test_batch_is_copied_with_preallocated_ids(loader, conn):
+    events = [make_event(["FirstRule", "SecondRule"]), make_event(["ThirdRule"])]
+
+    await loader._insert_events(events)
+
+    assert [row["id"] for row in conn.copied["events"]] == [1, 2]
+    assert [(row["id"], row["event_id"], row["rule_matched"]) for row in conn.copied["matches"]] == [
+        (1, 1, "FirstRule"), (2, 1, "SecondRule"), (3, 2, "ThirdRule")
+    ]
+    assert [row["match_id"] for row in conn.copied["ascii_match"]] == [1, 1, 2, 2, 3, 3]
+    assert events[1].matches[0].ascii_matches[0].match_id == 3
+
+
+@pytest.mark.asyncio
+async def test_events_without_matches_skip_the_match_tables(loader, conn):
+    await loader._insert_events([make_event([])])
+
+    assert len(conn.copied["events"]) == 1
+    assert conn.copy_records_to_table.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_each_distinct_content_is_stored_once_compressed(loader, conn):
+    content = b"password = hunter2\n" * 100
+    await loader._insert_events([make_event([], content), make_event([], content)])
+    await loader._insert_events([make_event([], content), make_event([], b"passwd = hunter3")])
+
+    content_hash = hashlib.sha256(content).digest()
+    assert len(conn.contents) == 2
+    assert zlib.decompress(conn.contents[content_hash][0]) == content
+    assert len(conn.contents[content_hash][0]) < len(content)
+    assert [row["content_sha256"] for row in conn.copied["events"]] == [
+        content_hash, hashlib.sha256(b"passwd = hunter3").digest()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(loader):
+    loader.retry_backoff = 0
+    loader._insert_events = AsyncMock(side_effect=[OSError("Connection reset"), None])
+    loader.dead_letters = AsyncMock()
+
+    await loader._store_batch([make_event(["FirstRule"])])
+
+    assert loader._insert_events.await_count == 2
+    loader.dead_letters.append.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_go_to_the_dead_letters(loader):
+    events = [make_event(["FirstRule"])]
+    loader.retry_backoff = 0
+    loader.max_retries = 2
+    loader._insert_events = AsyncMock(side_effect=OSError("Connection reset"))
+    loader.dead_letters = AsyncMock()
+
+    await loader._store_batch(events)
+
+    assert loader._insert_events.await_count == 3
+    loader.dead_letters.append.assert_awaited_once_with(events)
+
+
+@pytest.mark.asyncio
+async def test_only_the_failing_event_goes_to_the_dead_letters(loader):
+    events = [make_event(["FirstRule"]) for _ in range(5)]
+    bad_event = events[3]
+
+    async def insert_events(processed_events):
+        if bad_event in processed_events:
+            raise ValueError("invalid byte sequence")
+
+    loader._insert_events = AsyncMock(side_effect=insert_events)
+    loader.dead_letters = AsyncMock()
+
+    await loader._store_batch(events)
+
+    stored = [call.args[0] for call in loader._insert_events.await_args_list
+              if bad_event not in call.args[0]]
+    assert sorted(map(id, sum(stored, []))) == sorted(id(event) for event in events if event is not bad_event)
+    loader.dead_letters.append.assert_awaited_once_with([bad_event])
+
+
+@pytest.mark.asyncio
+async def test_snippet_only_events_store_no_content(loader, conn):
+    event = make_event(["FirstRule"], b"password = hunter2 " * 3)
+    event.raw_content = None
+
+    await loader._insert_events([event, make_event([])])
+
+    assert [row["content_sha256"] for row in conn.copied["events"]] == [
+        None, hashlib.sha256(b"password = hunter2").digest()
+    ]
+    assert len(conn.contents) == 1
+    assert [(row["identifier"], row["string_offset"]) for row in conn.copied["ascii_match"]] == [("$a", 0), ("$b", 40)]
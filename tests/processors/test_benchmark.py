@@ -0,0 +1,31 @@
+from infobserve.processors.benchmark import benchmark_rule_file, find_regressions
+
+
+def test_benchmark_rule_file():
+    result = benchmark_rule_file("yara-rules/generic_password.yar", [b"secret_password = 'this is a secret'", b"nope"],
+                                 rounds=1, min_time=0)
+
+    assert result["matches"] == 1
+    assert result["seconds"] > 0
+    assert result["bytes_per_second"] > 0
+
+
+def test_find_regressions():
+    baseline = {"fast.yar": {"seconds": 0.1}, "slow.yar": {"seconds": 0.1}, "cheap.yar": {"seconds": 0.001}}
+    results = {
+        "fast.yar": {"seconds": 0.11},
+        "slow.yar": {"seconds": 0.2},
+        "cheap.yar": {"seconds": 0.005},
+        "new.yar": {"seconds": 1.0}
+    }
+
+    assert find_regressions(results, baseline, 0.25) == ["slow.yar", "cheap.yar"]
+    # Below the noise floor, even with no threshold
+    assert find_regressions({"fast.yar": {"seconds": 0.102}}, baseline, 0) == []
+
+
+def test_cheap_rule_files_are_timed_over_several_passes():
+    result = benchmark_rule_file("yara-rules/generic_password.yar", [b"nope"], rounds=1, min_time=0.05)
+
+    # A single pass takes microseconds, it is the time of a pass that is reported
+    assert result["seconds"] < 0.01
@@ -0,0 +1,72 @@
+# pylint: disable=redefined-outer-name
+import pytest
+
+from infobserve.processors.rules_cache import RulesCache, ruleset_key
+
+RULE = """
+rule SecretRule
+{
+    strings:
+        $a = "KappaKeepo"
+    condition:
+        $a
+}
+"""
+
+
+@pytest.fixture
+def rule_files(tmp_path):
+    path = tmp_path / "secret.yar"
+    path.write_text(RULE)
+    return {path.as_posix(): path.as_posix()}
+
+
+@pytest.fixture
+def rules_cache(tmp_path):
+    return RulesCache((tmp_path / "cache").as_posix())
+
+
+def test_key_is_stable(rule_files):
+    assert ruleset_key(rule_files, {"a": "b"}) == ruleset_key(rule_files, {"a": "b"})
+
+
+def test_key_changes_with_content(rule_files):
+    key = ruleset_key(rule_files)
+    with open(next(iter(rule_files.values())), "a") as rule_file:
+        rule_file.write("\n// A comment\n")
+
+    assert ruleset_key(rule_files) != key
+
+
+def test_key_changes_with_externals(rule_files):
+    assert ruleset_key(rule_files, {"a": "b"}) != ruleset_key(rule_files, {"a": "c"})
+
+
+def test_load_compiles_then_hits(rules_cache, rule_files):
+    rules, cached = rules_cache.load(rule_files)
+    assert not cached
+    assert rules_cache.path(ruleset_key(rule_files)).is_file()
+
+    rules, cached = rules_cache.load(rule_files)
+    assert cached
+    assert rules.match(data="KappaKeepo")[0].rule == "SecretRule"
+
+
+def test_load_recovers_from_corrupt_cache_file(rules_cache, rule_files):
+    rules_cache.path(ruleset_key(rule_files)).write_bytes(b"not a ruleset")
+
+    rules, cached = rules_cache.load(rule_files)
+    assert not cached
+    assert rules.match(data="KappaKeepo")
+
+
+def test_prune_removes_stale_rulesets(rules_cache, rule_files):
+    rules_cache.load(rule_files)
+    stale_key = ruleset_key(rule_files)
+    with open(next(iter(rule_files.values())), "a") as rule_file:
+        rule_file.write("\n// A comment\n")
+    rules_cache.load(rule_files)
+
+    assert rules_cache.prune([ruleset_key(rule_files)]) == 1
+    assert not rules_cache.path(stale_key).exists()
+    assert rules_cache.path(ruleset_key(rule_files)).is_file()
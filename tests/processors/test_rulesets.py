@@ -0,0 +1,82 @@
+# pylint: disable=redefined-outer-name
+import pytest
+
+from infobserve.processors.rulesets import Ruleset, split_blacklist_rules
+
+BLACKLIST_RULE = """
+rule BlacklistRule
+{
+    strings:
+        $a = "#EXTINF:" nocase
+    condition:
+        $a
+}
+"""
+
+TAGGED_BLACKLIST_RULE = """
+rule NoiseRule : noise blacklist
+{
+    strings:
+        $a = "Technic Launcher is starting"
+    condition:
+        $a
+}
+
+rule SecretInNoiseRule
+{
+    strings:
+        $a = "Kreygasm"
+    condition:
+        $a
+}
+"""
+
+SECRET_RULE = """
+rule SecretRule : secret
+{
+    strings:
+        $a = "KappaKeepo"
+    condition:
+        $a
+}
+"""
+
+
+@pytest.fixture
+def rule_files(tmp_path):
+    rule_files = {}
+    for name, rule in (("blacklist", BLACKLIST_RULE), ("tagged", TAGGED_BLACKLIST_RULE), ("secret", SECRET_RULE)):
+        path = tmp_path / f"{name}.yar"
+        path.write_text(rule)
+        rule_files[name] = path.as_posix()
+    return rule_files
+
+
+@pytest.fixture
+def ruleset(rule_files):
+    return Ruleset.load(rule_files)
+
+
+def test_split_blacklist_rules(rule_files):
+    blacklist, main = split_blacklist_rules(rule_files)
+
+    assert sorted(blacklist) == ["blacklist", "tagged"]
+    assert list(main) == ["secret"]
+
+
+def test_blacklist_hit_skips_main_ruleset(ruleset):
+    matches = ruleset.match("#EXTINF: KappaKeepo")
+
+    assert [match.rule for match in matches] == ["BlacklistRule"]
+
+
+def test_tagged_blacklist_hit_skips_main_ruleset(ruleset):
+    matches = ruleset.match("Technic Launcher is starting KappaKeepo")
+
+    assert [match.rule for match in matches] == ["NoiseRule"]
+
+
+def test_no_blacklist_hit_runs_both_passes(ruleset):
+    matches = ruleset.match("Kreygasm KappaKeepo")
+
+    assert sorted(match.rule for match in matches) == ["SecretInNoiseRule", "SecretRule"]
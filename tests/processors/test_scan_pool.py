@@ -0,0 +1,54 @@
+# pylint: disable=redefined-outer-name
+import pickle
+
+import pytest
+
+from infobserve.processors.rulesets import ScanMatch
+from infobserve.processors.scan_pool import YaraScanPool
+
+RULE = """
+rule SecretRule : secret
+{
+    meta:
+        name = "Secret"
+    strings:
+        $a = "KappaKeepo"
+    condition:
+        $a
+}
+"""
+
+
+@pytest.fixture
+def rule_file(tmp_path):
+    path = tmp_path / "secret.yar"
+    path.write_text(RULE)
+    return path.as_posix()
+
+
+@pytest.fixture
+def scan_pool(rule_file):
+    pool = YaraScanPool(1, {rule_file: rule_file})
+    yield pool
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_match_in_worker(scan_pool, rule_file):
+    matches = await scan_pool.match("some text KappaKeepo some more text")
+
+    assert len(matches) == 1
+    assert matches[0].rule == "SecretRule"
+    assert matches[0].namespace == rule_file
+    assert matches[0].tags == ["secret"]
+    assert matches[0].strings == [(10, "$a", b"KappaKeepo")]
+
+
+@pytest.mark.asyncio
+async def test_no_match_in_worker(scan_pool):
+    assert await scan_pool.match("nothing to see here") == []
+
+
+def test_scan_match_is_picklable():
+    match = ScanMatch("SecretRule", "default", ["secret"], {}, [(10, "$a", b"KappaKeepo")])
+    assert pickle.loads(pickle.dumps(match)) == match
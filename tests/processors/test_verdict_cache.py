@@ -0,0 +1,47 @@
+# pylint: disable=redefined-outer-name
+import pytest
+
+from infobserve.processors.rulesets import ScanMatch
+from infobserve.processors.verdict_cache import VerdictCache
+
+MATCHES = [ScanMatch("SecretRule", "default", [], {}, [(0, "$a", b"KappaKeepo")])]
+
+
+@pytest.fixture
+def verdict_cache():
+    return VerdictCache(max_size=2, stats_interval=0)
+
+
+def test_key_depends_on_ruleset():
+    assert VerdictCache.key("KappaKeepo", "ruleset-1") != VerdictCache.key("KappaKeepo", "ruleset-2")
+    assert VerdictCache.key("KappaKeepo", "ruleset-1") == VerdictCache.key(b"KappaKeepo", "ruleset-1")
+
+
+@pytest.mark.asyncio
+async def test_hit_and_miss(verdict_cache):
+    key = VerdictCache.key("KappaKeepo", "ruleset")
+
+    assert await verdict_cache.get(key) is None
+    await verdict_cache.put(key, MATCHES)
+    assert await verdict_cache.get(key) == MATCHES
+
+    assert verdict_cache.hits == 1
+    assert verdict_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_verdicts_are_cached(verdict_cache):
+    await verdict_cache.put("key", [])
+    assert await verdict_cache.get("key") == []
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_is_evicted(verdict_cache):
+    await verdict_cache.put("first", MATCHES)
+    await verdict_cache.put("second", MATCHES)
+    await verdict_cache.get("first")
+    await verdict_cache.put("third", MATCHES)
+
+    assert await verdict_cache.get("second") is None
+    assert await verdict_cache.get("first") == MATCHES
+    assert verdict_cache.evictions == 1
@@ -0,0 +1,139 @@
+# pylint: disable=redefined-outer-name
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+import yara
+
+from infobserve.events import RawEvent
+from infobserve.processors.yara_processor import YaraProcessor
+
+RULE = """
+rule SecretRule
+{
+    strings:
+        $a = "KappaKeepo"
+    condition:
+        $a
+}
+"""
+
+NEW_RULE = """
+rule NewSecretRule
+{
+    strings:
+        $a = "Kreygasm"
+    condition:
+        $a
+}
+"""
+
+
+@pytest.fixture
+def rule_file(tmp_path):
+    path = tmp_path / "secret.yar"
+    path.write_text(RULE)
+    return path
+
+
+@pytest.fixture
+def processor(rule_file):
+    return YaraProcessor([rule_file.as_posix()], Mock(), Mock())
+
+
+@pytest.mark.asyncio
+async def test_reload_rules_swaps_ruleset(processor, rule_file):
+    rule_file.write_text(NEW_RULE)
+
+    assert await processor.reload_rules()
+    assert not await processor._match("KappaKeepo")
+    assert (await processor._match("Kreygasm"))[0].rule == "NewSecretRule"
+
+
+@pytest.mark.asyncio
+async def test_reload_rules_keeps_old_ruleset_on_error(processor, rule_file):
+    rule_file.write_text("rule Broken { condition: }")
+
+    assert not await processor.reload_rules()
+    assert (await processor._match("KappaKeepo"))[0].rule == "SecretRule"
+
+
+@pytest.mark.asyncio
+async def test_reload_rules_picks_up_new_files(processor, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "new_secret.yar").write_text(NEW_RULE)
+    processor._rule_files = ["*.yar"]
+
+    assert await processor.reload_rules()
+    assert (await processor._match("Kreygasm"))[0].rule == "NewSecretRule"
+
+
+@pytest.fixture
+def event():
+    event = Mock()
+    event.id = "0CeaNm8Y"
+    event.source = "pastebin"
+    event.raw_content = "KappaKeepo"
+    return event
+
+
+@pytest.mark.asyncio
+async def test_oversized_event_is_quarantined(rule_file, event):
+    quarantine_queue = AsyncMock()
+    processor = YaraProcessor([rule_file.as_posix()], Mock(), AsyncMock(), max_scan_size=4,
+                              quarantine_queue=quarantine_queue)
+
+    await processor._process_event(event)
+
+    quarantine_queue.queue_event.assert_awaited_once_with(event)
+    processor._db_queue.queue_event.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_event_is_quarantined(processor, event):
+    processor._quarantine_queue = AsyncMock()
+    processor._engine.match = Mock(side_effect=yara.TimeoutError)
+
+    await processor._process_event(event)
+
+    processor._quarantine_queue.queue_event.assert_awaited_once_with(event)
+
+
+@pytest.mark.asyncio
+async def test_snippets_mode_keeps_only_the_context_of_the_matches(rule_file):
+    processor = YaraProcessor([rule_file.as_posix()], Mock(), Mock(), storage_mode="snippets", snippet_context=4,
+                              full_content_sources=["github"])
+    event = RawEvent(datetime(2020, 5, 22, 10, 30), "pastebin", "0CeaNm8Y", "paste.txt", "Anonymous",
+                     b"x" * 60 + b"KappaKeepo" + b"y" * 60)
+
+    processed_event = await processor._process_event(event)
+
+    assert processed_event.raw_content is None
+    ascii_match = processed_event.matches[0].ascii_matches[0]
+    assert (ascii_match.identifier, ascii_match.offset, ascii_match.context) == ("$a", 60, "xxxxKappaKeepoyyyy")
+
+    event.source = "github"
+    assert (await processor._process_event(event)).raw_content == event.raw_content
+
+
+@pytest.mark.asyncio
+async def test_in_process_matches_do_not_block_the_loop(processor):
+    def slow_match(data, timeout, fast):
+        time.sleep(0.2)
+        return []
+    processor._engine.match = slow_match
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.ensure_future(tick())
+    await processor._match(b"KappaKeepo", timeout=1, fast=True)
+    ticker.cancel()
+
+    assert ticks > 5
@@ -0,0 +1,68 @@
+from unittest.mock import Mock, patch
+
+from infobserve.sources.github_polling import GithubPolling
+
+
+def make_response(status=200, **headers):
+    return Mock(status=status, url="https://api.github.com/events",
+                headers={name.replace("_", "-"): str(value) for name, value in headers.items()})
+
+
+def test_etag_is_sent_back_and_304_is_a_no_op():
+    polling = GithubPolling(60)
+    assert polling.headers() == {}
+
+    assert polling.update(make_response(ETag='W/"a1b2"'))
+    assert polling.headers() == {"If-None-Match": 'W/"a1b2"'}
+
+    assert not polling.update(make_response(304))
+    assert polling.headers() == {"If-None-Match": 'W/"a1b2"'}
+
+
+def test_server_poll_interval_is_followed():
+    polling = GithubPolling(10)
+    polling.update(make_response(X_Poll_Interval=60))
+
+    assert polling.delay() == 60
+
+
+@patch("infobserve.sources.github_polling.time.time", return_value=1000)
+def test_polls_slow_down_as_the_quota_runs_out(_time):
+    polling = GithubPolling(10)
+    polling.update(make_response(X_RateLimit_Remaining=1000, X_RateLimit_Reset=4600))
+    assert polling.delay() == 10
+
+    # The last cycle used 50 requests, and 50 are left for the hour until the reset
+    polling.update(make_response(X_RateLimit_Remaining=100, X_RateLimit_Reset=4600))
+    polling.update(make_response(X_RateLimit_Remaining=50, X_RateLimit_Reset=4600))
+    assert polling.delay() == 3600
+
+    assert not polling.update(make_response(403, X_RateLimit_Remaining=0, X_RateLimit_Reset=4600))
+    assert polling.delay() == 3600
+
+
+@patch("infobserve.sources.github_polling.time.time", return_value=1000)
+def test_secondary_rate_limit_waits_for_retry_after(_time):
+    polling = GithubPolling(10)
+
+    assert not polling.update(make_response(403, Retry_After=120, X_RateLimit_Remaining=4000, X_RateLimit_Reset=4600))
+    assert polling.delay() == 120
+
+    # Without Retry-After, a minute
+    assert not polling.update(make_response(429, X_RateLimit_Remaining=4000, X_RateLimit_Reset=4600))
+    assert polling.delay() == 60
+
+
+@patch("infobserve.sources.github_polling.time.time", return_value=1000)
+def test_errors_are_polls_without_content(_time):
+    polling = GithubPolling(10)
+    polling.update(make_response(ETag='W/"a1b2"'))
+
+    assert not polling.update(make_response(502))
+    assert polling.delay() == 10
+    assert not polling.update(make_response(503, Retry_After=30))
+    assert polling.delay() == 30
+    assert not polling.update(make_response(401))
+
+    # An error never replaces the ETag of the last content
+    assert polling.headers() == {"If-None-Match": 'W/"a1b2"'}
@@ -0,0 +1,28 @@
+import pytest
+
+from infobserve.atomic_file import atomic_write
+
+
+def test_file_is_replaced_once_written(tmp_path):
+    path = tmp_path / "checkpoint"
+    path.write_text("old")
+
+    with atomic_write(path, "w") as checkpoint_file:
+        checkpoint_file.write("new")
+        assert path.read_text() == "old"
+
+    assert path.read_text() == "new"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["checkpoint"]
+
+
+def test_file_is_left_as_it_was_on_error(tmp_path):
+    path = tmp_path / "checkpoint"
+    path.write_bytes(b"old")
+
+    with pytest.raises(ValueError):
+        with atomic_write(path) as checkpoint_file:
+            checkpoint_file.write(b"partial")
+            raise ValueError()
+
+    assert path.read_bytes() == b"old"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["checkpoint"]